@@ -1,29 +1,83 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import math
 import random
 from pathlib import Path
 import shutil
 from threading import Lock
-from typing import Any
+from typing import Any, Callable
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .app import build_default_teams
 from .engine import GameResult
+from .events import EventBus, format_sse
+from .jobs import SimJobManager
 from .league import LeagueSimulator
 from .models import (
     ALL_LINE_SLOTS,
-    DEFENSE_POSITIONS,
-    FORWARD_POSITIONS,
     GOALIE_POSITIONS,
     Player,
     Team,
     TeamRecord,
 )
+from .trades import TradeSearch, need_matches_position
+
+
+def encode_json_bytes(payload: Any) -> bytes:
+    # Payloads are plain dict/list/str/number trees, so skip FastAPI's jsonable_encoder walk.
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    try:
+        text = json.dumps(payload, separators=(",", ":"), ensure_ascii=False, check_circular=False, allow_nan=False)
+    except ValueError:
+        # NaN and infinities are not JSON; write them as null, as orjson does.
+        text = json.dumps(_finite_or_none(payload), separators=(",", ":"), ensure_ascii=False, check_circular=False)
+    return text.encode("utf-8")
+
+
+def _finite_or_none(value: Any) -> Any:
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(item) for item in value]
+    return value
+
+
+def parse_fields(raw: str | None) -> frozenset[str] | None:
+    if raw is None:
+        return None
+    names = frozenset(part.strip() for part in str(raw).split(",") if part.strip())
+    return names or None
+
+
+def project_fields(row: dict[str, Any], fields: frozenset[str] | None, keep: tuple[str, ...] = ()) -> dict[str, Any]:
+    if fields is None:
+        return row
+    return {key: value for key, value in row.items() if key in fields or key in keep}
+
+
+def rows_to_columns(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    # Columns in first-seen order across all rows; rows missing a column get null.
+    seen: dict[str, None] = {}
+    for row in rows:
+        seen.update(dict.fromkeys(row))
+    fields = list(seen)
+    return {"fields": fields, "rows": [[row.get(key) for key in fields] for row in rows]}
 
 
 class TeamSelection(BaseModel):
@@ -110,8 +164,21 @@ class TradeProposalSelection(BaseModel):
     receive_player: str
 
 
+class SimJobSelection(BaseModel):
+    target: str
+    day: int | None = None
+    seasons: int | None = None
+    detail: str = "full"
+
+
 class SimService:
     RUNTIME_SAVE_VERSION = 2
+    RESPONSE_CACHE_MAX_ENTRIES = 256
+    # Skater table columns by cost: totals need the traded-season carry rows, derived ones build on totals.
+    PLAYER_TOTAL_FIELDS = frozenset({"gp", "g", "a", "p"})
+    PLAYER_DERIVED_FIELDS = frozenset(
+        {"plus_minus", "pim", "toi_g", "ppg", "ppa", "shg", "sha", "shots", "shot_pct"}
+    )
     TRADE_PREF_VALUES = {"available", "shop", "untouchable"}
     SKATER_MILESTONES = {
         "games_played": [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000, 1200, 1400, 1500],
@@ -125,12 +192,71 @@ class SimService:
         "goalie_shutouts": [20, 30, 40, 50, 60, 70, 80, 100],
     }
 
-    def __init__(self) -> None:
-        self.data_root = Path(__file__).resolve().parents[2]
+    def __init__(self, data_root: Path | None = None) -> None:
+        self.data_root = Path(data_root) if data_root is not None else Path(__file__).resolve().parents[2]
         self.runtime_last_load_error: str = ""
+        # Service-side mutation counter; combined with the simulator's counter for cache keys.
+        self.state_generation = 0
+        # Write requests in flight; responses built meanwhile may see half-applied state.
+        self._writes_in_flight = 0
+        self._generation_lock = Lock()
+        self._response_cache: dict[tuple[str, tuple[Any, ...]], tuple[str, bytes]] = {}
+        self._response_cache_generation = ""
+        self._runtime_batched_depth = 0
+        self._runtime_save_pending = False
+        self.events = EventBus()
+        self._published_standings: dict[str, tuple[int, ...]] = {}
         self._init_fresh_state()
         self._load_runtime_state()
         self._lock = Lock()
+        self.jobs = SimJobManager(self)
+
+    def bump_generation(self) -> None:
+        with self._generation_lock:
+            self.state_generation += 1
+
+    def begin_write(self) -> None:
+        with self._generation_lock:
+            self._writes_in_flight += 1
+            self.state_generation += 1
+
+    def end_write(self) -> None:
+        with self._generation_lock:
+            self._writes_in_flight -= 1
+            self.state_generation += 1
+
+    def cache_generation(self) -> str:
+        return f"{self.state_generation}.{int(getattr(self.simulator, 'state_generation', 0))}"
+
+    def cached_response(
+        self,
+        endpoint: str,
+        params: tuple[Any, ...],
+        builder: Callable[[], Any],
+    ) -> tuple[str, bytes]:
+        # Read endpoints are pure functions of league state, so reuse encoded bodies
+        # until any mutation moves the generation forward.
+        generation = self.cache_generation()
+        if self._writes_in_flight:
+            body = encode_json_bytes(builder())
+            return self._etag(generation, body), body
+        if generation != self._response_cache_generation:
+            self._response_cache.clear()
+            self._response_cache_generation = generation
+        key = (endpoint, params)
+        hit = self._response_cache.get(key)
+        if hit is not None:
+            return hit
+        body = encode_json_bytes(builder())
+        etag = self._etag(generation, body)
+        if len(self._response_cache) >= self.RESPONSE_CACHE_MAX_ENTRIES:
+            self._response_cache.clear()
+        self._response_cache[key] = (etag, body)
+        return etag, body
+
+    @staticmethod
+    def _etag(generation: str, body: bytes) -> str:
+        return f'"{generation}-{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
 
     def _init_fresh_state(self) -> None:
         teams = build_default_teams()
@@ -249,7 +375,31 @@ class SimService:
                         team_rows[cleaned] = "shop"
         self.trade_preferences_by_team = parsed_prefs
 
+    def begin_batched_saves(self) -> None:
+        self._runtime_batched_depth += 1
+        self.simulator.begin_batched_saves()
+
+    def end_batched_saves(self) -> None:
+        self._runtime_batched_depth = max(0, self._runtime_batched_depth - 1)
+        self.simulator.end_batched_saves()
+        if self._runtime_batched_depth == 0:
+            self.flush_batched_saves()
+
+    def flush_batched_saves(self) -> None:
+        self.simulator.flush_batched_saves()
+        if not self._runtime_save_pending:
+            return
+        self._runtime_save_pending = False
+        self._write_runtime_state()
+
     def _save_runtime_state(self) -> None:
+        self.bump_generation()
+        if self._runtime_batched_depth > 0:
+            self._runtime_save_pending = True
+            return
+        self._write_runtime_state()
+
+    def _write_runtime_state(self) -> None:
         payload = {
             "save_version": self.RUNTIME_SAVE_VERSION,
             "runtime_state": {
@@ -363,14 +513,7 @@ class SimService:
         return sorted([name for name, pref in prefs.items() if pref == "shop"])
 
     def _need_matches_position(self, need_key: str, position: str) -> bool:
-        pos = position.upper()
-        if need_key in {"top6_f", "depth_f"}:
-            return pos in FORWARD_POSITIONS
-        if need_key in {"top4_d", "depth_d"}:
-            return pos in DEFENSE_POSITIONS
-        if need_key == "starter_g":
-            return pos in GOALIE_POSITIONS
-        return True
+        return need_matches_position(need_key, position)
 
     def _trade_player_value(self, player: Player, receiving_team: Team) -> float:
         base = self._player_overall(player)
@@ -437,48 +580,46 @@ class SimService:
             return -0.04
         return 0.0
 
-    def _evaluate_one_for_one_trade(
+    def _trade_search(self) -> TradeSearch:
+        """A trade search over the current rosters; reuse it across one review."""
+        return TradeSearch(
+            value=self._trade_player_value,
+            needs=self._team_needs,
+            pool=lambda team, outgoing: self._eligible_trade_players(team, outgoing=outgoing),
+            margin=self._trade_acceptance_margin,
+            overall=self._player_overall,
+        )
+
+    def _is_trade_acceptable(
         self,
+        team: Team,
+        give_player: Player,
+        receive_player: Player,
         *,
-        acquiring_team: Team,
-        sending_player: Player,
-        receiving_player: Player,
-    ) -> dict[str, float]:
-        acquired_val = self._trade_player_value(receiving_player, acquiring_team)
-        sent_val = self._trade_player_value(sending_player, acquiring_team)
-        net = acquired_val - sent_val
-        return {
-            "acquired_value": round(acquired_val, 3),
-            "sent_value": round(sent_val, 3),
-            "net_value": round(net, 3),
-        }
+        search: TradeSearch | None = None,
+    ) -> tuple[bool, dict[str, float]]:
+        return (search or self._trade_search()).acceptable(team, (give_player,), (receive_player,))
 
-    def _is_trade_acceptable(self, team: Team, give_player: Player, receive_player: Player) -> tuple[bool, dict[str, float]]:
-        eval_row = self._evaluate_one_for_one_trade(
-            acquiring_team=team,
-            sending_player=give_player,
-            receiving_player=receive_player,
-        )
-        margin = self._trade_acceptance_margin(team)
-        min_net = -0.08 + margin
-        max_overpay = 0.95
-        net = float(eval_row["net_value"])
-        accept = net >= min_net and abs(net) <= max_overpay
-        eval_row["min_net"] = round(min_net, 3)
-        eval_row["accept_margin"] = round(margin, 3)
-        return accept, eval_row
-
-    def _trade_offer_insight(self, team: Team, partner: Team, give_player: Player, receive_player: Player) -> dict[str, Any]:
-        user_accept, user_eval = self._is_trade_acceptable(team, give_player, receive_player)
-        partner_accept, partner_eval = self._is_trade_acceptable(partner, receive_player, give_player)
+    def _trade_offer_insight(
+        self,
+        team: Team,
+        partner: Team,
+        give_player: Player,
+        receive_player: Player,
+        *,
+        search: TradeSearch | None = None,
+    ) -> dict[str, Any]:
+        search = search or self._trade_search()
+        user_accept, user_eval = self._is_trade_acceptable(team, give_player, receive_player, search=search)
+        partner_accept, partner_eval = self._is_trade_acceptable(partner, receive_player, give_player, search=search)
         user_net = float(user_eval.get("net_value", 0.0))
         partner_net = float(partner_eval.get("net_value", 0.0))
         partner_min = float(partner_eval.get("min_net", 0.0))
         user_min = float(user_eval.get("min_net", 0.0))
         gap = partner_net - partner_min
         accept_probability = max(0.05, min(0.95, 0.5 + gap * 0.9))
-        team_needs = self._team_needs(team)
-        partner_needs = self._team_needs(partner)
+        team_needs = search.needs(team)
+        partner_needs = search.needs(partner)
         team_primary_need = str(team_needs.get("primary_need", ""))
         partner_primary_need = str(partner_needs.get("primary_need", ""))
         receive_matches_user_need = self._need_matches_position(team_primary_need, receive_player.position)
@@ -583,6 +724,7 @@ class SimService:
         receive_player: Player,
         counter_type: str,
     ) -> tuple[Player, Player, dict[str, Any]] | None:
+        search = self._trade_search()
         if counter_type == "counter_upgrade_return":
             candidates = sorted(
                 [p for p in partner.roster if not p.is_injured and p.name != receive_player.name],
@@ -596,7 +738,7 @@ class SimService:
                     healthy_goalies = len([p for p in partner.roster if p.position == "G" and not p.is_injured])
                     if healthy_goalies <= 1:
                         continue
-                insight = self._trade_offer_insight(team, partner, give_player, candidate)
+                insight = self._trade_offer_insight(team, partner, give_player, candidate, search=search)
                 if bool(insight.get("partner_accepts", False)):
                     return give_player, candidate, insight
             return None
@@ -613,7 +755,7 @@ class SimService:
                     healthy_goalies = len([p for p in team.roster if p.position == "G" and not p.is_injured])
                     if healthy_goalies <= 1:
                         continue
-                insight = self._trade_offer_insight(team, partner, candidate, receive_player)
+                insight = self._trade_offer_insight(team, partner, candidate, receive_player, search=search)
                 if bool(insight.get("partner_accepts", False)):
                     return candidate, receive_player, insight
             return None
@@ -628,14 +770,28 @@ class SimService:
         team_a_player: Player,
         team_b_player: Player,
     ) -> None:
-        self.simulator.snapshot_trade_season_split(team_a_player, team_a.name)
-        self.simulator.snapshot_trade_season_split(team_b_player, team_b.name)
-        team_a.roster.remove(team_a_player)
-        team_b.roster.remove(team_b_player)
-        team_a_player.team_name = team_b.name
-        team_b_player.team_name = team_a.name
-        team_b.roster.append(team_a_player)
-        team_a.roster.append(team_b_player)
+        self._execute_trade(team_a=team_a, team_b=team_b, team_a_players=[team_a_player], team_b_players=[team_b_player])
+
+    def _execute_trade(
+        self,
+        *,
+        team_a: Team,
+        team_b: Team,
+        team_a_players: list[Player],
+        team_b_players: list[Player],
+    ) -> None:
+        for player in team_a_players:
+            self.simulator.snapshot_trade_season_split(player, team_a.name)
+            team_a.roster.remove(player)
+            player.team_name = team_b.name
+        for player in team_b_players:
+            self.simulator.snapshot_trade_season_split(player, team_b.name)
+            team_b.roster.remove(player)
+            player.team_name = team_a.name
+        team_b.roster.extend(team_a_players)
+        team_a.roster.extend(team_b_players)
+        self.simulator.mark_team_dirty(team_a)
+        self.simulator.mark_team_dirty(team_b)
         self.simulator.normalize_player_numbers()
         team_a.set_default_lineup()
         team_b.set_default_lineup()
@@ -670,106 +826,18 @@ class SimService:
         *,
         requesting_team: Team,
         partner_team: Team,
+        search: TradeSearch | None = None,
     ) -> tuple[Player, Player, dict[str, float], dict[str, float]] | None:
-        req_needs = self._team_needs(requesting_team)
-        req_scores = req_needs.get("scores", {}) if isinstance(req_needs, dict) else {}
-        req_primary = str(req_needs.get("primary_need", ""))
-
-        give_pool = self._eligible_trade_players(requesting_team, outgoing=True)[:12]
-        # Favor sending from weaker/less critical buckets first.
-        give_pool = sorted(
-            give_pool,
-            key=lambda p: (
-                self._need_matches_position(req_primary, p.position),
-                self._player_overall(p),
-                -p.age,
-            ),
-        )
-        receive_pool = self._eligible_trade_players(partner_team, outgoing=False)[:14]
-        if req_primary:
-            preferred = [p for p in receive_pool if self._need_matches_position(req_primary, p.position)]
-            if preferred:
-                receive_pool = preferred + [p for p in receive_pool if p not in preferred]
-        if not give_pool or not receive_pool:
-            return None
-        best: tuple[Player, Player, dict[str, float], dict[str, float], float] | None = None
-        for give_player in give_pool:
-            for receive_player in receive_pool:
-                if give_player.name == receive_player.name:
-                    continue
-                # Do not worsen biggest need: avoid paying same-need position unless clear upgrade.
-                if req_primary and self._need_matches_position(req_primary, give_player.position):
-                    if not self._need_matches_position(req_primary, receive_player.position):
-                        continue
-                    if self._player_overall(receive_player) <= self._player_overall(give_player):
-                        continue
-
-                # Seller should move from relative surplus, not from their biggest need.
-                seller_needs = self._team_needs(partner_team)
-                seller_primary = str(seller_needs.get("primary_need", ""))
-                seller_scores = seller_needs.get("scores", {}) if isinstance(seller_needs, dict) else {}
-                if seller_primary and self._need_matches_position(seller_primary, receive_player.position):
-                    if float(seller_scores.get(seller_primary, 0.0)) >= 0.55:
-                        continue
-
-                req_accept, req_eval = self._is_trade_acceptable(requesting_team, give_player, receive_player)
-                if not req_accept:
-                    continue
-                part_accept, part_eval = self._is_trade_acceptable(partner_team, receive_player, give_player)
-                if not part_accept:
-                    continue
-                req_net = float(req_eval.get("net_value", 0.0))
-                part_net = float(part_eval.get("net_value", 0.0))
-                # Prefer deals both teams can defend as fair; slight bias toward improving weak teams.
-                fairness = -abs(req_net - part_net)
-                need_alignment = 0.0
-                if req_primary and self._need_matches_position(req_primary, receive_player.position):
-                    need_alignment += 0.18 + float(req_scores.get(req_primary, 0.0)) * 0.14
-                quality = req_net + part_net + fairness * 0.35 + need_alignment
-                if best is None or quality > best[4]:
-                    best = (give_player, receive_player, req_eval, part_eval, quality)
-        if best is None:
-            return None
-        return best[0], best[1], best[2], best[3]
+        return (search or self._trade_search()).balanced_offer(requesting_team, partner_team)
 
     def _find_cpu_trade_offer_relaxed(
         self,
         *,
         requesting_team: Team,
         partner_team: Team,
+        search: TradeSearch | None = None,
     ) -> tuple[Player, Player, dict[str, float], dict[str, float]] | None:
-        give_pool = self._eligible_trade_players(requesting_team, outgoing=True)[:10]
-        receive_pool = self._eligible_trade_players(partner_team, outgoing=False)[:10]
-        if not give_pool or not receive_pool:
-            return None
-        best: tuple[Player, Player, dict[str, float], dict[str, float], float] | None = None
-        for give_player in give_pool:
-            for receive_player in receive_pool:
-                if give_player.name == receive_player.name:
-                    continue
-                req_eval = self._evaluate_one_for_one_trade(
-                    acquiring_team=requesting_team,
-                    sending_player=give_player,
-                    receiving_player=receive_player,
-                )
-                part_eval = self._evaluate_one_for_one_trade(
-                    acquiring_team=partner_team,
-                    sending_player=receive_player,
-                    receiving_player=give_player,
-                )
-                req_net = float(req_eval.get("net_value", 0.0))
-                part_net = float(part_eval.get("net_value", 0.0))
-                # Keep relaxed trades plausible but not obviously broken.
-                if req_net < -0.20 or part_net < -0.20:
-                    continue
-                if abs(req_net - part_net) > 0.45:
-                    continue
-                quality = req_net + part_net - abs(req_net - part_net) * 0.35
-                if best is None or quality > best[4]:
-                    best = (give_player, receive_player, req_eval, part_eval, quality)
-        if best is None:
-            return None
-        return best[0], best[1], best[2], best[3]
+        return (search or self._trade_search()).relaxed_offer(requesting_team, partner_team)
 
     def _propose_user_trade(
         self,
@@ -798,8 +866,9 @@ class SimService:
             if healthy_goalies <= 1:
                 return {"ok": False, "reason": "partner_cannot_trade_last_goalie"}
 
-        user_accepts, user_eval = self._is_trade_acceptable(user_team, give_player, receive_player)
-        partner_accepts, partner_eval = self._is_trade_acceptable(partner_team, receive_player, give_player)
+        search = self._trade_search()
+        user_accepts, user_eval = self._is_trade_acceptable(user_team, give_player, receive_player, search=search)
+        partner_accepts, partner_eval = self._is_trade_acceptable(partner_team, receive_player, give_player, search=search)
         if not user_accepts:
             return {"ok": False, "reason": "bad_user_offer", "user_eval": user_eval, "partner_eval": partner_eval}
         if not partner_accepts:
@@ -972,6 +1041,7 @@ class SimService:
                 player = next((p for p in [*team.roster, *team.minor_roster] if p.name == injured_name), None)
                 if player is not None and player.injured_games_remaining > 0:
                     player.injured_games_remaining = max(0, player.injured_games_remaining - 1)
+                    self.simulator.mark_team_dirty(team)
 
         if team is not None and event_type == "injury_alert":
             if choice_id == "auto_call_up":
@@ -1125,6 +1195,7 @@ class SimService:
                 waiver_player.prospect_tier = "NHL"
                 waiver_player.seasons_to_nhl = 0
                 team.minor_roster.append(waiver_player)
+                self.simulator.mark_team_dirty(team)
                 self._add_news(
                     kind="transaction",
                     headline=f"Transaction: {team.name} claimed {waiver_player.name}",
@@ -1239,24 +1310,25 @@ class SimService:
             partners = [t for t in self.simulator.teams if t.name != team.name]
             self.simulator._rng.shuffle(partners)
             preferred_block = set(self._trade_block_names(team))
+            search = self._trade_search()
             for partner in partners:
-                offer = self._find_balanced_trade_offer(requesting_team=team, partner_team=partner)
+                offer = self._find_balanced_trade_offer(requesting_team=team, partner_team=partner, search=search)
                 if offer is not None and preferred_block:
                     give_player, _, _, _ = offer
                     if give_player.name not in preferred_block:
                         offer = None
                 if offer is None and preferred_block:
-                    relaxed = self._find_cpu_trade_offer_relaxed(requesting_team=team, partner_team=partner)
+                    relaxed = self._find_cpu_trade_offer_relaxed(requesting_team=team, partner_team=partner, search=search)
                     if relaxed is not None:
                         gp, rp, ge, pe = relaxed
                         if gp.name in preferred_block:
                             offer = (gp, rp, ge, pe)
                 if offer is None:
-                    offer = self._find_cpu_trade_offer_relaxed(requesting_team=team, partner_team=partner)
+                    offer = self._find_cpu_trade_offer_relaxed(requesting_team=team, partner_team=partner, search=search)
                 if offer is None:
                     continue
                 give_player, receive_player, _, _ = offer
-                insight = self._trade_offer_insight(team, partner, give_player, receive_player)
+                insight = self._trade_offer_insight(team, partner, give_player, receive_player, search=search)
                 details = (
                     f"{partner.name} offers {receive_player.name} for {give_player.name}. "
                     f"Model net for {team.name}: {float(insight.get('user_eval', {}).get('net_value', 0.0)):+.2f}"
@@ -1576,8 +1648,32 @@ class SimService:
         }
         self.news_feed.insert(0, row)
         self.news_feed = self.news_feed[:5000]
+        self.events.publish("news", dict(row))
         self._save_runtime_state()
 
+    def _publish_standings_snapshot(self, day_num: int, phase: str) -> None:
+        if not self.events.has_subscribers():
+            return
+        rows: list[list[Any]] = []
+        changed: list[str] = []
+        for rec in self.simulator.get_standings():
+            line = (rec.games_played, rec.wins, rec.losses, rec.ot_losses, rec.points, rec.goals_for, rec.goals_against)
+            if self._published_standings.get(rec.team.name) != line:
+                changed.append(rec.team.name)
+                self._published_standings[rec.team.name] = line
+            rows.append([rec.team.name, *line])
+        self.events.publish(
+            "standings",
+            {
+                "season": int(self.simulator.season_number),
+                "day": int(day_num),
+                "phase": phase,
+                "fields": ["team", "gp", "w", "l", "otl", "pts", "gf", "ga"],
+                "rows": rows,
+                "changed": changed,
+            },
+        )
+
     def _injury_news_from_results(self, day_num: int, results: list[GameResult]) -> None:
         for result in results:
             for inj in result.home_injuries:
@@ -1648,25 +1744,25 @@ class SimService:
                             team=team.name,
                             day=self.simulator.current_day,
                         )
-                self._add_inbox_event(
-                    day_num=day_num,
-                    event_type="injury_auto",
-                    title=f"Injury Update: {inj.player.name}",
-                    details=(
-                        f"{inj.injury_type} | {inj.injury_status} | Expected out {inj.games_out} games. "
-                        f"{action_detail}"
-                    ),
-                    options=[],
-                    payload={
-                        "key": payload_key,
-                        "player_name": inj.player.name,
-                        "injury_type": inj.injury_type,
-                        "injury_status": inj.injury_status,
-                        "games_out": inj.games_out,
-                    },
-                    expires_in_days=1,
-                )
-                continue
+                    self._add_inbox_event(
+                        day_num=day_num,
+                        event_type="injury_auto",
+                        title=f"Injury Update: {inj.player.name}",
+                        details=(
+                            f"{inj.injury_type} | {inj.injury_status} | Expected out {inj.games_out} games. "
+                            f"{action_detail}"
+                        ),
+                        options=[],
+                        payload={
+                            "key": payload_key,
+                            "player_name": inj.player.name,
+                            "injury_type": inj.injury_type,
+                            "injury_status": inj.injury_status,
+                            "games_out": inj.games_out,
+                        },
+                        expires_in_days=1,
+                    )
+                    continue
                 payload_key = f"{inj.player.player_id}:{day_num}:injury"
                 if self._inbox_event_exists(
                     event_type="injury_alert",
@@ -2308,6 +2404,7 @@ class SimService:
         team.coach_tenure_seasons = 0
         team.coach_changes_recent = min(5.0, max(0.0, team.coach_changes_recent) + 1.0)
         team.coach_honeymoon_games_remaining = 24
+        self.simulator.mark_team_dirty(team)
         team.set_default_lineup()
         self.simulator._save_state()
         self._add_news(
@@ -2430,8 +2527,10 @@ class SimService:
                     }
                 )
 
-        # CPU trade window: limited weekly 1-for-1 trades with sanity checks.
+        # CPU trade window: limited weekly 1-for-1 trades with sanity checks,
+        # falling back to 2-for-1 consolidation deals with sellers that have no 1-for-1 fit.
         cpu_teams = [t for t in self.simulator.teams if t.name != self.user_team_name]
+        search = self._trade_search()
         attempted: set[str] = set()
         max_trades = 2
         trade_count = 0
@@ -2443,49 +2542,63 @@ class SimService:
             rec_buyer = rec_map.get(buyer.name)
             if rec_buyer is None or rec_buyer.games_played < 18:
                 continue
-            best_trade: tuple[Team, Player, Player, dict[str, float], dict[str, float], float] | None = None
+            best_trade: tuple[Team, list[Player], Player, dict[str, float], dict[str, float], float] | None = None
+            # A 2-for-1 costs the buyer a roster spot, so only buyers with a healthy minor leaguer to call up consolidate.
+            can_consolidate = any(not p.is_injured for p in buyer.minor_roster)
             for seller in cpu_teams:
                 if seller.name == buyer.name or seller.name in attempted:
                     continue
-                offer = self._find_balanced_trade_offer(requesting_team=buyer, partner_team=seller)
-                if offer is None:
-                    offer = self._find_cpu_trade_offer_relaxed(requesting_team=buyer, partner_team=seller)
+                offer = self._find_balanced_trade_offer(requesting_team=buyer, partner_team=seller, search=search)
                 if offer is None:
-                    continue
-                buyer_send, seller_out, buyer_eval, seller_eval = offer
+                    offer = self._find_cpu_trade_offer_relaxed(requesting_team=buyer, partner_team=seller, search=search)
+                if offer is not None:
+                    buyer_send, seller_out, buyer_eval, seller_eval = offer
+                    buyer_sends = [buyer_send]
+                else:
+                    package = search.two_for_one_offer(buyer, seller) if can_consolidate else None
+                    if package is None:
+                        continue
+                    sent_pair, seller_out, buyer_eval, seller_eval = package
+                    buyer_sends = list(sent_pair)
                 quality = float(buyer_eval.get("net_value", 0.0)) + float(seller_eval.get("net_value", 0.0))
                 if best_trade is None or quality > best_trade[5]:
-                    best_trade = (seller, buyer_send, seller_out, buyer_eval, seller_eval, quality)
+                    best_trade = (seller, buyer_sends, seller_out, buyer_eval, seller_eval, quality)
 
             if best_trade is None:
                 continue
 
-            seller, buyer_send, seller_out, buyer_eval, seller_eval, _ = best_trade
-            self._execute_one_for_one_trade(
+            seller, buyer_sends, seller_out, buyer_eval, seller_eval, _ = best_trade
+            self._execute_trade(
                 team_a=buyer,
                 team_b=seller,
-                team_a_player=buyer_send,
-                team_b_player=seller_out,
+                team_a_players=buyer_sends,
+                team_b_players=[seller_out],
             )
+            search.forget(buyer, seller)
+            sent_names = " and ".join(p.name for p in buyer_sends)
 
             self._add_news(
                 kind="trade",
                 headline=f"Trade: {buyer.name} acquired {seller_out.name} from {seller.name}",
                 details=(
-                    f"{buyer.name} sent {buyer_send.name} to {seller.name}. "
+                    f"{buyer.name} sent {sent_names} to {seller.name}. "
                     f"Model values: {buyer.name} {float(buyer_eval.get('net_value', 0.0)):+.2f}, "
                     f"{seller.name} {float(seller_eval.get('net_value', 0.0)):+.2f}."
                 ),
                 team="",
                 day=day,
             )
+            if len(buyer_sends) > 1:
+                # The seller took on an extra player; keep its active roster within the limit.
+                self._auto_send_down_for_overflow(seller)
+                self._call_up_after_consolidation(buyer, buyer_sends, seller_out, day=day)
             moves.append(
                 {
                     "type": "trade",
                     "buyer": buyer.name,
                     "seller": seller.name,
                     "buyer_gets": seller_out.name,
-                    "seller_gets": buyer_send.name,
+                    "seller_gets": sent_names,
                     "buyer_net": round(float(buyer_eval.get("net_value", 0.0)), 3),
                     "seller_net": round(float(seller_eval.get("net_value", 0.0)), 3),
                 }
@@ -2495,6 +2608,24 @@ class SimService:
             trade_count += 1
         return moves
 
+    def _call_up_after_consolidation(self, team: Team, sent: list[Player], received: Player, *, day: int) -> None:
+        # Fill the spot a 2-for-1 opened at the position group the incoming player does not cover.
+        filled = next(key for key in ("starter_g", "top4_d", "top6_f") if need_matches_position(key, received.position))
+        vacated = next((p for p in sent if not need_matches_position(filled, p.position)), sent[-1])
+        called = self._auto_callup_best_candidate(team, injured_position=vacated.position) or self._auto_callup_best_candidate(team)
+        if called is None:
+            return
+        called_name, _ = called
+        self.simulator.normalize_player_numbers()
+        team.set_default_lineup()
+        self._add_news(
+            kind="transaction",
+            headline=f"Transaction: {team.name} recalled {called_name}",
+            details=f"{called_name} was called up to fill the roster spot opened by trading {vacated.name}.",
+            team=team.name,
+            day=day,
+        )
+
     def _team_slug(self, team_name: str) -> str:
         return team_name.lower().replace(" ", "_")
 
@@ -2592,102 +2723,14 @@ class SimService:
         return next((p for p in candidates if p.exists()), None)
 
     def _standings_clinch_map(self) -> dict[str, list[str]]:
-        tags: dict[str, list[str]] = {team.name: [] for team in self.simulator.teams}
-        total_games = self.simulator._team_total_games()
-        standings = self.simulator.get_standings()
-        by_division: dict[str, list[TeamRecord]] = {}
-        by_conference: dict[str, list[TeamRecord]] = {}
-        for rec in standings:
-            by_division.setdefault(rec.team.division, []).append(rec)
-            by_conference.setdefault(rec.team.conference, []).append(rec)
-
-        def _qualified_playoff_teams_from_standings() -> set[str]:
-            qualified: set[str] = set()
-            for conference in self.simulator.get_conferences():
-                conf_rows = self.simulator.get_conference_standings(conference)
-                if not conf_rows:
-                    continue
-                divisions = sorted({row.team.division for row in conf_rows})
-                # NHL-style conference shape: 2 divisions => top 3 per division + 2 wildcards.
-                if len(divisions) == 2:
-                    div_a, div_b = divisions[0], divisions[1]
-                    a_rows = [r for r in conf_rows if r.team.division == div_a]
-                    b_rows = [r for r in conf_rows if r.team.division == div_b]
-                    a_top = a_rows[:3]
-                    b_top = b_rows[:3]
-                    qualified.update(r.team.name for r in a_top)
-                    qualified.update(r.team.name for r in b_top)
-                    remaining = [r for r in conf_rows if r.team.name not in qualified]
-                    qualified.update(r.team.name for r in remaining[:2])
-                else:
-                    # Fallback when conference/division layout is non-standard.
-                    qualified.update(r.team.name for r in conf_rows[: min(8, len(conf_rows))])
-            return qualified
-
-        # Keep standings tags in sync with actual playoff reality once playoffs are active.
-        if self.simulator.has_playoff_session() and isinstance(self.simulator.pending_playoffs, dict):
-            seeds = self.simulator.pending_playoffs.get("seeds", [])
-            if isinstance(seeds, list):
-                for row in seeds:
-                    if not isinstance(row, dict):
-                        continue
-                    team_name = str(row.get("team", "")).strip()
-                    if team_name:
-                        tags.setdefault(team_name, []).append("x")
-        elif self.simulator.is_complete():
-            for team_name in _qualified_playoff_teams_from_standings():
-                tags.setdefault(team_name, []).append("x")
-        else:
-            playoffs = self.simulator.get_playoff_clinch_status()
-            for team_name, clinched in playoffs.items():
-                if clinched:
-                    tags.setdefault(team_name, []).append("x")
-
-        for _div, rows in by_division.items():
-            if not rows:
-                continue
-            leader = rows[0]
-            leader_total = total_games.get(leader.team.name, leader.games_played)
-            leader_remaining = max(0, leader_total - leader.games_played)
-            leader_floor = leader.points + leader_remaining
-            can_be_caught = any(
-                (other.team.name != leader.team.name)
-                and ((other.points + (2 * max(0, total_games.get(other.team.name, other.games_played) - other.games_played))) >= leader_floor)
-                for other in rows
-            )
-            if not can_be_caught:
-                tags.setdefault(leader.team.name, []).append("y")
-
-        for _conf, rows in by_conference.items():
-            if not rows:
-                continue
-            leader = rows[0]
-            leader_total = total_games.get(leader.team.name, leader.games_played)
-            leader_remaining = max(0, leader_total - leader.games_played)
-            leader_floor = leader.points + leader_remaining
-            can_be_caught = any(
-                (other.team.name != leader.team.name)
-                and ((other.points + (2 * max(0, total_games.get(other.team.name, other.games_played) - other.games_played))) >= leader_floor)
-                for other in rows
-            )
-            if not can_be_caught:
-                tags.setdefault(leader.team.name, []).append("z")
-
-        if standings:
-            leader = standings[0]
-            leader_total = total_games.get(leader.team.name, leader.games_played)
-            leader_remaining = max(0, leader_total - leader.games_played)
-            leader_floor = leader.points + leader_remaining
-            can_be_caught = any(
-                (other.team.name != leader.team.name)
-                and ((other.points + (2 * max(0, total_games.get(other.team.name, other.games_played) - other.games_played))) >= leader_floor)
-                for other in standings
-            )
-            if not can_be_caught:
-                tags.setdefault(leader.team.name, []).append("p")
-        return tags
+        return self.simulator.get_clinch_tags()
 
-    def _record_to_dict(self, rec: TeamRecord, clinch_tags: dict[str, list[str]] | None = None) -> dict[str, Any]:
+    def _record_to_dict(
+        self,
+        rec: TeamRecord,
+        clinch_tags: dict[str, list[str]] | None = None,
+        magic_numbers: dict[str, int | None] | None = None,
+    ) -> dict[str, Any]:
         return {
             "team": rec.team.name,
             "logo_url": f"/api/team-logo/{self._team_slug(rec.team.name)}",
@@ -2708,6 +2751,7 @@ class SimService:
             "pp_pct": round(rec.pp_pct, 3),
             "pk_pct": round(rec.pk_pct, 3),
             "clinch": list((clinch_tags or {}).get(rec.team.name, [])),
+            "magic": (magic_numbers or {}).get(rec.team.name),
         }
 
     def _three_stars(self, game: GameResult) -> list[dict[str, str]]:
@@ -2963,25 +3007,69 @@ class SimService:
             )
         return out
 
-    def _player_to_dict(self, player: Player, team_goal_diff: float = 0.0) -> dict[str, Any]:
-        season_no = int(self.simulator.season_number)
-        carry_rows = [
-            row
-            for row in player.career_seasons
-            if isinstance(row, dict) and int(row.get("season", 0)) == season_no
-        ]
-        carry_gp = sum(int(r.get("gp", 0)) for r in carry_rows)
-        carry_g = sum(int(r.get("g", 0)) for r in carry_rows)
-        carry_a = sum(int(r.get("a", 0)) for r in carry_rows)
-        carry_p = sum(int(r.get("p", 0)) for r in carry_rows)
-        total_gp_raw = int(player.games_played) + carry_gp
-        total_g = int(player.goals) + carry_g
-        total_a = int(player.assists) + carry_a
-        total_p = int(player.points) + carry_p
+    def _serialize_game_scores(self, day_results: list[Any]) -> list[dict[str, Any]]:
+        out: list[dict[str, Any]] = []
+        for result in day_results:
+            home_rec = self.simulator._records.get(result.home.name)
+            away_rec = self.simulator._records.get(result.away.name)
+            out.append(
+                {
+                    "home": result.home.name,
+                    "away": result.away.name,
+                    "home_goals": result.home_goals,
+                    "away_goals": result.away_goals,
+                    "overtime": result.overtime,
+                    "home_record": (
+                        f"{home_rec.wins}-{home_rec.losses}-{home_rec.ot_losses}" if home_rec is not None else ""
+                    ),
+                    "away_record": (
+                        f"{away_rec.wins}-{away_rec.losses}-{away_rec.ot_losses}" if away_rec is not None else ""
+                    ),
+                    "home_goalie": result.home_goalie.name if result.home_goalie is not None else "",
+                    "away_goalie": result.away_goalie.name if result.away_goalie is not None else "",
+                }
+            )
+        return out
+
+    def _player_to_dict(
+        self,
+        player: Player,
+        team_goal_diff: float = 0.0,
+        fields: frozenset[str] | None = None,
+    ) -> dict[str, Any]:
+        country_code = str(player.birth_country_code or "CA").upper()
+        row: dict[str, Any] = {
+            "team": player.team_name,
+            "name": player.name,
+            "jersey_number": player.jersey_number,
+            "country": player.birth_country,
+            "country_code": country_code,
+            "flag": self._flag_emoji(country_code),
+            "age": player.age,
+            "position": player.position,
+        }
+        if fields is not None and fields.isdisjoint(self.PLAYER_TOTAL_FIELDS | self.PLAYER_DERIVED_FIELDS):
+            row["injured"] = player.is_injured
+            row["injured_games_remaining"] = player.injured_games_remaining
+            row["injury_status"] = player.injury_status
+            return project_fields(row, fields, keep=("team", "name"))
+
+        # Rows already split off this season by trades count toward the season line.
+        carry = self.simulator.career_aggregate(player).season_totals(int(self.simulator.season_number))
+        total_gp_raw = int(player.games_played) + carry["gp"]
+        total_g = int(player.goals) + carry["g"]
+        total_a = int(player.assists) + carry["a"]
+        total_p = int(player.points) + carry["p"]
+
+        if fields is not None and fields.isdisjoint(self.PLAYER_DERIVED_FIELDS):
+            row.update({"gp": total_gp_raw, "g": total_g, "a": total_a, "p": total_p})
+            row["injured"] = player.is_injured
+            row["injured_games_remaining"] = player.injured_games_remaining
+            row["injury_status"] = player.injury_status
+            return project_fields(row, fields, keep=("team", "name"))
 
         gp = max(1, total_gp_raw)
         position = player.position
-        country_code = str(player.birth_country_code or "CA").upper()
         shot_rate = 1.15 + player.shooting * 0.68 + (0.18 if position in {"C", "LW", "RW"} else (-0.22 if position == "D" else -0.65))
         shots = max(total_g, int(round(gp * max(0.4, shot_rate))))
         shot_pct = (total_g / shots * 100.0) if shots > 0 else 0.0
@@ -3017,15 +3105,7 @@ class SimService:
             toi_per_game = 0.0
             plus_minus = 0
             pim = 0
-        return {
-            "team": player.team_name,
-            "name": player.name,
-            "jersey_number": player.jersey_number,
-            "country": player.birth_country,
-            "country_code": country_code,
-            "flag": self._flag_emoji(country_code),
-            "age": player.age,
-            "position": player.position,
+        row.update({
             "gp": total_gp_raw,
             "g": total_g,
             "a": total_a,
@@ -3042,7 +3122,8 @@ class SimService:
             "injured": player.is_injured,
             "injured_games_remaining": player.injured_games_remaining,
             "injury_status": player.injury_status,
-        }
+        })
+        return project_fields(row, fields, keep=("team", "name"))
 
     def _cup_count(self, team_name: str) -> int:
         return sum(1 for s in self.simulator.season_history if self._season_champion(s) == team_name)
@@ -3170,25 +3251,16 @@ class SimService:
         return out
 
     def _goalie_to_dict(self, player: Player) -> dict[str, Any]:
+        aggregate = self.simulator.career_aggregate(player)
         season_no = int(self.simulator.season_number)
-        carry_rows = [
-            row
-            for row in player.career_seasons
-            if isinstance(row, dict) and int(row.get("season", 0)) == season_no
-        ]
-        carry_gp = sum(int(r.get("goalie_gp", 0)) for r in carry_rows)
-        carry_w = sum(int(r.get("goalie_w", 0)) for r in carry_rows)
-        carry_l = sum(int(r.get("goalie_l", 0)) for r in carry_rows)
-        carry_otl = sum(int(r.get("goalie_otl", 0)) for r in carry_rows)
-        carry_so = sum(int(r.get("goalie_so", 0)) for r in carry_rows)
-        total_gp = int(player.goalie_games) + carry_gp
-        total_w = int(player.goalie_wins) + carry_w
-        total_l = int(player.goalie_losses) + carry_l
-        total_otl = int(player.goalie_ot_losses) + carry_otl
-        total_so = int(player.goalie_shutouts) + carry_so
+        carry = aggregate.season_totals(season_no)
+        total_gp = int(player.goalie_games) + carry["goalie_gp"]
+        total_w = int(player.goalie_wins) + carry["goalie_w"]
+        total_l = int(player.goalie_losses) + carry["goalie_l"]
+        total_otl = int(player.goalie_ot_losses) + carry["goalie_otl"]
+        total_so = int(player.goalie_shutouts) + carry["goalie_so"]
         if total_gp > 0:
-            carry_gaa_weighted = sum(float(r.get("gaa", 0.0)) * max(1, int(r.get("goalie_gp", 0))) for r in carry_rows)
-            carry_sv_weighted = sum(float(r.get("sv_pct", 0.0)) * max(1, int(r.get("goalie_gp", 0))) for r in carry_rows)
+            carry_gaa_weighted, carry_sv_weighted = aggregate.season_weighted_rates(season_no)
             cur_gp = max(0, int(player.goalie_games))
             cur_gaa_weighted = float(player.gaa) * cur_gp
             cur_sv_weighted = float(player.save_pct) * cur_gp
@@ -3354,10 +3426,11 @@ class SimService:
 
     def _wildcard_rows(self, conference: str) -> list[dict[str, Any]]:
         clinch_tags = self._standings_clinch_map()
+        magic_numbers = self.simulator.get_playoff_magic_numbers()
         conf_rows = self.simulator.get_conference_standings(conference)
         divisions = sorted({r.team.division for r in conf_rows})
         if len(divisions) != 2:
-            return [self._record_to_dict(r, clinch_tags=clinch_tags) for r in conf_rows]
+            return [self._record_to_dict(r, clinch_tags=clinch_tags, magic_numbers=magic_numbers) for r in conf_rows]
 
         div_a, div_b = divisions[0], divisions[1]
         a_rows = [r for r in conf_rows if r.team.division == div_a]
@@ -3369,12 +3442,12 @@ class SimService:
 
         out: list[dict[str, Any]] = []
         out.append({"kind": "header", "label": f"{div_a} Top 3"})
-        out.extend([{"kind": "team", **self._record_to_dict(r, clinch_tags=clinch_tags)} for r in a_top])
+        out.extend([{"kind": "team", **self._record_to_dict(r, clinch_tags=clinch_tags, magic_numbers=magic_numbers)} for r in a_top])
         out.append({"kind": "header", "label": f"{div_b} Top 3"})
-        out.extend([{"kind": "team", **self._record_to_dict(r, clinch_tags=clinch_tags)} for r in b_top])
+        out.extend([{"kind": "team", **self._record_to_dict(r, clinch_tags=clinch_tags, magic_numbers=magic_numbers)} for r in b_top])
         out.append({"kind": "header", "label": "Wild Card"})
         for idx, r in enumerate(wild, start=1):
-            row = {"kind": "team", **self._record_to_dict(r, clinch_tags=clinch_tags)}
+            row = {"kind": "team", **self._record_to_dict(r, clinch_tags=clinch_tags, magic_numbers=magic_numbers)}
             row["wc"] = f"WC{idx}" if idx <= 2 else ""
             out.append(row)
             if idx == 2 and len(wild) > 2:
@@ -3387,7 +3460,7 @@ class SimService:
         user_team = self.simulator.get_team(self.user_team_name) if self.user_team_name else None
         in_playoffs = self.simulator.has_playoff_session()
         reg_total = self.simulator.total_days
-        playoff_total = len(self.simulator.pending_playoff_days)
+        playoff_total = self.simulator.playoff_total_days()
         playoff_day = int(self.simulator.pending_playoff_day_index)
         display_day = self.simulator.current_day
         display_total = reg_total
@@ -3423,15 +3496,16 @@ class SimService:
 
     def standings(self, mode: str, value: str | None) -> dict[str, Any]:
         clinch_tags = self._standings_clinch_map()
+        magic_numbers = self.simulator.get_playoff_magic_numbers()
         if mode == "conference":
             if not value:
                 raise HTTPException(status_code=400, detail="conference value is required")
-            rows = [self._record_to_dict(r, clinch_tags=clinch_tags) for r in self.simulator.get_conference_standings(value)]
+            rows = [self._record_to_dict(r, clinch_tags=clinch_tags, magic_numbers=magic_numbers) for r in self.simulator.get_conference_standings(value)]
             return {"mode": mode, "rows": rows}
         if mode == "division":
             if not value:
                 raise HTTPException(status_code=400, detail="division value is required")
-            rows = [self._record_to_dict(r, clinch_tags=clinch_tags) for r in self.simulator.get_division_standings(value)]
+            rows = [self._record_to_dict(r, clinch_tags=clinch_tags, magic_numbers=magic_numbers) for r in self.simulator.get_division_standings(value)]
             return {"mode": mode, "rows": rows}
         if mode == "wildcard":
             if not value:
@@ -3440,10 +3514,10 @@ class SimService:
                 }
                 return {"mode": mode, "groups": groups}
             return {"mode": mode, "rows": self._wildcard_rows(value)}
-        rows = [self._record_to_dict(r, clinch_tags=clinch_tags) for r in self.simulator.get_standings()]
+        rows = [self._record_to_dict(r, clinch_tags=clinch_tags, magic_numbers=magic_numbers) for r in self.simulator.get_standings()]
         return {"mode": "league", "rows": rows}
 
-    def players(self, scope: str, team: str | None) -> list[dict[str, Any]]:
+    def players(self, scope: str, team: str | None, fields: frozenset[str] | None = None) -> list[dict[str, Any]]:
         standings = {r.team.name: r for r in self.simulator.get_standings()}
         if scope == "team":
             if not team:
@@ -3453,6 +3527,7 @@ class SimService:
                 self._player_to_dict(
                     p,
                     team_goal_diff=(standings.get(p.team_name).goal_diff if standings.get(p.team_name) is not None else 0.0),
+                    fields=fields,
                 )
                 for p in rows
             ]
@@ -3461,6 +3536,7 @@ class SimService:
             self._player_to_dict(
                 p,
                 team_goal_diff=(standings.get(p.team_name).goal_diff if standings.get(p.team_name) is not None else 0.0),
+                fields=fields,
             )
             for p in rows
         ]
@@ -4317,24 +4393,45 @@ class SimService:
             score += 8
         return score
 
-    def playoff_data(self) -> dict[str, Any]:
+    def playoff_data(self, fields: frozenset[str] | None = None) -> dict[str, Any]:
+        # Dotted names ("playoffs.rounds") project keys of the nested bracket payload.
+        bracket_fields = (
+            frozenset(name.split(".", 1)[1] for name in fields if name.startswith("playoffs."))
+            if fields is not None
+            else None
+        )
+        top_fields = (
+            frozenset({name.split(".", 1)[0] for name in fields})
+            if fields is not None
+            else None
+        )
+
+        def _shape(payload: dict[str, Any]) -> dict[str, Any]:
+            if bracket_fields and isinstance(payload.get("playoffs"), dict):
+                payload["playoffs"] = project_fields(payload["playoffs"], bracket_fields)
+            return project_fields(payload, top_fields, keep=("source",))
+
         if isinstance(self.simulator.pending_playoffs, dict) and self.simulator.pending_playoffs:
-            return {
+            payload: dict[str, Any] = {
                 "source": "live",
                 "revealed_days": self.simulator.pending_playoff_day_index,
-                "total_days": len(self.simulator.pending_playoff_days),
+                "total_days": self.simulator.playoff_total_days(),
                 "playoffs": self.simulator.pending_playoffs,
             }
+            # Odds run a Monte Carlo over the bracket, so skip them unless requested.
+            if top_fields is None or "odds" in top_fields:
+                payload["odds"] = self.simulator.playoff_odds()
+            return _shape(payload)
         if self.simulator.season_history:
             latest = self.simulator.season_history[-1]
             raw = latest.get("playoffs", {})
             if isinstance(raw, dict) and raw:
-                return {
+                return _shape({
                     "source": "last_completed",
                     "season": latest.get("season"),
                     "playoffs": raw,
-                }
-        return {"source": "none", "playoffs": {}}
+                })
+        return _shape({"source": "none", "playoffs": {}})
 
     def _playoff_outcome_for_team(self, season: dict[str, object], team_name: str) -> tuple[str, str]:
         playoffs = season.get("playoffs", {})
@@ -4383,37 +4480,16 @@ class SimService:
     def _franchise_leaders(
         self, team_name: str
     ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
-        totals: dict[str, dict[str, Any]] = {}
-        for entry in self.simulator.hall_of_fame:
-            if str(entry.get("team_at_retirement", "")) != team_name:
-                continue
-            player_id = str(entry.get("player_id", entry.get("name", "")))
-            row = totals.setdefault(
-                player_id,
-                {
-                    "name": str(entry.get("name", "")),
-                    "g": int(entry.get("career_g", 0)),
-                    "a": int(entry.get("career_a", 0)),
-                    "p": int(entry.get("career_p", 0)),
-                    "w": int(entry.get("goalie_w", 0)),
-                    "status": "Retired",
-                },
-            )
-            row["g"] = max(int(row["g"]), int(entry.get("career_g", 0)))
-            row["a"] = max(int(row["a"]), int(entry.get("career_a", 0)))
-            row["p"] = max(int(row["p"]), int(entry.get("career_p", 0)))
-            row["w"] = max(int(row["w"]), int(entry.get("goalie_w", 0)))
+        totals = self.simulator.record_book().leader_candidates(team_name)
 
         team = self.simulator.get_team(team_name)
         if team is not None:
             for player in team.roster:
-                career_g = sum(int(s.get("g", 0)) for s in player.career_seasons if isinstance(s, dict)) + player.goals
-                career_a = sum(int(s.get("a", 0)) for s in player.career_seasons if isinstance(s, dict)) + player.assists
-                career_p = sum(int(s.get("p", 0)) for s in player.career_seasons if isinstance(s, dict)) + player.points
-                career_w = (
-                    sum(int(s.get("goalie_w", 0)) for s in player.career_seasons if isinstance(s, dict))
-                    + player.goalie_wins
-                )
+                career = self.simulator.career_aggregate(player).totals
+                career_g = career["g"] + player.goals
+                career_a = career["a"] + player.assists
+                career_p = career["p"] + player.points
+                career_w = career["goalie_w"] + player.goalie_wins
                 row = totals.setdefault(
                     player.player_id,
                     {"name": player.name, "g": 0, "a": 0, "p": 0, "w": 0, "status": "Retired"},
@@ -4461,52 +4537,20 @@ class SimService:
         return leaders
 
     def _career_player_totals(self) -> list[dict[str, Any]]:
-        rows: dict[str, dict[str, Any]] = {}
-
-        for entry in self.simulator.hall_of_fame:
-            if not isinstance(entry, dict):
-                continue
-            player_id = str(entry.get("player_id", "")).strip()
-            if not player_id:
-                continue
-            row = rows.setdefault(
-                player_id,
-                {
-                    "player_id": player_id,
-                    "name": str(entry.get("name", "")).strip(),
-                    "team": str(entry.get("team_at_retirement", "")).strip(),
-                    "position": str(entry.get("position", "")).strip(),
-                    "status": "Retired",
-                    "gp": 0,
-                    "g": 0,
-                    "a": 0,
-                    "p": 0,
-                    "pim": 0,
-                    "goalie_w": 0,
-                    "goalie_so": 0,
-                },
-            )
-            row["name"] = str(entry.get("name", row["name"])).strip()
-            row["team"] = str(entry.get("team_at_retirement", row["team"])).strip()
-            row["position"] = str(entry.get("position", row["position"])).strip()
-            row["gp"] = max(int(row["gp"]), int(entry.get("career_gp", 0)))
-            row["g"] = max(int(row["g"]), int(entry.get("career_g", 0)))
-            row["a"] = max(int(row["a"]), int(entry.get("career_a", 0)))
-            row["p"] = max(int(row["p"]), int(entry.get("career_p", 0)))
-            row["goalie_w"] = max(int(row["goalie_w"]), int(entry.get("goalie_w", 0)))
-            row["goalie_so"] = max(int(row["goalie_so"]), int(entry.get("goalie_so", 0)))
+        """Career rows for every active player plus the retired players who can still top a record table."""
+        rows = self.simulator.record_book().league_candidates()
 
         for team in self.simulator.teams:
             for player in [*team.roster, *team.minor_roster]:
                 pid = str(player.player_id)
-                season_rows = [s for s in player.career_seasons if isinstance(s, dict)]
-                gp = sum(int(s.get("gp", 0)) for s in season_rows) + int(player.games_played)
-                goals = sum(int(s.get("g", 0)) for s in season_rows) + int(player.goals)
-                assists = sum(int(s.get("a", 0)) for s in season_rows) + int(player.assists)
-                points = sum(int(s.get("p", 0)) for s in season_rows) + int(player.points)
-                pim = sum(int(s.get("pim", 0)) for s in season_rows)
-                goalie_w = sum(int(s.get("goalie_w", 0)) for s in season_rows) + int(player.goalie_wins)
-                goalie_so = sum(int(s.get("goalie_so", 0)) for s in season_rows) + int(player.goalie_shutouts)
+                career = self.simulator.career_aggregate(player).totals
+                gp = career["gp"] + int(player.games_played)
+                goals = career["g"] + int(player.goals)
+                assists = career["a"] + int(player.assists)
+                points = career["p"] + int(player.points)
+                pim = career["pim"]
+                goalie_w = career["goalie_w"] + int(player.goalie_wins)
+                goalie_so = career["goalie_so"] + int(player.goalie_shutouts)
 
                 row = rows.setdefault(
                     pid,
@@ -4543,7 +4587,7 @@ class SimService:
         selected = str(team_name).strip()
         if not selected:
             return []
-        rows: dict[str, dict[str, Any]] = {}
+        rows = self.simulator.record_book().franchise_candidates(selected)
 
         def _upsert(
             pid: str,
@@ -4589,42 +4633,17 @@ class SimService:
             row["goalie_w"] = max(int(row["goalie_w"]), int(goalie_w))
             row["goalie_so"] = max(int(row["goalie_so"]), int(goalie_so))
 
-        for entry in self.simulator.hall_of_fame:
-            if not isinstance(entry, dict):
-                continue
-            pid = str(entry.get("player_id", "")).strip()
-            if not pid:
-                continue
-            seasons = [s for s in entry.get("seasons", []) if isinstance(s, dict)]
-            team_rows = [s for s in seasons if str(s.get("team", "")).strip() == selected]
-            if not team_rows:
-                continue
-            _upsert(
-                pid=pid,
-                name=str(entry.get("name", "")).strip(),
-                position=str(entry.get("position", "")).strip(),
-                status="Retired",
-                gp=sum(int(s.get("gp", 0)) for s in team_rows),
-                g=sum(int(s.get("g", 0)) for s in team_rows),
-                a=sum(int(s.get("a", 0)) for s in team_rows),
-                p=sum(int(s.get("p", 0)) for s in team_rows),
-                pim=sum(int(s.get("pim", 0)) for s in team_rows),
-                goalie_w=sum(int(s.get("goalie_w", 0)) for s in team_rows),
-                goalie_so=sum(int(s.get("goalie_so", 0)) for s in team_rows),
-            )
-
         for team in self.simulator.teams:
             for player in [*team.roster, *team.minor_roster]:
                 pid = str(player.player_id)
-                season_rows = [s for s in player.career_seasons if isinstance(s, dict)]
-                team_rows = [s for s in season_rows if str(s.get("team", "")).strip() == selected]
-                gp = sum(int(s.get("gp", 0)) for s in team_rows)
-                goals = sum(int(s.get("g", 0)) for s in team_rows)
-                assists = sum(int(s.get("a", 0)) for s in team_rows)
-                points = sum(int(s.get("p", 0)) for s in team_rows)
-                pim = sum(int(s.get("pim", 0)) for s in team_rows)
-                goalie_w = sum(int(s.get("goalie_w", 0)) for s in team_rows)
-                goalie_so = sum(int(s.get("goalie_so", 0)) for s in team_rows)
+                team_totals = self.simulator.career_aggregate(player).team_totals(selected)
+                gp = team_totals["gp"]
+                goals = team_totals["g"]
+                assists = team_totals["a"]
+                points = team_totals["p"]
+                pim = team_totals["pim"]
+                goalie_w = team_totals["goalie_w"]
+                goalie_so = team_totals["goalie_so"]
                 if str(player.team_name).strip() == selected:
                     gp += int(player.games_played)
                     goals += int(player.goals)
@@ -4648,10 +4667,18 @@ class SimService:
 
         return list(rows.values())
 
-    def records(self, team_name: str | None = None) -> dict[str, Any]:
+    def records(self, team_name: str | None = None, fields: frozenset[str] | None = None) -> dict[str, Any]:
         selected_team = (team_name or self.user_team_name).strip()
-        all_rows = self._career_player_totals()
-
+        want_league = fields is None or "league" in fields
+        want_franchise = fields is None or "franchise" in fields
+        all_rows = self._career_player_totals() if want_league else []
+        franchise_rows = self._career_player_totals_for_team(selected_team) if selected_team and want_franchise else []
+        payload = {"team": selected_team, **self._record_tables(all_rows, franchise_rows)}
+        return project_fields(payload, fields, keep=("team",))
+
+    def _record_tables(
+        self, all_rows: list[dict[str, Any]], franchise_rows: list[dict[str, Any]]
+    ) -> dict[str, list[dict[str, Any]]]:
         categories = [
             ("career_goals", "Career Goals", "g"),
             ("career_assists", "Career Assists", "a"),
@@ -4691,7 +4718,6 @@ class SimService:
             for key, label, stat in categories
         ]
 
-        franchise_rows = self._career_player_totals_for_team(selected_team) if selected_team else []
         franchise_tables = [
             {
                 "key": key,
@@ -4700,12 +4726,7 @@ class SimService:
             }
             for key, label, stat in categories
         ]
-
-        return {
-            "team": selected_team,
-            "league": league_tables,
-            "franchise": franchise_tables,
-        }
+        return {"league": league_tables, "franchise": franchise_tables}
 
     def _all_active_players(self) -> list[Player]:
         players: list[Player] = []
@@ -4814,9 +4835,9 @@ class SimService:
         }
 
     def _record_chases(self, team_name: str) -> dict[str, list[dict[str, Any]]]:
-        records_payload = self.records(team_name=team_name)
         all_totals = self._career_player_totals()
         team_totals = self._career_player_totals_for_team(team_name)
+        records_payload = self._record_tables(all_totals, team_totals)
         stat_map = {
             "career_goals": ("g", 25),
             "career_assists": ("a", 30),
@@ -4954,30 +4975,6 @@ class SimService:
         banners: list[dict[str, Any]] = []
         seen: set[tuple[int, str, str]] = set()
 
-        def _retired_year_range(player_name: str) -> tuple[int, int] | None:
-            if not player_name:
-                return None
-            seasons: list[int] = []
-            for entries in self.simulator.career_history.values():
-                if not isinstance(entries, list):
-                    continue
-                for row in entries:
-                    if not isinstance(row, dict):
-                        continue
-                    if str(row.get("name", "")).strip() != player_name:
-                        continue
-                    if str(row.get("team", "")).strip() != selected_team:
-                        continue
-                    raw_season = row.get("season")
-                    try:
-                        season_no = int(raw_season)
-                    except (TypeError, ValueError):
-                        continue
-                    if season_no > 0:
-                        seasons.append(season_no)
-            if not seasons:
-                return None
-            return min(seasons), max(seasons)
         for season in self.simulator.season_history:
             if not isinstance(season, dict):
                 continue
@@ -5058,7 +5055,7 @@ class SimService:
                 if key in seen:
                     continue
                 seen.add(key)
-                yr = _retired_year_range(player)
+                yr = self.simulator.team_season_range(player, selected_team)
                 banners.append(
                     {
                         "season": season_no,
@@ -5169,13 +5166,16 @@ class SimService:
             )
         return rows
 
-    def franchise(self, team_name: str) -> dict[str, Any]:
+    def franchise(self, team_name: str, fields: frozenset[str] | None = None) -> dict[str, Any]:
         team = self.simulator.get_team(team_name)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
 
+        def _wants(key: str) -> bool:
+            return fields is None or key in fields
+
         history_rows: list[dict[str, Any]] = []
-        for season in self.simulator.season_history:
+        for season in self.simulator.season_history if _wants("history") else []:
             standings = season.get("standings", [])
             if not isinstance(standings, list):
                 continue
@@ -5211,7 +5211,7 @@ class SimService:
             )
 
         coach_rows: list[dict[str, Any]] = []
-        for season in self.simulator.season_history:
+        for season in self.simulator.season_history if _wants("coaches") else []:
             coaches = season.get("coaches", [])
             if not isinstance(coaches, list):
                 continue
@@ -5238,7 +5238,8 @@ class SimService:
 
         retired_rows: list[dict[str, Any]] = []
         draft_rows: list[dict[str, Any]] = []
-        for season in reversed(self.simulator.season_history):
+        scan_seasons = _wants("retired") or _wants("draft_picks")
+        for season in reversed(self.simulator.season_history) if scan_seasons else []:
             season_no = int(season.get("season", 0))
             retired = season.get("retired", [])
             if isinstance(retired, list):
@@ -5270,10 +5271,10 @@ class SimService:
                             }
                         )
 
-        leaders_p, leaders_g, leaders_a, leaders_w = self._franchise_leaders(team_name)
-        return {
+        leaders_p, leaders_g, leaders_a, leaders_w = self._franchise_leaders(team_name) if _wants("leaders") else ([], [], [], [])
+        payload = {
             "team": team_name,
-            "cup_count": self._cup_count(team_name),
+            "cup_count": self._cup_count(team_name) if _wants("cup_count") else 0,
             "history": history_rows,
             "leaders": {
                 "points": leaders_p,
@@ -5285,10 +5286,13 @@ class SimService:
             "retired": retired_rows[:60],
             "draft_picks": draft_rows[:120],
         }
+        return project_fields(payload, fields, keep=("team",))
 
-    def advance(self) -> dict[str, Any]:
+    def advance(self, detail: str = "full") -> dict[str, Any]:
         if not self.user_team_name:
             raise HTTPException(status_code=400, detail="No user team selected")
+        # "minimal" is the fast-forward mode: no box scores, attendance, commentary or daily news.
+        minimal = detail == "minimal"
 
         self._returning_soon_inbox(day_num=self.simulator.current_day)
 
@@ -5339,6 +5343,7 @@ class SimService:
                 user_strategy=self.user_strategy,
                 use_user_lines=self.override_coach_for_lines,
                 use_user_strategy=self.override_coach_for_strategy,
+                detail="minimal" if minimal else "full",
             )
             self._validate_one_day_gp_progression(gp_before, day_num)
             user_team_after = self._user_team()
@@ -5349,11 +5354,15 @@ class SimService:
                     prev_left = int(injury_before.get(p.name, 0))
                     if prev_left > 0 and int(p.injured_games_remaining) <= 0:
                         returned_players.append(p.name)
-            self._injury_news_from_results(day_num=day_num, results=results)
+            if not minimal:
+                self._injury_news_from_results(day_num=day_num, results=results)
             self._injury_inbox_from_results(day_num=day_num, results=results)
             self._log_auto_roster_transactions(before=roster_before, day_num=day_num)
-            self._emit_milestone_news(day_num=day_num)
-            serialized = self._serialize_games(results)
+            if minimal:
+                serialized = self._serialize_game_scores(results)
+            else:
+                self._emit_milestone_news(day_num=day_num)
+                serialized = self._serialize_games(results)
             self.daily_results = [
                 d
                 for d in self.daily_results
@@ -5370,9 +5379,14 @@ class SimService:
                     "games": serialized,
                 }
             )
-            if day_num % 7 == 0:
+            if day_num % 7 == 0 and not minimal:
                 self._generate_weekly_inbox(day_num=day_num)
             gm_moves = self._cpu_gm_review(day=day_num, phase="regular")
+            self.events.publish(
+                "games",
+                {"season": self.simulator.season_number, "day": day_num, "phase": "regular", "games": serialized},
+            )
+            self._publish_standings_snapshot(day_num=day_num, phase="regular")
             self._save_runtime_state()
             return {
                 "phase": "regular",
@@ -5410,7 +5424,18 @@ class SimService:
                     "games": serialized,
                 }
             )
-            self._emit_milestone_news(day_num=day_no)
+            if not minimal:
+                self._emit_milestone_news(day_num=day_no)
+            self.events.publish(
+                "games",
+                {
+                    "season": self.simulator.season_number,
+                    "day": day_no,
+                    "phase": "playoffs",
+                    "round": round_name,
+                    "games": serialized,
+                },
+            )
             self._save_runtime_state()
             return {
                 "phase": "playoffs",
@@ -5437,18 +5462,29 @@ class SimService:
         free_agency = offseason.get("free_agency", {})
         if isinstance(free_agency, dict):
             self._free_agency_news_from_offseason(completed_season=completed, free_agency=free_agency)
+        self._published_standings = {}
+        self.events.publish(
+            "season",
+            {
+                "completed_season": offseason.get("completed_season"),
+                "next_season": offseason.get("next_season"),
+                "champion": offseason.get("champion"),
+            },
+        )
+        self._publish_standings_snapshot(day_num=0, phase="regular")
         self._save_runtime_state()
         return {
             "phase": "offseason",
             "completed_season": offseason.get("completed_season"),
             "next_season": offseason.get("next_season"),
             "champion": offseason.get("champion"),
+            "stages": offseason.get("stages", []),
         }
 
     def day_board(self, day: int) -> dict[str, Any]:
         season = self.simulator.season_number
         in_playoffs = self.simulator.has_playoff_session()
-        total_days = len(self.simulator.pending_playoff_days) if in_playoffs else self.simulator.total_days
+        total_days = self.simulator.playoff_total_days() if in_playoffs else self.simulator.total_days
         completed_days = len(
             [
                 d
@@ -5489,11 +5525,19 @@ class SimService:
         if in_playoffs:
             pending = self.simulator.pending_playoff_days
             idx = safe_day - 1
-            if 0 <= idx < len(pending):
-                day_row = pending[idx]
+            upcoming = self.simulator.upcoming_playoff_day() if idx == len(pending) else None
+            if 0 <= idx < len(pending) or upcoming is not None:
+                day_row = pending[idx] if idx < len(pending) else upcoming
                 round_name = str(day_row.get("round", "Playoffs"))
                 raw_games = day_row.get("games", [])
-                games = self._serialize_playoff_games(raw_games if isinstance(raw_games, list) else [], round_name)
+                if upcoming is not None:
+                    # The next playoff day is only paired, not played yet.
+                    games = [
+                        {"home": str(g.get("home", "")), "away": str(g.get("away", "")), "game": int(g.get("game", 0))}
+                        for g in raw_games
+                    ]
+                else:
+                    games = self._serialize_playoff_games(raw_games if isinstance(raw_games, list) else [], round_name)
                 return {
                     "season": season,
                     "day": safe_day,
@@ -5506,15 +5550,15 @@ class SimService:
                 }
 
         day_idx = safe_day - 1
-        if 0 <= day_idx < len(self.simulator._season_days):
-            games = self.simulator._season_days[day_idx]
+        schedule = self.simulator.schedule
+        if 0 <= day_idx < schedule.total_days:
             return {
                 "season": season,
                 "day": safe_day,
                 "total_days": total_days,
                 "completed_days": completed_days,
                 "status": "scheduled",
-                "games": [{"home": home.name, "away": away.name} for home, away in games],
+                "games": [{"home": home, "away": away} for home, away in schedule.games_on(day_idx)],
             }
         return {
             "season": season,
@@ -5584,19 +5628,12 @@ class SimService:
 
         regular_day_offset = max(0, int(self.simulator.current_day) - int(self.simulator._day_index) - 1)
         schedule_by_day: dict[int, dict[str, Any]] = {}
-        for idx, day_games in enumerate(self.simulator._season_days):
+        for idx, home_name, away_name in self.simulator.schedule.team_games(team.name):
             game_day = regular_day_offset + idx + 1
-            team_pair: tuple[Team, Team] | None = next(
-                ((home, away) for home, away in day_games if home.name == team.name or away.name == team.name),
-                None,
-            )
-            if team_pair is None:
-                continue
-            home, away = team_pair
             schedule_by_day[game_day] = {
                 "game_day": game_day,
-                "home": home.name,
-                "away": away.name,
+                "home": home_name,
+                "away": away_name,
                 "status": "scheduled",
             }
         for game_day, played in played_team_games_by_day.items():
@@ -5639,6 +5676,7 @@ class SimService:
                     played_playoff_games[playoff_day] = row
                     break
             pending = self.simulator.pending_playoff_days
+            upcoming_day = self.simulator.upcoming_playoff_day()
             for day_idx, day_row in enumerate(pending, start=1):
                 round_name = str(day_row.get("round", "Playoffs"))
                 serialized = self._serialize_playoff_games(
@@ -5661,6 +5699,23 @@ class SimService:
                 row["round"] = round_name
                 row["game_day"] = absolute_day
                 full_team_schedule.append(row)
+            if upcoming_day is not None:
+                team_game = next(
+                    (g for g in upcoming_day.get("games", []) if team.name in (g.get("home"), g.get("away"))),
+                    None,
+                )
+                if team_game is not None:
+                    full_team_schedule.append(
+                        {
+                            "home": str(team_game.get("home", "")),
+                            "away": str(team_game.get("away", "")),
+                            "game": int(team_game.get("game", 0)),
+                            "status": "scheduled",
+                            "phase": "playoffs",
+                            "round": str(upcoming_day.get("round", "Playoffs")),
+                            "game_day": regular_total_days + len(pending) + 1,
+                        }
+                    )
             full_team_schedule.sort(key=lambda r: int(r.get("game_day", 0)))
 
         upcoming_game: dict[str, Any] | None = None
@@ -5668,35 +5723,24 @@ class SimService:
         upcoming_phase = "regular"
         upcoming_round: str | None = None
         if self.simulator.has_playoff_session():
-            pending = self.simulator.pending_playoff_days
-            start_idx = int(self.simulator.pending_playoff_day_index)
-            for day_idx in range(start_idx, len(pending)):
-                day_row = pending[day_idx]
-                round_name = str(day_row.get("round", "Playoffs"))
-                serialized = self._serialize_playoff_games(
-                    day_row.get("games", []) if isinstance(day_row.get("games", []), list) else [],
-                    round_name,
-                )
+            # Later playoff days are not paired until the games before them are played.
+            upcoming_day = self.simulator.upcoming_playoff_day()
+            if upcoming_day is not None:
                 game = next(
-                    (g for g in serialized if str(g.get("home", "")) == team.name or str(g.get("away", "")) == team.name),
+                    (g for g in upcoming_day.get("games", []) if team.name in (g.get("home"), g.get("away"))),
                     None,
                 )
                 if game is not None:
-                    upcoming_game = game
-                    upcoming_game_day = day_idx + 1
+                    upcoming_game = {"home": str(game.get("home", "")), "away": str(game.get("away", "")), "game": int(game.get("game", 0))}
+                    upcoming_game_day = int(self.simulator.pending_playoff_day_index) + 1
                     upcoming_phase = "playoffs"
-                    upcoming_round = round_name
-                    break
+                    upcoming_round = str(upcoming_day.get("round", "Playoffs"))
         else:
-            for idx in range(int(self.simulator._day_index), len(self.simulator._season_days)):
-                day_games = self.simulator._season_days[idx]
-                for home, away in day_games:
-                    if home.name == team.name or away.name == team.name:
-                        upcoming_game = {"home": home.name, "away": away.name}
-                        upcoming_game_day = regular_day_offset + idx + 1
-                        break
-                if upcoming_game is not None:
-                    break
+            next_game = self.simulator.schedule.next_game(team.name, int(self.simulator._day_index))
+            if next_game is not None:
+                idx, home_name, away_name = next_game
+                upcoming_game = {"home": home_name, "away": away_name}
+                upcoming_game_day = regular_day_offset + idx + 1
 
         payload: dict[str, Any] = {
             "team": team.name,
@@ -5757,7 +5801,7 @@ class SimService:
             payload["playoffs"] = {
                 "active": True,
                 "day": seen,
-                "total_days": len(pending_days),
+                "total_days": self.simulator.playoff_total_days(),
                 "latest_team_game_day": latest_playoff_day if latest_playoff_day > 0 else None,
                 "latest_team_game": latest_team_playoff_game,
             }
@@ -5902,6 +5946,7 @@ class SimService:
         )
         temp.reset_persistent_history()
         self._init_fresh_state()
+        self.bump_generation()
         try:
             self.runtime_state_path.unlink(missing_ok=True)
         except OSError:
@@ -5969,6 +6014,22 @@ class SimService:
         }
 
 
+class EventStreamSafeGZipMiddleware(GZipMiddleware):
+    """GZip that passes the event stream through untouched.
+
+    A compressor buffers output, which would hold server-sent events back from
+    clients. Only newer Starlette releases skip text/event-stream on their own.
+    """
+
+    STREAM_PATHS = frozenset({"/api/stream"})
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope.get("path") in self.STREAM_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 service = SimService()
 app = FastAPI(title="Hockey Sim API", version="0.1.0")
 app.add_middleware(
@@ -5978,6 +6039,35 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Small JSON bodies are not worth the CPU; league tables and history payloads are.
+app.add_middleware(EventStreamSafeGZipMiddleware, minimum_size=1024)
+
+
+@app.middleware("http")
+async def bump_generation_on_write(request: Request, call_next):
+    if request.method in {"GET", "HEAD", "OPTIONS"}:
+        return await call_next(request)
+    # Any non-GET route may mutate league or runtime state outside the save paths, so
+    # reads are not cached while it runs and the generation moves on both sides of it.
+    service.begin_write()
+    try:
+        return await call_next(request)
+    finally:
+        service.end_write()
+
+
+def _cached_json(request: Request, endpoint: str, params: tuple[Any, ...], builder: Callable[[], Any]) -> Response:
+    with service._lock:
+        etag, body = service.cached_response(endpoint, params, builder)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _json_bytes_response(payload: Any) -> Response:
+    return Response(content=encode_json_bytes(payload), media_type="application/json")
 
 
 @app.get("/api/health")
@@ -5992,9 +6082,13 @@ def meta() -> dict[str, Any]:
 
 
 @app.get("/api/standings")
-def standings(mode: str = "league", value: str | None = None) -> dict[str, Any]:
-    with service._lock:
-        return service.standings(mode=mode.lower(), value=value)
+def standings(request: Request, mode: str = "league", value: str | None = None) -> Response:
+    return _cached_json(
+        request,
+        "standings",
+        (mode.lower(), value),
+        lambda: service.standings(mode=mode.lower(), value=value),
+    )
 
 
 @app.post("/api/user-team")
@@ -6043,18 +6137,75 @@ def set_game_mode(payload: GameModeSelection) -> dict[str, Any]:
         return service.set_game_mode(mode=payload.mode)
 
 
+def _reject_while_job_running() -> None:
+    job = service.jobs.active_job()
+    if job is not None:
+        raise HTTPException(status_code=409, detail=f"Simulation job {job.id} is running; cancel it or wait for it to finish")
+
+
 @app.post("/api/advance")
 def advance() -> dict[str, Any]:
+    _reject_while_job_running()
     with service._lock:
         return service.advance()
 
 
 @app.post("/api/reset")
 def reset() -> dict[str, Any]:
+    _reject_while_job_running()
     with service._lock:
         return service.reset()
 
 
+@app.get("/api/stream")
+async def stream(request: Request) -> StreamingResponse:
+    subscriber = service.events.subscribe()
+
+    async def event_source():
+        idle_ticks = 0
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                batch = subscriber.drain()
+                if batch:
+                    idle_ticks = 0
+                    yield "".join(format_sse(event) for event in batch)
+                    continue
+                idle_ticks += 1
+                if idle_ticks % 60 == 0:
+                    # Comment line keeps proxies from closing quiet connections.
+                    yield ": keepalive\n\n"
+                await asyncio.sleep(0.25)
+        finally:
+            service.events.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/jobs/sim")
+def start_sim_job(payload: SimJobSelection) -> dict[str, Any]:
+    return service.jobs.submit(target=payload.target, day=payload.day, seasons=payload.seasons, detail=payload.detail)
+
+
+@app.get("/api/jobs")
+def sim_jobs() -> list[dict[str, Any]]:
+    return service.jobs.list_jobs()
+
+
+@app.get("/api/jobs/{job_id}")
+def sim_job(job_id: str) -> dict[str, Any]:
+    return service.jobs.get(job_id)
+
+
+@app.post("/api/jobs/{job_id}/cancel")
+def cancel_sim_job(job_id: str) -> dict[str, Any]:
+    return service.jobs.cancel(job_id)
+
+
 @app.get("/api/inbox")
 def inbox(resolved: bool = False, limit: int = 60) -> list[dict[str, Any]]:
     with service._lock:
@@ -6096,16 +6247,42 @@ def team_logo(team_slug: str):
     return FileResponse(path)
 
 
+def _table_builder(rows_builder: Callable[[], list[dict[str, Any]]], table_format: str) -> Callable[[], Any]:
+    if table_format.lower() == "columns":
+        return lambda: rows_to_columns(rows_builder())
+    return rows_builder
+
+
 @app.get("/api/players")
-def players(scope: str = "league", team: str | None = None) -> list[dict[str, Any]]:
-    with service._lock:
-        return service.players(scope=scope.lower(), team=team)
+def players(
+    request: Request,
+    scope: str = "league",
+    team: str | None = None,
+    table_format: str = Query("rows", alias="format"),
+    fields: str | None = None,
+) -> Response:
+    selected = parse_fields(fields)
+    return _cached_json(
+        request,
+        "players",
+        (scope.lower(), team, table_format.lower(), selected),
+        _table_builder(lambda: service.players(scope=scope.lower(), team=team, fields=selected), table_format),
+    )
 
 
 @app.get("/api/goalies")
-def goalies(scope: str = "league", team: str | None = None) -> list[dict[str, Any]]:
-    with service._lock:
-        return service.goalies(scope=scope.lower(), team=team)
+def goalies(
+    request: Request,
+    scope: str = "league",
+    team: str | None = None,
+    table_format: str = Query("rows", alias="format"),
+) -> Response:
+    return _cached_json(
+        request,
+        "goalies",
+        (scope.lower(), team, table_format.lower()),
+        _table_builder(lambda: service.goalies(scope=scope.lower(), team=team), table_format),
+    )
 
 
 @app.get("/api/minor-league")
@@ -6197,45 +6374,52 @@ def player_career(team: str, name: str) -> dict[str, Any]:
 
 
 @app.get("/api/playoffs")
-def playoffs() -> dict[str, Any]:
+def playoffs(fields: str | None = None) -> Response:
     with service._lock:
-        return service.playoff_data()
+        return _json_bytes_response(service.playoff_data(fields=parse_fields(fields)))
 
 
 @app.get("/api/franchise")
-def franchise(team: str) -> dict[str, Any]:
-    with service._lock:
-        return service.franchise(team_name=team)
+def franchise(request: Request, team: str, fields: str | None = None) -> Response:
+    selected = parse_fields(fields)
+    return _cached_json(
+        request,
+        "franchise",
+        (team, selected),
+        lambda: service.franchise(team_name=team, fields=selected),
+    )
 
 
 @app.get("/api/records")
-def records(team: str | None = None) -> dict[str, Any]:
-    with service._lock:
-        return service.records(team_name=team)
+def records(request: Request, team: str | None = None, fields: str | None = None) -> Response:
+    selected = parse_fields(fields)
+    return _cached_json(
+        request,
+        "records",
+        (team, selected),
+        lambda: service.records(team_name=team, fields=selected),
+    )
 
 
 @app.get("/api/awards")
-def awards(team: str | None = None) -> dict[str, Any]:
-    with service._lock:
-        return service.awards(team_name=team)
+def awards(request: Request, team: str | None = None) -> Response:
+    return _cached_json(request, "awards", (team,), lambda: service.awards(team_name=team))
 
 
 @app.get("/api/banners")
-def banners(team: str | None = None) -> dict[str, Any]:
-    with service._lock:
-        return service.banners(team_name=team)
+def banners(request: Request, team: str | None = None) -> Response:
+    return _cached_json(request, "banners", (team,), lambda: service.banners(team_name=team))
 
 
 @app.get("/api/cup-history")
-def cup_history() -> list[dict[str, Any]]:
-    with service._lock:
-        return service.cup_history()
+def cup_history(request: Request) -> Response:
+    return _cached_json(request, "cup_history", (), service.cup_history)
 
 
 @app.get("/api/day-board")
-def day_board(day: int = 0) -> dict[str, Any]:
+def day_board(day: int = 0) -> Response:
     with service._lock:
-        return service.day_board(day=day)
+        return _json_bytes_response(service.day_board(day=day))
 
 
 @app.get("/api/home")
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+# Counting stats summed across career-season rows.
+CAREER_STAT_KEYS = (
+    "gp",
+    "g",
+    "a",
+    "p",
+    "pim",
+    "injuries",
+    "games_missed",
+    "goalie_gp",
+    "goalie_w",
+    "goalie_l",
+    "goalie_otl",
+    "goalie_so",
+)
+# Longest trailing window kept per player; offseason injury wear looks back three seasons.
+RECENT_SEASONS = 3
+
+
+def _empty_totals() -> dict[str, int]:
+    return {key: 0 for key in CAREER_STAT_KEYS}
+
+
+@dataclass(slots=True)
+class CareerAggregate:
+    """Running sums over one player's `career_seasons` rows.
+
+    `source` is the list the sums were built from; the aggregate is current
+    while that same list still has `count` rows. Non-dict rows are skipped,
+    as the career views always did.
+    """
+
+    source: list[Any]
+    count: int = 0
+    totals: dict[str, int] = field(default_factory=_empty_totals)
+    by_team: dict[str, dict[str, int]] = field(default_factory=dict)
+    by_season: dict[int, dict[str, int]] = field(default_factory=dict)
+    team_seasons: dict[str, int] = field(default_factory=dict)
+    recent: deque[dict[str, int]] = field(default_factory=lambda: deque(maxlen=RECENT_SEASONS))
+    seasons_played: int = 0
+    first_season: int | None = None
+    last_season: int | None = None
+    undated_seasons: int = 0
+    # Goalie rate stats weighted by max(1, goalie_gp), as the hall of fame averages them.
+    weighted_gaa: float = 0.0
+    weighted_sv_pct: float = 0.0
+    # The same weighted sums per season, as (gaa, sv_pct).
+    season_weighted: dict[int, list[float]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, seasons: list[Any]) -> CareerAggregate:
+        aggregate = cls(source=seasons)
+        for row in seasons:
+            aggregate._add(row)
+        aggregate.count = len(seasons)
+        return aggregate
+
+    def is_current(self, seasons: list[Any]) -> bool:
+        return self.source is seasons and self.count == len(seasons)
+
+    def append(self, row: Any) -> None:
+        """Account for `row` once it has been appended to the tracked list."""
+        self._add(row)
+        self.count += 1
+
+    def recent_total(self, key: str, seasons: int = RECENT_SEASONS) -> int:
+        if seasons <= 0:
+            return 0
+        return sum(row[key] for row in list(self.recent)[-seasons:])
+
+    def team_totals(self, team_name: str) -> dict[str, int]:
+        return self.by_team.get(team_name) or _empty_totals()
+
+    def season_totals(self, season: int) -> dict[str, int]:
+        return self.by_season.get(season) or _empty_totals()
+
+    def season_weighted_rates(self, season: int) -> tuple[float, float]:
+        weighted = self.season_weighted.get(season)
+        return (weighted[0], weighted[1]) if weighted is not None else (0.0, 0.0)
+
+    def _add(self, row: Any) -> None:
+        if not isinstance(row, dict):
+            return
+        values = {key: int(row.get(key, 0)) for key in CAREER_STAT_KEYS}
+        team = str(row.get("team", "")).strip()
+        season = int(row.get("season", 0))
+        team_totals = self.by_team.get(team)
+        if team_totals is None:
+            team_totals = self.by_team[team] = _empty_totals()
+        season_totals = self.by_season.get(season)
+        if season_totals is None:
+            season_totals = self.by_season[season] = _empty_totals()
+        totals = self.totals
+        for key, value in values.items():
+            totals[key] += value
+            team_totals[key] += value
+            season_totals[key] += value
+        self.team_seasons[team] = self.team_seasons.get(team, 0) + 1
+        self.recent.append(values)
+        self.seasons_played += 1
+        if "season" in row:
+            self.first_season = season if self.first_season is None else min(self.first_season, season)
+            self.last_season = season if self.last_season is None else max(self.last_season, season)
+        else:
+            self.undated_seasons += 1
+        weight = max(1, values["goalie_gp"])
+        gaa_weighted = float(row.get("gaa", 0.0)) * weight
+        sv_weighted = float(row.get("sv_pct", 0.0)) * weight
+        self.weighted_gaa += gaa_weighted
+        self.weighted_sv_pct += sv_weighted
+        season_weighted = self.season_weighted.get(season)
+        if season_weighted is None:
+            season_weighted = self.season_weighted[season] = [0.0, 0.0]
+        season_weighted[0] += gaa_weighted
+        season_weighted[1] += sv_weighted
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+from itertools import combinations
+from typing import Iterable, Sequence
+
+from .models import Team, TeamRecord
+
+DIVISION_SLOTS = 3
+WILDCARD_SLOTS = 2
+CONFERENCE_SLOTS = 8
+# Exact scenario searches enumerate subsets of undecided rivals; beyond this the
+# simple independent-maximum bounds are used (they never produce a wrong tag).
+MAX_EXACT_RIVALS = 12
+
+
+def _max_flow(capacity: dict[str, dict[str, int]], source: str, sink: str) -> int:
+    flow = 0
+    while True:
+        parents: dict[str, str] = {source: source}
+        queue = [source]
+        for node in queue:
+            if node == sink:
+                break
+            for nxt, cap in capacity.get(node, {}).items():
+                if cap > 0 and nxt not in parents:
+                    parents[nxt] = node
+                    queue.append(nxt)
+        if sink not in parents:
+            return flow
+        push = None
+        node = sink
+        while node != source:
+            prev = parents[node]
+            cap = capacity[prev][node]
+            push = cap if push is None else min(push, cap)
+            node = prev
+        node = sink
+        while node != source:
+            prev = parents[node]
+            capacity[prev][node] -= push
+            capacity.setdefault(node, {})[prev] = capacity.get(node, {}).get(prev, 0) + push
+            node = prev
+        flow += push
+
+
+class ClinchCalculator:
+    """Playoff clinch/elimination tags for one regular-season schedule.
+
+    Remaining games (per team and per head-to-head pair) are derived from the
+    schedule once and then advanced day by day; tags are recomputed only when
+    the day or the standings change.
+    """
+
+    def __init__(self, season_days: Sequence[Sequence[tuple[Team, Team]]], teams: Iterable[Team]) -> None:
+        self.season_days = season_days
+        self._teams = {team.name: team for team in teams}
+        self._day_index = 0
+        self._remaining: dict[str, int] = {}
+        self._pair_remaining: dict[tuple[str, str], int] = {}
+        self._cache_key: tuple[int, int] | None = None
+        self._tags: dict[str, list[str]] = {}
+        self._magic: dict[str, int | None] = {}
+        self._structures: dict[str, tuple[frozenset[str], frozenset[str], bool]] = {}
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._day_index = 0
+        self._remaining = {name: 0 for name in self._teams}
+        self._pair_remaining = {}
+        for day in self.season_days:
+            self._apply_day(day, 1)
+
+    def _apply_day(self, day: Sequence[tuple[Team, Team]], delta: int) -> None:
+        for home, away in day:
+            self._remaining[home.name] = self._remaining.get(home.name, 0) + delta
+            self._remaining[away.name] = self._remaining.get(away.name, 0) + delta
+            pair = (home.name, away.name) if home.name < away.name else (away.name, home.name)
+            count = self._pair_remaining.get(pair, 0) + delta
+            if count > 0:
+                self._pair_remaining[pair] = count
+            else:
+                self._pair_remaining.pop(pair, None)
+
+    def sync(self, day_index: int) -> None:
+        day_index = max(0, min(int(day_index), len(self.season_days)))
+        if day_index < self._day_index:
+            self._rebuild()
+        while self._day_index < day_index:
+            self._apply_day(self.season_days[self._day_index], -1)
+            self._day_index += 1
+
+    def remaining_games(self) -> dict[str, int]:
+        return dict(self._remaining)
+
+    def tags(self, records: dict[str, TeamRecord], day_index: int, standings_version: int) -> dict[str, list[str]]:
+        self._refresh(records, day_index, standings_version)
+        return {name: list(tags) for name, tags in self._tags.items()}
+
+    def magic_numbers(self, records: dict[str, TeamRecord], day_index: int, standings_version: int) -> dict[str, int | None]:
+        self._refresh(records, day_index, standings_version)
+        return dict(self._magic)
+
+    def _refresh(self, records: dict[str, TeamRecord], day_index: int, standings_version: int) -> None:
+        key = (int(day_index), int(standings_version))
+        if key == self._cache_key:
+            return
+        self.sync(day_index)
+        self._tags, self._magic = self._compute(records)
+        self._cache_key = key
+
+    def _compute(self, records: dict[str, TeamRecord]) -> tuple[dict[str, list[str]], dict[str, int | None]]:
+        points = {name: int(rec.points) for name, rec in records.items()}
+        best = {name: points[name] + 2 * self._remaining.get(name, 0) for name in points}
+        season_over = all(self._remaining.get(name, 0) == 0 for name in points)
+        ordered = sorted(
+            records.values(),
+            key=lambda r: (r.points, r.goal_diff, r.goals_for),
+            reverse=True,
+        )
+        conferences: dict[str, list[str]] = {}
+        for rec in ordered:
+            conferences.setdefault(rec.team.conference, []).append(rec.team.name)
+
+        tags: dict[str, list[str]] = {name: [] for name in points}
+        magic: dict[str, int | None] = {name: None for name in points}
+        eliminated_names: set[str] = set()
+        for members in conferences.values():
+            field = self._field_from_order(members)
+            for name in members:
+                if season_over:
+                    clinched = name in field
+                    eliminated = not clinched
+                else:
+                    clinched = self._clinched(name, members, points, best)
+                    eliminated = not clinched and self._eliminated(name, members, points, best)
+                if clinched:
+                    tags[name].append("x")
+                if eliminated:
+                    eliminated_names.add(name)
+                    continue
+                if clinched:
+                    magic[name] = 0
+                elif name in field:
+                    chasers = [best[other] for other in members if other not in field]
+                    magic[name] = max(0, max(chasers, default=0) + 1 - points[name])
+
+        groups: list[tuple[str, list[str]]] = []
+        divisions: dict[str, list[str]] = {}
+        for rec in ordered:
+            divisions.setdefault(rec.team.division, []).append(rec.team.name)
+        groups.extend(("y", rows) for rows in divisions.values())
+        groups.extend(("z", rows) for rows in conferences.values())
+        groups.append(("p", [rec.team.name for rec in ordered]))
+        for tag, rows in groups:
+            if not rows:
+                continue
+            leader = rows[0]
+            # A rival must be unable to even tie the leader's current total.
+            if season_over or all(best[other] < points[leader] for other in rows[1:]):
+                tags[leader].append(tag)
+        for name in eliminated_names:
+            tags[name].append("e")
+        return tags, magic
+
+    def _structure(self, name: str, members: list[str]) -> tuple[frozenset[str], frozenset[str], bool]:
+        cached = self._structures.get(name)
+        if cached is None:
+            team = self._teams.get(name)
+            division = team.division if team is not None else ""
+            member_divisions = {self._teams[m].division for m in members if m in self._teams}
+            same = frozenset(m for m in members if m != name and m in self._teams and self._teams[m].division == division)
+            other = frozenset(m for m in members if m != name and m not in same)
+            cached = (same, other, len(member_divisions) == 2)
+            self._structures[name] = cached
+        return cached
+
+    def _qualifies(self, name: str, members: list[str], above: set[str]) -> bool:
+        same, other, two_divisions = self._structure(name, members)
+        if not two_divisions:
+            return len(above) < min(CONFERENCE_SLOTS, len(members))
+        k_same = len(above & same)
+        if k_same < DIVISION_SLOTS:
+            return True
+        k_other = len(above & other)
+        return (k_same - DIVISION_SLOTS) + max(0, k_other - DIVISION_SLOTS) < WILDCARD_SLOTS
+
+    def _field_from_order(self, members: list[str]) -> set[str]:
+        if not members:
+            return set()
+        divisions: dict[str, list[str]] = {}
+        for name in members:
+            team = self._teams.get(name)
+            divisions.setdefault(team.division if team is not None else "", []).append(name)
+        if len(divisions) != 2:
+            return set(members[: min(CONFERENCE_SLOTS, len(members))])
+        field: set[str] = set()
+        for rows in divisions.values():
+            field.update(rows[:DIVISION_SLOTS])
+        field.update([name for name in members if name not in field][:WILDCARD_SLOTS])
+        return field
+
+    def _clinched(self, name: str, members: list[str], points: dict[str, int], best: dict[str, int]) -> bool:
+        # Worst case for the team: it loses every remaining game in regulation.
+        floor = points[name]
+        already = {m for m in members if m != name and points[m] >= floor}
+        possible = [m for m in members if m != name and m not in already and best[m] >= floor]
+        if self._qualifies(name, members, already | set(possible)):
+            return True
+        if not self._qualifies(name, members, already):
+            return False
+        if len(possible) > MAX_EXACT_RIVALS:
+            return False
+        # Head-to-head games cap how many rivals can catch up together, so check
+        # each minimal knock-out group for a joint way to reach the floor.
+        for size in range(1, len(possible) + 1):
+            for group in combinations(possible, size):
+                chosen = set(group)
+                if self._qualifies(name, members, already | chosen):
+                    continue
+                if any(not self._qualifies(name, members, already | (chosen - {m})) for m in chosen):
+                    continue
+                if self._can_all_reach(name, chosen, floor, points):
+                    return False
+        return True
+
+    def _eliminated(self, name: str, members: list[str], points: dict[str, int], best: dict[str, int]) -> bool:
+        # Best case for the team: it wins every remaining game and any tiebreak.
+        ceiling = best[name]
+        forced = {m for m in members if m != name and points[m] > ceiling}
+        possible = [m for m in members if m != name and m not in forced and best[m] > ceiling]
+        if not self._qualifies(name, members, forced):
+            return True
+        if self._qualifies(name, members, forced | set(possible)):
+            return False
+        if len(possible) > MAX_EXACT_RIVALS:
+            return False
+        for size in range(len(possible), -1, -1):
+            for group in combinations(possible, size):
+                allowed = set(group)
+                if not self._qualifies(name, members, forced | allowed):
+                    continue
+                held = [m for m in possible if m not in allowed]
+                if self._can_all_stay_below(name, held, ceiling, points):
+                    return False
+        return True
+
+    def _can_all_reach(self, name: str, group: set[str], floor: int, points: dict[str, int]) -> bool:
+        need: dict[str, int] = {}
+        for member in group:
+            external = self._remaining.get(member, 0)
+            for other in group:
+                if other != member:
+                    external -= self._pair_count(member, other)
+            # Games against the team itself or outside the group can all be wins.
+            shortfall = floor - points[member] - 2 * external
+            if shortfall > 0:
+                need[member] = shortfall
+        if not need:
+            return True
+        capacity: dict[str, dict[str, int]] = {"src": {}}
+        for a, b in combinations(sorted(group), 2):
+            count = self._pair_count(a, b)
+            if count <= 0 or (a not in need and b not in need):
+                continue
+            game = f"g:{a}|{b}"
+            # Each game yields 2 points, or 3 with an overtime loser point.
+            capacity["src"][game] = 3 * count
+            capacity[game] = {}
+            if a in need:
+                capacity[game][f"t:{a}"] = 2 * count
+            if b in need:
+                capacity[game][f"t:{b}"] = 2 * count
+        for member, shortfall in need.items():
+            capacity.setdefault(f"t:{member}", {})["sink"] = shortfall
+        return _max_flow(capacity, "src", "sink") >= sum(need.values())
+
+    def _can_all_stay_below(self, name: str, held: list[str], ceiling: int, points: dict[str, int]) -> bool:
+        if not held:
+            return True
+        room = {member: (ceiling - points[member]) // 2 for member in held}
+        if any(value < 0 for value in room.values()):
+            return False
+        capacity: dict[str, dict[str, int]] = {"src": {}}
+        total = 0
+        for a, b in combinations(sorted(held), 2):
+            count = self._pair_count(a, b)
+            if count <= 0:
+                continue
+            # Someone must win each of these games; regulation results add no extra point.
+            game = f"g:{a}|{b}"
+            capacity["src"][game] = count
+            capacity[game] = {f"t:{a}": count, f"t:{b}": count}
+            total += count
+        if total == 0:
+            return True
+        for member, wins in room.items():
+            capacity.setdefault(f"t:{member}", {})["sink"] = wins
+        return _max_flow(capacity, "src", "sink") >= total
+
+    def _pair_count(self, a: str, b: str) -> int:
+        pair = (a, b) if a < b else (b, a)
+        return self._pair_remaining.get(pair, 0)
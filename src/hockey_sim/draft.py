@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+BOARD_LIMIT = 80
+
+
+class DraftSession:
+    """Indexed view over the persisted `current_draft_state` dict.
+
+    The state dict and its prospect/pick rows are shared, not copied, so picks
+    land in the saved shape directly. On top of it the session keeps an id
+    index, the taken set, a cursor past the drafted head of the ranked pool and
+    a cursor per team board, so a pick never rescans the class.
+    """
+
+    __slots__ = ("state", "prospects", "picks", "_by_id", "_taken", "_ranked", "_pool_cursor", "_board_cursors")
+
+    def __init__(self, state: dict[str, Any]) -> None:
+        self.state = state
+        raw_prospects = state.get("prospects")
+        raw_picks = state.get("picks")
+        self.prospects: list[dict[str, Any]] = (
+            [p for p in raw_prospects if isinstance(p, dict)] if isinstance(raw_prospects, list) else []
+        )
+        self.picks: list[dict[str, Any]] = [row for row in raw_picks if isinstance(row, dict)] if isinstance(raw_picks, list) else []
+        state["prospects"] = self.prospects
+        state["picks"] = self.picks
+        if not isinstance(state.get("boards"), dict):
+            state["boards"] = {}
+        self._by_id: dict[str, dict[str, Any]] = {}
+        for prospect in self.prospects:
+            pid = str(prospect.get("id", ""))
+            if pid:
+                self._by_id[pid] = prospect
+        self._taken: set[str] = set()
+        for row in self.picks:
+            pid = str(row.get("prospect_id", ""))
+            if pid in self._by_id:
+                self._taken.add(pid)
+        self._ranked: list[tuple[float, str, dict[str, Any]]] = sorted(
+            ((float(p.get("projected_quality", 0.0)), pid, p) for pid, p in self._by_id.items()),
+            key=lambda row: -row[0],
+        )
+        self._pool_cursor = 0
+        self._board_cursors: dict[str, int] = {}
+
+    @property
+    def season(self) -> int:
+        return int(self.state.get("season", 0))
+
+    @property
+    def current_index(self) -> int:
+        return max(0, min(int(self.state.get("current_pick_index", 0)), len(self.picks)))
+
+    @property
+    def active(self) -> bool:
+        return bool(self.state.get("active", False)) and self.current_index < len(self.picks)
+
+    @property
+    def available_count(self) -> int:
+        return len(self._by_id) - len(self._taken)
+
+    def current_pick(self) -> dict[str, Any] | None:
+        return self.picks[self.current_index] if self.active else None
+
+    def prospect(self, prospect_id: str) -> dict[str, Any] | None:
+        return self._by_id.get(prospect_id)
+
+    def is_available(self, prospect_id: str) -> bool:
+        return prospect_id in self._by_id and prospect_id not in self._taken
+
+    def ranked_available(self) -> Iterator[tuple[float, str, dict[str, Any]]]:
+        """Available prospects from the best projection down."""
+        ranked = self._ranked
+        cursor = self._pool_cursor
+        while cursor < len(ranked) and ranked[cursor][1] in self._taken:
+            cursor += 1
+        self._pool_cursor = cursor
+        for idx in range(cursor, len(ranked)):
+            row = ranked[idx]
+            if row[1] not in self._taken:
+                yield row
+
+    def record_pick(self, prospect_id: str) -> dict[str, Any]:
+        current_idx = int(self.state.get("current_pick_index", 0))
+        if current_idx < 0 or current_idx >= len(self.picks):
+            self.state["active"] = False
+            raise ValueError("Draft is complete")
+        prospect = self._by_id.get(prospect_id)
+        if prospect is None:
+            raise ValueError("Prospect not found")
+        if prospect_id in self._taken:
+            raise ValueError("Prospect already drafted")
+        pick_row = self.picks[current_idx]
+        pick_row["prospect_id"] = prospect_id
+        pick_row["name"] = str(prospect.get("name", ""))
+        pick_row["position"] = str(prospect.get("position", ""))
+        pick_row["country"] = str(prospect.get("country", ""))
+        pick_row["country_code"] = str(prospect.get("country_code", ""))
+        pick_row["age"] = int(prospect.get("age", 18))
+        pick_row["quality"] = float(prospect.get("true_quality", 0.5))
+        self._taken.add(prospect_id)
+        self.state["current_pick_index"] = current_idx + 1
+        if current_idx + 1 >= len(self.picks):
+            self.state["active"] = False
+        return pick_row
+
+    def board_top(self, team_name: str) -> str | None:
+        board = self._raw_board(team_name)
+        cursor = self._board_cursors.get(team_name, 0)
+        while cursor < len(board) and not self.is_available(board[cursor]):
+            cursor += 1
+        self._board_cursors[team_name] = cursor
+        return board[cursor] if cursor < len(board) else None
+
+    def board(self, team_name: str) -> list[str]:
+        cleaned = self._clean_board(self._raw_board(team_name))
+        self.state["boards"][team_name] = cleaned
+        self._board_cursors[team_name] = 0
+        return cleaned
+
+    def set_board(self, team_name: str, prospect_ids: list[str]) -> list[str]:
+        cleaned = self._clean_board([str(raw).strip() for raw in prospect_ids])[:BOARD_LIMIT]
+        self.state["boards"][team_name] = cleaned
+        self._board_cursors[team_name] = 0
+        return list(cleaned)
+
+    def _raw_board(self, team_name: str) -> list[str]:
+        boards = self.state["boards"]
+        raw = boards.get(team_name)
+        if not isinstance(raw, list):
+            raw = []
+            boards[team_name] = raw
+        return raw
+
+    def _clean_board(self, prospect_ids: list[str]) -> list[str]:
+        cleaned: list[str] = []
+        seen: set[str] = set()
+        for raw in prospect_ids:
+            pid = str(raw)
+            if not pid or pid in seen or not self.is_available(pid):
+                continue
+            cleaned.append(pid)
+            seen.add(pid)
+        return cleaned
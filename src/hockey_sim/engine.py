@@ -4,6 +4,26 @@ import random
 from dataclasses import dataclass
 
 from .models import Player, Team
+from .undo import UndoLog
+
+GOALIE_GAME_FIELDS = (
+    "goalie_games",
+    "goals_against",
+    "shots_against",
+    "saves",
+    "goalie_wins",
+    "goalie_losses",
+    "goalie_ot_losses",
+    "goalie_shutouts",
+)
+INJURY_FIELDS = (
+    "injuries",
+    "injured_games_remaining",
+    "games_missed_injury",
+    "injury_type",
+    "injury_status",
+    "dtd_play_today",
+)
 
 # Injury baseline derived from 2024-25 team-level NHL man-games lost and injuries.
 # Rotowire table totals imply ~0.01357 injury events per player-game and ~8.04 games missed per injury.
@@ -246,9 +266,12 @@ def _record_goalie_stats(
     overtime: bool,
     is_win: bool,
     rng: random.Random,
+    undo: UndoLog | None = None,
 ) -> tuple[int, int]:
     if goalie is None:
         return (0, 0)
+    if undo is not None:
+        undo.save_fields(goalie, GOALIE_GAME_FIELDS)
     goalie.goalie_games += 1
     goalie.goals_against += goals_against
 
@@ -271,7 +294,12 @@ def _record_goalie_stats(
     return (shots, saves)
 
 
-def _record_goal(team: Team, rng: random.Random, usage: dict[str, float] | None = None) -> GoalEvent:
+def _record_goal(
+    team: Team,
+    rng: random.Random,
+    usage: dict[str, float] | None = None,
+    undo: UndoLog | None = None,
+) -> GoalEvent:
     skaters = [p for p in team.dressed_skaters() if p.position != "G"]
     if not skaters:
         skaters = [p for p in team.active_skaters() if p.position != "G"]
@@ -286,6 +314,8 @@ def _record_goal(team: Team, rng: random.Random, usage: dict[str, float] | None
         weighted = max(0.15, p.scoring_weight * role_mod * toi_mod)
         scorer_weights.append(max(0.1, weighted ** 2.25))
     scorer = _choose_weighted(skaters, scorer_weights, rng)
+    if undo is not None:
+        undo.save(scorer, "goals")
     scorer.goals += 1
 
     remaining = [p for p in skaters if p is not scorer]
@@ -303,6 +333,8 @@ def _record_goal(team: Team, rng: random.Random, usage: dict[str, float] | None
             ],
             rng,
         )
+        if undo is not None:
+            undo.save(primary, "assists")
         primary.assists += 1
         assists.append(primary)
         remaining = [p for p in remaining if p is not primary]
@@ -313,24 +345,76 @@ def _record_goal(team: Team, rng: random.Random, usage: dict[str, float] | None
             [max(0.1, (p.playmaking * 0.95 + p.defense * 0.08) ** 1.35) for p in remaining],
             rng,
         )
+        if undo is not None:
+            undo.save(secondary, "assists")
         secondary.assists += 1
         assists.append(secondary)
 
     return GoalEvent(scorer=scorer, assists=assists)
 
 
+def _record_goals_minimal(
+    team: Team,
+    goals: int,
+    rng: random.Random,
+    usage: dict[str, float] | None = None,
+    undo: UndoLog | None = None,
+) -> None:
+    """Same draws and stat increments as repeated _record_goal, without GoalEvent objects."""
+    if goals <= 0:
+        return
+    skaters = [p for p in team.dressed_skaters() if p.position != "G"]
+    if not skaters:
+        skaters = [p for p in team.active_skaters() if p.position != "G"]
+    if not skaters:
+        skaters = team.dressed_players() or team.active_players()
+
+    scorer_weights = []
+    primary_weight: dict[int, float] = {}
+    secondary_weight: dict[int, float] = {}
+    for p in skaters:
+        role_mod = 1.10 if p.position in {"C", "LW", "RW"} else 0.68
+        toi_mod = usage.get(p.player_id, 1.0) if usage else 1.0
+        weighted = max(0.15, p.scoring_weight * role_mod * toi_mod)
+        scorer_weights.append(max(0.1, weighted ** 2.25))
+        primary_weight[id(p)] = max(
+            0.1,
+            (p.playmaking * (1.08 if p.position in {"C", "D"} else 1.0) + p.defense * 0.05) ** 1.55,
+        )
+        secondary_weight[id(p)] = max(0.1, (p.playmaking * 0.95 + p.defense * 0.08) ** 1.35)
+
+    for _ in range(goals):
+        scorer = _choose_weighted(skaters, scorer_weights, rng)
+        if undo is not None:
+            undo.save(scorer, "goals")
+        scorer.goals += 1
+        remaining = [p for p in skaters if p is not scorer]
+        if remaining and rng.random() < 0.79:
+            primary = _choose_weighted(remaining, [primary_weight[id(p)] for p in remaining], rng)
+            if undo is not None:
+                undo.save(primary, "assists")
+            primary.assists += 1
+            remaining = [p for p in remaining if p is not primary]
+        if remaining and rng.random() < 0.43:
+            secondary = _choose_weighted(remaining, [secondary_weight[id(p)] for p in remaining], rng)
+            if undo is not None:
+                undo.save(secondary, "assists")
+            secondary.assists += 1
+
+
 def _build_goal_events(
     team: Team,
     goals: int,
     rng: random.Random,
     record_stats: bool,
     usage: dict[str, float] | None = None,
+    undo: UndoLog | None = None,
 ) -> list[GoalEvent]:
     events: list[GoalEvent] = []
     if goals <= 0:
         return events
     if record_stats:
-        return [_record_goal(team, rng, usage=usage) for _ in range(goals)]
+        return [_record_goal(team, rng, usage=usage, undo=undo) for _ in range(goals)]
 
     skaters = [p for p in team.dressed_skaters() if p.position != "G"]
     if not skaters:
@@ -422,7 +506,12 @@ def _sample_injury_taxonomy(rng: random.Random, strategy_mult: float) -> tuple[s
     return injury_type, games_out
 
 
-def _apply_injuries(team: Team, strategy: str, rng: random.Random) -> list[InjuryEvent]:
+def _apply_injuries(
+    team: Team,
+    strategy: str,
+    rng: random.Random,
+    undo: UndoLog | None = None,
+) -> list[InjuryEvent]:
     strategy_effect = STRATEGY_EFFECTS.get(strategy, STRATEGY_EFFECTS["balanced"])
     injury_mult = strategy_effect["injury_mult"]
     events: list[InjuryEvent] = []
@@ -450,6 +539,8 @@ def _apply_injuries(team: Team, strategy: str, rng: random.Random) -> list[Injur
             if injury_status == "Season-ending":
                 # Keep season-ending injuries out through playoffs; reset happens in offseason.
                 games_out = max(games_out, 200)
+            if undo is not None:
+                undo.save_fields(player, INJURY_FIELDS)
             player.injuries += 1
             new_games_out = max(previous_games_out, games_out)
             player.injured_games_remaining = new_games_out
@@ -470,6 +561,68 @@ def _apply_injuries(team: Team, strategy: str, rng: random.Random) -> list[Injur
     return events
 
 
+@dataclass(frozen=True, slots=True)
+class TeamStrength:
+    """Lineup ratings frozen at one moment, for pricing games without simulating them."""
+
+    offense: float
+    defense: float
+    power_play: float
+    penalty_kill: float
+    goalie: float
+    fatigue: float
+
+
+def team_strength(team: Team) -> TeamStrength:
+    usage = _deployment_usage(team)
+    usage_mean = _avg(list(usage.values()), 1.0)
+    usage_peak = max(usage.values()) if usage else 1.0
+    power_play, penalty_kill, goalie = _special_teams_ratings(team)
+    return TeamStrength(
+        offense=_team_offense(team),
+        defense=_team_defense(team),
+        power_play=power_play,
+        penalty_kill=penalty_kill,
+        goalie=goalie,
+        fatigue=min(0.12, max(0.0, (usage_peak - usage_mean) * 0.10)),
+    )
+
+
+def _poisson_pmf(lam: float, limit: int = 14) -> list[float]:
+    term = pow(2.718281828459045, -lam)
+    out = [term]
+    for k in range(1, limit + 1):
+        term *= lam / k
+        out.append(term)
+    return out
+
+
+def home_win_probability(
+    home: TeamStrength,
+    away: TeamStrength,
+    home_context_bonus: float = 0.0,
+    away_context_bonus: float = 0.0,
+) -> float:
+    """Closed-form chance the home side wins, mirroring `simulate_game` scoring with balanced strategies."""
+    home_lam = max(1.5, min(3.5, home.offense * 0.55 + (5.0 - away.defense) * 0.36 - 0.08 - home.fatigue + home_context_bonus))
+    away_lam = max(1.5, min(3.5, away.offense * 0.55 + (5.0 - home.defense) * 0.36 - 0.22 - away.fatigue + away_context_bonus))
+    # Expected power-play goals at the league-average 2.6 chances per side.
+    home_pp_rate = 0.135 + (home.power_play - 3.0) * 0.024 - (away.penalty_kill - 3.0) * 0.020 - (away.goalie - 3.0) * 0.015
+    away_pp_rate = 0.135 + (away.power_play - 3.0) * 0.024 - (home.penalty_kill - 3.0) * 0.020 - (home.goalie - 3.0) * 0.015
+    home_lam += 2.6 * max(0.05, min(0.31, home_pp_rate))
+    away_lam += 2.6 * max(0.05, min(0.31, away_pp_rate))
+    home_pmf = _poisson_pmf(home_lam)
+    away_pmf = _poisson_pmf(away_lam)
+    regulation_win = 0.0
+    tie = 0.0
+    away_below = 0.0
+    for goals, prob in enumerate(home_pmf):
+        tie += prob * away_pmf[goals]
+        regulation_win += prob * away_below
+        away_below += away_pmf[goals]
+    return max(0.0, min(1.0, regulation_win + tie * 0.52))
+
+
 def simulate_game(
     home: Team,
     away: Team,
@@ -488,6 +641,8 @@ def simulate_game(
     home_injury_mult: float = 1.0,
     away_injury_mult: float = 1.0,
     record_goalie_stats: bool = True,
+    detail: str = "full",
+    undo: UndoLog | None = None,
 ) -> GameResult:
     rng = rng or random.Random()
     home_goalie = _starting_goalie(home, rng)
@@ -568,19 +723,27 @@ def simulate_game(
             away_goals += 1
 
     if record_player_stats:
-        for player in (home.dressed_players() or home.active_players()):
-            player.games_played += 1
-        for player in (away.dressed_players() or away.active_players()):
-            player.games_played += 1
-
-    home_goal_events = _build_goal_events(home, home_goals, rng, record_player_stats, usage=home_usage)
-    away_goal_events = _build_goal_events(away, away_goals, rng, record_player_stats, usage=away_usage)
+        for team in (home, away):
+            for player in (team.dressed_players() or team.active_players()):
+                if undo is not None:
+                    undo.save(player, "games_played")
+                player.games_played += 1
+
+    home_goal_events: list[GoalEvent] = []
+    away_goal_events: list[GoalEvent] = []
+    if detail == "minimal" and record_player_stats:
+        # Fast-forward: box-score events are never read, only the player totals.
+        _record_goals_minimal(home, home_goals, rng, usage=home_usage, undo=undo)
+        _record_goals_minimal(away, away_goals, rng, usage=away_usage, undo=undo)
+    else:
+        home_goal_events = _build_goal_events(home, home_goals, rng, record_player_stats, usage=home_usage, undo=undo)
+        away_goal_events = _build_goal_events(away, away_goals, rng, record_player_stats, usage=away_usage, undo=undo)
 
     home_injuries: list[InjuryEvent] = []
     away_injuries: list[InjuryEvent] = []
     if apply_injuries:
-        home_injuries = _apply_injuries(home, home_strategy, rng)
-        away_injuries = _apply_injuries(away, away_strategy, rng)
+        home_injuries = _apply_injuries(home, home_strategy, rng, undo=undo)
+        away_injuries = _apply_injuries(away, away_strategy, rng, undo=undo)
         if home_injury_mult != 1.0:
             for injury in home_injuries:
                 adjusted = max(1, int(round(injury.games_out * home_injury_mult)))
@@ -613,10 +776,10 @@ def simulate_game(
     away_goalie_saves = 0
     if record_goalie_stats:
         home_goalie_shots, home_goalie_saves = _record_goalie_stats(
-            home_goalie, away_goals, overtime, home_win, rng
+            home_goalie, away_goals, overtime, home_win, rng, undo=undo
         )
         away_goalie_shots, away_goalie_saves = _record_goalie_stats(
-            away_goalie, home_goals, overtime, not home_win, rng
+            away_goalie, home_goals, overtime, not home_win, rng, undo=undo
         )
     else:
         if home_goalie is not None:
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import deque
+import json
+import threading
+from typing import Any
+
+DEFAULT_SUBSCRIBER_BUFFER = 256
+# Snapshot kinds supersede each other, so older copies are the first to go under backpressure.
+SNAPSHOT_KINDS = frozenset({"standings"})
+
+
+class EventSubscriber:
+    """Bounded per-client buffer fed by EventBus.publish."""
+
+    __slots__ = ("_events", "_lock", "max_events", "dropped", "closed")
+
+    def __init__(self, max_events: int = DEFAULT_SUBSCRIBER_BUFFER) -> None:
+        self._events: deque[dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self.max_events = max(8, int(max_events))
+        self.dropped = 0
+        self.closed = False
+
+    def push(self, event: dict[str, Any]) -> None:
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self._make_room()
+            self._events.append(event)
+
+    def _make_room(self) -> None:
+        for idx, queued in enumerate(self._events):
+            if queued.get("kind") in SNAPSHOT_KINDS:
+                del self._events[idx]
+                return
+        # Nothing coalescible left: drop the oldest events behind a single resync marker.
+        if self._events[0].get("kind") == "resync":
+            del self._events[1]
+            self.dropped += 1
+        else:
+            for _ in range(min(2, len(self._events))):
+                self._events.popleft()
+                self.dropped += 1
+            self._events.appendleft({"id": 0, "kind": "resync", "data": {}})
+        self._events[0]["data"] = {"dropped": self.dropped}
+
+    def drain(self, limit: int = 64) -> list[dict[str, Any]]:
+        with self._lock:
+            count = min(len(self._events), max(1, limit))
+            return [self._events.popleft() for _ in range(count)]
+
+
+class EventBus:
+    """In-process publish/subscribe hub for simulation progress."""
+
+    def __init__(self) -> None:
+        self._subscribers: list[EventSubscriber] = []
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self, max_events: int = DEFAULT_SUBSCRIBER_BUFFER) -> EventSubscriber:
+        subscriber = EventSubscriber(max_events=max_events)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: EventSubscriber) -> None:
+        subscriber.closed = True
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s is not subscriber]
+
+    def publish(self, kind: str, data: Any) -> None:
+        if not self._subscribers:
+            return
+        with self._lock:
+            event = {"id": self._next_id, "kind": kind, "data": data}
+            self._next_id += 1
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.push(event)
+
+
+def format_sse(event: dict[str, Any]) -> str:
+    payload = json.dumps(event.get("data", {}), separators=(",", ":"))
+    lines = []
+    if int(event.get("id", 0) or 0) > 0:
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event.get('kind', 'message')}")
+    lines.append(f"data: {payload}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator
+
+from .models import Player
+
+
+class FreeAgentMarket:
+    """Offseason free-agent pool indexed by position.
+
+    Each position's players are ordered once, best contract value first. Signed
+    players are dropped lazily behind a per-position cursor, so a team looking
+    for candidates only touches the few players it inspects. Signing is the
+    only change the pool sees during a market, so no re-sorting is needed.
+    """
+
+    __slots__ = ("_order", "_ids", "_pools", "_cursors", "_signed", "_excluded")
+
+    def __init__(self, players: Iterable[Player], value: Callable[[Player], float], excluded: Iterable[str] = ()) -> None:
+        self._order = sorted(players, key=lambda p: (value(p), p.age, p.name), reverse=True)
+        self._ids = {p.player_id for p in self._order}
+        self._excluded = set(excluded)
+        self._pools: dict[str, list[Player]] = {}
+        for player in self._order:
+            if player.player_id not in self._excluded:
+                self._pools.setdefault(player.position, []).append(player)
+        for pool in self._pools.values():
+            pool.sort(key=lambda p: (value(p), -p.age, p.name), reverse=True)
+        self._cursors: dict[str, int] = {position: 0 for position in self._pools}
+        self._signed: set[str] = set()
+
+    def __bool__(self) -> bool:
+        return len(self._signed) < len(self._order)
+
+    def is_available(self, player: Player) -> bool:
+        return player.player_id in self._ids and player.player_id not in self._signed
+
+    def candidates(self, position: str, limit: int) -> Iterator[Player]:
+        """Up to `limit` unsigned, unprotected players at a position, best first."""
+        pool = self._pools.get(position)
+        if not pool:
+            return
+        cursor = self._cursors[position]
+        while cursor < len(pool) and pool[cursor].player_id in self._signed:
+            cursor += 1
+        self._cursors[position] = cursor
+        seen = 0
+        for idx in range(cursor, len(pool)):
+            player = pool[idx]
+            if player.player_id in self._signed:
+                continue
+            yield player
+            seen += 1
+            if seen >= limit:
+                return
+
+    def sign(self, player: Player) -> None:
+        self._signed.add(player.player_id)
+
+    def remaining(self) -> list[Player]:
+        return [p for p in self._order if p.player_id not in self._signed]
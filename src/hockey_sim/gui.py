@@ -16,6 +16,7 @@ except ImportError:
 from .app import build_default_teams
 from .league import LeagueSimulator
 from .models import Player, Team
+from .playoffs import summary_game_rows
 
 
 class HockeySimGUI:
@@ -1416,34 +1417,16 @@ class HockeySimGUI:
     ]:
         if self.simulator is None:
             return ([], [], [], [])
-        totals: dict[str, dict[str, object]] = {}
-
-        for entry in self.simulator.hall_of_fame:
-            if str(entry.get("team_at_retirement", "")) != team_name:
-                continue
-            player_id = str(entry.get("player_id", entry.get("name", "")))
-            row = totals.setdefault(
-                player_id,
-                {
-                    "name": str(entry.get("name", "")),
-                    "g": int(entry.get("career_g", 0)),
-                    "a": int(entry.get("career_a", 0)),
-                    "p": int(entry.get("career_p", 0)),
-                    "w": int(entry.get("goalie_w", 0)),
-                },
-            )
-            row["g"] = max(int(row["g"]), int(entry.get("career_g", 0)))
-            row["a"] = max(int(row["a"]), int(entry.get("career_a", 0)))
-            row["p"] = max(int(row["p"]), int(entry.get("career_p", 0)))
-            row["w"] = max(int(row["w"]), int(entry.get("goalie_w", 0)))
+        totals = self.simulator.record_book().leader_candidates(team_name)
 
         team = self.simulator.get_team(team_name)
         if team is not None:
             for player in team.roster:
-                career_g = sum(int(s.get("g", 0)) for s in player.career_seasons if isinstance(s, dict)) + player.goals
-                career_a = sum(int(s.get("a", 0)) for s in player.career_seasons if isinstance(s, dict)) + player.assists
-                career_p = sum(int(s.get("p", 0)) for s in player.career_seasons if isinstance(s, dict)) + player.points
-                career_w = sum(int(s.get("goalie_w", 0)) for s in player.career_seasons if isinstance(s, dict)) + player.goalie_wins
+                career = self.simulator.career_aggregate(player).totals
+                career_g = career["g"] + player.goals
+                career_a = career["a"] + player.assists
+                career_p = career["p"] + player.points
+                career_w = career["goalie_w"] + player.goalie_wins
                 row = totals.setdefault(
                     player.player_id,
                     {"name": player.name, "g": 0, "a": 0, "p": 0, "w": 0, "status": "Retired"},
@@ -2518,9 +2501,8 @@ class HockeySimGUI:
                     f"    {series.get('higher_seed', '?')} vs {series.get('lower_seed', '?')} -> "
                     f"{series.get('winner', '?')} ({series.get('winner_wins', 0)}-{series.get('loser_wins', 0)})"
                 )
-                for game_row in series.get("games", []):
-                    if isinstance(game_row, dict):
-                        self._append_results(f"      {self._format_playoff_game(game_row)}")
+                for game_row in summary_game_rows(series):
+                    self._append_results(f"      {self._format_playoff_game(game_row)}")
 
     def _current_playoff_status_map(self, playoffs: dict[str, object]) -> dict[tuple[str, str, str], dict[str, object]]:
         status: dict[tuple[str, str, str], dict[str, object]] = {}
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any
+import uuid
+
+from fastapi import HTTPException
+
+JOB_TARGETS = ("to_day", "end_of_regular_season", "end_of_playoffs", "n_seasons")
+JOB_DETAIL_LEVELS = ("full", "minimal")
+MAX_JOB_SEASONS = 25
+MAX_KEPT_JOBS = 20
+
+
+@dataclass(slots=True)
+class SimJob:
+    id: str
+    target: str
+    day: int = 0
+    seasons: int = 0
+    detail: str = "full"
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    steps_done: int = 0
+    start_season: int = 0
+    season: int = 0
+    day_num: int = 0
+    total_days: int = 0
+    phase: str = ""
+    cancel_requested: bool = False
+    error: str = ""
+    last_step: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in {"queued", "running"}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "target": self.target,
+            "day": self.day,
+            "seasons": self.seasons,
+            "detail": self.detail,
+            "status": self.status,
+            "created_at": round(self.created_at, 3),
+            "started_at": round(self.started_at, 3),
+            "finished_at": round(self.finished_at, 3),
+            "elapsed_sec": round((self.finished_at or time.time()) - self.started_at, 3) if self.started_at else 0.0,
+            "steps_done": self.steps_done,
+            "progress": {
+                "start_season": self.start_season,
+                "season": self.season,
+                "day": self.day_num,
+                "total_days": self.total_days,
+                "phase": self.phase,
+            },
+            "cancel_requested": self.cancel_requested,
+            "error": self.error,
+            "last_step": self.last_step,
+        }
+
+
+class SimJobManager:
+    """Runs multi-day simulations on a worker thread, one job at a time."""
+
+    def __init__(self, service: Any) -> None:
+        self.service = service
+        self._jobs: dict[str, SimJob] = {}
+        self._order: list[str] = []
+        self._jobs_lock = threading.Lock()
+
+    def active_job(self) -> SimJob | None:
+        with self._jobs_lock:
+            for job_id in reversed(self._order):
+                job = self._jobs[job_id]
+                if job.is_active:
+                    return job
+        return None
+
+    def submit(
+        self,
+        target: str,
+        day: int | None = None,
+        seasons: int | None = None,
+        detail: str = "full",
+    ) -> dict[str, Any]:
+        target = str(target or "").strip().lower()
+        if target not in JOB_TARGETS:
+            raise HTTPException(status_code=400, detail=f"Unknown job target '{target}'")
+        detail = str(detail or "full").strip().lower()
+        if detail not in JOB_DETAIL_LEVELS:
+            raise HTTPException(status_code=400, detail=f"Unknown detail level '{detail}'")
+        job = SimJob(id=uuid.uuid4().hex[:12], target=target, detail=detail)
+        if target == "to_day":
+            if day is None or int(day) < 1:
+                raise HTTPException(status_code=400, detail="day is required for to_day target")
+            job.day = int(day)
+        if target == "n_seasons":
+            count = int(seasons or 1)
+            if count < 1 or count > MAX_JOB_SEASONS:
+                raise HTTPException(status_code=400, detail=f"seasons must be between 1 and {MAX_JOB_SEASONS}")
+            job.seasons = count
+        if not self.service.user_team_name:
+            raise HTTPException(status_code=400, detail="No user team selected")
+        with self._jobs_lock:
+            for job_id in self._order:
+                if self._jobs[job_id].is_active:
+                    raise HTTPException(status_code=409, detail=f"Simulation job {job_id} is already running")
+            self._jobs[job.id] = job
+            self._order.append(job.id)
+            while len(self._order) > MAX_KEPT_JOBS:
+                oldest = self._order[0]
+                if self._jobs[oldest].is_active:
+                    break
+                self._order.pop(0)
+                self._jobs.pop(oldest, None)
+        worker = threading.Thread(target=self._run, args=(job,), name=f"sim-job-{job.id}", daemon=True)
+        worker.start()
+        return job.to_dict()
+
+    def get(self, job_id: str) -> dict[str, Any]:
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job.to_dict()
+
+    def list_jobs(self) -> list[dict[str, Any]]:
+        with self._jobs_lock:
+            jobs = [self._jobs[job_id] for job_id in reversed(self._order)]
+        return [job.to_dict() for job in jobs]
+
+    def cancel(self, job_id: str) -> dict[str, Any]:
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if job.is_active:
+            job.cancel_requested = True
+        return job.to_dict()
+
+    def _target_reached(self, job: SimJob) -> bool:
+        sim = self.service.simulator
+        if job.target == "to_day":
+            return int(sim.season_number) != job.start_season or sim.is_complete() or sim.current_day >= job.day
+        if job.target == "end_of_regular_season":
+            return int(sim.season_number) != job.start_season or sim.is_complete()
+        if job.target == "end_of_playoffs":
+            return int(sim.season_number) != job.start_season or (sim.is_complete() and sim.playoffs_finished())
+        return int(sim.season_number) >= job.start_season + job.seasons
+
+    def _update_progress(self, job: SimJob) -> None:
+        sim = self.service.simulator
+        job.season = int(sim.season_number)
+        if sim.has_playoff_session():
+            job.phase = "offseason" if sim.playoffs_finished() else "playoffs"
+            job.day_num = int(sim.pending_playoff_day_index)
+            job.total_days = sim.playoff_total_days()
+        else:
+            job.phase = "regular"
+            job.day_num = int(sim._day_index)
+            job.total_days = int(sim.total_days)
+
+    def _run(self, job: SimJob) -> None:
+        service = self.service
+        with service._lock:
+            simulator = service.simulator
+            job.status = "running"
+            job.started_at = time.time()
+            job.start_season = int(simulator.season_number)
+            self._update_progress(job)
+            service.begin_batched_saves()
+        # Status only flips to a terminal value once pending saves are on disk.
+        final_status = "completed"
+        try:
+            while True:
+                with service._lock:
+                    if service.simulator is not simulator:
+                        final_status = "cancelled"
+                        job.error = "League was reset while the job was running."
+                        break
+                    if job.cancel_requested:
+                        final_status = "cancelled"
+                        break
+                    if self._target_reached(job):
+                        break
+                    step = service.advance(detail=job.detail)
+                    job.steps_done += 1
+                    job.last_step = {
+                        "phase": step.get("phase", ""),
+                        "season": step.get("season", step.get("completed_season", 0)),
+                        "day": step.get("day", 0),
+                    }
+                    self._update_progress(job)
+        except HTTPException as exc:
+            final_status = "failed"
+            job.error = str(exc.detail)
+        except Exception as exc:
+            final_status = "failed"
+            job.error = f"{type(exc).__name__}: {exc}"
+        finally:
+            with service._lock:
+                service.end_batched_saves()
+                self._update_progress(job)
+            job.finished_at = time.time()
+            job.status = final_status
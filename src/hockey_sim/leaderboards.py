@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import heapq
+from typing import Any, Callable
+
+from .career import CareerAggregate
+
+# Career stats on the all-time record tables.
+RECORD_STATS = ("gp", "g", "a", "p", "pim", "goalie_w", "goalie_so")
+# Career stats on a franchise's leader board ("w" is goalie wins).
+LEADER_STATS = ("g", "a", "p", "w")
+LEADERBOARD_SIZE = 10
+
+
+class Leaderboard:
+    """The `size` best rows for one stat, ranked by (value, name) like the record tables.
+
+    Rows tied on both keep whichever was offered first, as a stable sort would.
+    """
+
+    __slots__ = ("stat", "size", "_heap")
+
+    def __init__(self, stat: str, size: int = LEADERBOARD_SIZE) -> None:
+        self.stat = stat
+        self.size = size
+        self._heap: list[tuple[int, str, int, str, dict[str, Any]]] = []
+
+    def offer(self, seq: int, key: str, row: dict[str, Any]) -> None:
+        value = int(row.get(self.stat, 0))
+        if value <= 0:
+            return
+        item = (value, str(row.get("name", "")), -seq, key, row)
+        if len(self._heap) < self.size:
+            heapq.heappush(self._heap, item)
+        elif item[:3] > self._heap[0][:3]:
+            heapq.heapreplace(self._heap, item)
+
+    def entries(self) -> list[tuple[int, str, dict[str, Any]]]:
+        return [(-item[2], item[3], item[4]) for item in self._heap]
+
+
+def _candidates(boards: dict[str, Leaderboard] | None) -> dict[str, dict[str, Any]]:
+    """Copies of every row on `boards`, keyed and ordered as they were first offered."""
+    if not boards:
+        return {}
+    found: dict[str, tuple[int, dict[str, Any]]] = {}
+    for board in boards.values():
+        for seq, key, row in board.entries():
+            found.setdefault(key, (seq, row))
+    ordered = sorted(found.items(), key=lambda item: item[1][0])
+    return {key: dict(row) for key, (_, row) in ordered}
+
+
+def _merge_record_row(rows: dict[str, dict[str, Any]], player_id: str, entry: dict[str, Any]) -> None:
+    row = rows.setdefault(
+        player_id,
+        {
+            "player_id": player_id,
+            "name": str(entry.get("name", "")).strip(),
+            "team": str(entry.get("team_at_retirement", "")).strip(),
+            "position": str(entry.get("position", "")).strip(),
+            "status": "Retired",
+            "gp": 0,
+            "g": 0,
+            "a": 0,
+            "p": 0,
+            "pim": 0,
+            "goalie_w": 0,
+            "goalie_so": 0,
+        },
+    )
+    row["name"] = str(entry.get("name", row["name"])).strip()
+    row["team"] = str(entry.get("team_at_retirement", row["team"])).strip()
+    row["position"] = str(entry.get("position", row["position"])).strip()
+    row["gp"] = max(int(row["gp"]), int(entry.get("career_gp", 0)))
+    row["g"] = max(int(row["g"]), int(entry.get("career_g", 0)))
+    row["a"] = max(int(row["a"]), int(entry.get("career_a", 0)))
+    row["p"] = max(int(row["p"]), int(entry.get("career_p", 0)))
+    row["goalie_w"] = max(int(row["goalie_w"]), int(entry.get("goalie_w", 0)))
+    row["goalie_so"] = max(int(row["goalie_so"]), int(entry.get("goalie_so", 0)))
+
+
+def _merge_franchise_row(
+    rows: dict[str, dict[str, Any]],
+    player_id: str,
+    entry: dict[str, Any],
+    team_name: str,
+    totals: dict[str, int],
+) -> None:
+    if all(int(totals[stat]) <= 0 for stat in RECORD_STATS):
+        return
+    row = rows.setdefault(
+        player_id,
+        {
+            "player_id": player_id,
+            "name": "",
+            "team": team_name,
+            "position": "",
+            "status": "Retired",
+            **{stat: 0 for stat in RECORD_STATS},
+        },
+    )
+    row["name"] = str(entry.get("name", "")).strip()
+    row["position"] = str(entry.get("position", "")).strip()
+    for stat in RECORD_STATS:
+        row[stat] = max(int(row[stat]), int(totals[stat]))
+
+
+def _merge_leader_row(rows: dict[str, dict[str, Any]], key: str, entry: dict[str, Any]) -> None:
+    row = rows.setdefault(
+        key,
+        {
+            "name": str(entry.get("name", "")),
+            "g": int(entry.get("career_g", 0)),
+            "a": int(entry.get("career_a", 0)),
+            "p": int(entry.get("career_p", 0)),
+            "w": int(entry.get("goalie_w", 0)),
+            "status": "Retired",
+        },
+    )
+    row["g"] = max(int(row["g"]), int(entry.get("career_g", 0)))
+    row["a"] = max(int(row["a"]), int(entry.get("career_a", 0)))
+    row["p"] = max(int(row["p"]), int(entry.get("career_p", 0)))
+    row["w"] = max(int(row["w"]), int(entry.get("goalie_w", 0)))
+
+
+def _boards(stats: tuple[str, ...]) -> dict[str, Leaderboard]:
+    return {stat: Leaderboard(stat) for stat in stats}
+
+
+@dataclass(slots=True)
+class RecordBook:
+    """All-time leader boards over the hall of fame, extended as players retire.
+
+    Only retired careers are ranked: active totals move every game, so callers
+    merge the current players in at query time. A table never needs more than
+    its top rows from here, because merging an active player only raises values.
+    `source` is the hall of fame list the book was built from; entries appended
+    to it are picked up by `sync`, anything else needs a rebuild.
+    """
+
+    source: list[Any]
+    count: int = 0
+    # Every player id seen, for spotting a re-entered player.
+    player_ids: set[str] = field(default_factory=set)
+    league: dict[str, Leaderboard] = field(default_factory=lambda: _boards(RECORD_STATS))
+    # Per franchise, from each retired player's seasons with that team.
+    franchise: dict[str, dict[str, Leaderboard]] = field(default_factory=dict)
+    # Per team at retirement, whole-career totals.
+    leaders: dict[str, dict[str, Leaderboard]] = field(default_factory=dict)
+    _keys: set[tuple[str, str]] = field(default_factory=set)
+
+    @classmethod
+    def build(cls, entries: list[Any], aggregate: Callable[[dict[str, Any]], CareerAggregate]) -> RecordBook:
+        book = cls(source=entries)
+        league_rows: dict[str, dict[str, Any]] = {}
+        franchise_rows: dict[str, dict[str, dict[str, Any]]] = {}
+        leader_rows: dict[str, dict[str, dict[str, Any]]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            book.player_ids.add(str(entry.get("player_id", "")))
+            player_id = str(entry.get("player_id", "")).strip()
+            if player_id:
+                _merge_record_row(league_rows, player_id, entry)
+                for team_name, totals in aggregate(entry).by_team.items():
+                    _merge_franchise_row(franchise_rows.setdefault(team_name, {}), player_id, entry, team_name, totals)
+            team_name = str(entry.get("team_at_retirement", ""))
+            _merge_leader_row(leader_rows.setdefault(team_name, {}), str(entry.get("player_id", entry.get("name", ""))), entry)
+        seq = 0
+        for key, row in league_rows.items():
+            book._offer("league", book.league, seq, key, row)
+            seq += 1
+        for team_name, rows in franchise_rows.items():
+            boards = book.franchise.setdefault(team_name, _boards(RECORD_STATS))
+            for key, row in rows.items():
+                book._offer(f"franchise:{team_name}", boards, seq, key, row)
+                seq += 1
+        for team_name, rows in leader_rows.items():
+            boards = book.leaders.setdefault(team_name, _boards(LEADER_STATS))
+            for key, row in rows.items():
+                book._offer(f"leaders:{team_name}", boards, seq, key, row)
+                seq += 1
+        book.count = len(entries)
+        return book
+
+    def sync(self, entries: list[Any], aggregate: Callable[[dict[str, Any]], CareerAggregate]) -> bool:
+        """Rank entries appended to `entries` since the last sync.
+
+        Returns False when the book cannot be extended and must be rebuilt: the
+        list was replaced or shrank, or a player already ranked came back.
+        """
+        if entries is not self.source or len(entries) < self.count:
+            return False
+        for entry in entries[self.count :]:
+            if not isinstance(entry, dict):
+                continue
+            if not self._add(entry, aggregate):
+                return False
+        self.count = len(entries)
+        return True
+
+    def league_candidates(self) -> dict[str, dict[str, Any]]:
+        return _candidates(self.league)
+
+    def franchise_candidates(self, team_name: str) -> dict[str, dict[str, Any]]:
+        return _candidates(self.franchise.get(team_name))
+
+    def leader_candidates(self, team_name: str) -> dict[str, dict[str, Any]]:
+        return _candidates(self.leaders.get(team_name))
+
+    def _add(self, entry: dict[str, Any], aggregate: Callable[[dict[str, Any]], CareerAggregate]) -> bool:
+        seq = len(self._keys)
+        player_id = str(entry.get("player_id", "")).strip()
+        team_name = str(entry.get("team_at_retirement", ""))
+        leader_key = str(entry.get("player_id", entry.get("name", "")))
+        if (f"leaders:{team_name}", leader_key) in self._keys:
+            return False
+        franchise_rows: dict[str, dict[str, dict[str, Any]]] = {}
+        if player_id:
+            if ("league", player_id) in self._keys:
+                return False
+            for stint_team, totals in aggregate(entry).by_team.items():
+                if (f"franchise:{stint_team}", player_id) in self._keys:
+                    return False
+                _merge_franchise_row(franchise_rows.setdefault(stint_team, {}), player_id, entry, stint_team, totals)
+            league_rows: dict[str, dict[str, Any]] = {}
+            _merge_record_row(league_rows, player_id, entry)
+            self._offer("league", self.league, seq, player_id, league_rows[player_id])
+            for stint_team, rows in franchise_rows.items():
+                boards = self.franchise.setdefault(stint_team, _boards(RECORD_STATS))
+                for key, row in rows.items():
+                    self._offer(f"franchise:{stint_team}", boards, seq, key, row)
+        leader_rows: dict[str, dict[str, Any]] = {}
+        _merge_leader_row(leader_rows, leader_key, entry)
+        boards = self.leaders.setdefault(team_name, _boards(LEADER_STATS))
+        self._offer(f"leaders:{team_name}", boards, seq, leader_key, leader_rows[leader_key])
+        self.player_ids.add(str(entry.get("player_id", "")))
+        return True
+
+    def _offer(self, table: str, boards: dict[str, Leaderboard], seq: int, key: str, row: dict[str, Any]) -> None:
+        self._keys.add((table, key))
+        for board in boards.values():
+            board.offer(seq, key, row)
+
+
+@dataclass(slots=True)
+class StintIndex:
+    """First and last season each (player name, team) pair appears in the career history.
+
+    `source` is the history mapping the index was built from; rows appended
+    since are added with `add`.
+    """
+
+    source: dict[str, list[Any]]
+    ranges: dict[tuple[str, str], tuple[int, int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, history: dict[str, list[Any]]) -> StintIndex:
+        index = cls(source=history)
+        for rows in history.values():
+            if not isinstance(rows, list):
+                continue
+            for row in rows:
+                index.add(row)
+        return index
+
+    def add(self, row: Any) -> None:
+        if not isinstance(row, dict):
+            return
+        try:
+            season = int(row.get("season"))
+        except (TypeError, ValueError):
+            return
+        if season <= 0:
+            return
+        key = (str(row.get("name", "")).strip(), str(row.get("team", "")).strip())
+        current = self.ranges.get(key)
+        self.ranges[key] = (season, season) if current is None else (min(current[0], season), max(current[1], season))
+
+    def season_range(self, player_name: str, team_name: str) -> tuple[int, int] | None:
+        if not player_name:
+            return None
+        return self.ranges.get((player_name, team_name))
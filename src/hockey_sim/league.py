@@ -1,17 +1,28 @@
 ﻿from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from pathlib import Path
+import heapq
 import json
 import random
 import shutil
 from typing import Any
 
+from .career import CareerAggregate
+from .clinch import ClinchCalculator
 from .config import PLAYER_BIRTH_COUNTRIES
-from .engine import GameResult, STRATEGY_EFFECTS, simulate_game
+from .draft import DraftSession
+from .engine import GameResult, STRATEGY_EFFECTS, TeamStrength, home_win_probability, simulate_game, team_strength
+from .free_agency import FreeAgentMarket
+from .leaderboards import RecordBook, StintIndex
 from .models import DEFENSE_POSITIONS, FORWARD_POSITIONS, GOALIE_POSITIONS, Player, Team, TeamRecord
 from .names import COACH_FIRST_NAMES, COACH_LAST_NAMES, NameGenerator
-from .schedule import build_round_robin_days
+from .offseason import OffseasonProgress, OffseasonStage, run_offseason_stages
+from .parallel import DayGameExecutor
+from .playoffs import STAGE_COUNT, PlayoffGame, PlayoffSeries, PlayoffSession, higher_seed_hosts, series_outcomes, stage_label
+from .progression import DRAWS_PER_PLAYER, ProgressionTable
+from .schedule import ScheduleConfig, SeasonSchedule, build_season_schedule
+from .undo import UndoLog
 
 
 @dataclass(slots=True)
@@ -19,6 +30,46 @@ class LeagueResult:
     standings: list[TeamRecord]
 
 
+@dataclass(slots=True)
+class TeamDayContext:
+    """Coach-decision inputs for one team, computed once per game day."""
+
+    team: Team
+    coach_quality: float
+    dtd_candidates: list[Player]
+    healthy_by_pos: dict[str, int]
+    top_scoring_average: float | None = None
+    goalie_values: dict[str, float] = field(default_factory=dict)
+
+
+# "minimal" skips goal-event bookkeeping when fast-forwarding.
+SIM_DETAIL_LEVELS = ("full", "minimal")
+_RECORD_COUNTER_FIELDS = tuple(f.name for f in fields(TeamRecord) if f.name not in {"team", "recent_results"})
+_TEAM_FIELD_NAMES = tuple(f.name for f in fields(Team))
+_PLAYER_FIELD_NAMES = tuple(f.name for f in fields(Player))
+
+
+def _field_state(obj: Any, names: tuple[str, ...]) -> dict[str, Any]:
+    state: dict[str, Any] = {}
+    for name in names:
+        value = getattr(obj, name)
+        if isinstance(value, (list, dict, set)):
+            value = value.copy()
+        state[name] = value
+    return state
+
+
+@dataclass(slots=True)
+class SimCheckpoint:
+    """In-memory league state captured before a batch of simulated days."""
+
+    day_index: int
+    rng_state: object
+    records: dict[str, dict[str, object]]
+    teams: list[tuple[Team, dict[str, Any]]]
+    players: list[tuple[Player, dict[str, Any]]]
+
+
 class LeagueSimulator:
     SAVE_VERSION = 2
     DRAFT_FOCUS_OPTIONS = ("auto", "F", "C", "LW", "RW", "D", "G")
@@ -36,14 +87,34 @@ class LeagueSimulator:
         state_path: str | None = None,
         prime_age_min: int = 27,
         prime_age_max: int = 28,
+        schedule_config: ScheduleConfig | None = None,
     ) -> None:
         self.games_per_matchup = games_per_matchup
+        self.schedule_config = schedule_config
         self._rng = random.Random(seed)
         self.state_path = Path(state_path or "league_state.json")
         self.last_load_error: str = ""
+        # Bumped on every persisted mutation; API read caches key off this.
+        self.state_generation = 0
+        self._batched_saves_depth = 0
+        self._batched_save_pending = False
         loaded_state = self._load_state()
         loaded_teams = self._deserialize_teams(loaded_state.get("teams", [])) if loaded_state else []
         self.teams = loaded_teams if loaded_teams else teams
+        self._rebuild_team_indexes()
+        # Teams whose roster availability changed since their last depth/lineup pass.
+        self._dirty_team_names: set[str] = {team.name for team in self.teams}
+        # Per-day coach-decision contexts; None outside of game simulation.
+        self._team_contexts: dict[str, TeamDayContext] | None = None
+        # Inverse operations for the regular-season day in progress; None otherwise.
+        self._undo_log: UndoLog | None = None
+        self._game_executor: DayGameExecutor | None = None
+        # Running career-season sums, keyed by player id; rebuilt when a player's season list changes underneath.
+        self._career_aggregates: dict[str, CareerAggregate] = {}
+        self._hall_of_fame_aggregates: dict[str, CareerAggregate] = {}
+        # All-time leader boards and team stint ranges; None until first asked for.
+        self._record_book: RecordBook | None = None
+        self._stint_index: StintIndex | None = None
         self.free_agents: list[Player] = []
         self._name_generator = NameGenerator(seed=seed)
         self._name_generator.reserve([p.name for t in self.teams for p in [*t.roster, *t.minor_roster]])
@@ -70,7 +141,12 @@ class LeagueSimulator:
         self._records = self._deserialize_records(loaded_state.get("records", {})) if loaded_teams else {
             team.name: TeamRecord(team=team) for team in self.teams
         }
-        self._season_days = build_round_robin_days(self.teams, self.games_per_matchup)
+        self._invalidate_standings()
+        saved_schedule = SeasonSchedule.from_dict(loaded_state.get("schedule")) if loaded_teams else None
+        generator = self.schedule_config.generator if self.schedule_config is not None else "round_robin"
+        if saved_schedule is None or not saved_schedule.matches(self.teams, self.games_per_matchup, generator):
+            saved_schedule = self._build_schedule()
+        self._set_schedule(saved_schedule)
         if loaded_teams:
             saved_day = int(loaded_state.get("day_index", 0))
             self._day_index = max(0, min(saved_day, len(self._season_days)))
@@ -116,18 +192,24 @@ class LeagueSimulator:
             self.draft_focus_by_team = {}
             self.team_needs_by_team = {}
             self.current_draft_state = {}
+        self._draft_session_cache: DraftSession | None = None
+        self._playoff_session = PlayoffSession.from_dict(loaded_state.get("playoff_session"))
+        self._playoff_odds_cache: tuple[tuple[int, int, int, int], dict[str, object]] | None = None
         raw_pending_playoffs = loaded_state.get("pending_playoffs")
-        self.pending_playoffs: dict[str, object] | None = raw_pending_playoffs if isinstance(raw_pending_playoffs, dict) else None
-        raw_pending_days = loaded_state.get("pending_playoff_days")
-        self.pending_playoff_days: list[dict[str, object]] = (
-            [d for d in raw_pending_days if isinstance(d, dict)] if isinstance(raw_pending_days, list) else []
+        if self._playoff_session is None and isinstance(raw_pending_playoffs, dict):
+            # Older saves stored a fully simulated bracket; reveal it day by day as before.
+            self._playoff_session = PlayoffSession.from_legacy(
+                raw_pending_playoffs,
+                loaded_state.get("pending_playoff_days"),
+                loaded_state.get("pending_playoff_day_index", 0),
+            )
+        # An offseason interrupted after a checkpoint resumes at its next stage.
+        self._offseason_progress = OffseasonProgress.from_dict(loaded_state.get("offseason_progress"))
+        self._offseason_failed_stage = ""
+        raw_stages = loaded_state.get("last_offseason_stages", [])
+        self.last_offseason_stages: list[dict[str, object]] = (
+            [row for row in raw_stages if isinstance(row, dict)] if isinstance(raw_stages, list) else []
         )
-        raw_pending_idx = loaded_state.get("pending_playoff_day_index", 0)
-        try:
-            self.pending_playoff_day_index = int(raw_pending_idx)
-        except (TypeError, ValueError):
-            self.pending_playoff_day_index = 0
-        self.pending_playoff_day_index = max(0, min(self.pending_playoff_day_index, len(self.pending_playoff_days)))
         self._normalize_team_needs_config()
         self._save_state()
 
@@ -176,7 +258,7 @@ class LeagueSimulator:
             "save_version": self.SAVE_VERSION,
             "season_history": self.season_history,
         }
-        self._write_json_with_backup(self.history_path, payload)
+        self._write_json_with_backup(self.history_path, payload, compact=True)
 
     def _load_state(self) -> dict[str, Any]:
         if not self.state_path.exists():
@@ -197,7 +279,53 @@ class LeagueSimulator:
             return {}
         return {}
 
-    def _save_state(self) -> None:
+    def set_game_executor(self, mode: str | None, max_workers: int | None = None) -> None:
+        """Opt into per-game RNG substreams ("serial") or a process pool ("process").
+
+        None restores the default shared-RNG path. Both executor modes give the
+        same results as each other for a given seed, but not the same as None.
+        """
+        self.close_game_executor()
+        if mode:
+            self._game_executor = DayGameExecutor(mode=mode, max_workers=max_workers)
+
+    def close_game_executor(self) -> None:
+        if self._game_executor is not None:
+            self._game_executor.close()
+            self._game_executor = None
+
+    def begin_batched_saves(self) -> None:
+        # Long-running API jobs hold state writes until the batch ends.
+        self._batched_saves_depth += 1
+
+    def end_batched_saves(self) -> None:
+        self._batched_saves_depth = max(0, self._batched_saves_depth - 1)
+        if self._batched_saves_depth == 0:
+            self.flush_batched_saves()
+
+    def flush_batched_saves(self) -> None:
+        if not self._batched_save_pending:
+            return
+        self._batched_save_pending = False
+        self._write_state()
+
+    def discard_batched_saves(self) -> None:
+        # Drops a held write whose in-memory state is no longer safe to put on disk.
+        self._batched_save_pending = False
+
+    def _save_state(self, *, force: bool = False) -> None:
+        # force writes now even inside a batch, for state that must stay in step with other files.
+        self.state_generation += 1
+        if self._batched_saves_depth > 0 and not force:
+            self._batched_save_pending = True
+            return
+        self._batched_save_pending = False
+        self._write_state()
+
+    def _write_state(self) -> None:
+        if self._offseason_failed_stage:
+            # Memory holds a partly applied offseason stage; the last checkpoint on disk stays the save.
+            return
         state = {
             "save_version": self.SAVE_VERSION,
             "season_number": self.season_number,
@@ -205,6 +333,7 @@ class LeagueSimulator:
             "teams": [self._serialize_team(team) for team in self.teams],
             "free_agents": [self._serialize_player(player) for player in self.free_agents],
             "records": self._serialize_records(),
+            "schedule": self._schedule.to_dict(),
             "last_offseason_retired": self.last_offseason_retired,
             "last_offseason_retired_numbers": self.last_offseason_retired_numbers,
             "last_offseason_drafted": self.last_offseason_drafted,
@@ -212,12 +341,12 @@ class LeagueSimulator:
             "draft_focus_by_team": self.draft_focus_by_team,
             "team_needs_by_team": self.team_needs_by_team,
             "current_draft_state": self.current_draft_state,
-            "pending_playoffs": self.pending_playoffs,
-            "pending_playoff_days": self.pending_playoff_days,
-            "pending_playoff_day_index": self.pending_playoff_day_index,
+            "playoff_session": self._playoff_session.to_dict() if self._playoff_session is not None else None,
+            "offseason_progress": self._offseason_progress.to_dict() if self._offseason_progress is not None else None,
+            "last_offseason_stages": self.last_offseason_stages,
         }
-        # Routine autosave is called frequently during sim; skip per-save backup copy for speed.
-        self._write_json_with_backup(self.state_path, state, with_backup=False)
+        # Routine autosave is called frequently during sim; skip per-save backup copy and indentation for speed.
+        self._write_json_with_backup(self.state_path, state, with_backup=False, compact=True)
 
     def _normalize_need_scores(self, raw_scores: Any) -> dict[str, float]:
         scores: dict[str, float] = {}
@@ -317,14 +446,16 @@ class LeagueSimulator:
         }
         self._write_json_with_backup(self.hall_of_fame_path, payload)
 
-    def _write_json_with_backup(self, path: Path, payload: Any, *, with_backup: bool = True) -> None:
+    def _write_json_with_backup(self, path: Path, payload: Any, *, with_backup: bool = True, compact: bool = False) -> None:
         if with_backup and path.exists():
             backup = path.with_suffix(path.suffix + ".bak")
             try:
                 shutil.copy2(path, backup)
             except OSError:
                 pass
-        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Indented output goes through the pure-Python encoder; compact output uses the C one.
+        text = json.dumps(payload, separators=(",", ":")) if compact else json.dumps(payload, indent=2)
+        path.write_text(text, encoding="utf-8")
 
     def _apply_career_history_to_rosters(self) -> None:
         for team in self.teams:
@@ -651,6 +782,7 @@ class LeagueSimulator:
         team.coach_tenure_seasons = 0
         team.coach_changes_recent = min(5.0, max(0.0, team.coach_changes_recent) + 0.8)
         team.coach_honeymoon_games_remaining = 24
+        self._dirty_team_names.add(team.name)
         team.set_default_lineup()
         return {
             "team": team.name,
@@ -689,8 +821,12 @@ class LeagueSimulator:
         goalie_penalty = 4.0 if player.position in GOALIE_POSITIONS else 0.0
         return skater_score + age_bonus - goalie_penalty
 
-    def _ensure_team_leadership(self) -> None:
-        for team in self.teams:
+    def mark_team_dirty(self, team: Team | str) -> None:
+        self._dirty_team_names.add(team.name if isinstance(team, Team) else str(team))
+
+    def _ensure_team_leadership(self, team: Team | None = None) -> None:
+        targets = [team] if team is not None else self.teams
+        for team in targets:
             core = [p for p in team.roster if not p.is_injured]
             if not core:
                 core = list(team.roster)
@@ -836,11 +972,46 @@ class LeagueSimulator:
             if colors is not None:
                 team.primary_color, team.secondary_color = colors
 
+    def _team_context(self, team: Team) -> TeamDayContext:
+        contexts = self._team_contexts
+        context = contexts.get(team.name) if contexts is not None else None
+        if context is not None and context.team is team:
+            return context
+        healthy_by_pos: dict[str, int] = {"C": 0, "LW": 0, "RW": 0, "D": 0, "G": 0}
+        dtd_candidates: list[Player] = []
+        for p in team.roster:
+            if p.injured_games_remaining <= 0:
+                healthy_by_pos[p.position] = healthy_by_pos.get(p.position, 0) + 1
+            elif p.injury_status == "DTD":
+                dtd_candidates.append(p)
+        context = TeamDayContext(
+            team=team,
+            coach_quality=max(0.0, min(1.0, (team.coach_rating - 2.0) / 3.0)),
+            dtd_candidates=dtd_candidates,
+            healthy_by_pos=healthy_by_pos,
+        )
+        if contexts is not None:
+            contexts[team.name] = context
+        return context
+
+    def _team_top_scoring_average(self, team: Team) -> float:
+        context = self._team_context(team)
+        if context.top_scoring_average is None:
+            top = sorted([p.scoring_weight for p in team.active_skaters()], reverse=True)[:6]
+            context.top_scoring_average = sum(top) / max(1, len(top))
+        return context.top_scoring_average
+
+    def _team_goalie_value(self, team: Team, player: Player) -> float:
+        values = self._team_context(team).goalie_values
+        value = values.get(player.name)
+        if value is None:
+            value = self._goalie_selection_value(player)
+            values[player.name] = value
+        return value
+
     def _coach_matchup_preference(self, team: Team, opponent: Team) -> str:
-        team_top = sorted([p.scoring_weight for p in team.active_skaters()], reverse=True)[:6]
-        opp_top = sorted([p.scoring_weight for p in opponent.active_skaters()], reverse=True)[:6]
-        team_off = sum(team_top) / max(1, len(team_top))
-        opp_off = sum(opp_top) / max(1, len(opp_top))
+        team_off = self._team_top_scoring_average(team)
+        opp_off = self._team_top_scoring_average(opponent)
         if team_off - opp_off > 0.16:
             return "aggressive"
         if opp_off - team_off > 0.16:
@@ -899,6 +1070,8 @@ class LeagueSimulator:
 
     def _consume_coach_game_effect(self, team: Team) -> None:
         if team.coach_honeymoon_games_remaining > 0:
+            if self._undo_log is not None:
+                self._undo_log.save(team, "coach_honeymoon_games_remaining")
             team.coach_honeymoon_games_remaining -= 1
 
     def _schedule_context_modifiers(
@@ -946,7 +1119,7 @@ class LeagueSimulator:
         if len(goalies) == 1:
             return goalies[0]
 
-        ranked = sorted(goalies, key=self._goalie_selection_value, reverse=True)
+        ranked = sorted(goalies, key=lambda g: self._team_goalie_value(team, g), reverse=True)
         starter = ranked[0]
         backup = ranked[1]
 
@@ -1034,9 +1207,9 @@ class LeagueSimulator:
         if len(goalies) == 1:
             return goalies[0]
 
-        coach_quality = max(0.0, min(1.0, (team.coach_rating - 2.0) / 3.0))
+        coach_quality = self._team_context(team).coach_quality
 
-        ranked = sorted(goalies, key=self._goalie_selection_value, reverse=True)
+        ranked = sorted(goalies, key=lambda g: self._team_goalie_value(team, g), reverse=True)
         starter = ranked[0]
         backup = ranked[1]
 
@@ -1046,7 +1219,7 @@ class LeagueSimulator:
 
         # In regular season back-to-backs, coaches should usually rest the starter.
         if not playoff_mode and played_yesterday:
-            quality_gap = self._goalie_selection_value(starter) - self._goalie_selection_value(backup)
+            quality_gap = self._team_goalie_value(team, starter) - self._team_goalie_value(team, backup)
             starter_override_chance = 0.10
             if quality_gap > 0.85:
                 starter_override_chance = 0.22
@@ -1076,23 +1249,24 @@ class LeagueSimulator:
         playoff_mode: bool = False,
         elimination_game: bool = False,
     ) -> None:
-        coach_quality = max(0.0, min(1.0, (team.coach_rating - 2.0) / 3.0))
+        context = self._team_context(team)
+        # Availability is being re-rolled, so any cached skater averages are stale.
+        context.top_scoring_average = None
+        for player in team.roster:
+            if player.dtd_play_today and not player.is_dtd:
+                player.dtd_play_today = False
+        if not context.dtd_candidates:
+            return
+        coach_quality = context.coach_quality
+        healthy_by_pos = context.healthy_by_pos
         style = team.coach_style if team.coach_style in {"aggressive", "balanced", "defensive"} else "balanced"
         team_rec = self._records.get(team.name)
         opp_rec = self._records.get(opponent.name)
         underdog_push = 0.0
         if team_rec is not None and opp_rec is not None and team_rec.point_pct + 0.015 < opp_rec.point_pct:
             underdog_push = 0.04
-        healthy_by_pos: dict[str, int] = {"C": 0, "LW": 0, "RW": 0, "D": 0, "G": 0}
-        for p in team.roster:
-            if p.injured_games_remaining <= 0:
-                healthy_by_pos[p.position] = healthy_by_pos.get(p.position, 0) + 1
-
-        for player in team.roster:
-            if not player.is_dtd:
-                player.dtd_play_today = False
-                continue
 
+        for player in context.dtd_candidates:
             healthy_depth_count = max(0, healthy_by_pos.get(player.position, 0))
             has_healthy_depth = healthy_depth_count > 0
             if player.position in GOALIE_POSITIONS and not has_healthy_depth:
@@ -1146,6 +1320,7 @@ class LeagueSimulator:
         team.coach_tenure_seasons = 0
         team.coach_changes_recent = min(5.0, max(0.0, team.coach_changes_recent) + 1.0)
         team.coach_honeymoon_games_remaining = 24
+        self._dirty_team_names.add(team.name)
         team.set_default_lineup()
         self._save_state()
         return {
@@ -1282,117 +1457,103 @@ class LeagueSimulator:
             return []
         return self._season_days[self._day_index]
 
+    @property
+    def schedule(self) -> SeasonSchedule:
+        return self._schedule
+
+    def _build_schedule(self) -> SeasonSchedule:
+        return build_season_schedule(self.teams, self.games_per_matchup, config=self.schedule_config)
+
+    def _set_schedule(self, schedule: SeasonSchedule) -> None:
+        self._schedule = schedule
+        # Live (Team, Team) days for the simulation loop, resolved from the compact artifact.
+        self._season_days = schedule.materialize(self.teams)
+
+    def _rebuild_team_indexes(self) -> None:
+        self._team_by_name: dict[str, Team] = {}
+        self._teams_by_division: dict[str, list[Team]] = {}
+        self._teams_by_conference: dict[str, list[Team]] = {}
+        for team in self.teams:
+            self._team_by_name[team.name] = team
+            self._teams_by_division.setdefault(team.division, []).append(team)
+            self._teams_by_conference.setdefault(team.conference, []).append(team)
+
+    def _invalidate_standings(self) -> None:
+        # Sorted standings only change when a game is registered or records are replaced.
+        self._standings_version = getattr(self, "_standings_version", 0) + 1
+        self._standings_cache: list[TeamRecord] | None = None
+        self._division_standings_cache: dict[str, list[TeamRecord]] = {}
+        self._conference_standings_cache: dict[str, list[TeamRecord]] = {}
+
+    def _sorted_standings(self) -> list[TeamRecord]:
+        if self._standings_cache is None:
+            self._standings_cache = sorted(
+                self._records.values(),
+                key=lambda r: (r.points, r.goal_diff, r.goals_for),
+                reverse=True,
+            )
+        return self._standings_cache
+
     def get_standings(self) -> list[TeamRecord]:
-        return sorted(
-            self._records.values(),
-            key=lambda r: (r.points, r.goal_diff, r.goals_for),
-            reverse=True,
-        )
+        return list(self._sorted_standings())
 
     def get_division_standings(self, division: str) -> list[TeamRecord]:
-        return [rec for rec in self.get_standings() if rec.team.division == division]
+        rows = self._division_standings_cache.get(division)
+        if rows is None:
+            rows = [rec for rec in self._sorted_standings() if rec.team.division == division]
+            self._division_standings_cache[division] = rows
+        return list(rows)
 
     def get_divisions(self) -> list[str]:
-        return sorted({team.division for team in self.teams})
+        return sorted(self._teams_by_division)
 
     def get_conference_standings(self, conference: str) -> list[TeamRecord]:
-        return [rec for rec in self.get_standings() if rec.team.conference == conference]
+        rows = self._conference_standings_cache.get(conference)
+        if rows is None:
+            rows = [rec for rec in self._sorted_standings() if rec.team.conference == conference]
+            self._conference_standings_cache[conference] = rows
+        return list(rows)
 
     def get_conferences(self) -> list[str]:
-        return sorted({team.conference for team in self.teams})
+        return sorted(self._teams_by_conference)
 
-    def _team_total_games(self) -> dict[str, int]:
-        totals: dict[str, int] = {team.name: 0 for team in self.teams}
-        for day in self._season_days:
-            for home, away in day:
-                totals[home.name] = totals.get(home.name, 0) + 1
-                totals[away.name] = totals.get(away.name, 0) + 1
-        return totals
-
-    def _conference_playoff_qualifiers_from_rows(
-        self,
-        conf_rows: list[TeamRecord],
-        points_override: dict[str, int] | None = None,
-    ) -> set[str]:
-        if not conf_rows:
-            return set()
-        points_override = points_override or {}
-        divisions = sorted({rec.team.division for rec in conf_rows})
-        ordered = sorted(
-            conf_rows,
-            key=lambda rec: (
-                int(points_override.get(rec.team.name, rec.points)),
-                rec.goal_diff,
-                rec.goals_for,
-            ),
-            reverse=True,
-        )
-        if len(divisions) != 2:
-            return {rec.team.name for rec in ordered[: min(8, len(ordered))]}
-        div_a, div_b = divisions[0], divisions[1]
-        a_rows = [r for r in ordered if r.team.division == div_a]
-        b_rows = [r for r in ordered if r.team.division == div_b]
-        a_top = a_rows[:3]
-        b_top = b_rows[:3]
-        qualified = {r.team.name for r in a_top + b_top}
-        wildcards = [r for r in ordered if r.team.name not in qualified][:2]
-        qualified.update(r.team.name for r in wildcards)
-        return qualified
-
-    def _current_playoff_field(self) -> set[str]:
-        qualified: set[str] = set()
-        for conference in self.get_conferences():
-            conf_rows = self.get_conference_standings(conference)
-            qualified.update(self._conference_playoff_qualifiers_from_rows(conf_rows))
-        return qualified
+    def _clinch_calculator(self) -> ClinchCalculator:
+        calculator = getattr(self, "_clinch", None)
+        if calculator is None or calculator.season_days is not self._season_days:
+            calculator = ClinchCalculator(self._season_days, self.teams)
+            self._clinch = calculator
+        return calculator
 
     def get_playoff_clinch_status(self) -> dict[str, bool]:
-        clinched: dict[str, bool] = {team.name: False for team in self.teams}
+        return {team_name: "x" in tags for team_name, tags in self.get_clinch_tags().items()}
+
+    def get_clinch_tags(self) -> dict[str, list[str]]:
+        """x/y/z/p clinch and e elimination tags per team for the current standings."""
+        tags = self._clinch_calculator().tags(self._records, self._day_index, self._standings_version)
         # Once playoffs are active, the playoff field is concrete from seeds.
-        if isinstance(self.pending_playoffs, dict):
-            seeds = self.pending_playoffs.get("seeds", [])
-            if isinstance(seeds, list):
-                for row in seeds:
-                    if not isinstance(row, dict):
-                        continue
-                    team_name = str(row.get("team", "")).strip()
-                    if team_name:
-                        clinched[team_name] = True
-                return clinched
-
-        # Season complete: playoff field is deterministic from standings.
-        if self.is_complete():
-            for team_name in self._current_playoff_field():
-                clinched[team_name] = True
-            return clinched
-
-        # In-season clinch: pessimistic test aligned to actual qualifier structure.
-        # A team is clinched only if it still qualifies when every other team is
-        # given its maximum possible points while that team stays at current points.
-        total_games = self._team_total_games()
-        for conference in self.get_conferences():
-            conf_rows = self.get_conference_standings(conference)
-            if not conf_rows:
-                continue
-            max_points_by_team: dict[str, int] = {}
-            for rec in conf_rows:
-                total = total_games.get(rec.team.name, rec.games_played)
-                remaining = max(0, total - rec.games_played)
-                max_points_by_team[rec.team.name] = rec.points + (2 * remaining)
-            for rec in conf_rows:
-                pessimistic_points = dict(max_points_by_team)
-                pessimistic_points[rec.team.name] = rec.points
-                qualified = self._conference_playoff_qualifiers_from_rows(
-                    conf_rows,
-                    points_override=pessimistic_points,
-                )
-                if rec.team.name in qualified:
-                    clinched[rec.team.name] = True
-        return clinched
+        if self._playoff_session is not None:
+            seeds = self._playoff_session.seeds
+            if seeds:
+                seeded = {
+                    str(row.get("team", "")).strip()
+                    for row in seeds
+                    if isinstance(row, dict) and str(row.get("team", "")).strip()
+                }
+                for team_name in set(tags) | seeded:
+                    rest = [tag for tag in tags.get(team_name, []) if tag not in {"x", "e"}]
+                    tags[team_name] = ["x", *rest] if team_name in seeded else [*rest, "e"]
+        return tags
+
+    def get_playoff_magic_numbers(self) -> dict[str, int | None]:
+        return self._clinch_calculator().magic_numbers(self._records, self._day_index, self._standings_version)
 
     def get_team(self, team_name: str) -> Team | None:
+        team = self._team_by_name.get(team_name)
+        if team is not None and team.name == team_name:
+            return team
         for team in self.teams:
             if team.name == team_name:
+                self._rebuild_team_indexes()
                 return team
         return None
 
@@ -1420,149 +1581,125 @@ class LeagueSimulator:
         return self._day_index >= len(self._season_days)
 
     def has_playoff_session(self) -> bool:
-        return self.pending_playoffs is not None
+        return self._playoff_session is not None
 
     def playoffs_finished(self) -> bool:
-        return self.pending_playoffs is not None and self.pending_playoff_day_index >= len(self.pending_playoff_days)
-
-    def _build_playoff_reveal_days(self, playoffs: dict[str, object]) -> list[dict[str, object]]:
-        days: list[dict[str, object]] = []
-        rounds = playoffs.get("rounds", [])
-        if not isinstance(rounds, list):
-            return days
-        stage_groups: dict[str, list[dict[str, object]]] = {}
-        stage_order: list[str] = []
-
-        def _stage_name(round_name: str) -> str:
-            suffixes = (
-                " First Round",
-                " Division Finals",
-                " Conference Final",
-                " Conference Quarterfinal",
-                " Conference Semifinal",
-            )
-            for suffix in suffixes:
-                if round_name.endswith(suffix):
-                    return suffix.strip()
-            return round_name
+        return self._playoff_session is not None and self._playoff_session.complete
 
-        for round_row in rounds:
-            if not isinstance(round_row, dict):
+    @property
+    def pending_playoffs(self) -> dict[str, object] | None:
+        session = self._playoff_session
+        if session is None:
+            return None
+        return session.bracket(self._playoff_mvp_race(session.tracker, limit=12))
+
+    @property
+    def pending_playoff_days(self) -> list[dict[str, object]]:
+        return self._playoff_session.days if self._playoff_session is not None else []
+
+    @property
+    def pending_playoff_day_index(self) -> int:
+        return len(self.pending_playoff_days)
+
+    def playoff_total_days(self) -> int:
+        """Days played so far plus the most the remaining bracket could still take."""
+        return self._playoff_session.total_days_estimate() if self._playoff_session is not None else 0
+
+    def upcoming_playoff_day(self) -> dict[str, object] | None:
+        session = self._playoff_session
+        if session is None or session.complete:
+            return None
+        if session.legacy_bracket is not None:
+            return session.legacy_days[session.legacy_revealed]
+        active = session.active_series()
+        games: list[dict[str, object]] = []
+        for series in active:
+            higher_seed = self.get_team(series.higher_seed)
+            lower_seed = self.get_team(series.lower_seed)
+            if higher_seed is None or lower_seed is None:
                 continue
-            round_name = str(round_row.get("name", "Round"))
-            stage = _stage_name(round_name)
-            if stage not in stage_groups:
-                stage_groups[stage] = []
-                stage_order.append(stage)
-            stage_groups[stage].append(round_row)
-
-        for stage in stage_order:
-            grouped_rounds = stage_groups.get(stage, [])
-            all_series: list[dict[str, object]] = []
-            for round_row in grouped_rounds:
-                series_rows = round_row.get("series", [])
-                if isinstance(series_rows, list):
-                    all_series.extend([s for s in series_rows if isinstance(s, dict)])
-            max_games = 0
-            for series in all_series:
-                games = series.get("games", [])
-                if isinstance(games, list):
-                    max_games = max(max_games, len(games))
-            for game_no in range(1, max_games + 1):
-                day_games: list[dict[str, object]] = []
-                for series in all_series:
-                    games = series.get("games", [])
-                    if not isinstance(games, list):
-                        continue
-
-                    def _game_no(row: dict[str, object]) -> int:
-                        try:
-                            return int(row.get("game", 0))
-                        except (TypeError, ValueError):
-                            return 0
-
-                    game_row = next((g for g in games if isinstance(g, dict) and _game_no(g) == game_no), None)
-                    if game_row is None:
-                        continue
-                    series_high = str(series.get("higher_seed", ""))
-                    series_low = str(series.get("lower_seed", ""))
-                    high_wins = 0
-                    low_wins = 0
-                    for prior in games:
-                        if not isinstance(prior, dict) or _game_no(prior) > game_no:
-                            continue
-                        winner = str(prior.get("winner", ""))
-                        if winner == series_high:
-                            high_wins += 1
-                        elif winner == series_low:
-                            low_wins += 1
-                    entry = dict(game_row)
-                    entry["series_higher_seed"] = series_high
-                    entry["series_lower_seed"] = series_low
-                    entry["series_high_wins"] = high_wins
-                    entry["series_low_wins"] = low_wins
-                    day_games.append(entry)
-                if day_games:
-                    days.append({"round": stage, "game_number": game_no, "games": day_games})
-        return days
+            game_number = len(series.games) + 1
+            home = self._series_home_team(game_number, higher_seed, lower_seed)
+            away = lower_seed if home.name == higher_seed.name else higher_seed
+            games.append(
+                {
+                    "game": game_number,
+                    "home": home.name,
+                    "away": away.name,
+                    "series_higher_seed": series.higher_seed,
+                    "series_lower_seed": series.lower_seed,
+                    "series_high_wins": series.high_wins,
+                    "series_low_wins": series.low_wins,
+                }
+            )
+        return {
+            "round": stage_label(active[0].group) if active else "",
+            "game_number": session.stage_game_number(),
+            "games": games,
+        }
 
     def start_playoffs(self) -> dict[str, object]:
         if not self.is_complete():
             return {"started": False, "reason": "season_not_complete"}
-        if self.pending_playoffs is None:
-            playoffs = self._run_playoffs()
-            self.pending_playoffs = playoffs
-            self.pending_playoff_days = self._build_playoff_reveal_days(playoffs)
-            self.pending_playoff_day_index = 0
+        if self._playoff_session is None:
+            self._playoff_session = self._create_playoff_session()
             self._save_state()
         return {
             "started": True,
-            "total_days": len(self.pending_playoff_days),
+            "total_days": self.playoff_total_days(),
             "playoffs": self.pending_playoffs,
         }
 
     def simulate_next_playoff_day(self) -> dict[str, object]:
-        if self.pending_playoffs is None:
+        session = self._playoff_session
+        if session is None:
             return {"advanced": False, "reason": "playoffs_not_started"}
-        if self.pending_playoff_day_index >= len(self.pending_playoff_days):
+        if session.complete:
             return {
                 "advanced": False,
                 "reason": "playoffs_complete",
                 "complete": True,
                 "playoffs": self.pending_playoffs,
             }
-        # Decay injury timers per revealed playoff day so UI injury status stays in sync.
-        # Playoffs are pre-simulated for outcomes, but user-facing recovery must still tick.
         self._advance_recovery_day()
         self._ensure_team_player_numbers()
-        day = self.pending_playoff_days[self.pending_playoff_day_index]
-        self.pending_playoff_day_index += 1
-        complete = self.pending_playoff_day_index >= len(self.pending_playoff_days)
+        if session.legacy_bracket is not None:
+            session.legacy_revealed += 1
+            session.complete = session.legacy_revealed >= len(session.legacy_days)
+        else:
+            # Only today's games are decided; later games see today's injuries and goalie usage.
+            for series in session.active_series():
+                self._play_playoff_game(session, series)
+            self._team_contexts = None
+            session.invalidate_days()
+            self._advance_playoff_bracket(session)
+        days = session.days
         self._save_state()
         return {
             "advanced": True,
-            "day_number": self.pending_playoff_day_index,
-            "total_days": len(self.pending_playoff_days),
-            "day": day,
-            "complete": complete,
+            "day_number": len(days),
+            "total_days": self.playoff_total_days(),
+            "day": days[-1] if days else {},
+            "complete": session.complete,
             "playoffs": self.pending_playoffs,
         }
 
     def _advance_recovery_day(self) -> None:
+        undo = self._undo_log
         for team in self.teams:
             for player in [*team.roster, *team.minor_roster]:
+                if undo is not None and (player.dtd_play_today or player.injured_games_remaining > 0):
+                    undo.save_fields(player, ("dtd_play_today", "injured_games_remaining", "injury_type", "injury_status"))
                 player.dtd_play_today = False
                 if player.injured_games_remaining > 0:
                     player.injured_games_remaining -= 1
                     if player.injured_games_remaining <= 0:
                         player.injury_type = ""
                         player.injury_status = "Healthy"
-
-    def _record_gp_snapshot(self) -> dict[str, int]:
-        return {
-            team_name: int(rec.games_played)
-            for team_name, rec in self._records.items()
-        }
+                        self._dirty_team_names.add(team.name)
+                    elif player.is_dtd:
+                        # Game-time decisions reset daily, so availability must be re-evaluated.
+                        self._dirty_team_names.add(team.name)
 
     def _snapshot_team_records(self) -> dict[str, dict[str, object]]:
         snapshot: dict[str, dict[str, object]] = {}
@@ -1588,6 +1725,7 @@ class LeagueSimulator:
         return snapshot
 
     def _restore_team_records(self, snapshot: dict[str, dict[str, object]]) -> None:
+        self._invalidate_standings()
         for team_name, rec in self._records.items():
             saved = snapshot.get(team_name)
             if not isinstance(saved, dict):
@@ -1610,17 +1748,130 @@ class LeagueSimulator:
             recent = saved.get("recent_results", [])
             rec.recent_results = list(recent) if isinstance(recent, list) else list(rec.recent_results)
 
-    def simulate_next_day(
+    def _prepare_regular_season_game(
         self,
-        user_team_name: str | None = None,
-        user_strategy: str = "balanced",
-        use_user_lines: bool = False,
-        use_user_strategy: bool = False,
-    ) -> list[GameResult]:
-        if self.is_complete():
-            return []
+        home: Team,
+        away: Team,
+        user_team_name: str | None,
+        user_strategy: str,
+        use_user_lines: bool,
+        use_user_strategy: bool,
+        played_yesterday: set[str],
+        detail: str = "full",
+    ) -> dict[str, object]:
+        home_dirty = home.name in self._dirty_team_names
+        away_dirty = away.name in self._dirty_team_names
+        if home_dirty:
+            self._ensure_team_depth(home)
+        if away_dirty:
+            self._ensure_team_depth(away)
+        self._coach_set_dtd_decisions(home, away, playoff_mode=False)
+        self._coach_set_dtd_decisions(away, home, playoff_mode=False)
+        # Lineups only move when availability changed; DTD calls are re-rolled every game.
+        home_dtd = any(p.is_dtd for p in home.roster)
+        away_dtd = any(p.is_dtd for p in away.roster)
+        home_refresh = home_dirty or home_dtd or home.name == user_team_name
+        away_refresh = away_dirty or away_dtd or away.name == user_team_name
+        if home_refresh and (home.name != user_team_name or not use_user_lines):
+            home.set_default_lineup()
+        if away_refresh and (away.name != user_team_name or not use_user_lines):
+            away.set_default_lineup()
+        self._dirty_team_names.discard(home.name)
+        self._dirty_team_names.discard(away.name)
 
-        # Integrity guard: standings cannot be ahead of calendar day before sim.
+        home_coach_controls = home.name != user_team_name or not use_user_lines
+        away_coach_controls = away.name != user_team_name or not use_user_lines
+        if home_coach_controls:
+            home_goalie = self._coach_choose_starting_goalie(
+                home,
+                playoff_mode=False,
+                played_yesterday=(home.name in played_yesterday),
+            )
+            home.set_starting_goalie(home_goalie.name if home_goalie is not None else None)
+        if away_coach_controls:
+            away_goalie = self._coach_choose_starting_goalie(
+                away,
+                playoff_mode=False,
+                played_yesterday=(away.name in played_yesterday),
+            )
+            away.set_starting_goalie(away_goalie.name if away_goalie is not None else None)
+
+        home_strategy = home.coach_style
+        away_strategy = away.coach_style
+        if home.name == user_team_name and use_user_strategy:
+            home_strategy = user_strategy
+        if away.name == user_team_name and use_user_strategy:
+            away_strategy = user_strategy
+        home_off_bonus, home_def_bonus, home_injury_mult = self._coach_modifiers(home, home_strategy, away)
+        away_off_bonus, away_def_bonus, away_injury_mult = self._coach_modifiers(away, away_strategy, home)
+        if home.name == user_team_name:
+            position_penalty = home.lineup_position_penalty()
+            home_off_bonus -= position_penalty * 0.45
+            home_def_bonus -= position_penalty * 0.50
+        if away.name == user_team_name:
+            position_penalty = away.lineup_position_penalty()
+            away_off_bonus -= position_penalty * 0.45
+            away_def_bonus -= position_penalty * 0.50
+        home_sched_bonus, home_sched_injury = self._schedule_context_modifiers(
+            home, away, played_yesterday, is_away=False
+        )
+        away_sched_bonus, away_sched_injury = self._schedule_context_modifiers(
+            away, home, played_yesterday, is_away=True
+        )
+        home_off_bonus += home_sched_bonus
+        away_off_bonus += away_sched_bonus
+        home_injury_mult *= home_sched_injury
+        away_injury_mult *= away_sched_injury
+        return {
+            "home_strategy": home_strategy,
+            "away_strategy": away_strategy,
+            "home_coach_offense_bonus": home_off_bonus,
+            "away_coach_offense_bonus": away_off_bonus,
+            "home_coach_defense_bonus": home_def_bonus,
+            "away_coach_defense_bonus": away_def_bonus,
+            "home_context_bonus": 0.012,
+            "away_context_bonus": -0.006,
+            "home_injury_mult": home_injury_mult,
+            "away_injury_mult": away_injury_mult,
+            "detail": detail,
+        }
+
+    def _register_regular_season_result(self, result: GameResult) -> None:
+        if self._undo_log is not None:
+            for team in (result.home, result.away):
+                rec = self._records[team.name]
+                self._undo_log.save_fields(rec, _RECORD_COUNTER_FIELDS)
+                self._undo_log.save_length(rec, "recent_results")
+        self._records[result.home.name].register_game(
+            result.home_goals,
+            result.away_goals,
+            result.overtime,
+            is_home=True,
+            pp_goals=result.home_pp_goals,
+            pp_chances=result.home_pp_chances,
+            pk_goals_against=result.away_pp_goals,
+            pk_chances_against=result.away_pp_chances,
+        )
+        self._records[result.away.name].register_game(
+            result.away_goals,
+            result.home_goals,
+            result.overtime,
+            is_home=False,
+            pp_goals=result.away_pp_goals,
+            pp_chances=result.away_pp_chances,
+            pk_goals_against=result.home_pp_goals,
+            pk_chances_against=result.home_pp_chances,
+        )
+        self._invalidate_standings()
+        self._consume_coach_game_effect(result.home)
+        self._consume_coach_game_effect(result.away)
+        if result.home_injuries:
+            self._dirty_team_names.add(result.home.name)
+        if result.away_injuries:
+            self._dirty_team_names.add(result.away.name)
+
+    def _check_calendar_integrity(self) -> None:
+        # Standings cannot be ahead of the calendar day before a sim.
         max_allowed_gp = max(0, int(self._day_index))
         for rec in self._records.values():
             if int(rec.games_played) > max_allowed_gp:
@@ -1629,143 +1880,269 @@ class LeagueSimulator:
                     f"while calendar day index is {self._day_index}."
                 )
 
+    def _capture_checkpoint(self) -> SimCheckpoint:
+        return SimCheckpoint(
+            day_index=self._day_index,
+            rng_state=self._rng.getstate(),
+            records=self._snapshot_team_records(),
+            teams=[(team, _field_state(team, _TEAM_FIELD_NAMES)) for team in self.teams],
+            players=[
+                (player, _field_state(player, _PLAYER_FIELD_NAMES))
+                for team in self.teams
+                for player in [*team.roster, *team.minor_roster]
+            ],
+        )
+
+    def _restore_checkpoint(self, checkpoint: SimCheckpoint) -> None:
+        for team, state in checkpoint.teams:
+            for name, value in state.items():
+                setattr(team, name, value)
+        for player, state in checkpoint.players:
+            for name, value in state.items():
+                setattr(player, name, value)
+        self._restore_team_records(checkpoint.records)
+        self._rng.setstate(checkpoint.rng_state)
+        self._day_index = checkpoint.day_index
+        self._team_contexts = None
+        self._dirty_team_names = {team.name for team in self.teams}
+
+    def simulate_next_day(
+        self,
+        user_team_name: str | None = None,
+        user_strategy: str = "balanced",
+        use_user_lines: bool = False,
+        use_user_strategy: bool = False,
+        detail: str = "full",
+    ) -> list[GameResult]:
+        if self.is_complete():
+            return []
+        self._check_calendar_integrity()
         self._ensure_team_player_numbers()
-        self._advance_recovery_day()
+        return self._simulate_day(
+            user_team_name=user_team_name,
+            user_strategy=user_strategy,
+            use_user_lines=use_user_lines,
+            use_user_strategy=use_user_strategy,
+            detail=detail,
+            in_batch=False,
+        )
 
+    def _simulate_day(
+        self,
+        user_team_name: str | None,
+        user_strategy: str,
+        use_user_lines: bool,
+        use_user_strategy: bool,
+        detail: str,
+        in_batch: bool,
+    ) -> list[GameResult]:
         user_strategy = user_strategy.lower()
         if user_strategy not in STRATEGY_EFFECTS:
             user_strategy = "balanced"
 
         day_games = self._season_days[self._day_index]
         # Schedule integrity: a team may play at most one game per regular-season day.
-        scheduled_names: set[str] = set()
-        scheduled_day_teams: set[str] = set()
+        gp_before: dict[str, int] = {}
         for home, away in day_games:
-            if home.name in scheduled_names or away.name in scheduled_names:
+            if home.name in gp_before or away.name in gp_before:
                 raise ValueError(f"Invalid schedule day: duplicate team assignment on day {self.current_day}.")
-            scheduled_names.add(home.name)
-            scheduled_names.add(away.name)
-            scheduled_day_teams.add(home.name)
-            scheduled_day_teams.add(away.name)
-        gp_before = self._record_gp_snapshot()
-        records_before = self._snapshot_team_records()
-        played_yesterday: set[str] = set()
-        if self._day_index > 0:
-            for home_prev, away_prev in self._season_days[self._day_index - 1]:
-                played_yesterday.add(home_prev.name)
-                played_yesterday.add(away_prev.name)
+            gp_before[home.name] = int(self._records[home.name].games_played)
+            gp_before[away.name] = int(self._records[away.name].games_played)
+        # Batches roll back from their own checkpoint; a lone day logs inverse operations instead.
+        undo = None if in_batch else UndoLog()
+        rng_state = None if in_batch else self._rng.getstate()
+        played_yesterday = self._schedule.teams_on(self._day_index - 1)
         day_results: list[GameResult] = []
+        self._undo_log = undo
+        self._team_contexts = {}
         try:
-            for home, away in day_games:
-                self._ensure_team_depth(home)
-                self._ensure_team_depth(away)
-                self._coach_set_dtd_decisions(home, away, playoff_mode=False)
-                self._coach_set_dtd_decisions(away, home, playoff_mode=False)
-                if home.name != user_team_name or not use_user_lines:
-                    home.set_default_lineup()
-                if away.name != user_team_name or not use_user_lines:
-                    away.set_default_lineup()
-
-                home_coach_controls = home.name != user_team_name or not use_user_lines
-                away_coach_controls = away.name != user_team_name or not use_user_lines
-                if home_coach_controls:
-                    home_goalie = self._coach_choose_starting_goalie(
+            self._advance_recovery_day()
+            if self._game_executor is None:
+                for home, away in day_games:
+                    game_kwargs = self._prepare_regular_season_game(
                         home,
-                        playoff_mode=False,
-                        played_yesterday=(home.name in played_yesterday),
+                        away,
+                        user_team_name=user_team_name,
+                        user_strategy=user_strategy,
+                        use_user_lines=use_user_lines,
+                        use_user_strategy=use_user_strategy,
+                        played_yesterday=played_yesterday,
+                        detail=detail,
                     )
-                    home.set_starting_goalie(home_goalie.name if home_goalie is not None else None)
-                if away_coach_controls:
-                    away_goalie = self._coach_choose_starting_goalie(
+                    result = simulate_game(home=home, away=away, rng=self._rng, undo=undo, **game_kwargs)
+                    self._register_regular_season_result(result)
+                    day_results.append(result)
+            else:
+                # Coach decisions stay on the league RNG; each game then gets its own substream.
+                prepared = [
+                    (
+                        home,
                         away,
-                        playoff_mode=False,
-                        played_yesterday=(away.name in played_yesterday),
+                        self._prepare_regular_season_game(
+                            home,
+                            away,
+                            user_team_name=user_team_name,
+                            user_strategy=user_strategy,
+                            use_user_lines=use_user_lines,
+                            use_user_strategy=use_user_strategy,
+                            played_yesterday=played_yesterday,
+                            detail=detail,
+                        ),
                     )
-                    away.set_starting_goalie(away_goalie.name if away_goalie is not None else None)
-
-                home_strategy = home.coach_style
-                away_strategy = away.coach_style
-                if home.name == user_team_name and use_user_strategy:
-                    home_strategy = user_strategy
-                if away.name == user_team_name and use_user_strategy:
-                    away_strategy = user_strategy
-                home_off_bonus, home_def_bonus, home_injury_mult = self._coach_modifiers(home, home_strategy, away)
-                away_off_bonus, away_def_bonus, away_injury_mult = self._coach_modifiers(away, away_strategy, home)
-                if home.name == user_team_name:
-                    position_penalty = home.lineup_position_penalty()
-                    home_off_bonus -= position_penalty * 0.45
-                    home_def_bonus -= position_penalty * 0.50
-                if away.name == user_team_name:
-                    position_penalty = away.lineup_position_penalty()
-                    away_off_bonus -= position_penalty * 0.45
-                    away_def_bonus -= position_penalty * 0.50
-                home_sched_bonus, home_sched_injury = self._schedule_context_modifiers(
-                    home, away, played_yesterday, is_away=False
-                )
-                away_sched_bonus, away_sched_injury = self._schedule_context_modifiers(
-                    away, home, played_yesterday, is_away=True
-                )
-                home_off_bonus += home_sched_bonus
-                away_off_bonus += away_sched_bonus
-                home_injury_mult *= home_sched_injury
-                away_injury_mult *= away_sched_injury
-                result = simulate_game(
-                    home=home,
-                    away=away,
-                    home_strategy=home_strategy,
-                    away_strategy=away_strategy,
-                    home_coach_offense_bonus=home_off_bonus,
-                    away_coach_offense_bonus=away_off_bonus,
-                    home_coach_defense_bonus=home_def_bonus,
-                    away_coach_defense_bonus=away_def_bonus,
-                    home_context_bonus=0.012,
-                    away_context_bonus=-0.006,
-                    home_injury_mult=home_injury_mult,
-                    away_injury_mult=away_injury_mult,
-                    rng=self._rng,
-                )
-                self._records[home.name].register_game(
-                    result.home_goals,
-                    result.away_goals,
-                    result.overtime,
-                    is_home=True,
-                    pp_goals=result.home_pp_goals,
-                    pp_chances=result.home_pp_chances,
-                    pk_goals_against=result.away_pp_goals,
-                    pk_chances_against=result.away_pp_chances,
-                )
-                self._records[away.name].register_game(
-                    result.away_goals,
-                    result.home_goals,
-                    result.overtime,
-                    is_home=False,
-                    pp_goals=result.away_pp_goals,
-                    pp_chances=result.away_pp_chances,
-                    pk_goals_against=result.home_pp_goals,
-                    pk_chances_against=result.home_pp_chances,
+                    for home, away in day_games
+                ]
+                games = [(home, away, kwargs, self._rng.getrandbits(64)) for home, away, kwargs in prepared]
+                for result in self._game_executor.run(games, undo=undo):
+                    self._register_regular_season_result(result)
+                    day_results.append(result)
+
+            # Post-sim integrity: each scheduled team +1 GP, and no result touched anyone else.
+            if len(day_results) != len(day_games):
+                raise ValueError(
+                    f"Invalid result count on day {self.current_day}: {len(day_results)} of {len(day_games)} games."
                 )
-                self._consume_coach_game_effect(home)
-                self._consume_coach_game_effect(away)
-                day_results.append(result)
-
-            # Post-sim integrity: each scheduled team +1 GP, others unchanged.
-            for team_name, rec in self._records.items():
-                before = int(gp_before.get(team_name, 0))
-                after = int(rec.games_played)
-                delta = after - before
-                expected = 1 if team_name in scheduled_day_teams else 0
-                if delta != expected:
+            for result in day_results:
+                if result.home.name not in gp_before or result.away.name not in gp_before:
+                    raise ValueError(f"Unscheduled game registered on day {self.current_day}.")
+            for team_name, before in gp_before.items():
+                delta = int(self._records[team_name].games_played) - before
+                if delta != 1:
                     raise ValueError(
                         f"Invalid GP delta for {team_name} on day {self.current_day}: "
-                        f"delta={delta}, expected={expected}."
+                        f"delta={delta}, expected=1."
                     )
         except Exception:
-            self._restore_team_records(records_before)
+            if undo is not None:
+                undo.rollback()
+                self._rng.setstate(rng_state)
+                self._invalidate_standings()
+            self._dirty_team_names.update(gp_before)
             raise
+        finally:
+            self._undo_log = None
+            self._team_contexts = None
         self._day_index += 1
         self._save_state()
         return day_results
 
+    def _simulate_batch(
+        self,
+        target: int,
+        user_team_name: str | None,
+        user_strategy: str,
+        use_user_lines: bool,
+        use_user_strategy: bool,
+        detail: str,
+        keep_results: bool = True,
+    ) -> list[list[GameResult]]:
+        if self.is_complete() or self._day_index >= target:
+            return []
+        self._check_calendar_integrity()
+        # Call-ups during the batch only move players between roster and minors, and numbering
+        # covers both, so one pass before the first day holds for every day.
+        self._ensure_team_player_numbers()
+        checkpoint = self._capture_checkpoint()
+        pending_before = self._batched_save_pending
+        results: list[list[GameResult]] = []
+        self.begin_batched_saves()
+        try:
+            while not self.is_complete() and self._day_index < target:
+                day_results = self._simulate_day(
+                    user_team_name=user_team_name,
+                    user_strategy=user_strategy,
+                    use_user_lines=use_user_lines,
+                    use_user_strategy=use_user_strategy,
+                    detail=detail,
+                    in_batch=True,
+                )
+                if keep_results:
+                    results.append(day_results)
+        except Exception:
+            self._restore_checkpoint(checkpoint)
+            self._batched_save_pending = pending_before
+            raise
+        finally:
+            self.end_batched_saves()
+        return results
+
+    def simulate_days(
+        self,
+        days: int,
+        user_team_name: str | None = None,
+        user_strategy: str = "balanced",
+        use_user_lines: bool = False,
+        use_user_strategy: bool = False,
+        detail: str = "full",
+    ) -> list[list[GameResult]]:
+        """Simulate up to `days` regular-season days as one batch; returns results per day.
+
+        State is written once at the end. If any day fails, every day in the
+        batch is rolled back and the error re-raised.
+        """
+        target = min(len(self._season_days), self._day_index + max(0, int(days)))
+        return self._simulate_batch(
+            target,
+            user_team_name=user_team_name,
+            user_strategy=user_strategy,
+            use_user_lines=use_user_lines,
+            use_user_strategy=use_user_strategy,
+            detail=detail,
+        )
+
+    def simulate_to(
+        self,
+        day: int,
+        user_team_name: str | None = None,
+        user_strategy: str = "balanced",
+        use_user_lines: bool = False,
+        use_user_strategy: bool = False,
+        detail: str = "full",
+    ) -> list[list[GameResult]]:
+        """Simulate until `day` regular-season days are complete, as one batch (see `simulate_days`)."""
+        target = max(0, min(int(day), len(self._season_days)))
+        return self._simulate_batch(
+            target,
+            user_team_name=user_team_name,
+            user_strategy=user_strategy,
+            use_user_lines=use_user_lines,
+            use_user_strategy=use_user_strategy,
+            detail=detail,
+        )
+
+    def simulate_until(
+        self,
+        day: int | None = None,
+        detail: str = "minimal",
+        user_team_name: str | None = None,
+        user_strategy: str = "balanced",
+        use_user_lines: bool = False,
+        use_user_strategy: bool = False,
+    ) -> dict[str, object]:
+        """Simulate regular-season days until `day` days are complete (default: season end).
+
+        detail="minimal" skips goal-event bookkeeping; standings, player totals and
+        injuries follow the same model as the detailed path. State is written once.
+        """
+        if detail not in SIM_DETAIL_LEVELS:
+            raise ValueError(f"Unknown detail level '{detail}'; expected one of {', '.join(SIM_DETAIL_LEVELS)}")
+        target = len(self._season_days) if day is None else max(0, min(int(day), len(self._season_days)))
+        start_index = self._day_index
+        self._simulate_batch(
+            target,
+            user_team_name=user_team_name,
+            user_strategy=user_strategy,
+            use_user_lines=use_user_lines,
+            use_user_strategy=use_user_strategy,
+            detail=detail,
+            keep_results=False,
+        )
+        return {
+            "simulated_days": self._day_index - start_index,
+            "day": self._day_index,
+            "total_days": len(self._season_days),
+            "season_complete": self.is_complete(),
+        }
+
     def _create_draft_player(
         self,
         team_name: str,
@@ -1873,8 +2250,47 @@ class LeagueSimulator:
                     team_name=team.name,
                     team_goal_diff=team_goal_diff,
                 )
-                player.career_seasons.append(entry)
-                self.career_history[player.player_id] = list(player.career_seasons)
+                self._append_career_season(player, entry)
+
+    def career_aggregate(self, player: Player) -> CareerAggregate:
+        seasons = player.career_seasons
+        aggregate = self._career_aggregates.get(player.player_id)
+        if aggregate is None or not aggregate.is_current(seasons):
+            aggregate = CareerAggregate.build(seasons)
+            self._career_aggregates[player.player_id] = aggregate
+        return aggregate
+
+    def hall_of_fame_aggregate(self, entry: dict[str, Any]) -> CareerAggregate:
+        seasons = entry.get("seasons")
+        if not isinstance(seasons, list):
+            return CareerAggregate.build([])
+        key = str(entry.get("player_id", "")) or str(entry.get("name", ""))
+        aggregate = self._hall_of_fame_aggregates.get(key)
+        if aggregate is None or not aggregate.is_current(seasons):
+            aggregate = CareerAggregate.build(seasons)
+            self._hall_of_fame_aggregates[key] = aggregate
+        return aggregate
+
+    def _append_career_season(self, player: Player, entry: dict[str, object]) -> None:
+        aggregate = self.career_aggregate(player)
+        player.career_seasons.append(entry)
+        aggregate.append(entry)
+        self.career_history[player.player_id] = list(player.career_seasons)
+        if self._stint_index is not None and self._stint_index.source is self.career_history:
+            self._stint_index.add(entry)
+
+    def record_book(self) -> RecordBook:
+        book = self._record_book
+        if book is None or not book.sync(self.hall_of_fame, self.hall_of_fame_aggregate):
+            book = self._record_book = RecordBook.build(self.hall_of_fame, self.hall_of_fame_aggregate)
+        return book
+
+    def team_season_range(self, player_name: str, team_name: str) -> tuple[int, int] | None:
+        """First and last completed season `player_name` spent with `team_name`."""
+        index = self._stint_index
+        if index is None or index.source is not self.career_history:
+            index = self._stint_index = StintIndex.build(self.career_history)
+        return index.season_range(player_name, team_name)
 
     def _build_career_season_entry(
         self,
@@ -1969,8 +2385,7 @@ class LeagueSimulator:
             team_name=from_team_name,
             team_goal_diff=team_goal_diff,
         )
-        player.career_seasons.append(entry)
-        self.career_history[player.player_id] = list(player.career_seasons)
+        self._append_career_season(player, entry)
         player.games_played = 0
         player.goals = 0
         player.assists = 0
@@ -2121,95 +2536,52 @@ class LeagueSimulator:
             "boards": {},
         }
 
-    def _draft_available_ids(self) -> set[str]:
-        state = self.current_draft_state if isinstance(self.current_draft_state, dict) else {}
-        all_ids = {
-            str(p.get("id", ""))
-            for p in (state.get("prospects", []) if isinstance(state.get("prospects", []), list) else [])
-            if isinstance(p, dict) and str(p.get("id", ""))
-        }
-        picks = state.get("picks", [])
-        if isinstance(picks, list):
-            for row in picks:
-                if not isinstance(row, dict):
-                    continue
-                pid = str(row.get("prospect_id", ""))
-                if pid:
-                    all_ids.discard(pid)
-        return all_ids
-
-    def _draft_state_normalized(self) -> dict[str, object]:
+    def _draft_session(self) -> DraftSession:
         self._init_draft_state()
         state = self.current_draft_state if isinstance(self.current_draft_state, dict) else {}
         if int(state.get("season", 0)) != int(self.season_number):
             self.current_draft_state = {}
             self._init_draft_state()
-            state = self.current_draft_state if isinstance(self.current_draft_state, dict) else {}
-        return state
-
-    def _draft_board_for_team(self, team_name: str) -> list[str]:
-        state = self._draft_state_normalized()
-        boards = state.get("boards", {})
-        if not isinstance(boards, dict):
-            boards = {}
-            state["boards"] = boards
-        raw = boards.get(team_name, [])
-        if not isinstance(raw, list):
-            raw = []
-        available_ids = self._draft_available_ids()
-        deduped: list[str] = []
-        seen: set[str] = set()
-        for item in raw:
-            pid = str(item)
-            if not pid or pid in seen or pid not in available_ids:
-                continue
-            deduped.append(pid)
-            seen.add(pid)
-        boards[team_name] = deduped
-        return deduped
+        session = self._draft_session_cache
+        if session is None or session.state is not self.current_draft_state:
+            session = DraftSession(self.current_draft_state)
+            self._draft_session_cache = session
+        return session
 
     def get_draft_state(self, team_name: str) -> dict[str, object]:
-        state = self._draft_state_normalized()
-        picks = state.get("picks", [])
-        picks_rows = [dict(row) for row in picks if isinstance(row, dict)]
-        current_idx = int(state.get("current_pick_index", 0))
-        current_idx = max(0, min(current_idx, len(picks_rows)))
-        active = bool(state.get("active", False)) and current_idx < len(picks_rows)
+        session = self._draft_session()
+        picks_rows = [dict(row) for row in session.picks]
+        active = session.active
+        current_idx = session.current_index
         if not active:
             current_idx = len(picks_rows)
-            state["active"] = False
-            state["current_pick_index"] = current_idx
-        next_pick = picks_rows[current_idx] if active and current_idx < len(picks_rows) else None
+            session.state["active"] = False
+            session.state["current_pick_index"] = current_idx
+        next_pick = picks_rows[current_idx] if active else None
         recent = [row for row in picks_rows if str(row.get("prospect_id", ""))]
         recent = recent[-18:]
-        user_board = self._draft_board_for_team(team_name)
         return {
-            "season": int(state.get("season", self.season_number)),
+            "season": int(session.state.get("season", self.season_number)),
             "active": active,
-            "rounds": int(state.get("rounds", self._draft_rounds())),
+            "rounds": int(session.state.get("rounds", self._draft_rounds())),
             "total_picks": len(picks_rows),
             "current_pick_index": current_idx,
             "next_pick": next_pick,
             "recent_picks": recent,
-            "user_board": user_board,
+            "user_board": session.board(team_name),
             "user_team": team_name,
         }
 
     def get_draft_class(self, team_name: str) -> dict[str, object]:
-        state = self._draft_state_normalized()
-        prospects_raw = state.get("prospects", [])
-        prospects = [dict(p) for p in prospects_raw if isinstance(p, dict)]
+        session = self._draft_session()
         taken: dict[str, dict[str, object]] = {}
-        for row in (state.get("picks", []) if isinstance(state.get("picks", []), list) else []):
-            if not isinstance(row, dict):
-                continue
+        for row in session.picks:
             pid = str(row.get("prospect_id", ""))
             if pid:
                 taken[pid] = row
-        board = self._draft_board_for_team(team_name)
-        board_rank = {pid: idx + 1 for idx, pid in enumerate(board)}
+        board_rank = {pid: idx + 1 for idx, pid in enumerate(session.board(team_name))}
         rows: list[dict[str, object]] = []
-        for p in prospects:
+        for p in session.prospects:
             pid = str(p.get("id", ""))
             row = dict(p)
             pick_row = taken.get(pid)
@@ -2228,30 +2600,17 @@ class LeagueSimulator:
             )
         )
         return {
-            "season": int(state.get("season", self.season_number)),
+            "season": int(session.state.get("season", self.season_number)),
             "rows": rows,
         }
 
     def set_draft_board(self, team_name: str, prospect_ids: list[str]) -> list[str]:
-        state = self._draft_state_normalized()
-        if not bool(state.get("active", False)):
+        session = self._draft_session()
+        if not bool(session.state.get("active", False)):
             return []
-        boards = state.get("boards", {})
-        if not isinstance(boards, dict):
-            boards = {}
-            state["boards"] = boards
-        available = self._draft_available_ids()
-        deduped: list[str] = []
-        seen: set[str] = set()
-        for raw in prospect_ids:
-            pid = str(raw).strip()
-            if not pid or pid in seen or pid not in available:
-                continue
-            deduped.append(pid)
-            seen.add(pid)
-        boards[team_name] = deduped[:80]
+        board = session.set_board(team_name, prospect_ids)
         self._save_state()
-        return list(boards[team_name])
+        return board
 
     def _cpu_pick_position_fit_bonus(self, team_name: str, position: str) -> float:
         team = self.get_team(team_name)
@@ -2267,140 +2626,102 @@ class LeagueSimulator:
         return -0.04
 
     def _cpu_choose_draft_prospect_id(self, team_name: str) -> str | None:
-        state = self._draft_state_normalized()
-        prospects = [dict(p) for p in (state.get("prospects", []) if isinstance(state.get("prospects", []), list) else [])]
-        available = self._draft_available_ids()
-        if not available:
+        session = self._draft_session()
+        if session.available_count <= 0:
             return None
-        prospect_by_id = {str(p.get("id", "")): p for p in prospects if str(p.get("id", ""))}
-        board = self._draft_board_for_team(team_name)
         # Most of the time, CPU follows board top if still available.
-        if board and self._rng.random() < 0.74:
-            for pid in board:
-                if pid in available:
-                    return pid
-        candidates: list[tuple[float, str]] = []
-        for pid in available:
-            p = prospect_by_id.get(pid)
-            if p is None:
-                continue
-            projected = float(p.get("projected_quality", 0.0))
+        board_top = session.board_top(team_name)
+        if board_top is not None and self._rng.random() < 0.74:
+            return board_top
+        fit_by_position: dict[str, float] = {}
+        # Only the best few scores matter (top pick or a reach to 4th-9th), and fit plus
+        # noise can lift a prospect at most this far, so the ranked scan stops early.
+        keep = 9
+        max_lift = 0.16 + 0.10
+        top: list[tuple[float, int, str]] = []
+        for order, (projected, pid, prospect) in enumerate(session.ranked_available()):
+            if len(top) >= keep and projected + max_lift < top[0][0]:
+                break
+            position = str(prospect.get("position", ""))
+            fit = fit_by_position.get(position)
+            if fit is None:
+                fit = self._cpu_pick_position_fit_bonus(team_name, position)
+                fit_by_position[position] = fit
             noise = self._rng.uniform(-0.10, 0.10)
-            fit = self._cpu_pick_position_fit_bonus(team_name, str(p.get("position", "")))
-            score = projected + fit + noise
-            candidates.append((score, pid))
-        if not candidates:
+            entry = (projected + fit + noise, -order, pid)
+            if len(top) < keep:
+                heapq.heappush(top, entry)
+            elif entry > top[0]:
+                heapq.heapreplace(top, entry)
+        if not top:
             return None
-        candidates.sort(key=lambda row: row[0], reverse=True)
+        candidates = sorted(top, reverse=True)
         # Mistakes happen: occasional reach down the board.
-        if len(candidates) >= 6 and self._rng.random() < 0.17:
-            return candidates[min(len(candidates) - 1, self._rng.randint(3, 8))][1]
-        return candidates[0][1]
+        if session.available_count >= 6 and self._rng.random() < 0.17:
+            return candidates[min(len(candidates) - 1, self._rng.randint(3, 8))][2]
+        return candidates[0][2]
 
     def _finalize_single_draft_pick(self, prospect_id: str) -> dict[str, object]:
-        state = self._draft_state_normalized()
-        picks = state.get("picks", [])
-        prospects = state.get("prospects", [])
-        if not isinstance(picks, list) or not isinstance(prospects, list):
-            raise ValueError("Draft state unavailable")
-        current_idx = int(state.get("current_pick_index", 0))
-        if current_idx < 0 or current_idx >= len(picks):
-            state["active"] = False
-            raise ValueError("Draft is complete")
-        pick_row = picks[current_idx]
-        if not isinstance(pick_row, dict):
-            raise ValueError("Invalid draft pick row")
-        prospect = next((p for p in prospects if isinstance(p, dict) and str(p.get("id", "")) == prospect_id), None)
-        if prospect is None:
-            raise ValueError("Prospect not found")
-        if prospect_id not in self._draft_available_ids():
-            raise ValueError("Prospect already drafted")
-        pick_row["prospect_id"] = prospect_id
-        pick_row["name"] = str(prospect.get("name", ""))
-        pick_row["position"] = str(prospect.get("position", ""))
-        pick_row["country"] = str(prospect.get("country", ""))
-        pick_row["country_code"] = str(prospect.get("country_code", ""))
-        pick_row["age"] = int(prospect.get("age", 18))
-        pick_row["quality"] = float(prospect.get("true_quality", 0.5))
-        state["current_pick_index"] = current_idx + 1
-        if int(state.get("current_pick_index", 0)) >= len(picks):
-            state["active"] = False
+        pick_row = self._draft_session().record_pick(prospect_id)
         self._save_state()
         return dict(pick_row)
 
     def make_user_draft_pick(self, team_name: str, prospect_id: str) -> dict[str, object]:
-        state = self._draft_state_normalized()
-        if not bool(state.get("active", False)):
+        session = self._draft_session()
+        if not bool(session.state.get("active", False)):
             raise ValueError("Draft is not active")
-        picks = state.get("picks", [])
-        if not isinstance(picks, list):
-            raise ValueError("Draft picks unavailable")
-        current_idx = int(state.get("current_pick_index", 0))
-        if current_idx < 0 or current_idx >= len(picks):
+        next_row = session.current_pick()
+        if next_row is None:
             raise ValueError("Draft is complete")
-        next_row = picks[current_idx] if isinstance(picks[current_idx], dict) else {}
         if str(next_row.get("team", "")) != team_name:
             raise ValueError("Not your pick")
         picked = self._finalize_single_draft_pick(prospect_id.strip())
-        board = self._draft_board_for_team(team_name)
+        board = session.board(team_name)
         if str(picked.get("prospect_id", "")) in board:
             self.set_draft_board(team_name, [pid for pid in board if pid != str(picked.get("prospect_id", ""))])
         return picked
 
     def sim_draft_to_user_pick(self, team_name: str) -> dict[str, object]:
-        state = self._draft_state_normalized()
-        picks = state.get("picks", [])
-        if not isinstance(picks, list):
-            raise ValueError("Draft picks unavailable")
+        session = self._draft_session()
         moved = 0
-        while bool(state.get("active", False)):
-            current_idx = int(state.get("current_pick_index", 0))
-            if current_idx < 0 or current_idx >= len(picks):
-                state["active"] = False
-                break
-            row = picks[current_idx] if isinstance(picks[current_idx], dict) else {}
-            if str(row.get("team", "")) == team_name:
-                break
-            choice = self._cpu_choose_draft_prospect_id(str(row.get("team", "")))
-            if not choice:
-                break
-            self._finalize_single_draft_pick(choice)
-            moved += 1
-            state = self._draft_state_normalized()
-            picks = state.get("picks", [])
-            if not isinstance(picks, list):
-                break
+        self.begin_batched_saves()
+        try:
+            while session.active:
+                row = session.current_pick()
+                if row is None or str(row.get("team", "")) == team_name:
+                    break
+                choice = self._cpu_choose_draft_prospect_id(str(row.get("team", "")))
+                if not choice:
+                    break
+                self._finalize_single_draft_pick(choice)
+                moved += 1
+            if not session.active:
+                session.state["active"] = False
+        finally:
+            self.end_batched_saves()
         payload = self.get_draft_state(team_name)
         payload["simulated_picks"] = moved
         return payload
 
     def _autopick_remaining_draft(self, user_team_name: str | None = None) -> None:
-        state = self._draft_state_normalized()
-        picks = state.get("picks", [])
-        if not isinstance(picks, list):
-            return
-        while bool(state.get("active", False)):
-            current_idx = int(state.get("current_pick_index", 0))
-            if current_idx < 0 or current_idx >= len(picks):
-                state["active"] = False
-                break
-            row = picks[current_idx] if isinstance(picks[current_idx], dict) else {}
-            team_name = str(row.get("team", ""))
-            choice: str | None = None
-            if user_team_name and team_name == user_team_name:
-                for pid in self._draft_board_for_team(team_name):
-                    if pid in self._draft_available_ids():
-                        choice = pid
-                        break
-            if not choice:
-                choice = self._cpu_choose_draft_prospect_id(team_name)
-            if not choice:
-                break
-            self._finalize_single_draft_pick(choice)
-            state = self._draft_state_normalized()
-            picks = state.get("picks", [])
-            if not isinstance(picks, list):
-                break
+        session = self._draft_session()
+        self.begin_batched_saves()
+        try:
+            while session.active:
+                row = session.current_pick()
+                team_name = str(row.get("team", "")) if row is not None else ""
+                choice: str | None = None
+                if user_team_name and team_name == user_team_name:
+                    choice = session.board_top(team_name)
+                if not choice:
+                    choice = self._cpu_choose_draft_prospect_id(team_name)
+                if not choice:
+                    break
+                self._finalize_single_draft_pick(choice)
+            if not session.active:
+                session.state["active"] = False
+        finally:
+            self.end_batched_saves()
 
     def _promote_from_minors(self, team: Team, player: Player, replacement_for: str = "") -> bool:
         if player not in team.minor_roster:
@@ -2459,6 +2780,7 @@ class LeagueSimulator:
         player.team_name = team.name
         player.temporary_replacement_for = replacement_for.strip()
         team.roster.append(player)
+        self._dirty_team_names.add(team.name)
         return True
 
     def promote_minor_player(self, team_name: str, player_name: str, replacement_for: str = "") -> bool:
@@ -2473,7 +2795,7 @@ class LeagueSimulator:
             return False
         self._assign_team_player_numbers(team)
         team.set_default_lineup()
-        self._ensure_team_leadership()
+        self._ensure_team_leadership(team)
         self._save_state()
         return True
 
@@ -2497,15 +2819,16 @@ class LeagueSimulator:
         team.dressed_player_names.discard(player.name)
         if team.starting_goalie_name == player.name:
             team.starting_goalie_name = None
+        self._dirty_team_names.add(team.name)
         self._assign_team_player_numbers(team)
         team.set_default_lineup()
-        self._ensure_team_leadership()
+        self._ensure_team_leadership(team)
         self._save_state()
         return True
 
     def _ensure_team_depth(self, team: Team) -> None:
         if not team.minor_roster:
-            self._ensure_team_leadership()
+            self._ensure_team_leadership(team)
             return
 
         needs_payload = self.get_team_needs(team.name)
@@ -2570,153 +2893,20 @@ class LeagueSimulator:
         _fill_defense()
 
         team.set_default_lineup()
-        self._ensure_team_leadership()
-
-    def _apply_injury_wear(self, player: Player) -> None:
-        season_injuries = max(0, player.injuries)
-        season_games_missed = max(0, player.games_missed_injury)
-        recent = player.career_seasons[-3:]
-        recent_injuries = sum(int(row.get("injuries", 0)) for row in recent)
-        recent_games_missed = sum(int(row.get("games_missed", 0)) for row in recent)
-
-        # Baseline wear rises with both severity (games missed) and repeat injuries.
-        wear_score = (
-            season_injuries * 0.48
-            + (season_games_missed / 7.0) * 0.34
-            + recent_injuries * 0.10
-            + (recent_games_missed / 35.0) * 0.08
-        )
-        if wear_score <= 0.25:
-            return
-
-        major_season = season_games_missed >= 20 or season_injuries >= 3
-        repeat_history = recent_games_missed >= 35 or recent_injuries >= 5
-        volatility = self._rng.uniform(0.92, 1.10)
-        impact = wear_score * 0.030 * volatility
-        if major_season:
-            impact *= 1.28
-        if repeat_history:
-            impact *= 1.22
-
-        durability_drop = impact * (1.28 + 0.08 * season_injuries)
-        physical_drop = impact * (0.70 + 0.02 * season_games_missed)
-
-        player.durability = self._clamp(player.durability - durability_drop, 0.6)
-        player.physical = self._clamp(player.physical - physical_drop, 0.7)
-
-        if player.position in GOALIE_POSITIONS:
-            goalie_drop = impact * (0.74 + 0.03 * season_injuries)
-            defense_drop = impact * (0.34 + 0.01 * season_games_missed)
-            player.goaltending = self._clamp(player.goaltending - goalie_drop, 0.6)
-            player.defense = self._clamp(player.defense - defense_drop, 0.7)
-            player.playmaking = self._clamp(player.playmaking - impact * 0.16, 0.7)
-        else:
-            skill_drop = impact * (0.42 + 0.015 * season_injuries)
-            defense_drop = impact * (0.36 + 0.010 * season_games_missed)
-            player.shooting = self._clamp(player.shooting - skill_drop, 0.7)
-            player.playmaking = self._clamp(player.playmaking - skill_drop * 0.92, 0.7)
-            player.defense = self._clamp(player.defense - defense_drop, 0.7)
-            player.goaltending = self._clamp(player.goaltending - impact * 0.04, 0.3)
-
-    def _apply_aging_curve(self, player: Player, team: Team, team_games: int) -> None:
-        age = player.age
-        goalie = player.position in GOALIE_POSITIONS
-        team_games = max(1, team_games)
-        usage_ratio = (player.goalie_games / team_games) if goalie else (player.games_played / team_games)
-        coach_quality = max(0.0, min(1.0, (team.coach_rating - 2.0) / 3.0))
-        goalie_dev_quality = max(0.0, min(1.0, (team.coach_goalie_dev - 2.0) / 3.0))
-        churn_penalty = min(0.20, max(0.0, team.coach_changes_recent) * 0.035)
-
-        if age <= 20:
-            dev = 0.10 if not goalie else 0.08
-        elif age <= 22:
-            dev = 0.07 if not goalie else 0.06
-        elif age <= 24:
-            dev = 0.04 if not goalie else 0.05
-        elif age <= 27:
-            dev = 0.015 if not goalie else 0.02
-        elif age <= 29:
-            dev = 0.0 if not goalie else 0.01
-        elif age <= 32:
-            dev = -0.025 if not goalie else -0.015
-        elif age <= 35:
-            dev = -0.05 if not goalie else -0.03
-        else:
-            dev = -0.08 if not goalie else -0.05
-
-        shift = dev + self._rng.uniform(-0.012, 0.012)
-        shift *= 0.92 + coach_quality * 0.22
-
-        if age <= 24:
-            if usage_ratio >= 0.65:
-                shift += 0.020 + coach_quality * 0.010
-            elif usage_ratio >= 0.45:
-                shift += 0.008 + coach_quality * 0.006
-            elif usage_ratio <= 0.22:
-                shift -= 0.018 + (1.0 - coach_quality) * 0.010
-            if churn_penalty > 0:
-                shift -= churn_penalty * 0.65
-        elif age <= 29:
-            if usage_ratio <= 0.25:
-                shift -= 0.004
-        else:
-            if usage_ratio >= 0.78:
-                shift -= 0.008
-
-        if player.seasons_to_nhl > 0:
-            # Prospect tracks mostly develop off-NHL usage until they are ready.
-            minor_dev = 0.010 + player.prospect_potential * 0.028 + coach_quality * 0.010
-            if player.prospect_tier == "Junior":
-                minor_dev += 0.006
-            elif player.prospect_tier == "AHL":
-                minor_dev += 0.003
-            shift += minor_dev
-            if usage_ratio >= 0.45:
-                # Rushing prospects into heavy NHL usage can hurt growth.
-                shift -= 0.012 + (0.55 - min(0.55, coach_quality * 0.55))
-            player.seasons_to_nhl = max(0, player.seasons_to_nhl - 1)
-
-        if player.seasons_to_nhl == 0 and not player.prospect_resolved and age <= 24:
-            # One-time boom/bust transition when prospect becomes NHL-ready.
-            coach_dev = max(0.0, min(1.0, (team.coach_goalie_dev - 2.0) / 3.0))
-            boom = self._clamp(player.prospect_boom_chance + coach_dev * 0.05, 0.02, 0.30)
-            bust = self._clamp(player.prospect_bust_chance - coach_dev * 0.05, 0.01, 0.24)
-            roll = self._rng.random()
-            if roll < boom:
-                shift += 0.050 + player.prospect_potential * 0.035
-            elif roll < boom + bust:
-                shift -= 0.045 + (0.55 - player.prospect_potential) * 0.030
-            player.prospect_resolved = True
-
-        if goalie:
-            shift *= 0.94 + goalie_dev_quality * 0.18
-            player.goaltending = min(5.0, max(0.8, player.goaltending + shift * 1.2))
-            player.defense = min(5.0, max(0.8, player.defense + shift * 0.6))
-            player.playmaking = min(5.0, max(0.8, player.playmaking + shift * 0.4))
-            player.shooting = min(5.0, max(0.4, player.shooting + shift * 0.1))
-            player.physical = min(5.0, max(0.8, player.physical + shift * 0.5))
-        else:
-            player.shooting = min(5.0, max(0.8, player.shooting + shift * 1.0))
-            player.playmaking = min(5.0, max(0.8, player.playmaking + shift * 0.9))
-            player.defense = min(5.0, max(0.8, player.defense + shift * 0.8))
-            player.goaltending = min(5.0, max(0.3, player.goaltending + shift * 0.05))
-            player.physical = min(5.0, max(0.8, player.physical + shift * 0.75))
-        player.durability = min(5.0, max(0.8, player.durability + shift * 0.6))
+        self._ensure_team_leadership(team)
 
     def _should_retire_jersey(self, player: Player, team_name: str) -> bool:
-        seasons = list(player.career_seasons)
-        if not seasons:
-            return False
-        team_seasons = [s for s in seasons if str(s.get("team", "")) == team_name]
-        if len(team_seasons) < 6:
+        career = self.career_aggregate(player)
+        if career.team_seasons.get(team_name, 0) < 6:
             return False
-        gp = sum(int(s.get("gp", 0)) for s in team_seasons)
-        goals = sum(int(s.get("g", 0)) for s in team_seasons)
-        assists = sum(int(s.get("a", 0)) for s in team_seasons)
+        team_totals = career.team_totals(team_name)
+        gp = team_totals["gp"]
+        goals = team_totals["g"]
+        assists = team_totals["a"]
         points = goals + assists
-        goalie_gp = sum(int(s.get("goalie_gp", 0)) for s in team_seasons)
-        goalie_w = sum(int(s.get("goalie_w", 0)) for s in team_seasons)
-        goalie_so = sum(int(s.get("goalie_so", 0)) for s in team_seasons)
+        goalie_gp = team_totals["goalie_gp"]
+        goalie_w = team_totals["goalie_w"]
+        goalie_so = team_totals["goalie_so"]
         cups = self._cup_count_for_team_up_to_season(team_name, self.season_number)
 
         if player.position in GOALIE_POSITIONS:
@@ -2776,33 +2966,27 @@ class LeagueSimulator:
     def _age_and_retire_players(self) -> tuple[list[str], list[dict[str, object]]]:
         retired: list[str] = []
         retired_numbers: list[dict[str, object]] = []
+        entries: list[tuple[Player, Team, int]] = []
         for team in self.teams:
             team_games = self._records.get(team.name, TeamRecord(team=team)).games_played
+            entries.extend((player, team, team_games) for player in [*team.roster, *team.minor_roster])
+        table = ProgressionTable.build(entries, career=self.career_aggregate)
+        draws = [self._rng.random() for _ in range(len(table) * DRAWS_PER_PLAYER)]
+        retiring = {player.player_id for player, flag in zip(table.players, table.run(draws)) if flag}
+        if not retiring:
+            return retired, retired_numbers
+        for team in self.teams:
             remaining: list[Player] = []
             minor_remaining: list[Player] = []
             for player in [*team.roster, *team.minor_roster]:
-                player.age += 1
-                self._apply_injury_wear(player)
-                self._apply_aging_curve(player, team, team_games)
-
-                retire_prob = 0.0
-                if player.position in GOALIE_POSITIONS:
-                    if player.age >= 37:
-                        retire_prob = min(0.90, 0.08 + (player.age - 37) * 0.10)
-                    elif player.age >= 34:
-                        retire_prob = 0.03 + (player.age - 34) * 0.025
-                else:
-                    if player.age >= 35:
-                        retire_prob = min(0.92, 0.10 + (player.age - 35) * 0.12)
-                    elif player.age >= 32:
-                        retire_prob = 0.03 + (player.age - 32) * 0.03
-                if self._rng.random() < retire_prob:
+                if player.player_id in retiring:
                     retired.append(f"{player.name} ({team.name})")
                     self._add_hall_of_fame_entry(player, team.name, self.season_number)
                     team.dressed_player_names.discard(player.name)
                     retired_number = self._retire_jersey_if_eligible(team, player)
                     if retired_number is not None:
                         retired_numbers.append(retired_number)
+                    self._career_aggregates.pop(player.player_id, None)
                 else:
                     if player in team.roster:
                         remaining.append(player)
@@ -2814,25 +2998,19 @@ class LeagueSimulator:
 
     def _add_hall_of_fame_entry(self, player: Player, team_name: str, retired_after_season: int) -> None:
         seasons = list(player.career_seasons)
-        total_gp = sum(int(s.get("gp", 0)) for s in seasons)
-        total_g = sum(int(s.get("g", 0)) for s in seasons)
-        total_a = sum(int(s.get("a", 0)) for s in seasons)
-        total_p = sum(int(s.get("p", 0)) for s in seasons)
-        total_inj = sum(int(s.get("injuries", 0)) for s in seasons)
-        total_missed = sum(int(s.get("games_missed", 0)) for s in seasons)
-        total_ggp = sum(int(s.get("goalie_gp", 0)) for s in seasons)
-        total_gw = sum(int(s.get("goalie_w", 0)) for s in seasons)
-        total_gl = sum(int(s.get("goalie_l", 0)) for s in seasons)
-        total_gotl = sum(int(s.get("goalie_otl", 0)) for s in seasons)
-        first_season = min([int(s.get("season", retired_after_season)) for s in seasons], default=retired_after_season)
-        last_season = max([int(s.get("season", retired_after_season)) for s in seasons], default=retired_after_season)
+        career = self.career_aggregate(player)
+        totals = career.totals
+        dated = [season for season in (career.first_season, career.last_season) if season is not None]
+        if career.undated_seasons or not dated:
+            dated.append(retired_after_season)
+        first_season = min(dated)
+        last_season = max(dated)
+        total_ggp = totals["goalie_gp"]
         goalie_gaa = 0.0
         goalie_sv = 0.0
         if total_ggp > 0:
-            weighted_gaa = sum(float(s.get("gaa", 0.0)) * max(1, int(s.get("goalie_gp", 0))) for s in seasons)
-            weighted_sv = sum(float(s.get("sv_pct", 0.0)) * max(1, int(s.get("goalie_gp", 0))) for s in seasons)
-            goalie_gaa = round(weighted_gaa / total_ggp, 2)
-            goalie_sv = round(weighted_sv / total_ggp, 3)
+            goalie_gaa = round(career.weighted_gaa / total_ggp, 2)
+            goalie_sv = round(career.weighted_sv_pct / total_ggp, 3)
 
         entry = {
             "player_id": player.player_id,
@@ -2844,22 +3022,24 @@ class LeagueSimulator:
             "seasons_played": len(seasons),
             "first_season": first_season,
             "last_season": last_season,
-            "career_gp": total_gp,
-            "career_g": total_g,
-            "career_a": total_a,
-            "career_p": total_p,
-            "career_injuries": total_inj,
-            "career_games_missed": total_missed,
+            "career_gp": totals["gp"],
+            "career_g": totals["g"],
+            "career_a": totals["a"],
+            "career_p": totals["p"],
+            "career_injuries": totals["injuries"],
+            "career_games_missed": totals["games_missed"],
             "goalie_gp": total_ggp,
-            "goalie_w": total_gw,
-            "goalie_l": total_gl,
-            "goalie_otl": total_gotl,
+            "goalie_w": totals["goalie_w"],
+            "goalie_l": totals["goalie_l"],
+            "goalie_otl": totals["goalie_otl"],
             "goalie_gaa": goalie_gaa,
             "goalie_sv_pct": goalie_sv,
             "seasons": seasons,
         }
-        self.hall_of_fame = [e for e in self.hall_of_fame if str(e.get("player_id", "")) != player.player_id]
+        if player.player_id in self.record_book().player_ids:
+            self.hall_of_fame = [e for e in self.hall_of_fame if str(e.get("player_id", "")) != player.player_id]
         self.hall_of_fame.append(entry)
+        self.record_book()
 
     def _choose_draft_position(self, team: Team) -> str:
         focus_position = self._team_focus_position(team)
@@ -2894,8 +3074,7 @@ class LeagueSimulator:
         drafted_name_set: dict[str, set[str]] = {}
         draft_details: dict[str, list[dict[str, object]]] = {}
         self._autopick_remaining_draft(user_team_name=user_team_name)
-        state = self._draft_state_normalized()
-        picks = [dict(row) for row in (state.get("picks", []) if isinstance(state.get("picks", []), list) else []) if isinstance(row, dict)]
+        picks = [dict(row) for row in self._draft_session().picks]
         for pick_row in picks:
             team_name = str(pick_row.get("team", ""))
             if not team_name:
@@ -3272,66 +3451,70 @@ class LeagueSimulator:
             team.roster = keep_roster
             team.minor_roster = keep_minors
 
-        free_agents = sorted(
-            expiring_free_agents,
-            key=lambda p: (self._contract_player_value(p), p.age, p.name),
-            reverse=True,
-        )
+        market = FreeAgentMarket(expiring_free_agents, self._contract_player_value, excluded=protected_free_agent_ids)
+        cap_used = {team.name: self._team_cap_used(team) for team in self.teams}
+        # Offer context only changes for a team when it signs someone, so it is rebuilt on that event.
+        contexts: dict[str, dict[str, object] | None] = {}
+
+        def offer_context(team: Team) -> dict[str, object] | None:
+            needs = self._team_fa_needs(team)
+            if needs["ANY"] <= 0:
+                return None
+            cap_relief_score = needs.get("score_cap_relief", 0) / 1000.0
+            score_f = max(needs["F"] * 0.22, needs.get("score_top6_f", 0) / 1000.0, needs.get("score_depth_f", 0) / 1000.0)
+            score_d = max(needs["D"] * 0.24, needs.get("score_top4_d", 0) / 1000.0, needs.get("score_depth_d", 0) / 1000.0)
+            score_g = max(needs["G"] * 0.30, needs.get("score_starter_g", 0) / 1000.0)
+            position_weights = {
+                "C": score_f,
+                "LW": score_f,
+                "RW": score_f,
+                "D": score_d,
+                "G": score_g,
+            }
+            preferred = sorted(position_weights.items(), key=lambda kv: kv[1], reverse=True)
+            wanted_positions: list[str] = [pos for pos, w in preferred if w > 0.01]
+            if not wanted_positions:
+                wanted_positions = ["C", "LW", "RW", "D", "G"]
+            cap_limit_for_signing: float | None = None
+            if cap_relief_score >= 0.45:
+                cap_limit_for_signing = max(0.75, 2.2 - (cap_relief_score - 0.45) * 2.0)
+            return {
+                "weights": position_weights,
+                "wanted": wanted_positions,
+                "cap_limit": cap_limit_for_signing,
+                "contender_bonus": max(0.0, min(0.12, (self._team_point_pct(team) - 0.5) * 0.6)),
+            }
 
-        cpu_teams = [t for t in self.teams if not (user_team_name and t.name == user_team_name)]
+        cpu_teams = sorted(
+            (t for t in self.teams if not (user_team_name and t.name == user_team_name)),
+            key=lambda t: t.name,
+        )
         max_rounds = 10
         fa_round = 0
-        while free_agents and fa_round < max_rounds:
+        while market and fa_round < max_rounds:
             fa_round += 1
             offers: list[dict[str, object]] = []
-            for team in sorted(cpu_teams, key=lambda t: t.name):
-                needs = self._team_fa_needs(team)
-                if needs["ANY"] <= 0:
+            for team in cpu_teams:
+                if team.name not in contexts:
+                    contexts[team.name] = offer_context(team)
+                context = contexts[team.name]
+                if context is None:
                     continue
-                cap_space = self._team_cap_limit(team) - self._team_cap_used(team)
+                cap_space = self._team_cap_limit(team) - cap_used[team.name]
                 if cap_space < 0.65:
                     continue
-
-                cap_relief_score = needs.get("score_cap_relief", 0) / 1000.0
-                score_f = max(needs["F"] * 0.22, needs.get("score_top6_f", 0) / 1000.0, needs.get("score_depth_f", 0) / 1000.0)
-                score_d = max(needs["D"] * 0.24, needs.get("score_top4_d", 0) / 1000.0, needs.get("score_depth_d", 0) / 1000.0)
-                score_g = max(needs["G"] * 0.30, needs.get("score_starter_g", 0) / 1000.0)
-                position_weights = {
-                    "C": score_f,
-                    "LW": score_f,
-                    "RW": score_f,
-                    "D": score_d,
-                    "G": score_g,
-                }
-                preferred = sorted(position_weights.items(), key=lambda kv: kv[1], reverse=True)
-                wanted_positions: list[str] = [pos for pos, w in preferred if w > 0.01]
-                if not wanted_positions:
-                    wanted_positions = ["C", "LW", "RW", "D", "G"]
-
-                cap_limit_for_signing: float | None = None
-                if cap_relief_score >= 0.45:
-                    cap_limit_for_signing = max(0.75, 2.2 - (cap_relief_score - 0.45) * 2.0)
-
+                position_weights = context["weights"]
+                cap_limit_for_signing = context["cap_limit"]
                 offer_added = False
-                for pos in wanted_positions:
-                    pos_candidates = [
-                        p for p in free_agents
-                        if p.position == pos and p.player_id not in protected_free_agent_ids
-                    ]
-                    pos_candidates = sorted(
-                        pos_candidates,
-                        key=lambda p: (self._contract_player_value(p), -p.age, p.name),
-                        reverse=True,
-                    )[:20]
-                    for candidate in pos_candidates:
+                for pos in context["wanted"]:
+                    for candidate in market.candidates(pos, limit=20):
                         years, cap_hit, contract_type, is_rfa = self._estimate_contract_offer(candidate)
                         if cap_limit_for_signing is not None and cap_hit > cap_limit_for_signing:
                             continue
                         if cap_hit > cap_space:
                             continue
                         fit_bonus = float(position_weights.get(candidate.position, 0.0))
-                        contender_bonus = max(0.0, min(0.12, (self._team_point_pct(team) - 0.5) * 0.6))
-                        offer_score = cap_hit * years + fit_bonus * 0.65 + contender_bonus + self._rng.random() * 0.05
+                        offer_score = cap_hit * years + fit_bonus * 0.65 + context["contender_bonus"] + self._rng.random() * 0.05
                         offers.append(
                             {
                                 "team": team,
@@ -3368,12 +3551,12 @@ class LeagueSimulator:
                     continue
                 if team_obj.name in signed_team_names or player_id in signed_player_ids:
                     continue
-                if player_obj not in free_agents:
+                if not market.is_available(player_obj):
                     continue
                 if len([p for p in team_obj.roster if not p.is_injured]) >= Team.MAX_ROSTER_SIZE:
                     continue
                 cap_hit = float(best_offer.get("cap_hit", 0.0))
-                if cap_hit > (self._team_cap_limit(team_obj) - self._team_cap_used(team_obj)):
+                if cap_hit > (self._team_cap_limit(team_obj) - cap_used[team_obj.name]):
                     continue
 
                 self._assign_contract_terms(
@@ -3383,10 +3566,12 @@ class LeagueSimulator:
                     contract_type=str(best_offer.get("contract_type", "veteran")),
                     is_rfa=bool(best_offer.get("is_rfa", False)),
                 )
-                free_agents.remove(player_obj)
+                market.sign(player_obj)
                 player_obj.team_name = team_obj.name
                 player_obj.free_agent_origin_team = ""
                 team_obj.roster.append(player_obj)
+                cap_used[team_obj.name] = round(cap_used[team_obj.name] + float(player_obj.cap_hit), 2)
+                contexts.pop(team_obj.name, None)
                 signings.append(
                     {
                         "team": team_obj.name,
@@ -3402,6 +3587,7 @@ class LeagueSimulator:
         for team in self.teams:
             team.set_default_lineup()
 
+        free_agents = market.remaining()
         self.free_agents = list(free_agents)
         user_pending_re_signs = [
             {
@@ -3469,9 +3655,10 @@ class LeagueSimulator:
         player.team_name = team.name
         player.free_agent_origin_team = ""
         team.roster.append(player)
+        self._dirty_team_names.add(team.name)
         self._assign_team_player_numbers(team)
         team.set_default_lineup()
-        self._ensure_team_leadership()
+        self._ensure_team_leadership(team)
         self._save_state()
         return {
             "ok": True,
@@ -3521,8 +3708,7 @@ class LeagueSimulator:
         }
 
     def _series_home_team(self, game_number: int, higher_seed: Team, lower_seed: Team) -> Team:
-        pattern = [higher_seed, higher_seed, lower_seed, lower_seed, higher_seed, lower_seed, higher_seed]
-        return pattern[min(game_number - 1, len(pattern) - 1)]
+        return higher_seed if higher_seed_hosts(game_number) else lower_seed
 
     def _accumulate_playoff_game_stats(self, result: GameResult, tracker: dict[str, dict[str, object]]) -> None:
         def ensure_player(player: Player) -> dict[str, object]:
@@ -3666,483 +3852,434 @@ class LeagueSimulator:
             )
         return out
 
-    def _simulate_playoff_series(
+    def _playoff_seed_key(self, team_name: str) -> tuple[int, int, int]:
+        rec = self._records.get(team_name)
+        if rec is None:
+            return (0, 0, 0)
+        return (rec.points, rec.goal_diff, rec.goals_for)
+
+    def _add_playoff_series(
         self,
+        session: PlayoffSession,
         round_name: str,
-        higher_seed: Team,
-        lower_seed: Team,
-        best_of: int = 7,
-        playoff_tracker: dict[str, dict[str, object]] | None = None,
-    ) -> dict[str, object]:
-        wins_needed = best_of // 2 + 1
-        high_wins = 0
-        low_wins = 0
-        games: list[dict[str, object]] = []
-        game_number = 1
-
-        while high_wins < wins_needed and low_wins < wins_needed:
-            self._advance_recovery_day()
-            home = self._series_home_team(game_number, higher_seed, lower_seed)
-            away = lower_seed if home.name == higher_seed.name else higher_seed
-            elimination_game = (
-                high_wins == wins_needed - 1
-                or low_wins == wins_needed - 1
-            )
-            self._coach_set_dtd_decisions(home, away, playoff_mode=True, elimination_game=elimination_game)
-            self._coach_set_dtd_decisions(away, home, playoff_mode=True, elimination_game=elimination_game)
-            self._ensure_team_depth(home)
-            self._ensure_team_depth(away)
-            home.set_default_lineup()
-            away.set_default_lineup()
-            home_goalie = self._coach_choose_playoff_goalie(
-                home,
-                series_games=games,
-                elimination_game=elimination_game,
-            )
-            away_goalie = self._coach_choose_playoff_goalie(
-                away,
-                series_games=games,
-                elimination_game=elimination_game,
-            )
-            home.set_starting_goalie(home_goalie.name if home_goalie is not None else None)
-            away.set_starting_goalie(away_goalie.name if away_goalie is not None else None)
-            home_strategy = home.coach_style if home.coach_style in STRATEGY_EFFECTS else "balanced"
-            away_strategy = away.coach_style if away.coach_style in STRATEGY_EFFECTS else "balanced"
-            home_off_bonus, home_def_bonus, home_injury_mult = self._coach_modifiers(home, home_strategy, away)
-            away_off_bonus, away_def_bonus, away_injury_mult = self._coach_modifiers(away, away_strategy, home)
-
-            # Playoff officiating tends to slightly favor home side on marginal calls.
-            home_context_bonus = 0.024
-            away_context_bonus = -0.012
-            randomness_scale = 1.0
-            if elimination_game:
-                randomness_scale = 1.32
-                if home.name == higher_seed.name:
-                    home_context_bonus += 0.010
-                else:
-                    away_context_bonus += 0.010
-            if game_number == 7:
-                randomness_scale = max(randomness_scale, 1.40)
-
-            result = simulate_game(
-                home=home,
-                away=away,
-                home_strategy=home_strategy,
-                away_strategy=away_strategy,
-                home_coach_offense_bonus=home_off_bonus,
-                away_coach_offense_bonus=away_off_bonus,
-                home_coach_defense_bonus=home_def_bonus,
-                away_coach_defense_bonus=away_def_bonus,
-                home_context_bonus=home_context_bonus,
-                away_context_bonus=away_context_bonus,
-                randomness_scale=randomness_scale,
-                home_injury_mult=home_injury_mult,
-                away_injury_mult=away_injury_mult,
-                rng=self._rng,
-                record_player_stats=False,
-                apply_injuries=True,
-                record_goalie_stats=False,
-            )
-            if playoff_tracker is not None:
-                self._accumulate_playoff_game_stats(result, playoff_tracker)
-            higher_goals = result.home_goals if home.name == higher_seed.name else result.away_goals
-            lower_goals = result.home_goals if home.name == lower_seed.name else result.away_goals
-            higher_won = higher_goals > lower_goals
-            if higher_won:
-                high_wins += 1
-            else:
-                low_wins += 1
-            home_rec = self._records.get(home.name)
-            away_rec = self._records.get(away.name)
-            home_pct = home_rec.point_pct if home_rec is not None else 0.5
-            away_pct = away_rec.point_pct if away_rec is not None else 0.5
-            arena_capacity = max(9500, int(getattr(home, "arena_capacity", 16000)))
-            base_attendance = int(arena_capacity * 0.90)
-            quality_bump = int((home_pct - 0.5) * 5400 + (away_pct - 0.5) * 2600)
-            rivalry_bump = 950 if home.division == away.division else (450 if home.conference == away.conference else 200)
-            elimination_bump = 650 if elimination_game else 0
-            attendance_noise = self._rng.randint(-420, 620)
-            attendance = max(8600, min(arena_capacity, base_attendance + quality_bump + rivalry_bump + elimination_bump + attendance_noise))
-            stars = self._playoff_three_stars(result)
-            games.append(
-                {
-                    "game": game_number,
-                    "home": home.name,
-                    "away": away.name,
-                    "home_goals": result.home_goals,
-                    "away_goals": result.away_goals,
-                    "overtime": result.overtime,
-                    "home_goalie": result.home_goalie.name if result.home_goalie is not None else "",
-                    "away_goalie": result.away_goalie.name if result.away_goalie is not None else "",
-                    "home_goalie_shots": int(result.home_goalie_shots),
-                    "home_goalie_saves": int(result.home_goalie_saves),
-                    "away_goalie_shots": int(result.away_goalie_shots),
-                    "away_goalie_saves": int(result.away_goalie_saves),
-                    "attendance": attendance,
-                    "arena_capacity": arena_capacity,
-                    "winner": higher_seed.name if higher_won else lower_seed.name,
-                    "three_stars": stars,
-                }
+        group: str,
+        conference: str,
+        higher_seed: str,
+        lower_seed: str,
+        slot: str,
+    ) -> None:
+        session.series.append(
+            PlayoffSeries(
+                round=round_name,
+                group=group,
+                conference=conference,
+                stage=session.stage,
+                slot=slot,
+                higher_seed=higher_seed,
+                lower_seed=lower_seed,
             )
-            self._consume_coach_game_effect(higher_seed)
-            self._consume_coach_game_effect(lower_seed)
-            game_number += 1
-
-        winner = higher_seed if high_wins > low_wins else lower_seed
-        loser = lower_seed if winner.name == higher_seed.name else higher_seed
-        return {
-            "round": round_name,
-            "higher_seed": higher_seed.name,
-            "lower_seed": lower_seed.name,
-            "winner": winner.name,
-            "loser": loser.name,
-            "winner_wins": max(high_wins, low_wins),
-            "loser_wins": min(high_wins, low_wins),
-            "games": games,
-        }
-
-    def _run_playoffs(self) -> dict[str, object]:
-        standings = {rec.team.name: rec for rec in self.get_standings()}
-        rounds: list[dict[str, object]] = []
-        playoff_seeds: list[dict[str, object]] = []
-        playoff_tracker: dict[str, dict[str, object]] = {}
-
-        def _team_seed_key(team: Team) -> tuple[int, int, int]:
-            rec = standings.get(team.name)
-            if rec is None:
-                return (0, 0, 0)
-            return (rec.points, rec.goal_diff, rec.goals_for)
+        )
 
-        conference_finalists: dict[str, Team] = {}
+    def _create_playoff_session(self) -> PlayoffSession:
+        session = PlayoffSession(seeds=[], plans={}, conference_order=[])
         for conference in self.get_conferences():
             conf_records = self.get_conference_standings(conference)
             if len(conf_records) < 2:
                 continue
+            session.conference_order.append(conference)
             divisions = sorted({rec.team.division for rec in conf_records})
-
             # NHL-style branch: exactly 2 divisions per conference.
             if len(divisions) == 2:
-                division_top_three: dict[str, list[TeamRecord]] = {}
-                for division in divisions:
-                    division_rows = [rec for rec in conf_records if rec.team.division == division]
-                    division_top_three[division] = division_rows[:3]
-                qualified_names = {
-                    rec.team.name
-                    for division in divisions
-                    for rec in division_top_three.get(division, [])
-                }
-                wildcard_candidates = [rec for rec in conf_records if rec.team.name not in qualified_names]
-                wildcards = wildcard_candidates[:2]
+                self._seed_division_bracket(session, conference, conf_records, divisions)
+            else:
+                self._seed_conference_bracket(session, conference, conf_records)
+        self._advance_playoff_bracket(session)
+        return session
 
-                for division in divisions:
-                    for idx, rec in enumerate(division_top_three.get(division, []), start=1):
-                        playoff_seeds.append(
-                            {
-                                "conference": conference,
-                                "division": division,
-                                "seed": f"D{idx}",
-                                "team": rec.team.name,
-                                "points": rec.points,
-                            }
-                        )
-                for idx, rec in enumerate(wildcards, start=1):
-                    playoff_seeds.append(
-                        {
-                            "conference": conference,
-                            "division": "Wildcard",
-                            "seed": f"WC{idx}",
-                            "team": rec.team.name,
-                            "points": rec.points,
-                        }
-                    )
+    def _seed_division_bracket(
+        self,
+        session: PlayoffSession,
+        conference: str,
+        conf_records: list[TeamRecord],
+        divisions: list[str],
+    ) -> None:
+        session.plans[conference] = {"format": "divisions", "divisions": list(divisions)}
+        division_top_three: dict[str, list[str]] = {}
+        for division in divisions:
+            division_top_three[division] = [rec.team.name for rec in conf_records if rec.team.division == division][:3]
+        qualified_names = {name for rows in division_top_three.values() for name in rows}
+        wildcards = [rec.team.name for rec in conf_records if rec.team.name not in qualified_names][:2]
+
+        points = {rec.team.name: rec.points for rec in conf_records}
+        for division in divisions:
+            for idx, name in enumerate(division_top_three[division], start=1):
+                session.seeds.append(
+                    {"conference": conference, "division": division, "seed": f"D{idx}", "team": name, "points": points[name]}
+                )
+        for idx, name in enumerate(wildcards, start=1):
+            session.seeds.append(
+                {"conference": conference, "division": "Wildcard", "seed": f"WC{idx}", "team": name, "points": points[name]}
+            )
 
-                div_a, div_b = divisions[0], divisions[1]
-                a_top = division_top_three.get(div_a, [])
-                b_top = division_top_three.get(div_b, [])
-                a_wc: Team | None = None
-                b_wc: Team | None = None
-                if len(wildcards) == 2 and a_top and b_top:
-                    higher_a = _team_seed_key(a_top[0].team)
-                    higher_b = _team_seed_key(b_top[0].team)
-                    if higher_a >= higher_b:
-                        a_wc = wildcards[1].team
-                        b_wc = wildcards[0].team
-                    else:
-                        a_wc = wildcards[0].team
-                        b_wc = wildcards[1].team
-                elif len(wildcards) == 1:
-                    if a_top and b_top:
-                        if _team_seed_key(a_top[0].team) >= _team_seed_key(b_top[0].team):
-                            b_wc = wildcards[0].team
-                        else:
-                            a_wc = wildcards[0].team
-                    elif a_top:
-                        a_wc = wildcards[0].team
-                    elif b_top:
-                        b_wc = wildcards[0].team
-
-                first_round_series: list[dict[str, object]] = []
-                division_advancers: dict[str, list[Team]] = {div_a: [], div_b: []}
-
-                if a_top and a_wc is not None:
-                    series = self._simulate_playoff_series(f"{div_a} Division First Round", a_top[0].team, a_wc, best_of=7, playoff_tracker=playoff_tracker)
-                    first_round_series.append(series)
-                    winner_team = self.get_team(str(series["winner"]))
-                    if winner_team is not None:
-                        division_advancers[div_a].append(winner_team)
-                elif a_top:
-                    division_advancers[div_a].append(a_top[0].team)
-                if len(a_top) >= 3:
-                    series = self._simulate_playoff_series(f"{div_a} Division First Round", a_top[1].team, a_top[2].team, best_of=7, playoff_tracker=playoff_tracker)
-                    first_round_series.append(series)
-                    winner_team = self.get_team(str(series["winner"]))
-                    if winner_team is not None:
-                        division_advancers[div_a].append(winner_team)
-
-                if b_top and b_wc is not None:
-                    series = self._simulate_playoff_series(f"{div_b} Division First Round", b_top[0].team, b_wc, best_of=7, playoff_tracker=playoff_tracker)
-                    first_round_series.append(series)
-                    winner_team = self.get_team(str(series["winner"]))
-                    if winner_team is not None:
-                        division_advancers[div_b].append(winner_team)
-                elif b_top:
-                    division_advancers[div_b].append(b_top[0].team)
-                if len(b_top) >= 3:
-                    series = self._simulate_playoff_series(f"{div_b} Division First Round", b_top[1].team, b_top[2].team, best_of=7, playoff_tracker=playoff_tracker)
-                    first_round_series.append(series)
-                    winner_team = self.get_team(str(series["winner"]))
-                    if winner_team is not None:
-                        division_advancers[div_b].append(winner_team)
-
-                if first_round_series:
-                    rounds.append({"name": f"{conference} First Round", "series": first_round_series})
-
-                division_final_series: list[dict[str, object]] = []
-                division_champions: list[Team] = []
-                for division in (div_a, div_b):
-                    advancers = division_advancers.get(division, [])
-                    if len(advancers) >= 2:
-                        advancers = sorted(advancers, key=_team_seed_key, reverse=True)
-                        series = self._simulate_playoff_series(f"{division} Division Final", advancers[0], advancers[1], best_of=7, playoff_tracker=playoff_tracker)
-                        division_final_series.append(series)
-                        winner_team = self.get_team(str(series["winner"]))
-                        if winner_team is not None:
-                            division_champions.append(winner_team)
-                    elif len(advancers) == 1:
-                        division_champions.append(advancers[0])
-
-                if division_final_series:
-                    rounds.append({"name": f"{conference} Division Finals", "series": division_final_series})
-
-                if len(division_champions) >= 2:
-                    division_champions = sorted(division_champions, key=_team_seed_key, reverse=True)
-                    conference_final = self._simulate_playoff_series(
-                        f"{conference} Conference Final",
-                        division_champions[0],
-                        division_champions[1],
-                        best_of=7,
-                        playoff_tracker=playoff_tracker,
-                    )
-                    rounds.append({"name": f"{conference} Conference Final", "series": [conference_final]})
-                    conf_winner = self.get_team(str(conference_final["winner"]))
-                    if conf_winner is not None:
-                        conference_finalists[conference] = conf_winner
-                elif len(division_champions) == 1:
-                    conference_finalists[conference] = division_champions[0]
+        div_a, div_b = divisions[0], divisions[1]
+        a_top = division_top_three[div_a]
+        b_top = division_top_three[div_b]
+        # The better division winner draws the lower wildcard.
+        wildcard_for: dict[str, str] = {}
+        if len(wildcards) == 2 and a_top and b_top:
+            if self._playoff_seed_key(a_top[0]) >= self._playoff_seed_key(b_top[0]):
+                wildcard_for = {div_a: wildcards[1], div_b: wildcards[0]}
+            else:
+                wildcard_for = {div_a: wildcards[0], div_b: wildcards[1]}
+        elif len(wildcards) == 1:
+            if a_top and b_top:
+                if self._playoff_seed_key(a_top[0]) >= self._playoff_seed_key(b_top[0]):
+                    wildcard_for = {div_b: wildcards[0]}
+                else:
+                    wildcard_for = {div_a: wildcards[0]}
+            elif a_top:
+                wildcard_for = {div_a: wildcards[0]}
+            elif b_top:
+                wildcard_for = {div_b: wildcards[0]}
+
+        group = f"{conference} First Round"
+        for division, top in ((div_a, a_top), (div_b, b_top)):
+            slot = f"{conference}|{division}"
+            round_name = f"{division} Division First Round"
+            wildcard = wildcard_for.get(division)
+            if top and wildcard is not None:
+                self._add_playoff_series(session, round_name, group, conference, top[0], wildcard, slot)
+            elif top:
+                session.add_advancer(slot, top[0])
+            if len(top) >= 3:
+                self._add_playoff_series(session, round_name, group, conference, top[1], top[2], slot)
+
+    def _seed_conference_bracket(self, session: PlayoffSession, conference: str, conf_records: list[TeamRecord]) -> None:
+        # Fallback bracket for non-NHL conference formats.
+        session.plans[conference] = {"format": "seeded"}
+        qualifiers = conf_records[:8]
+        for idx, rec in enumerate(qualifiers, start=1):
+            session.seeds.append(
+                {"conference": conference, "division": rec.team.division, "seed": idx, "team": rec.team.name, "points": rec.points}
+            )
+        if len(qualifiers) < 2:
+            return
+        round_name = f"{conference} Conference Quarterfinal"
+        for high_idx, low_idx in ((0, 7), (1, 6), (2, 5), (3, 4)):
+            if high_idx >= len(qualifiers) or low_idx >= len(qualifiers):
                 continue
+            self._add_playoff_series(
+                session,
+                round_name,
+                round_name,
+                conference,
+                qualifiers[high_idx].team.name,
+                qualifiers[low_idx].team.name,
+                f"{conference}|semis",
+            )
 
-            # Fallback bracket for non-NHL conference formats.
-            conference_qualifiers = conf_records[:8]
-            for idx, rec in enumerate(conference_qualifiers, start=1):
-                playoff_seeds.append(
-                    {
-                        "conference": conference,
-                        "division": rec.team.division,
-                        "seed": idx,
-                        "team": rec.team.name,
-                        "points": rec.points,
-                    }
-                )
-            if len(conference_qualifiers) < 2:
-                continue
+    def _take_playoff_advancers(self, session: PlayoffSession, slot: str) -> list[str]:
+        return sorted(session.advancers.pop(slot, []), key=self._playoff_seed_key, reverse=True)
 
-            first_round_pairs = [(0, 7), (1, 6), (2, 5), (3, 4)]
-            first_round_series: list[dict[str, object]] = []
-            semifinal_teams: list[Team] = []
-            for high_idx, low_idx in first_round_pairs:
-                if high_idx >= len(conference_qualifiers) or low_idx >= len(conference_qualifiers):
-                    continue
-                high_team = conference_qualifiers[high_idx].team
-                low_team = conference_qualifiers[low_idx].team
-                series = self._simulate_playoff_series(f"{conference} Conference Quarterfinal", high_team, low_team, best_of=7, playoff_tracker=playoff_tracker)
-                first_round_series.append(series)
-                winner_team = self.get_team(str(series["winner"]))
-                if winner_team is not None:
-                    semifinal_teams.append(winner_team)
-            if first_round_series:
-                rounds.append({"name": f"{conference} Conference Quarterfinal", "series": first_round_series})
-
-            semifinal_teams = sorted(semifinal_teams, key=_team_seed_key, reverse=True)
-            semifinal_series: list[dict[str, object]] = []
-            finalists: list[Team] = []
-            if len(semifinal_teams) >= 2:
-                while len(semifinal_teams) >= 2:
-                    high = semifinal_teams.pop(0)
-                    low = semifinal_teams.pop(-1)
-                    series = self._simulate_playoff_series(f"{conference} Conference Semifinal", high, low, best_of=7, playoff_tracker=playoff_tracker)
-                    semifinal_series.append(series)
-                    winner_team = self.get_team(str(series["winner"]))
-                    if winner_team is not None:
-                        finalists.append(winner_team)
-            if semifinal_series:
-                rounds.append({"name": f"{conference} Conference Semifinal", "series": semifinal_series})
-
-            finalists = sorted(finalists, key=_team_seed_key, reverse=True)
+    def _pair_playoff_stage(self, session: PlayoffSession) -> None:
+        stage = session.stage
+        if stage == STAGE_COUNT - 1:
+            finalists = self._take_playoff_advancers(session, "cup")
             if len(finalists) >= 2:
-                conference_final = self._simulate_playoff_series(
-                    f"{conference} Conference Final",
-                    finalists[0],
-                    finalists[1],
-                    best_of=7,
-                    playoff_tracker=playoff_tracker,
-                )
-                rounds.append({"name": f"{conference} Conference Final", "series": [conference_final]})
-                conf_winner = self.get_team(str(conference_final["winner"]))
-                if conf_winner is not None:
-                    conference_finalists[conference] = conf_winner
-            elif len(finalists) == 1:
-                conference_finalists[conference] = finalists[0]
-
-        finalists = list(conference_finalists.values())
-        finalists = sorted(
-            finalists,
-            key=lambda t: (
-                standings[t.name].points if t.name in standings else 0,
-                standings[t.name].goal_diff if t.name in standings else 0,
-                standings[t.name].goals_for if t.name in standings else 0,
-            ),
-            reverse=True,
-        )
-        if len(finalists) >= 2:
-            cup_final = self._simulate_playoff_series("Cup Final", finalists[0], finalists[1], best_of=7, playoff_tracker=playoff_tracker)
-            rounds.append({"name": "Cup Final", "series": [cup_final]})
-            cup_champion = str(cup_final.get("winner", ""))
-        elif finalists:
-            cup_champion = finalists[0].name
-        else:
-            cup_champion = self.get_standings()[0].team.name if self.teams else ""
-
-        return {
-            "cup_name": "Founders Cup",
-            "champion": cup_champion,
-            "cup_champion": cup_champion,
-            "mvp": self._select_playoff_mvp(cup_champion, playoff_tracker),
-            "mvp_race": self._playoff_mvp_race(playoff_tracker, limit=12),
-            "seeds": playoff_seeds,
-            "rounds": rounds,
-        }
-
-    def _playoff_three_stars(self, result: GameResult) -> list[dict[str, str]]:
-        skater_lines: dict[str, dict[str, object]] = {}
-
-        def add_goal_events(events: list[Any], team_name: str) -> None:
-            for ev in events:
-                scorer = ev.scorer
-                sid = scorer.player_id
-                if sid not in skater_lines:
-                    skater_lines[sid] = {"player": scorer, "team": team_name, "g": 0, "a": 0}
-                skater_lines[sid]["g"] = int(skater_lines[sid]["g"]) + 1
-                for helper in ev.assists:
-                    aid = helper.player_id
-                    if aid not in skater_lines:
-                        skater_lines[aid] = {"player": helper, "team": team_name, "g": 0, "a": 0}
-                    skater_lines[aid]["a"] = int(skater_lines[aid]["a"]) + 1
-
-        add_goal_events(result.home_goal_events, result.home.name)
-        add_goal_events(result.away_goal_events, result.away.name)
-
-        candidates: list[tuple[float, str]] = []
-        for line in skater_lines.values():
-            player = line["player"]
-            goals = int(line["g"])
-            assists = int(line["a"])
-            points = goals + assists
-            score = points * 52.0 + goals * 18.0 + assists * 8.0
-            if points >= 3:
-                score += 18.0
-            if goals >= 2:
-                score += 12.0
-            summary = f"{player.name} ({line['team']}) {goals}G {assists}A"
-            candidates.append((score, summary))
-
-        def goalie_score(saves: int, shots: int, goals_against: int, won: bool) -> float:
-            if shots <= 0:
-                return 0.0
-            sv = saves / shots
-            score = saves * 2.0
-            if sv >= 0.960:
-                score += 95.0
-            elif sv >= 0.950:
-                score += 78.0
-            elif sv >= 0.940:
-                score += 62.0
-            elif sv >= 0.930:
-                score += 46.0
-            elif sv >= 0.920:
-                score += 28.0
-            elif sv >= 0.910:
-                score += 12.0
-            if shots >= 40:
-                score += 36.0
-            elif shots >= 35:
-                score += 24.0
-            elif shots >= 30:
-                score += 14.0
-            if won:
-                score += 34.0
-            if goals_against == 0:
-                score += 135.0
-            return max(0.0, score)
-
-        if result.home_goalie is not None and result.home_goalie_shots > 0:
-            candidates.append(
-                (
-                    goalie_score(
-                        saves=result.home_goalie_saves,
-                        shots=result.home_goalie_shots,
-                        goals_against=result.away_goals,
-                        won=result.home_goals > result.away_goals,
-                    ),
-                    f"{result.home_goalie.name} ({result.home.name}) {result.home_goalie_saves}/{result.home_goalie_shots} SV",
-                )
+                self._add_playoff_series(session, "Cup Final", "Cup Final", "", finalists[0], finalists[1], "champion")
+            elif finalists:
+                session.add_advancer("champion", finalists[0])
+            return
+        for conference in session.conference_order:
+            plan = session.plans.get(conference, {})
+            final_slot = f"{conference}|final"
+            if stage == 1 and plan.get("format") == "divisions":
+                for division in plan.get("divisions", []):
+                    teams = self._take_playoff_advancers(session, f"{conference}|{division}")
+                    if len(teams) >= 2:
+                        self._add_playoff_series(
+                            session,
+                            f"{division} Division Final",
+                            f"{conference} Division Finals",
+                            conference,
+                            teams[0],
+                            teams[1],
+                            final_slot,
+                        )
+                    elif teams:
+                        session.add_advancer(final_slot, teams[0])
+            elif stage == 1:
+                teams = self._take_playoff_advancers(session, f"{conference}|semis")
+                round_name = f"{conference} Conference Semifinal"
+                while len(teams) >= 2:
+                    high = teams.pop(0)
+                    low = teams.pop(-1)
+                    self._add_playoff_series(session, round_name, round_name, conference, high, low, final_slot)
+            else:
+                teams = self._take_playoff_advancers(session, final_slot)
+                round_name = f"{conference} Conference Final"
+                if len(teams) >= 2:
+                    self._add_playoff_series(session, round_name, round_name, conference, teams[0], teams[1], "cup")
+                elif teams:
+                    session.add_advancer("cup", teams[0])
+
+    def _advance_playoff_bracket(self, session: PlayoffSession) -> None:
+        """Move finished stages forward until a stage has games left to play or the cup is decided."""
+        while not session.complete and not session.active_series():
+            self._step_playoff_stage(session)
+
+    def _step_playoff_stage(self, session: PlayoffSession, finalize: bool = True) -> None:
+        for series in session.stage_series():
+            session.add_advancer(series.slot, series.winner)
+        session.stage += 1
+        if session.stage < STAGE_COUNT:
+            self._pair_playoff_stage(session)
+            return
+        champions = session.advancers.get("champion", [])
+        if champions:
+            session.champion = champions[0]
+        elif finalize:
+            session.champion = self.get_standings()[0].team.name if self.teams else ""
+        if finalize:
+            session.mvp = self._select_playoff_mvp(session.champion, session.tracker)
+        session.complete = True
+
+    def playoff_odds(self, samples: int = 2000) -> dict[str, object]:
+        """Series score tables and round-by-round advancement odds for the live bracket.
+
+        Single games are priced from lineup strengths frozen when called; each sample
+        then draws whole series outcomes from the exact series tables, so a sample
+        costs one random draw per remaining series.
+        """
+        session = self._playoff_session
+        if session is None or session.legacy_bracket is not None:
+            return {}
+        key = (self.season_number, len(session.days), session.stage, samples)
+        if self._playoff_odds_cache is not None and self._playoff_odds_cache[0] == key:
+            return self._playoff_odds_cache[1]
+
+        strengths: dict[str, TeamStrength] = {}
+        for row in session.seeds:
+            team = self.get_team(str(row.get("team", "")))
+            if team is not None:
+                strengths[team.name] = team_strength(team)
+        tables: dict[tuple[str, str, int, int], dict[tuple[int, int], float]] = {}
+
+        def table(series: PlayoffSeries) -> dict[tuple[int, int], float]:
+            table_key = (series.higher_seed, series.lower_seed, series.high_wins, series.low_wins)
+            cached = tables.get(table_key)
+            if cached is None:
+                high = strengths.get(series.higher_seed)
+                low = strengths.get(series.lower_seed)
+                if high is None or low is None:
+                    at_home = on_road = 0.5
+                else:
+                    # Same playoff home-ice bonuses as `_play_playoff_game`.
+                    at_home = home_win_probability(high, low, 0.024, -0.012)
+                    on_road = 1.0 - home_win_probability(low, high, 0.024, -0.012)
+                cached = series_outcomes(at_home, on_road, series.high_wins, series.low_wins, series.best_of)
+                tables[table_key] = cached
+            return cached
+
+        chances: dict[tuple[str, str, int, int], float] = {}
+
+        def high_win_chance(series: PlayoffSeries) -> float:
+            chance_key = (series.higher_seed, series.lower_seed, series.high_wins, series.low_wins)
+            chance = chances.get(chance_key)
+            if chance is None:
+                chance = sum(prob for (high, low), prob in table(series).items() if high > low)
+                chances[chance_key] = chance
+            return chance
+
+        team_names = [str(row.get("team", "")) for row in session.seeds]
+        reached = {name: [0.0] * (STAGE_COUNT + 1) for name in team_names}
+        alive_now = session.alive() if not session.complete else {session.champion}
+        for name in team_names:
+            later = {series.stage for series in session.series if name in (series.higher_seed, series.lower_seed)}
+            for stage in range(min(session.stage, STAGE_COUNT) + 1):
+                if name in alive_now or any(played >= stage for played in later):
+                    reached[name][stage] = float(samples)
+
+        if not session.complete:
+            rng = random.Random(f"playoff-odds:{self.season_number}:{len(session.days)}")
+            for _ in range(samples):
+                trial = session.fork()
+                while not trial.complete:
+                    for series in trial.active_series():
+                        if rng.random() < high_win_chance(series):
+                            series.high_wins = series.wins_needed
+                        else:
+                            series.low_wins = series.wins_needed
+                    self._step_playoff_stage(trial, finalize=False)
+                    for name in trial.alive():
+                        if name in reached:
+                            reached[name][min(trial.stage, STAGE_COUNT)] += 1.0
+
+        series_rows: list[dict[str, object]] = []
+        for series in session.active_series():
+            outcomes = sorted(table(series).items(), key=lambda item: (-max(item[0]), item[0][1] - item[0][0]))
+            series_rows.append(
+                {
+                    "round": series.round,
+                    "higher_seed": series.higher_seed,
+                    "lower_seed": series.lower_seed,
+                    "high_wins": series.high_wins,
+                    "low_wins": series.low_wins,
+                    "higher_seed_win_pct": round(high_win_chance(series) * 100.0, 1),
+                    "outcomes": [
+                        {
+                            "winner": series.higher_seed if high > low else series.lower_seed,
+                            "result": f"{max(high, low)}-{min(high, low)}",
+                            "pct": round(prob * 100.0, 1),
+                        }
+                        for (high, low), prob in outcomes
+                    ],
+                }
             )
-        if result.away_goalie is not None and result.away_goalie_shots > 0:
-            candidates.append(
-                (
-                    goalie_score(
-                        saves=result.away_goalie_saves,
-                        shots=result.away_goalie_shots,
-                        goals_against=result.home_goals,
-                        won=result.away_goals > result.home_goals,
-                    ),
-                    f"{result.away_goalie.name} ({result.away.name}) {result.away_goalie_saves}/{result.away_goalie_shots} SV",
-                )
+        columns = ("second_round", "conference_final", "cup_final", "champion")
+        team_rows = [
+            {"team": name, **{column: round(reached[name][idx] * 100.0 / samples, 1) for idx, column in enumerate(columns, start=1)}}
+            for name in team_names
+        ]
+        team_rows.sort(key=lambda row: tuple(-float(row[column]) for column in reversed(columns)))
+        odds: dict[str, object] = {"samples": samples, "series": series_rows, "teams": team_rows}
+        self._playoff_odds_cache = (key, odds)
+        return odds
+
+    def _play_playoff_game(self, session: PlayoffSession, series: PlayoffSeries) -> None:
+        higher_seed = self.get_team(series.higher_seed)
+        lower_seed = self.get_team(series.lower_seed)
+        if higher_seed is None or lower_seed is None:
+            raise ValueError(f"Playoff series references unknown team: {series.higher_seed} vs {series.lower_seed}")
+        game_number = len(series.games) + 1
+        # Injuries and goalie form move between games, so contexts last a single game.
+        self._team_contexts = {}
+        home = self._series_home_team(game_number, higher_seed, lower_seed)
+        away = lower_seed if home.name == higher_seed.name else higher_seed
+        elimination_game = series.elimination_game
+        self._coach_set_dtd_decisions(home, away, playoff_mode=True, elimination_game=elimination_game)
+        self._coach_set_dtd_decisions(away, home, playoff_mode=True, elimination_game=elimination_game)
+        self._ensure_team_depth(home)
+        self._ensure_team_depth(away)
+        home.set_default_lineup()
+        away.set_default_lineup()
+        series_games = series.game_rows()
+        home_goalie = self._coach_choose_playoff_goalie(
+            home,
+            series_games=series_games,
+            elimination_game=elimination_game,
+        )
+        away_goalie = self._coach_choose_playoff_goalie(
+            away,
+            series_games=series_games,
+            elimination_game=elimination_game,
+        )
+        home.set_starting_goalie(home_goalie.name if home_goalie is not None else None)
+        away.set_starting_goalie(away_goalie.name if away_goalie is not None else None)
+        home_strategy = home.coach_style if home.coach_style in STRATEGY_EFFECTS else "balanced"
+        away_strategy = away.coach_style if away.coach_style in STRATEGY_EFFECTS else "balanced"
+        home_off_bonus, home_def_bonus, home_injury_mult = self._coach_modifiers(home, home_strategy, away)
+        away_off_bonus, away_def_bonus, away_injury_mult = self._coach_modifiers(away, away_strategy, home)
+
+        # Playoff officiating tends to slightly favor home side on marginal calls.
+        home_context_bonus = 0.024
+        away_context_bonus = -0.012
+        randomness_scale = 1.0
+        if elimination_game:
+            randomness_scale = 1.32
+            if home.name == higher_seed.name:
+                home_context_bonus += 0.010
+            else:
+                away_context_bonus += 0.010
+        if game_number == 7:
+            randomness_scale = max(randomness_scale, 1.40)
+
+        result = simulate_game(
+            home=home,
+            away=away,
+            home_strategy=home_strategy,
+            away_strategy=away_strategy,
+            home_coach_offense_bonus=home_off_bonus,
+            away_coach_offense_bonus=away_off_bonus,
+            home_coach_defense_bonus=home_def_bonus,
+            away_coach_defense_bonus=away_def_bonus,
+            home_context_bonus=home_context_bonus,
+            away_context_bonus=away_context_bonus,
+            randomness_scale=randomness_scale,
+            home_injury_mult=home_injury_mult,
+            away_injury_mult=away_injury_mult,
+            rng=self._rng,
+            record_player_stats=False,
+            apply_injuries=True,
+            record_goalie_stats=False,
+        )
+        self._accumulate_playoff_game_stats(result, session.tracker)
+        higher_goals = result.home_goals if home.name == higher_seed.name else result.away_goals
+        lower_goals = result.home_goals if home.name == lower_seed.name else result.away_goals
+        higher_won = higher_goals > lower_goals
+        home_rec = self._records.get(home.name)
+        away_rec = self._records.get(away.name)
+        home_pct = home_rec.point_pct if home_rec is not None else 0.5
+        away_pct = away_rec.point_pct if away_rec is not None else 0.5
+        arena_capacity = max(9500, int(getattr(home, "arena_capacity", 16000)))
+        base_attendance = int(arena_capacity * 0.90)
+        quality_bump = int((home_pct - 0.5) * 5400 + (away_pct - 0.5) * 2600)
+        rivalry_bump = 950 if home.division == away.division else (450 if home.conference == away.conference else 200)
+        elimination_bump = 650 if elimination_game else 0
+        attendance_noise = self._rng.randint(-420, 620)
+        attendance = max(8600, min(arena_capacity, base_attendance + quality_bump + rivalry_bump + elimination_bump + attendance_noise))
+        slot = series.player_slot
+
+        def scoring(events: list[Any]) -> tuple[tuple[int, ...], ...]:
+            return tuple(
+                (slot(ev.scorer.player_id, ev.scorer.name), *(slot(helper.player_id, helper.name) for helper in ev.assists))
+                for ev in events
             )
 
-        candidates.sort(key=lambda row: row[0], reverse=True)
-        labels = ["1st Star", "2nd Star", "3rd Star"]
-        return [{"label": labels[idx], "summary": summary} for idx, (_, summary) in enumerate(candidates[:3])]
+        series.record_game(
+            PlayoffGame(
+                game=game_number,
+                higher_seed_home=home.name == higher_seed.name,
+                home_goals=result.home_goals,
+                away_goals=result.away_goals,
+                overtime=bool(result.overtime),
+                home_goalie=slot(result.home_goalie.player_id, result.home_goalie.name) if result.home_goalie is not None else -1,
+                away_goalie=slot(result.away_goalie.player_id, result.away_goalie.name) if result.away_goalie is not None else -1,
+                home_goalie_shots=int(result.home_goalie_shots),
+                home_goalie_saves=int(result.home_goalie_saves),
+                away_goalie_shots=int(result.away_goalie_shots),
+                away_goalie_saves=int(result.away_goalie_saves),
+                attendance=attendance,
+                arena_capacity=arena_capacity,
+                home_scoring=scoring(result.home_goal_events),
+                away_scoring=scoring(result.away_goal_events),
+            )
+        )
+        self._consume_coach_game_effect(higher_seed)
+        self._consume_coach_game_effect(lower_seed)
 
     def _start_new_season(self) -> None:
         self._records = {team.name: TeamRecord(team=team) for team in self.teams}
-        self._season_days = build_round_robin_days(self.teams, self.games_per_matchup)
+        self._invalidate_standings()
+        self._dirty_team_names = {team.name for team in self.teams}
+        self._set_schedule(self._build_schedule())
         self._day_index = 0
 
-    def _complete_offseason_with_playoffs(
-        self,
-        playoffs: dict[str, object],
-        user_team_name: str | None = None,
-    ) -> dict[str, object]:
+    def _offseason_stages(self) -> list[OffseasonStage]:
+        return [
+            OffseasonStage("summary", self._offseason_summary_stage),
+            OffseasonStage("career_stats", self._offseason_career_stage, stores=("career_history",)),
+            OffseasonStage("aging", self._offseason_aging_stage, stores=("hall_of_fame",)),
+            OffseasonStage("draft", self._offseason_draft_stage),
+            OffseasonStage("free_agency", self._offseason_free_agency_stage),
+            OffseasonStage("clear_stats", self._offseason_clear_stats_stage),
+            OffseasonStage("coaches", self._offseason_coaches_stage),
+            OffseasonStage("history", self._offseason_history_stage, stores=("season_history",)),
+            OffseasonStage("new_season", self._offseason_new_season_stage),
+        ]
+
+    def _offseason_summary_stage(self, progress: OffseasonProgress) -> None:
+        playoffs = self.pending_playoffs
         champion = str(playoffs.get("champion", "")) if playoffs else (self.get_standings()[0].team.name if self.teams else "")
         coach_rows: list[dict[str, object]] = []
         leadership_rows: list[dict[str, object]] = []
@@ -4170,7 +4307,7 @@ class LeagueSimulator:
                     "assistants": list(rec.team.assistant_names),
                 }
             )
-        summary = {
+        progress.results["summary"] = {
             "season": self.season_number,
             "champion": champion,
             "standings": self._serialize_standings(),
@@ -4181,15 +4318,31 @@ class LeagueSimulator:
             "playoffs": playoffs,
         }
 
-        self._record_career_season_stats(self.season_number)
+    def _offseason_career_stage(self, progress: OffseasonProgress) -> None:
+        self._record_career_season_stats(progress.season)
+
+    def _offseason_aging_stage(self, progress: OffseasonProgress) -> None:
         retired, retired_numbers = self._age_and_retire_players()
-        drafted, drafted_details = self._run_draft(user_team_name=user_team_name)
-        free_agency = self._run_contract_and_free_agency(user_team_name=user_team_name)
+        progress.results["retired"] = retired
+        progress.results["retired_numbers"] = retired_numbers
+
+    def _offseason_draft_stage(self, progress: OffseasonProgress) -> None:
+        drafted, drafted_details = self._run_draft(user_team_name=progress.user_team_name)
+        progress.results["drafted"] = drafted
+        progress.results["drafted_details"] = drafted_details
+
+    def _offseason_free_agency_stage(self, progress: OffseasonProgress) -> None:
+        progress.results["free_agency"] = self._run_contract_and_free_agency(user_team_name=progress.user_team_name)
+
+    def _offseason_clear_stats_stage(self, progress: OffseasonProgress) -> None:
         self._clear_season_player_stats()
-        self.last_offseason_retired = list(retired)
-        self.last_offseason_retired_numbers = list(retired_numbers)
-        self.last_offseason_drafted = {k: list(v) for k, v in drafted.items()}
-        self.last_offseason_drafted_details = {k: list(v) for k, v in drafted_details.items()}
+        results = progress.results
+        self.last_offseason_retired = list(results.get("retired", []))
+        self.last_offseason_retired_numbers = list(results.get("retired_numbers", []))
+        self.last_offseason_drafted = {k: list(v) for k, v in results.get("drafted", {}).items()}
+        self.last_offseason_drafted_details = {k: list(v) for k, v in results.get("drafted_details", {}).items()}
+
+    def _offseason_coaches_stage(self, progress: OffseasonProgress) -> None:
         retired_coaches: list[dict[str, object]] = []
         for team in self.teams:
             replaced = False
@@ -4202,54 +4355,91 @@ class LeagueSimulator:
             team.coach_changes_recent = max(0.0, team.coach_changes_recent * 0.72)
             team.coach_honeymoon_games_remaining = 0
         self._ensure_team_leadership()
-
-        summary["retired"] = retired
-        summary["retired_numbers"] = retired_numbers
-        summary["draft"] = drafted
-        summary["draft_details"] = drafted_details
-        summary["free_agency"] = free_agency
-        summary["retired_coaches"] = retired_coaches
+        progress.results["retired_coaches"] = retired_coaches
+
+    def _offseason_history_stage(self, progress: OffseasonProgress) -> None:
+        results = progress.results
+        summary = results["summary"]
+        summary["retired"] = results.get("retired", [])
+        summary["retired_numbers"] = results.get("retired_numbers", [])
+        summary["draft"] = results.get("drafted", {})
+        summary["draft_details"] = results.get("drafted_details", {})
+        summary["free_agency"] = results.get("free_agency", {})
+        summary["retired_coaches"] = results.get("retired_coaches", [])
         self.season_history.append(summary)
-        self._save_history()
-        self._save_career_history()
-        self._save_hall_of_fame()
 
-        self.season_number += 1
+    def _offseason_new_season_stage(self, progress: OffseasonProgress) -> None:
+        self.season_number = progress.season + 1
         self._start_new_season()
-        self.pending_playoffs = None
-        self.pending_playoff_days = []
-        self.pending_playoff_day_index = 0
-        self._save_state()
+        self._playoff_session = None
+        self._offseason_progress = None
+        # Shares the list, so this stage's own timing row lands before the final checkpoint.
+        self.last_offseason_stages = progress.timings
+
+    def _checkpoint_offseason(self, stage: OffseasonStage) -> None:
+        if "season_history" in stage.stores:
+            self._save_history()
+        if "career_history" in stage.stores:
+            self._save_career_history()
+        if "hall_of_fame" in stage.stores:
+            self._save_hall_of_fame()
+        # History files above are already on disk, so state follows them now even inside a batch.
+        self._save_state(force=True)
+
+    def _complete_offseason_with_playoffs(self, user_team_name: str | None = None) -> dict[str, object]:
+        progress = self._offseason_progress
+        if progress is None:
+            progress = OffseasonProgress(season=self.season_number, user_team_name=user_team_name)
+            self._offseason_progress = progress
+        stages = self._offseason_stages()
+        # A failed stage drops held writes, so anything batched before the offseason goes to disk first.
+        self.flush_batched_saves()
+        try:
+            run_offseason_stages(stages, progress, self._checkpoint_offseason)
+        except Exception:
+            # Memory now holds a partly applied stage; only the last checkpoint on disk is safe to resume from.
+            self._offseason_failed_stage = stages[progress.next_stage].name
+            self.discard_batched_saves()
+            raise
+        results = progress.results
+        summary = results["summary"]
         return {
             "advanced": True,
-            "retired": retired,
-            "retired_numbers": retired_numbers,
-            "drafted": drafted,
-            "drafted_details": drafted_details,
-            "free_agency": free_agency,
-            "retired_coaches": retired_coaches,
-            "champion": champion,
-            "playoffs": playoffs,
+            "retired": results.get("retired", []),
+            "retired_numbers": results.get("retired_numbers", []),
+            "drafted": results.get("drafted", {}),
+            "drafted_details": results.get("drafted_details", {}),
+            "free_agency": results.get("free_agency", {}),
+            "retired_coaches": results.get("retired_coaches", []),
+            "champion": summary["champion"],
+            "playoffs": summary["playoffs"],
             "completed_season": summary["season"],
             "next_season": self.season_number,
+            "stages": list(progress.timings),
         }
 
     def finalize_offseason_after_playoffs(self, user_team_name: str | None = None) -> dict[str, object]:
+        if self._offseason_failed_stage:
+            return {"advanced": False, "reason": "offseason_failed", "stage": self._offseason_failed_stage}
         if not self.is_complete():
             return {"advanced": False, "reason": "season_not_complete"}
-        if self.pending_playoffs is None:
+        if self._playoff_session is None:
             return {"advanced": False, "reason": "playoffs_not_started"}
-        if self.pending_playoff_day_index < len(self.pending_playoff_days):
+        if not self._playoff_session.complete:
             return {"advanced": False, "reason": "playoffs_not_complete"}
-        return self._complete_offseason_with_playoffs(self.pending_playoffs, user_team_name=user_team_name)
+        return self._complete_offseason_with_playoffs(user_team_name=user_team_name)
 
     def advance_to_next_season(self, user_team_name: str | None = None) -> dict[str, object]:
         if not self.is_complete():
             return {"advanced": False, "reason": "season_not_complete"}
-        if self.pending_playoffs is None:
+        if self._playoff_session is None:
             self.start_playoffs()
-        self.pending_playoff_day_index = len(self.pending_playoff_days)
-        self._save_state()
+        self.begin_batched_saves()
+        try:
+            while self.simulate_next_playoff_day().get("advanced"):
+                pass
+        finally:
+            self.end_batched_saves()
         return self.finalize_offseason_after_playoffs(user_team_name=user_team_name)
 
     def reset_persistent_history(self) -> None:
@@ -4263,9 +4453,14 @@ class LeagueSimulator:
         self.free_agents = []
         self.draft_focus_by_team = {}
         self.current_draft_state = {}
-        self.pending_playoffs = None
-        self.pending_playoff_days = []
-        self.pending_playoff_day_index = 0
+        self._playoff_session = None
+        self._offseason_progress = None
+        self._offseason_failed_stage = ""
+        self.last_offseason_stages = []
+        self._career_aggregates = {}
+        self._hall_of_fame_aggregates = {}
+        self._record_book = None
+        self._stint_index = None
         self.season_number = 1
         for team in self.teams:
             for player in [*team.roster, *team.minor_roster]:
@@ -4292,7 +4487,6 @@ class LeagueSimulator:
             pass
 
     def run_season(self) -> LeagueResult:
-        while not self.is_complete():
-            self.simulate_next_day()
+        self.simulate_to(len(self._season_days))
         return LeagueResult(standings=self.get_standings())
 
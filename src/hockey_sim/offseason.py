@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Sequence
+
+
+@dataclass(slots=True)
+class OffseasonProgress:
+    """Resumable state of an offseason that has started but not finished.
+
+    `results` collects what each stage produced so the final summary can be
+    assembled after a restart; `timings` holds one row per finished stage.
+    """
+
+    season: int
+    user_team_name: str | None = None
+    next_stage: int = 0
+    results: dict[str, Any] = field(default_factory=dict)
+    timings: list[dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "season": self.season,
+            "user_team_name": self.user_team_name,
+            "next_stage": self.next_stage,
+            "results": self.results,
+            "timings": self.timings,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Any) -> OffseasonProgress | None:
+        if not isinstance(raw, dict):
+            return None
+        try:
+            results = raw.get("results", {})
+            user_team_name = raw.get("user_team_name")
+            return cls(
+                season=int(raw["season"]),
+                user_team_name=str(user_team_name) if user_team_name else None,
+                next_stage=max(0, int(raw.get("next_stage", 0))),
+                results=dict(results) if isinstance(results, dict) else {},
+                timings=[row for row in raw.get("timings", []) or [] if isinstance(row, dict)],
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+@dataclass(frozen=True, slots=True)
+class OffseasonStage:
+    name: str
+    run: Callable[[OffseasonProgress], None]
+    # Persisted stores besides the league state that this stage dirties: "season_history", "career_history", "hall_of_fame".
+    stores: tuple[str, ...] = ()
+
+
+def run_offseason_stages(
+    stages: Sequence[OffseasonStage],
+    progress: OffseasonProgress,
+    checkpoint: Callable[[OffseasonStage], None],
+) -> None:
+    """Run the stages `progress` has not reached yet, checkpointing after each.
+
+    Wall time is always recorded. Allocations are reported as the net change in
+    live interpreter blocks, plus the traced peak when tracemalloc is running.
+    """
+    while progress.next_stage < len(stages):
+        stage = stages[progress.next_stage]
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        blocks_before = sys.getallocatedblocks()
+        started = time.perf_counter()
+        stage.run(progress)
+        timing: dict[str, Any] = {
+            "stage": stage.name,
+            "seconds": round(time.perf_counter() - started, 4),
+            "net_blocks": sys.getallocatedblocks() - blocks_before,
+        }
+        if tracing:
+            timing["peak_kib"] = round((tracemalloc.get_traced_memory()[1] - traced_before) / 1024.0, 1)
+        progress.timings.append(timing)
+        progress.next_stage += 1
+        started = time.perf_counter()
+        checkpoint(stage)
+        timing["checkpoint_seconds"] = round(time.perf_counter() - started, 4)
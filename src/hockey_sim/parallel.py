@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+import copy
+from dataclasses import fields
+import random
+from typing import Any
+
+from .engine import GameResult, GoalEvent, InjuryEvent, simulate_game
+from .models import Player, Team
+from .undo import UndoLog
+
+GAME_EXECUTORS = ("serial", "process")
+
+_PLAYER_SCALAR_FIELDS = tuple(
+    f.name for f in fields(Player) if f.name not in {"career_seasons"}
+)
+
+
+def _player_scalars(player: Player) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for name in _PLAYER_SCALAR_FIELDS:
+        value = getattr(player, name)
+        if isinstance(value, (int, float, str, bool)) or value is None:
+            out[name] = value
+    return out
+
+
+def _isolated_team(team: Team) -> Team:
+    # Workers only need the active roster; career history is dead weight to pickle.
+    clone = copy.copy(team)
+    roster: list[Player] = []
+    for player in team.roster:
+        light = copy.copy(player)
+        light.career_seasons = []
+        roster.append(light)
+    clone.roster = roster
+    clone.minor_roster = []
+    clone.line_assignments = dict(team.line_assignments)
+    return clone
+
+
+def simulate_game_isolated(
+    home: Team,
+    away: Team,
+    game_kwargs: dict[str, Any],
+    seed: int,
+) -> tuple[GameResult, dict[str, dict[str, Any]]]:
+    """Run one game on its own RNG substream and report per-player field changes."""
+    players = [*home.roster, *away.roster]
+    before = {p.player_id: _player_scalars(p) for p in players}
+    result = simulate_game(home=home, away=away, rng=random.Random(seed), **game_kwargs)
+    deltas: dict[str, dict[str, Any]] = {}
+    for player in players:
+        after = _player_scalars(player)
+        prior = before[player.player_id]
+        changed = {name: value for name, value in after.items() if prior.get(name) != value}
+        if changed:
+            deltas[player.player_id] = changed
+    return result, deltas
+
+
+def _rebind_result(result: GameResult, home: Team, away: Team) -> GameResult:
+    live = {p.player_id: p for p in [*home.roster, *away.roster]}
+
+    def _live(player: Player | None) -> Player | None:
+        if player is None:
+            return None
+        return live.get(player.player_id, player)
+
+    def _events(events: list[GoalEvent]) -> list[GoalEvent]:
+        return [GoalEvent(scorer=_live(ev.scorer), assists=[_live(a) for a in ev.assists]) for ev in events]
+
+    def _injuries(events: list[InjuryEvent]) -> list[InjuryEvent]:
+        return [
+            InjuryEvent(
+                player=_live(ev.player),
+                games_out=ev.games_out,
+                injury_type=ev.injury_type,
+                injury_status=ev.injury_status,
+            )
+            for ev in events
+        ]
+
+    result.home = home
+    result.away = away
+    result.home_goal_events = _events(result.home_goal_events)
+    result.away_goal_events = _events(result.away_goal_events)
+    result.home_injuries = _injuries(result.home_injuries)
+    result.away_injuries = _injuries(result.away_injuries)
+    result.home_goalie = _live(result.home_goalie)
+    result.away_goalie = _live(result.away_goalie)
+    return result
+
+
+class DayGameExecutor:
+    """Simulates a day's games, which never share a team, on independent RNG substreams.
+
+    "serial" runs them in-process and "process" fans them out to a process pool;
+    both produce the same results for the same seeds. Results are returned in
+    schedule order with player changes already merged into the live teams.
+    """
+
+    def __init__(self, mode: str = "serial", max_workers: int | None = None) -> None:
+        if mode not in GAME_EXECUTORS:
+            raise ValueError(f"Unknown game executor '{mode}'")
+        self.mode = mode
+        self.max_workers = max_workers
+        self._pool: Executor | None = None
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def run(
+        self,
+        games: list[tuple[Team, Team, dict[str, Any], int]],
+        undo: UndoLog | None = None,
+    ) -> list[GameResult]:
+        if self.mode == "serial" or len(games) <= 1:
+            return [
+                simulate_game(home=home, away=away, rng=random.Random(seed), undo=undo, **kwargs)
+                for home, away, kwargs, seed in games
+            ]
+        pool = self._get_pool()
+        futures = [
+            pool.submit(simulate_game_isolated, _isolated_team(home), _isolated_team(away), kwargs, seed)
+            for home, away, kwargs, seed in games
+        ]
+        results: list[GameResult] = []
+        # Merge strictly in schedule order so downstream bookkeeping matches serial runs.
+        for (home, away, _kwargs, _seed), future in zip(games, futures):
+            result, deltas = future.result()
+            for team in (home, away):
+                for player in team.roster:
+                    changed = deltas.get(player.player_id)
+                    if changed:
+                        for name, value in changed.items():
+                            if undo is not None:
+                                undo.save(player, name)
+                            setattr(player, name, value)
+            results.append(_rebind_result(result, home, away))
+        return results
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
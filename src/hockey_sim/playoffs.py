@@ -0,0 +1,572 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+CUP_NAME = "Founders Cup"
+# Bracket stages play one after another; every series in a stage plays game N on the same day.
+STAGE_COUNT = 4
+# 2-2-1-1-1 format: whether the higher seed hosts game N of a series.
+HIGHER_SEED_HOSTS = (True, True, False, False, True, False, True)
+_STAGE_SUFFIXES = (
+    " First Round",
+    " Division Finals",
+    " Conference Final",
+    " Conference Quarterfinal",
+    " Conference Semifinal",
+)
+
+
+def stage_label(group: str) -> str:
+    for suffix in _STAGE_SUFFIXES:
+        if group.endswith(suffix):
+            return suffix.strip()
+    return group
+
+
+def higher_seed_hosts(game_number: int) -> bool:
+    return HIGHER_SEED_HOSTS[min(game_number - 1, len(HIGHER_SEED_HOSTS) - 1)]
+
+
+def series_outcomes(
+    win_at_home: float,
+    win_on_road: float,
+    high_wins: int = 0,
+    low_wins: int = 0,
+    best_of: int = 7,
+) -> dict[tuple[int, int], float]:
+    """Exact chance of every final (high, low) series score from the given state.
+
+    `win_at_home` and `win_on_road` are the higher seed's single-game chances.
+    """
+    need = best_of // 2 + 1
+    outcomes: dict[tuple[int, int], float] = {}
+    frontier = {(high_wins, low_wins): 1.0}
+    while frontier:
+        step: dict[tuple[int, int], float] = {}
+        for (high, low), prob in frontier.items():
+            if high >= need or low >= need:
+                outcomes[(high, low)] = outcomes.get((high, low), 0.0) + prob
+                continue
+            p = win_at_home if higher_seed_hosts(high + low + 1) else win_on_road
+            step[(high + 1, low)] = step.get((high + 1, low), 0.0) + prob * p
+            step[(high, low + 1)] = step.get((high, low + 1), 0.0) + prob * (1.0 - p)
+        frontier = step
+    return outcomes
+
+
+class PlayoffGame(NamedTuple):
+    """One decided playoff game as kept in a series log.
+
+    Goalies and scorers are indices into the series' `players` name table, with
+    -1 for a missing goalie. Each scoring entry is (scorer, *assists).
+    """
+
+    game: int
+    higher_seed_home: bool
+    home_goals: int
+    away_goals: int
+    overtime: bool
+    home_goalie: int
+    away_goalie: int
+    home_goalie_shots: int
+    home_goalie_saves: int
+    away_goalie_shots: int
+    away_goalie_saves: int
+    attendance: int
+    arena_capacity: int
+    home_scoring: tuple[tuple[int, ...], ...]
+    away_scoring: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def from_row(cls, raw: Any) -> PlayoffGame | None:
+        if not isinstance(raw, (list, tuple)) or len(raw) != len(cls._fields):
+            return None
+        try:
+            return cls(
+                int(raw[0]),
+                bool(raw[1]),
+                *(int(value) for value in raw[2:4]),
+                bool(raw[4]),
+                *(int(value) for value in raw[5:13]),
+                tuple(tuple(int(idx) for idx in goal) for goal in raw[13]),
+                tuple(tuple(int(idx) for idx in goal) for goal in raw[14]),
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def row(self) -> tuple[Any, ...]:
+        """Plain tuple for JSON encoders that do not take tuple subclasses."""
+        return tuple(self)
+
+
+def _goalie_star_score(saves: int, shots: int, goals_against: int, won: bool) -> float:
+    if shots <= 0:
+        return 0.0
+    sv = saves / shots
+    score = saves * 2.0
+    if sv >= 0.960:
+        score += 95.0
+    elif sv >= 0.950:
+        score += 78.0
+    elif sv >= 0.940:
+        score += 62.0
+    elif sv >= 0.930:
+        score += 46.0
+    elif sv >= 0.920:
+        score += 28.0
+    elif sv >= 0.910:
+        score += 12.0
+    if shots >= 40:
+        score += 36.0
+    elif shots >= 35:
+        score += 24.0
+    elif shots >= 30:
+        score += 14.0
+    if won:
+        score += 34.0
+    if goals_against == 0:
+        score += 135.0
+    return max(0.0, score)
+
+
+@lru_cache(maxsize=512)
+def playoff_three_stars(game: PlayoffGame, players: tuple[str, ...], home: str, away: str) -> tuple[tuple[str, str], ...]:
+    """(label, summary) for the game's three stars, derived from its scoring and goalie lines."""
+
+    def name(idx: int) -> str:
+        return players[idx] if 0 <= idx < len(players) else ""
+
+    skater_lines: dict[int, list[Any]] = {}
+    for scoring, team_name in ((game.home_scoring, home), (game.away_scoring, away)):
+        for scorer, *assists in scoring:
+            skater_lines.setdefault(scorer, [team_name, 0, 0])[1] += 1
+            for helper in assists:
+                skater_lines.setdefault(helper, [team_name, 0, 0])[2] += 1
+
+    candidates: list[tuple[float, str]] = []
+    for idx, (team_name, goals, assists) in skater_lines.items():
+        points = goals + assists
+        score = points * 52.0 + goals * 18.0 + assists * 8.0
+        if points >= 3:
+            score += 18.0
+        if goals >= 2:
+            score += 12.0
+        candidates.append((score, f"{name(idx)} ({team_name}) {goals}G {assists}A"))
+    if game.home_goalie >= 0 and game.home_goalie_shots > 0:
+        candidates.append(
+            (
+                _goalie_star_score(
+                    game.home_goalie_saves, game.home_goalie_shots, game.away_goals, game.home_goals > game.away_goals
+                ),
+                f"{name(game.home_goalie)} ({home}) {game.home_goalie_saves}/{game.home_goalie_shots} SV",
+            )
+        )
+    if game.away_goalie >= 0 and game.away_goalie_shots > 0:
+        candidates.append(
+            (
+                _goalie_star_score(
+                    game.away_goalie_saves, game.away_goalie_shots, game.home_goals, game.away_goals > game.home_goals
+                ),
+                f"{name(game.away_goalie)} ({away}) {game.away_goalie_saves}/{game.away_goalie_shots} SV",
+            )
+        )
+    candidates.sort(key=lambda row: row[0], reverse=True)
+    labels = ("1st Star", "2nd Star", "3rd Star")
+    return tuple((labels[idx], summary) for idx, (_, summary) in enumerate(candidates[:3]))
+
+
+def expand_playoff_game(
+    game: PlayoffGame | dict[str, object],
+    higher_seed: str,
+    lower_seed: str,
+    players: tuple[str, ...],
+) -> dict[str, object]:
+    """The game as a plain display row with team and goalie names and derived three stars.
+
+    Legacy dict rows are copied as-is.
+    """
+    if isinstance(game, dict):
+        return dict(game)
+    home, away = (higher_seed, lower_seed) if game.higher_seed_home else (lower_seed, higher_seed)
+
+    def name(idx: int) -> str:
+        return players[idx] if 0 <= idx < len(players) else ""
+
+    return {
+        "game": game.game,
+        "home": home,
+        "away": away,
+        "home_goals": game.home_goals,
+        "away_goals": game.away_goals,
+        "overtime": game.overtime,
+        "home_goalie": name(game.home_goalie),
+        "away_goalie": name(game.away_goalie),
+        "home_goalie_shots": game.home_goalie_shots,
+        "home_goalie_saves": game.home_goalie_saves,
+        "away_goalie_shots": game.away_goalie_shots,
+        "away_goalie_saves": game.away_goalie_saves,
+        "attendance": game.attendance,
+        "arena_capacity": game.arena_capacity,
+        "winner": home if game.home_goals > game.away_goals else away,
+        "three_stars": [
+            {"label": label, "summary": summary} for label, summary in playoff_three_stars(game, players, home, away)
+        ],
+    }
+
+
+def summary_game_rows(summary: dict[str, Any]) -> list[dict[str, object]]:
+    """Display rows for the games of a series summary, compact or legacy."""
+    players = tuple(str(name) for name in summary.get("players", []) or [])
+    higher_seed = str(summary.get("higher_seed", ""))
+    lower_seed = str(summary.get("lower_seed", ""))
+    rows: list[dict[str, object]] = []
+    for raw in summary.get("games", []) or []:
+        game = raw if isinstance(raw, dict) else PlayoffGame.from_row(raw)
+        if game is not None:
+            rows.append(expand_playoff_game(game, higher_seed, lower_seed, players))
+    return rows
+
+
+@dataclass(slots=True)
+class PlayoffSeries:
+    round: str
+    group: str
+    conference: str
+    stage: int
+    slot: str
+    higher_seed: str
+    lower_seed: str
+    best_of: int = 7
+    high_wins: int = 0
+    low_wins: int = 0
+    # Compact games; saves from before compact records hold dict rows.
+    games: list[PlayoffGame | dict[str, object]] = field(default_factory=list)
+    # Names referenced by the compact games, in first-seen order; `_player_slots` maps player ids to them.
+    players: tuple[str, ...] = ()
+    _player_slots: dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def wins_needed(self) -> int:
+        return self.best_of // 2 + 1
+
+    @property
+    def complete(self) -> bool:
+        return self.high_wins >= self.wins_needed or self.low_wins >= self.wins_needed
+
+    @property
+    def winner(self) -> str:
+        if not self.complete:
+            return ""
+        return self.higher_seed if self.high_wins > self.low_wins else self.lower_seed
+
+    @property
+    def loser(self) -> str:
+        if not self.complete:
+            return ""
+        return self.lower_seed if self.high_wins > self.low_wins else self.higher_seed
+
+    @property
+    def elimination_game(self) -> bool:
+        return self.high_wins == self.wins_needed - 1 or self.low_wins == self.wins_needed - 1
+
+    @property
+    def max_games_left(self) -> int:
+        if self.complete:
+            return 0
+        return (self.wins_needed - self.high_wins) + (self.wins_needed - self.low_wins) - 1
+
+    def player_slot(self, player_id: str, name: str) -> int:
+        """Index of the player in `players`, adding them on first sight."""
+        slot = self._player_slots.get(player_id)
+        if slot is None:
+            slot = self._player_slots[player_id] = len(self.players)
+            self.players = (*self.players, name)
+        return slot
+
+    def game_winner(self, game: PlayoffGame | dict[str, object]) -> str:
+        if isinstance(game, dict):
+            return str(game.get("winner", ""))
+        if (game.home_goals > game.away_goals) == game.higher_seed_home:
+            return self.higher_seed
+        return self.lower_seed
+
+    def game_rows(self) -> list[dict[str, object]]:
+        return [expand_playoff_game(game, self.higher_seed, self.lower_seed, self.players) for game in self.games]
+
+    def record_game(self, game: PlayoffGame | dict[str, object]) -> None:
+        if self.game_winner(game) == self.higher_seed:
+            self.high_wins += 1
+        else:
+            self.low_wins += 1
+        self.games.append(game)
+
+    def _game_log(self) -> list[Any]:
+        return [game if isinstance(game, dict) else game.row() for game in self.games]
+
+    def to_summary(self) -> dict[str, object]:
+        return {
+            "round": self.round,
+            "higher_seed": self.higher_seed,
+            "lower_seed": self.lower_seed,
+            "winner": self.winner,
+            "loser": self.loser,
+            "winner_wins": max(self.high_wins, self.low_wins),
+            "loser_wins": min(self.high_wins, self.low_wins),
+            "games": self._game_log(),
+            "players": list(self.players),
+        }
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "round": self.round,
+            "group": self.group,
+            "conference": self.conference,
+            "stage": self.stage,
+            "slot": self.slot,
+            "higher_seed": self.higher_seed,
+            "lower_seed": self.lower_seed,
+            "best_of": self.best_of,
+            "games": self._game_log(),
+            "players": list(self.players),
+            "player_ids": self._player_ids(),
+        }
+
+    def _player_ids(self) -> list[str]:
+        ids = [""] * len(self.players)
+        for player_id, slot in self._player_slots.items():
+            ids[slot] = player_id
+        return ids
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> PlayoffSeries:
+        series = cls(
+            round=str(raw.get("round", "")),
+            group=str(raw.get("group", "")),
+            conference=str(raw.get("conference", "")),
+            stage=int(raw.get("stage", 0)),
+            slot=str(raw.get("slot", "")),
+            higher_seed=str(raw.get("higher_seed", "")),
+            lower_seed=str(raw.get("lower_seed", "")),
+            best_of=int(raw.get("best_of", 7)),
+        )
+        series.players = tuple(str(name) for name in raw.get("players", []) or [])
+        ids = [str(player_id) for player_id in raw.get("player_ids", []) or []]
+        # Saves from before ids were kept only lose slot reuse: later games add their players again.
+        series._player_slots = {player_id: slot for slot, player_id in enumerate(ids[: len(series.players)]) if player_id}
+        for row in raw.get("games", []) or []:
+            game = row if isinstance(row, dict) else PlayoffGame.from_row(row)
+            if game is not None:
+                series.record_game(game)
+        return series
+
+
+@dataclass(slots=True)
+class PlayoffSession:
+    """Live playoff bracket, advanced one day at a time.
+
+    Only decided games exist: each stage's series are created once the previous
+    stage is over, and revealed days are rebuilt from the series game logs
+    instead of being stored. `plans` holds each conference's bracket format
+    and `advancers` the teams waiting in each bracket slot.
+    """
+
+    seeds: list[dict[str, object]]
+    plans: dict[str, dict[str, Any]]
+    conference_order: list[str]
+    stage: int = 0
+    series: list[PlayoffSeries] = field(default_factory=list)
+    advancers: dict[str, list[str]] = field(default_factory=dict)
+    tracker: dict[str, dict[str, object]] = field(default_factory=dict)
+    champion: str = ""
+    mvp: dict[str, object] = field(default_factory=dict)
+    complete: bool = False
+    # Saves from before incremental playoffs carry a fully simulated bracket to reveal.
+    legacy_bracket: dict[str, object] | None = None
+    legacy_days: list[dict[str, object]] = field(default_factory=list)
+    legacy_revealed: int = 0
+    _days_cache: list[dict[str, object]] | None = None
+
+    def stage_series(self, stage: int | None = None) -> list[PlayoffSeries]:
+        target = self.stage if stage is None else stage
+        return [series for series in self.series if series.stage == target]
+
+    def active_series(self) -> list[PlayoffSeries]:
+        return [series for series in self.stage_series() if not series.complete]
+
+    def stage_game_number(self) -> int:
+        played = [len(series.games) for series in self.stage_series()]
+        return max(played, default=0) + 1
+
+    def add_advancer(self, slot: str, team_name: str) -> None:
+        self.advancers.setdefault(slot, []).append(team_name)
+
+    def fork(self) -> PlayoffSession:
+        """Bracket state for what-if sampling: current-stage series and waiting advancers, without game logs."""
+        return PlayoffSession(
+            seeds=self.seeds,
+            plans=self.plans,
+            conference_order=self.conference_order,
+            stage=self.stage,
+            series=[
+                PlayoffSeries(
+                    round=series.round,
+                    group=series.group,
+                    conference=series.conference,
+                    stage=series.stage,
+                    slot=series.slot,
+                    higher_seed=series.higher_seed,
+                    lower_seed=series.lower_seed,
+                    best_of=series.best_of,
+                    high_wins=series.high_wins,
+                    low_wins=series.low_wins,
+                )
+                for series in self.stage_series()
+            ],
+            advancers={slot: list(names) for slot, names in self.advancers.items()},
+            complete=self.complete,
+        )
+
+    def alive(self) -> set[str]:
+        names = {name for names in self.advancers.values() for name in names}
+        for series in self.stage_series():
+            if series.complete:
+                names.add(series.winner)
+            else:
+                names.update((series.higher_seed, series.lower_seed))
+        return names
+
+    def invalidate_days(self) -> None:
+        self._days_cache = None
+
+    @property
+    def days(self) -> list[dict[str, object]]:
+        if self.legacy_bracket is not None:
+            return self.legacy_days[: self.legacy_revealed]
+        if self._days_cache is None:
+            self._days_cache = self._build_days()
+        return self._days_cache
+
+    def _build_days(self) -> list[dict[str, object]]:
+        days: list[dict[str, object]] = []
+        for stage in range(STAGE_COUNT):
+            rows = self.stage_series(stage)
+            longest = max((len(series.games) for series in rows), default=0)
+            for game_no in range(1, longest + 1):
+                day_games: list[dict[str, object]] = []
+                for series in rows:
+                    if len(series.games) < game_no:
+                        continue
+                    high_wins = sum(1 for g in series.games[:game_no] if series.game_winner(g) == series.higher_seed)
+                    entry = expand_playoff_game(series.games[game_no - 1], series.higher_seed, series.lower_seed, series.players)
+                    entry["series_higher_seed"] = series.higher_seed
+                    entry["series_lower_seed"] = series.lower_seed
+                    entry["series_high_wins"] = high_wins
+                    entry["series_low_wins"] = game_no - high_wins
+                    day_games.append(entry)
+                if day_games:
+                    days.append({"round": stage_label(rows[0].group), "game_number": game_no, "games": day_games})
+        return days
+
+    def total_days_estimate(self) -> int:
+        if self.legacy_bracket is not None:
+            return len(self.legacy_days)
+        played = len(self.days)
+        if self.complete:
+            return played
+        remaining = max((series.max_games_left for series in self.active_series()), default=0)
+        # Later stages are not paired yet; assume each can go the distance.
+        return played + remaining + 7 * max(0, STAGE_COUNT - 1 - self.stage)
+
+    def bracket(self, mvp_race: list[dict[str, object]]) -> dict[str, object]:
+        if self.legacy_bracket is not None:
+            return self.legacy_bracket
+        order = {name: idx for idx, name in enumerate(self.conference_order)}
+        rounds: list[dict[str, object]] = []
+        groups: dict[str, list[PlayoffSeries]] = {}
+        for series in sorted(self.series, key=lambda s: (order.get(s.conference, len(order)), s.stage)):
+            if series.group not in groups:
+                groups[series.group] = []
+                rounds.append({"name": series.group, "series": []})
+            groups[series.group].append(series)
+        for row in rounds:
+            row["series"] = [series.to_summary() for series in groups[str(row["name"])]]
+        return {
+            "cup_name": CUP_NAME,
+            "champion": self.champion,
+            "cup_champion": self.champion,
+            "mvp": self.mvp,
+            "mvp_race": mvp_race,
+            "seeds": self.seeds,
+            "rounds": rounds,
+        }
+
+    def to_dict(self) -> dict[str, object]:
+        if self.legacy_bracket is not None:
+            return {
+                "legacy_bracket": self.legacy_bracket,
+                "legacy_days": self.legacy_days,
+                "legacy_revealed": self.legacy_revealed,
+            }
+        return {
+            "seeds": self.seeds,
+            "plans": self.plans,
+            "conference_order": self.conference_order,
+            "stage": self.stage,
+            "series": [series.to_dict() for series in self.series],
+            "advancers": self.advancers,
+            "tracker": self.tracker,
+            "champion": self.champion,
+            "mvp": self.mvp,
+            "complete": self.complete,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Any) -> PlayoffSession | None:
+        if not isinstance(raw, dict):
+            return None
+        try:
+            legacy = raw.get("legacy_bracket")
+            if isinstance(legacy, dict):
+                return cls.from_legacy(legacy, raw.get("legacy_days"), raw.get("legacy_revealed", 0))
+            plans = raw.get("plans", {})
+            advancers = raw.get("advancers", {})
+            tracker = raw.get("tracker", {})
+            mvp = raw.get("mvp", {})
+            return cls(
+                seeds=[row for row in raw.get("seeds", []) or [] if isinstance(row, dict)],
+                plans=dict(plans) if isinstance(plans, dict) else {},
+                conference_order=[str(name) for name in raw.get("conference_order", []) or []],
+                stage=int(raw.get("stage", 0)),
+                series=[PlayoffSeries.from_dict(row) for row in raw.get("series", []) or [] if isinstance(row, dict)],
+                advancers={str(k): [str(n) for n in v] for k, v in advancers.items() if isinstance(v, list)}
+                if isinstance(advancers, dict)
+                else {},
+                tracker=dict(tracker) if isinstance(tracker, dict) else {},
+                champion=str(raw.get("champion", "")),
+                mvp=dict(mvp) if isinstance(mvp, dict) else {},
+                complete=bool(raw.get("complete", False)),
+            )
+        except (TypeError, ValueError, AttributeError):
+            return None
+
+    @classmethod
+    def from_legacy(cls, bracket: dict[str, object], days: Any, revealed: Any) -> PlayoffSession:
+        day_rows = [row for row in days if isinstance(row, dict)] if isinstance(days, list) else []
+        try:
+            revealed_count = int(revealed)
+        except (TypeError, ValueError):
+            revealed_count = 0
+        seeds = bracket.get("seeds", [])
+        session = cls(
+            seeds=[row for row in seeds if isinstance(row, dict)] if isinstance(seeds, list) else [],
+            plans={},
+            conference_order=[],
+            legacy_bracket=bracket,
+            legacy_days=day_rows,
+            legacy_revealed=max(0, min(revealed_count, len(day_rows))),
+        )
+        session.champion = str(bracket.get("champion", ""))
+        session.complete = session.legacy_revealed >= len(day_rows)
+        return session
@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .career import CareerAggregate
+from .models import GOALIE_POSITIONS, Player, Team
+
+RATING_FIELDS = ("shooting", "playmaking", "defense", "goaltending", "physical", "durability")
+# Uniform draws each player consumes, in order: wear volatility, aging noise, prospect boom/bust roll, retirement roll.
+DRAWS_PER_PLAYER = 4
+_INPUT_FIELDS = (
+    "age",
+    "goalie",
+    "season_injuries",
+    "season_games_missed",
+    "recent_injuries",
+    "recent_games_missed",
+    "usage",
+    "coach_quality",
+    "goalie_dev_quality",
+    "churn_penalty",
+    "seasons_to_nhl",
+    "prospect_resolved",
+    "prospect_potential",
+    "tier_bonus",
+    "boom_chance",
+    "bust_chance",
+)
+_VOLATILITY_LOW, _VOLATILITY_HIGH = 0.92, 1.10
+_NOISE_LOW, _NOISE_HIGH = -0.012, 0.012
+# (age ceiling, skater development, goalie development); older than the last ceiling uses the final row.
+_DEV_CURVE = (
+    (20, 0.10, 0.08),
+    (22, 0.07, 0.06),
+    (24, 0.04, 0.05),
+    (27, 0.015, 0.02),
+    (29, 0.0, 0.01),
+    (32, -0.025, -0.015),
+    (35, -0.05, -0.03),
+)
+_DEV_OLD = (-0.08, -0.05)
+# Aging shift multipliers and rating floors, (field, multiplier, floor).
+_GOALIE_SHIFTS = (
+    ("goaltending", 1.2, 0.8),
+    ("defense", 0.6, 0.8),
+    ("playmaking", 0.4, 0.8),
+    ("shooting", 0.1, 0.4),
+    ("physical", 0.5, 0.8),
+)
+_SKATER_SHIFTS = (
+    ("shooting", 1.0, 0.8),
+    ("playmaking", 0.9, 0.8),
+    ("defense", 0.8, 0.8),
+    ("goaltending", 0.05, 0.3),
+    ("physical", 0.75, 0.8),
+)
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def _clamp(value: float, low: float, high: float = 5.0) -> float:
+    return min(high, max(low, value))
+
+
+@dataclass(slots=True)
+class ProgressionTable:
+    """One offseason's aging inputs for every rostered player, stored by column.
+
+    `run` applies injury wear, the aging curve and the retirement roll to all
+    players at once, with NumPy when it is installed and a plain loop over the
+    same columns otherwise. Both paths use the same draws and arithmetic, so
+    they give identical results.
+    """
+
+    players: list[Player]
+    columns: dict[str, list[float]]
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    @classmethod
+    def build(
+        cls,
+        entries: Iterable[tuple[Player, Team, int]],
+        career: Callable[[Player], CareerAggregate] = lambda player: CareerAggregate.build(player.career_seasons),
+    ) -> ProgressionTable:
+        """Columns for (player, team, team games played) rows, ages already advanced a year."""
+        players: list[Player] = []
+        columns: dict[str, list[float]] = {name: [] for name in (*_INPUT_FIELDS, *RATING_FIELDS)}
+        team_factors: dict[str, tuple[float, float, float]] = {}
+        for player, team, team_games in entries:
+            factors = team_factors.get(team.name)
+            if factors is None:
+                factors = (
+                    max(0.0, min(1.0, (team.coach_rating - 2.0) / 3.0)),
+                    max(0.0, min(1.0, (team.coach_goalie_dev - 2.0) / 3.0)),
+                    min(0.20, max(0.0, team.coach_changes_recent) * 0.035),
+                )
+                team_factors[team.name] = factors
+            goalie = player.position in GOALIE_POSITIONS
+            history = career(player)
+            games = max(1, team_games)
+            players.append(player)
+            columns["age"].append(player.age + 1)
+            columns["goalie"].append(goalie)
+            columns["season_injuries"].append(max(0, player.injuries))
+            columns["season_games_missed"].append(max(0, player.games_missed_injury))
+            columns["recent_injuries"].append(history.recent_total("injuries"))
+            columns["recent_games_missed"].append(history.recent_total("games_missed"))
+            columns["usage"].append((player.goalie_games / games) if goalie else (player.games_played / games))
+            columns["coach_quality"].append(factors[0])
+            columns["goalie_dev_quality"].append(factors[1])
+            columns["churn_penalty"].append(factors[2])
+            columns["seasons_to_nhl"].append(player.seasons_to_nhl)
+            columns["prospect_resolved"].append(player.prospect_resolved)
+            columns["prospect_potential"].append(player.prospect_potential)
+            columns["tier_bonus"].append(
+                0.006 if player.prospect_tier == "Junior" else (0.003 if player.prospect_tier == "AHL" else 0.0)
+            )
+            columns["boom_chance"].append(player.prospect_boom_chance)
+            columns["bust_chance"].append(player.prospect_bust_chance)
+            for name in RATING_FIELDS:
+                columns[name].append(getattr(player, name))
+        return cls(players=players, columns=columns)
+
+    def run(self, draws: Sequence[float], use_numpy: bool | None = None) -> list[bool]:
+        """Age every player in place and return which of them retire.
+
+        `draws` holds `DRAWS_PER_PLAYER` uniform [0, 1) values per player, player-major.
+        """
+        if len(draws) < len(self.players) * DRAWS_PER_PLAYER:
+            raise ValueError("Not enough random draws for the progression table")
+        if use_numpy is None:
+            use_numpy = np is not None
+        if use_numpy and np is None:
+            raise RuntimeError("NumPy is not installed")
+        out = _run_numpy(self.columns, draws) if use_numpy else _run_python(self.columns, draws)
+        ages = self.columns["age"]
+        seasons_to_nhl = out["seasons_to_nhl"]
+        resolved = out["prospect_resolved"]
+        ratings = [(name, out[name]) for name in RATING_FIELDS]
+        for idx, player in enumerate(self.players):
+            player.age = int(ages[idx])
+            player.seasons_to_nhl = int(seasons_to_nhl[idx])
+            player.prospect_resolved = bool(resolved[idx])
+            for name, values in ratings:
+                setattr(player, name, float(values[idx]))
+        return [bool(flag) for flag in out["retire"]]
+
+
+def _development(age: int, goalie: bool) -> float:
+    for ceiling, skater_dev, goalie_dev in _DEV_CURVE:
+        if age <= ceiling:
+            return goalie_dev if goalie else skater_dev
+    return _DEV_OLD[1] if goalie else _DEV_OLD[0]
+
+
+def _retire_probability(age: int, goalie: bool) -> float:
+    if goalie:
+        if age >= 37:
+            return min(0.90, 0.08 + (age - 37) * 0.10)
+        if age >= 34:
+            return 0.03 + (age - 34) * 0.025
+        return 0.0
+    if age >= 35:
+        return min(0.92, 0.10 + (age - 35) * 0.12)
+    if age >= 32:
+        return 0.03 + (age - 32) * 0.03
+    return 0.0
+
+
+def _run_python(columns: dict[str, list[float]], draws: Sequence[float]) -> dict[str, list[float]]:
+    size = len(columns["age"])
+    out: dict[str, list[float]] = {name: [0.0] * size for name in RATING_FIELDS}
+    out["seasons_to_nhl"] = list(columns["seasons_to_nhl"])
+    out["prospect_resolved"] = list(columns["prospect_resolved"])
+    out["retire"] = [False] * size
+    out_shooting, out_playmaking, out_defense = out["shooting"], out["playmaking"], out["defense"]
+    out_goaltending, out_physical, out_durability = out["goaltending"], out["physical"], out["durability"]
+    rows = zip(
+        range(size),
+        columns["age"],
+        columns["goalie"],
+        columns["season_injuries"],
+        columns["season_games_missed"],
+        columns["recent_injuries"],
+        columns["recent_games_missed"],
+        columns["usage"],
+        columns["coach_quality"],
+        columns["goalie_dev_quality"],
+        columns["churn_penalty"],
+        columns["prospect_potential"],
+        columns["tier_bonus"],
+        columns["boom_chance"],
+        columns["bust_chance"],
+        zip(*(columns[name] for name in RATING_FIELDS)),
+    )
+    for (
+        idx,
+        age,
+        goalie,
+        season_injuries,
+        season_games_missed,
+        recent_injuries,
+        recent_games_missed,
+        usage,
+        coach_quality,
+        goalie_dev_quality,
+        churn_penalty,
+        potential,
+        tier_bonus,
+        boom_chance,
+        bust_chance,
+        (shooting, playmaking, defense, goaltending, physical, durability),
+    ) in rows:
+        base = idx * DRAWS_PER_PLAYER
+        wear_score = (
+            season_injuries * 0.48
+            + (season_games_missed / 7.0) * 0.34
+            + recent_injuries * 0.10
+            + (recent_games_missed / 35.0) * 0.08
+        )
+        if wear_score > 0.25:
+            volatility = _VOLATILITY_LOW + (_VOLATILITY_HIGH - _VOLATILITY_LOW) * draws[base]
+            impact = wear_score * 0.030 * volatility
+            if season_games_missed >= 20 or season_injuries >= 3:
+                impact *= 1.28
+            if recent_games_missed >= 35 or recent_injuries >= 5:
+                impact *= 1.22
+            durability = _clamp(durability - impact * (1.28 + 0.08 * season_injuries), 0.6)
+            physical = _clamp(physical - impact * (0.70 + 0.02 * season_games_missed), 0.7)
+            if goalie:
+                goaltending = _clamp(goaltending - impact * (0.74 + 0.03 * season_injuries), 0.6)
+                defense = _clamp(defense - impact * (0.34 + 0.01 * season_games_missed), 0.7)
+                playmaking = _clamp(playmaking - impact * 0.16, 0.7)
+            else:
+                skill_drop = impact * (0.42 + 0.015 * season_injuries)
+                shooting = _clamp(shooting - skill_drop, 0.7)
+                playmaking = _clamp(playmaking - skill_drop * 0.92, 0.7)
+                defense = _clamp(defense - impact * (0.36 + 0.010 * season_games_missed), 0.7)
+                goaltending = _clamp(goaltending - impact * 0.04, 0.3)
+
+        shift = _development(age, goalie) + (_NOISE_LOW + (_NOISE_HIGH - _NOISE_LOW) * draws[base + 1])
+        shift *= 0.92 + coach_quality * 0.22
+        if age <= 24:
+            if usage >= 0.65:
+                shift += 0.020 + coach_quality * 0.010
+            elif usage >= 0.45:
+                shift += 0.008 + coach_quality * 0.006
+            elif usage <= 0.22:
+                shift -= 0.018 + (1.0 - coach_quality) * 0.010
+            if churn_penalty > 0:
+                shift -= churn_penalty * 0.65
+        elif age <= 29:
+            if usage <= 0.25:
+                shift -= 0.004
+        elif usage >= 0.78:
+            shift -= 0.008
+
+        seasons_to_nhl = out["seasons_to_nhl"][idx]
+        if seasons_to_nhl > 0:
+            shift += 0.010 + potential * 0.028 + coach_quality * 0.010 + tier_bonus
+            if usage >= 0.45:
+                shift -= 0.012 + (0.55 - min(0.55, coach_quality * 0.55))
+            seasons_to_nhl = max(0, seasons_to_nhl - 1)
+            out["seasons_to_nhl"][idx] = seasons_to_nhl
+        if seasons_to_nhl == 0 and not out["prospect_resolved"][idx] and age <= 24:
+            boom = _clamp(boom_chance + goalie_dev_quality * 0.05, 0.02, 0.30)
+            bust = _clamp(bust_chance - goalie_dev_quality * 0.05, 0.01, 0.24)
+            roll = draws[base + 2]
+            if roll < boom:
+                shift += 0.050 + potential * 0.035
+            elif roll < boom + bust:
+                shift -= 0.045 + (0.55 - potential) * 0.030
+            out["prospect_resolved"][idx] = True
+
+        if goalie:
+            shift *= 0.94 + goalie_dev_quality * 0.18
+            goaltending = min(5.0, max(0.8, goaltending + shift * 1.2))
+            defense = min(5.0, max(0.8, defense + shift * 0.6))
+            playmaking = min(5.0, max(0.8, playmaking + shift * 0.4))
+            shooting = min(5.0, max(0.4, shooting + shift * 0.1))
+            physical = min(5.0, max(0.8, physical + shift * 0.5))
+        else:
+            shooting = min(5.0, max(0.8, shooting + shift * 1.0))
+            playmaking = min(5.0, max(0.8, playmaking + shift * 0.9))
+            defense = min(5.0, max(0.8, defense + shift * 0.8))
+            goaltending = min(5.0, max(0.3, goaltending + shift * 0.05))
+            physical = min(5.0, max(0.8, physical + shift * 0.75))
+        durability = min(5.0, max(0.8, durability + shift * 0.6))
+
+        out_shooting[idx] = shooting
+        out_playmaking[idx] = playmaking
+        out_defense[idx] = defense
+        out_goaltending[idx] = goaltending
+        out_physical[idx] = physical
+        out_durability[idx] = durability
+        out["retire"][idx] = draws[base + 3] < _retire_probability(age, goalie)
+    return out
+
+
+def _run_numpy(columns: dict[str, list[float]], draws: Sequence[float]) -> dict[str, object]:
+    size = len(columns["age"])
+    col = {name: np.asarray(columns[name], dtype=np.float64) for name in columns}
+    age = np.asarray(columns["age"], dtype=np.int64)
+    goalie = np.asarray(columns["goalie"], dtype=bool)
+    resolved = np.asarray(columns["prospect_resolved"], dtype=bool)
+    stn = np.asarray(columns["seasons_to_nhl"], dtype=np.int64)
+    rolls = np.asarray(draws[: size * DRAWS_PER_PLAYER], dtype=np.float64).reshape(size, DRAWS_PER_PLAYER)
+    rating = {name: col[name].copy() for name in RATING_FIELDS}
+
+    def clamp(values, low: float, high: float = 5.0):
+        return np.minimum(high, np.maximum(low, values))
+
+    def lower(name: str, mask, drop, floor: float) -> None:
+        rating[name] = np.where(mask, clamp(rating[name] - drop, floor), rating[name])
+
+    season_injuries = col["season_injuries"]
+    season_games_missed = col["season_games_missed"]
+    recent_injuries = col["recent_injuries"]
+    recent_games_missed = col["recent_games_missed"]
+    wear_score = (
+        season_injuries * 0.48
+        + (season_games_missed / 7.0) * 0.34
+        + recent_injuries * 0.10
+        + (recent_games_missed / 35.0) * 0.08
+    )
+    worn = wear_score > 0.25
+    impact = wear_score * 0.030 * (_VOLATILITY_LOW + (_VOLATILITY_HIGH - _VOLATILITY_LOW) * rolls[:, 0])
+    impact = np.where((season_games_missed >= 20) | (season_injuries >= 3), impact * 1.28, impact)
+    impact = np.where((recent_games_missed >= 35) | (recent_injuries >= 5), impact * 1.22, impact)
+    worn_goalie = worn & goalie
+    worn_skater = worn & ~goalie
+    skill_drop = impact * (0.42 + 0.015 * season_injuries)
+    lower("durability", worn, impact * (1.28 + 0.08 * season_injuries), 0.6)
+    lower("physical", worn, impact * (0.70 + 0.02 * season_games_missed), 0.7)
+    lower("goaltending", worn_goalie, impact * (0.74 + 0.03 * season_injuries), 0.6)
+    lower("defense", worn_goalie, impact * (0.34 + 0.01 * season_games_missed), 0.7)
+    lower("playmaking", worn_goalie, impact * 0.16, 0.7)
+    lower("shooting", worn_skater, skill_drop, 0.7)
+    lower("playmaking", worn_skater, skill_drop * 0.92, 0.7)
+    lower("defense", worn_skater, impact * (0.36 + 0.010 * season_games_missed), 0.7)
+    lower("goaltending", worn_skater, impact * 0.04, 0.3)
+
+    usage = col["usage"]
+    coach_quality = col["coach_quality"]
+    goalie_dev_quality = col["goalie_dev_quality"]
+    churn_penalty = col["churn_penalty"]
+    conditions = [age <= ceiling for ceiling, _, _ in _DEV_CURVE]
+    dev = np.select(
+        conditions,
+        [np.where(goalie, goalie_dev, skater_dev) for _, skater_dev, goalie_dev in _DEV_CURVE],
+        default=np.where(goalie, _DEV_OLD[1], _DEV_OLD[0]),
+    )
+    shift = dev + (_NOISE_LOW + (_NOISE_HIGH - _NOISE_LOW) * rolls[:, 1])
+    shift = shift * (0.92 + coach_quality * 0.22)
+    young = age <= 24
+    prime = ~young & (age <= 29)
+    veteran = age > 29
+    shift = np.where(young & (usage >= 0.65), shift + (0.020 + coach_quality * 0.010), shift)
+    shift = np.where(young & (usage < 0.65) & (usage >= 0.45), shift + (0.008 + coach_quality * 0.006), shift)
+    shift = np.where(young & (usage < 0.45) & (usage <= 0.22), shift - (0.018 + (1.0 - coach_quality) * 0.010), shift)
+    shift = np.where(young & (churn_penalty > 0), shift - churn_penalty * 0.65, shift)
+    shift = np.where(prime & (usage <= 0.25), shift - 0.004, shift)
+    shift = np.where(veteran & (usage >= 0.78), shift - 0.008, shift)
+
+    potential = col["prospect_potential"]
+    developing = stn > 0
+    shift = np.where(
+        developing,
+        shift + (0.010 + potential * 0.028 + coach_quality * 0.010 + col["tier_bonus"]),
+        shift,
+    )
+    shift = np.where(developing & (usage >= 0.45), shift - (0.012 + (0.55 - np.minimum(0.55, coach_quality * 0.55))), shift)
+    stn = np.where(developing, np.maximum(0, stn - 1), stn)
+    resolving = (stn == 0) & ~resolved & young
+    boom = clamp(col["boom_chance"] + goalie_dev_quality * 0.05, 0.02, 0.30)
+    bust = clamp(col["bust_chance"] - goalie_dev_quality * 0.05, 0.01, 0.24)
+    roll = rolls[:, 2]
+    shift = np.where(resolving & (roll < boom), shift + (0.050 + potential * 0.035), shift)
+    shift = np.where(resolving & (roll >= boom) & (roll < boom + bust), shift - (0.045 + (0.55 - potential) * 0.030), shift)
+    resolved = resolved | resolving
+
+    shift = np.where(goalie, shift * (0.94 + goalie_dev_quality * 0.18), shift)
+    goalie_fields = {name: (multiplier, floor) for name, multiplier, floor in _GOALIE_SHIFTS}
+    skater_fields = {name: (multiplier, floor) for name, multiplier, floor in _SKATER_SHIFTS}
+    for name in goalie_fields:
+        g_mult, g_floor = goalie_fields[name]
+        s_mult, s_floor = skater_fields[name]
+        rating[name] = np.where(
+            goalie,
+            np.minimum(5.0, np.maximum(g_floor, rating[name] + shift * g_mult)),
+            np.minimum(5.0, np.maximum(s_floor, rating[name] + shift * s_mult)),
+        )
+    rating["durability"] = np.minimum(5.0, np.maximum(0.8, rating["durability"] + shift * 0.6))
+
+    retire_prob = np.where(
+        goalie,
+        np.where(age >= 37, np.minimum(0.90, 0.08 + (age - 37) * 0.10), np.where(age >= 34, 0.03 + (age - 34) * 0.025, 0.0)),
+        np.where(age >= 35, np.minimum(0.92, 0.10 + (age - 35) * 0.12), np.where(age >= 32, 0.03 + (age - 32) * 0.03, 0.0)),
+    )
+    out: dict[str, object] = {name: rating[name].tolist() for name in RATING_FIELDS}
+    out["seasons_to_nhl"] = stn.tolist()
+    out["prospect_resolved"] = resolved.tolist()
+    out["retire"] = (rolls[:, 3] < retire_prob).tolist()
+    return out
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Iterable
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+import random
+from typing import Any, Iterable
 
 from .models import Team
 
@@ -91,3 +95,486 @@ def build_round_robin_days(
 
 def build_round_robin(teams: Iterable[Team], games_per_matchup: int = 2) -> list[tuple[Team, Team]]:
     return [game for day in build_round_robin_days(teams, games_per_matchup) for game in day]
+
+
+@dataclass(slots=True, frozen=True)
+class ScheduleConfig:
+    """Targets and calendar limits for `build_constrained_days`.
+
+    Each team plays `games_per_team` games, split across opponents in
+    proportion to the division/conference/other weights. No team plays more
+    than `max_consecutive_days` days in a row or more than `max_back_to_backs`
+    back-to-backs; with `travel_aware`, back-to-back legs stay within one
+    conference of venues.
+    """
+
+    games_per_team: int = 82
+    division_weight: float = 1.75
+    conference_weight: float = 1.5
+    other_weight: float = 1.0
+    calendar_density: float = 0.60
+    max_consecutive_days: int = 2
+    max_back_to_backs: int | None = None
+    travel_aware: bool = True
+    seed: int = 0
+
+    @property
+    def generator(self) -> str:
+        b2b = "-" if self.max_back_to_backs is None else str(int(self.max_back_to_backs))
+        return (
+            f"constrained:{int(self.games_per_team)}:{self.division_weight:g}:{self.conference_weight:g}:"
+            f"{self.other_weight:g}:{self.calendar_density:g}:{int(self.max_consecutive_days)}:{b2b}:"
+            f"{int(bool(self.travel_aware))}:{int(self.seed)}"
+        )
+
+
+def _matchup_counts(team_list: list[Team], config: ScheduleConfig) -> dict[tuple[int, int], int]:
+    """Games per unordered team-id pair, hitting `games_per_team` exactly for every team."""
+    count = len(team_list)
+    games = int(config.games_per_team)
+    if games < 1:
+        raise ValueError("games_per_team must be positive")
+    if (count * games) % 2:
+        raise ValueError("games_per_team times team count must be even")
+
+    def _weight(a: Team, b: Team) -> float:
+        if a.division == b.division:
+            return max(0.0, float(config.division_weight))
+        if a.conference == b.conference:
+            return max(0.0, float(config.conference_weight))
+        return max(0.0, float(config.other_weight))
+
+    weights = {
+        (i, j): _weight(team_list[i], team_list[j])
+        for i in range(count)
+        for j in range(i + 1, count)
+    }
+    totals = [0.0] * count
+    for (i, j), weight in weights.items():
+        totals[i] += weight
+        totals[j] += weight
+    if any(total <= 0 for total in totals):
+        raise ValueError("matchup weights leave a team without opponents")
+
+    counts: dict[tuple[int, int], int] = {}
+    # Positive when a pair is below its ideal share, negative when above it.
+    slack: dict[tuple[int, int], float] = {}
+    balance = [games] * count
+    for (i, j), weight in weights.items():
+        target = 0.5 * weight * games * (1.0 / totals[i] + 1.0 / totals[j])
+        counts[(i, j)] = int(target)
+        slack[(i, j)] = target - int(target)
+        balance[i] -= int(target)
+        balance[j] -= int(target)
+
+    def _pair(a: int, b: int) -> tuple[int, int]:
+        return (a, b) if a < b else (b, a)
+
+    def _adjust(a: int, b: int, delta: int) -> None:
+        key = _pair(a, b)
+        counts[key] += delta
+        slack[key] -= delta
+        balance[a] -= delta
+        balance[b] -= delta
+
+    # Unequal weight totals can overshoot; trim pairs furthest above their share first.
+    while True:
+        over = [t for t in range(count) if balance[t] < 0]
+        if not over:
+            break
+        team = min(over, key=lambda t: (balance[t], t))
+        partners = [t for t in over if t != team and counts[_pair(team, t)] > 0]
+        if partners:
+            other = min(partners, key=lambda t: (slack[_pair(team, t)], balance[t], t))
+            _adjust(team, other, -1)
+            continue
+        legs = sorted(
+            (t for t in range(count) if t != team and counts[_pair(team, t)] > 0),
+            key=lambda t: (slack[_pair(team, t)], t),
+        )
+        _adjust(team, legs[0], -1)
+        _adjust(team, legs[1], -1)
+        _adjust(legs[0], legs[1], 1)
+
+    while True:
+        short = [t for t in range(count) if balance[t] > 0]
+        if not short:
+            break
+        team = max(short, key=lambda t: (balance[t], -t))
+        partners = [t for t in short if t != team]
+        if partners:
+            other = max(partners, key=lambda t: (slack[_pair(team, t)], balance[t], -t))
+            _adjust(team, other, 1)
+            continue
+        # Only this team is short (by an even amount): reroute one game between two others to it.
+        first, second = min(
+            (key for key, value in counts.items() if value > 0 and team not in key),
+            key=lambda key: (slack[key], key),
+        )
+        _adjust(first, second, -1)
+        _adjust(team, first, 1)
+        _adjust(team, second, 1)
+    return {key: value for key, value in counts.items() if value > 0}
+
+
+def _matchup_legs(count: int, pair_counts: dict[tuple[int, int], int]) -> dict[tuple[int, int], list[tuple[int, int]]]:
+    """Home/away order for each pair's meetings, alternating venues.
+
+    Even series split evenly; the odd games are oriented along Euler trails of
+    the leftover-game graph so every team's home total is within one of its
+    road total.
+    """
+    odd_pairs = [pair for pair, games in sorted(pair_counts.items()) if games % 2]
+    adjacency: list[list[tuple[int, int]]] = [[] for _ in range(count + 1)]
+    for edge_id, (i, j) in enumerate(odd_pairs):
+        adjacency[i].append((j, edge_id))
+        adjacency[j].append((i, edge_id))
+    edge_total = len(odd_pairs)
+    # A phantom node pairs up odd-degree teams so every trail closes.
+    for team in range(count):
+        if len(adjacency[team]) % 2:
+            adjacency[team].append((count, edge_total))
+            adjacency[count].append((team, edge_total))
+            edge_total += 1
+    walked = [False] * edge_total
+    extra_home: dict[tuple[int, int], int] = {}
+    for start in range(count + 1):
+        stack = [start]
+        while stack:
+            node = stack[-1]
+            while adjacency[node] and walked[adjacency[node][-1][1]]:
+                adjacency[node].pop()
+            if not adjacency[node]:
+                stack.pop()
+                continue
+            nxt, edge_id = adjacency[node].pop()
+            walked[edge_id] = True
+            if edge_id < len(odd_pairs):
+                extra_home[odd_pairs[edge_id]] = node
+            stack.append(nxt)
+
+    legs: dict[tuple[int, int], list[tuple[int, int]]] = {}
+    for (i, j), games in sorted(pair_counts.items()):
+        first = extra_home.get((i, j), i)
+        second = j if first == i else i
+        legs[(i, j)] = [(first, second) if idx % 2 == 0 else (second, first) for idx in range(games)]
+    return legs
+
+
+def build_constrained_days(
+    teams: Iterable[Team],
+    config: ScheduleConfig | None = None,
+) -> list[list[tuple[Team, Team]]]:
+    """Build a calendar for weighted matchup targets under per-team rest limits.
+
+    Days are packed greedily: teams with the most games left pick first,
+    rested teams ahead of ones on a back-to-back, and each picks the eligible
+    opponent with the most games left that it has not met most recently. A
+    day that cannot place any game under the limits is filled with them
+    relaxed so the schedule always completes.
+    """
+    config = config or ScheduleConfig()
+    team_list = list(teams)
+    count = len(team_list)
+    if count < 2:
+        return []
+    legs = _matchup_legs(count, _matchup_counts(team_list, config))
+    opponents: list[set[int]] = [set() for _ in range(count)]
+    remaining = [0] * count
+    for (i, j), rows in legs.items():
+        opponents[i].add(j)
+        opponents[j].add(i)
+        remaining[i] += len(rows)
+        remaining[j] += len(rows)
+    games_left = sum(remaining) // 2
+    target_games_per_day = max(1, int((count * max(0.35, min(config.calendar_density, 1.0))) / 2))
+    max_streak = max(1, int(config.max_consecutive_days))
+    max_b2b = None if config.max_back_to_backs is None else max(0, int(config.max_back_to_backs))
+    conference_ids: dict[str, int] = {}
+    venue_conference = [conference_ids.setdefault(team.conference, len(conference_ids)) for team in team_list]
+
+    rng = random.Random(config.seed)
+    last_day = [-2] * count
+    streak = [0] * count
+    back_to_backs = [0] * count
+    last_venue = [-1] * count
+    last_met: dict[tuple[int, int], int] = {}
+    season_days: list[list[tuple[Team, Team]]] = []
+    day = 0
+    while games_left > 0:
+        tiebreak = [rng.random() for _ in range(count)]
+        played_yesterday = [last_day[t] == day - 1 for t in range(count)]
+
+        def _can_play(team: int, venue: int, relaxed: bool) -> bool:
+            if relaxed or not played_yesterday[team]:
+                return True
+            if streak[team] >= max_streak:
+                return False
+            if max_b2b is not None and back_to_backs[team] >= max_b2b:
+                return False
+            return not config.travel_aware or venue_conference[last_venue[team]] == venue_conference[venue]
+
+        order = sorted(range(count), key=lambda t: (played_yesterday[t], -remaining[t], tiebreak[t]))
+        today: list[tuple[int, int]] = []
+        for relaxed in (False, True):
+            used: set[int] = set()
+            for team in order:
+                if len(today) >= target_games_per_day:
+                    break
+                if team in used or remaining[team] == 0:
+                    continue
+                best: tuple[Any, ...] | None = None
+                for other in opponents[team]:
+                    if other in used:
+                        continue
+                    pair = (team, other) if team < other else (other, team)
+                    home, away = legs[pair][-1]
+                    if not _can_play(team, home, relaxed) or not _can_play(other, home, relaxed):
+                        continue
+                    key = (played_yesterday[other], -remaining[other], last_met.get(pair, -1), tiebreak[other], pair)
+                    if best is None or key < best:
+                        best = key
+                if best is None:
+                    continue
+                pair = best[-1]
+                today.append(legs[pair].pop())
+                used.update(pair)
+                last_met[pair] = day
+                if not legs[pair]:
+                    opponents[pair[0]].discard(pair[1])
+                    opponents[pair[1]].discard(pair[0])
+            if today:
+                break
+
+        for home, away in today:
+            for team in (home, away):
+                if played_yesterday[team]:
+                    streak[team] += 1
+                    back_to_backs[team] += 1
+                else:
+                    streak[team] = 1
+                last_day[team] = day
+                last_venue[team] = home
+                remaining[team] -= 1
+        games_left -= len(today)
+        season_days.append([(team_list[home], team_list[away]) for home, away in today])
+        day += 1
+    return season_days
+
+
+@dataclass(slots=True, frozen=True)
+class SeasonSchedule:
+    """Compact regular-season schedule keyed by integer team ids.
+
+    Ids are positions in `team_names`. Per-team lookups (game days, back-to-backs,
+    games played before a day) are precomputed so schedule queries never scan
+    the whole season.
+    """
+
+    team_names: tuple[str, ...]
+    games_per_matchup: int
+    calendar_density: float
+    days: tuple[tuple[tuple[int, int], ...], ...]
+    team_days: tuple[tuple[int, ...], ...]
+    back_to_back: tuple[tuple[bool, ...], ...]
+    day_teams: tuple[frozenset[int], ...]
+    team_index: dict[str, int]
+    generator: str = "round_robin"
+
+    @classmethod
+    def from_days(
+        cls,
+        team_names: Iterable[str],
+        days: Iterable[Iterable[tuple[int, int]]],
+        games_per_matchup: int,
+        calendar_density: float,
+        generator: str = "round_robin",
+    ) -> SeasonSchedule:
+        names = tuple(team_names)
+        day_rows = tuple(tuple((int(h), int(a)) for h, a in day) for day in days)
+        per_team: list[list[int]] = [[] for _ in names]
+        for day_idx, day in enumerate(day_rows):
+            for home_id, away_id in day:
+                per_team[home_id].append(day_idx)
+                per_team[away_id].append(day_idx)
+        team_days = tuple(tuple(rows) for rows in per_team)
+        back_to_back = tuple(
+            tuple(idx > 0 and rows[idx - 1] == day_idx - 1 for idx, day_idx in enumerate(rows))
+            for rows in team_days
+        )
+        day_teams = tuple(frozenset(tid for game in day for tid in game) for day in day_rows)
+        return cls(
+            team_names=names,
+            games_per_matchup=int(games_per_matchup),
+            calendar_density=float(calendar_density),
+            days=day_rows,
+            team_days=team_days,
+            back_to_back=back_to_back,
+            day_teams=day_teams,
+            team_index={name: idx for idx, name in enumerate(names)},
+            generator=str(generator),
+        )
+
+    @property
+    def total_days(self) -> int:
+        return len(self.days)
+
+    def team_id(self, team_name: str) -> int | None:
+        return self.team_index.get(team_name)
+
+    def games_on(self, day_index: int) -> list[tuple[str, str]]:
+        if not 0 <= day_index < len(self.days):
+            return []
+        names = self.team_names
+        return [(names[h], names[a]) for h, a in self.days[day_index]]
+
+    def teams_on(self, day_index: int) -> set[str]:
+        if not 0 <= day_index < len(self.day_teams):
+            return set()
+        return {self.team_names[tid] for tid in self.day_teams[day_index]}
+
+    def plays_on(self, team_name: str, day_index: int) -> bool:
+        tid = self.team_index.get(team_name)
+        if tid is None or not 0 <= day_index < len(self.day_teams):
+            return False
+        return tid in self.day_teams[day_index]
+
+    def total_games(self, team_name: str) -> int:
+        tid = self.team_index.get(team_name)
+        return len(self.team_days[tid]) if tid is not None else 0
+
+    def games_before(self, team_name: str, day_index: int) -> int:
+        tid = self.team_index.get(team_name)
+        if tid is None:
+            return 0
+        return bisect_left(self.team_days[tid], day_index)
+
+    def remaining_games(self, team_name: str, day_index: int) -> int:
+        return self.total_games(team_name) - self.games_before(team_name, day_index)
+
+    def is_back_to_back(self, team_name: str, day_index: int) -> bool:
+        tid = self.team_index.get(team_name)
+        if tid is None:
+            return False
+        rows = self.team_days[tid]
+        pos = bisect_left(rows, day_index)
+        return pos < len(rows) and rows[pos] == day_index and self.back_to_back[tid][pos]
+
+    def team_games(self, team_name: str, from_day: int = 0) -> list[tuple[int, str, str]]:
+        """(day_index, home, away) for each of a team's games from `from_day` on."""
+        tid = self.team_index.get(team_name)
+        if tid is None:
+            return []
+        rows = self.team_days[tid]
+        names = self.team_names
+        out: list[tuple[int, str, str]] = []
+        for day_idx in rows[bisect_left(rows, from_day):]:
+            for home_id, away_id in self.days[day_idx]:
+                if home_id == tid or away_id == tid:
+                    out.append((day_idx, names[home_id], names[away_id]))
+                    break
+        return out
+
+    def next_game(self, team_name: str, from_day: int) -> tuple[int, str, str] | None:
+        tid = self.team_index.get(team_name)
+        if tid is None:
+            return None
+        rows = self.team_days[tid]
+        pos = bisect_left(rows, from_day)
+        if pos >= len(rows):
+            return None
+        day_idx = rows[pos]
+        for home_id, away_id in self.days[day_idx]:
+            if home_id == tid or away_id == tid:
+                return (day_idx, self.team_names[home_id], self.team_names[away_id])
+        return None
+
+    def materialize(self, teams: Iterable[Team]) -> list[list[tuple[Team, Team]]]:
+        by_name = {team.name: team for team in teams}
+        resolved = [by_name[name] for name in self.team_names]
+        return [[(resolved[h], resolved[a]) for h, a in day] for day in self.days]
+
+    def matches(self, teams: Iterable[Team], games_per_matchup: int, generator: str = "round_robin") -> bool:
+        return (
+            tuple(sorted(team.name for team in teams)) == tuple(sorted(self.team_names))
+            and self.games_per_matchup == int(games_per_matchup)
+            and self.generator == generator
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "teams": list(self.team_names),
+            "games_per_matchup": self.games_per_matchup,
+            "calendar_density": self.calendar_density,
+            "generator": self.generator,
+            "days": [[[h, a] for h, a in day] for day in self.days],
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Any) -> SeasonSchedule | None:
+        if not isinstance(raw, dict):
+            return None
+        names = raw.get("teams")
+        days = raw.get("days")
+        if not isinstance(names, list) or not isinstance(days, list):
+            return None
+        try:
+            count = len(names)
+            parsed = []
+            for day in days:
+                games = [(int(game[0]), int(game[1])) for game in day]
+                if any(not (0 <= h < count and 0 <= a < count) or h == a for h, a in games):
+                    return None
+                parsed.append(games)
+            return cls.from_days(
+                [str(name) for name in names],
+                parsed,
+                games_per_matchup=int(raw.get("games_per_matchup", 1)),
+                calendar_density=float(raw.get("calendar_density", 0.60)),
+                generator=str(raw.get("generator", "round_robin")),
+            )
+        except (TypeError, ValueError, IndexError):
+            return None
+
+
+@lru_cache(maxsize=16)
+def _cached_schedule(team_names: tuple[str, ...], games_per_matchup: int, calendar_density: float) -> SeasonSchedule:
+    placeholders = [Team(name=name) for name in team_names]
+    index = {team.name: idx for idx, team in enumerate(placeholders)}
+    days = build_round_robin_days(placeholders, games_per_matchup, calendar_density)
+    return SeasonSchedule.from_days(
+        team_names,
+        [[(index[home.name], index[away.name]) for home, away in day] for day in days],
+        games_per_matchup=games_per_matchup,
+        calendar_density=calendar_density,
+    )
+
+
+@lru_cache(maxsize=16)
+def _cached_constrained_schedule(
+    team_keys: tuple[tuple[str, str, str], ...],
+    games_per_matchup: int,
+    config: ScheduleConfig,
+) -> SeasonSchedule:
+    placeholders = [Team(name=name, division=division, conference=conference) for name, division, conference in team_keys]
+    index = {team.name: idx for idx, team in enumerate(placeholders)}
+    days = build_constrained_days(placeholders, config)
+    return SeasonSchedule.from_days(
+        [team.name for team in placeholders],
+        [[(index[home.name], index[away.name]) for home, away in day] for day in days],
+        games_per_matchup=games_per_matchup,
+        calendar_density=config.calendar_density,
+        generator=config.generator,
+    )
+
+
+def build_season_schedule(
+    teams: Iterable[Team],
+    games_per_matchup: int = 2,
+    calendar_density: float = 0.60,
+    config: ScheduleConfig | None = None,
+) -> SeasonSchedule:
+    if config is not None:
+        team_keys = tuple((team.name, team.division, team.conference) for team in teams)
+        return _cached_constrained_schedule(team_keys, int(games_per_matchup), config)
+    return _cached_schedule(tuple(team.name for team in teams), int(games_per_matchup), float(calendar_density))
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from itertools import combinations
+from typing import Any, Callable, Sequence
+
+from .models import DEFENSE_POSITIONS, FORWARD_POSITIONS, GOALIE_POSITIONS, Player, Team
+
+# A team takes a deal netting at least this plus its standings margin, and none lopsided past MAX_TRADE_SWING.
+MIN_TRADE_NET = -0.08
+MAX_TRADE_SWING = 0.95
+# In a 2-for-1 the lesser player mostly fills a roster spot, so only this share of his value counts.
+SECOND_PLAYER_SHARE = 0.3
+# Covers the rounding of each side's net value when pruning on value bounds.
+_BOUND_SLACK = 0.002
+
+TradeEval = dict[str, float]
+
+
+def need_matches_position(need_key: str, position: str) -> bool:
+    pos = position.upper()
+    if need_key in {"top6_f", "depth_f"}:
+        return pos in FORWARD_POSITIONS
+    if need_key in {"top4_d", "depth_d"}:
+        return pos in DEFENSE_POSITIONS
+    if need_key == "starter_g":
+        return pos in GOALIE_POSITIONS
+    return True
+
+
+class TradeSearch:
+    """Trade offers between teams, valued once per review.
+
+    Team needs, trade pools, acceptance margins and each player's value to a
+    receiving team are computed on first use and reused for every pair the
+    review looks at; call `forget` for the teams in an executed trade. Pair
+    scans skip anything whose best possible quality cannot beat the best
+    offer found so far, so the results match a full scan.
+    """
+
+    __slots__ = ("_value", "_needs", "_pool", "_margin", "_overall", "_values", "_team_needs", "_pools", "_margins")
+
+    def __init__(
+        self,
+        *,
+        value: Callable[[Player, Team], float],
+        needs: Callable[[Team], dict[str, Any]],
+        pool: Callable[[Team, bool], list[Player]],
+        margin: Callable[[Team], float],
+        overall: Callable[[Player], float],
+    ) -> None:
+        self._value = value
+        self._needs = needs
+        self._pool = pool
+        self._margin = margin
+        self._overall = overall
+        self._values: dict[tuple[str, str], float] = {}
+        self._team_needs: dict[str, dict[str, Any]] = {}
+        self._pools: dict[tuple[str, bool], list[Player]] = {}
+        self._margins: dict[str, float] = {}
+
+    def value(self, player: Player, receiving_team: Team) -> float:
+        key = (player.player_id, receiving_team.name)
+        value = self._values.get(key)
+        if value is None:
+            value = self._values[key] = self._value(player, receiving_team)
+        return value
+
+    def needs(self, team: Team) -> dict[str, Any]:
+        needs = self._team_needs.get(team.name)
+        if needs is None:
+            needs = self._team_needs[team.name] = self._needs(team)
+        return needs
+
+    def pool(self, team: Team, *, outgoing: bool) -> list[Player]:
+        key = (team.name, outgoing)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = self._pool(team, outgoing)
+        return pool
+
+    def margin(self, team: Team) -> float:
+        margin = self._margins.get(team.name)
+        if margin is None:
+            margin = self._margins[team.name] = self._margin(team)
+        return margin
+
+    def forget(self, *teams: Team) -> None:
+        """Drop everything derived from these teams' rosters."""
+        names = {team.name for team in teams}
+        self._values = {key: value for key, value in self._values.items() if key[1] not in names}
+        for name in names:
+            self._team_needs.pop(name, None)
+            self._pools.pop((name, True), None)
+            self._pools.pop((name, False), None)
+            self._margins.pop(name, None)
+
+    def package_value(self, players: Sequence[Player], team: Team) -> float:
+        values = sorted((self.value(player, team) for player in players), reverse=True)
+        if len(values) == 1:
+            return values[0]
+        return values[0] + SECOND_PLAYER_SHARE * sum(values[1:])
+
+    def evaluate(self, acquiring_team: Team, sending: Sequence[Player], receiving: Sequence[Player]) -> TradeEval:
+        acquired_val = self.package_value(receiving, acquiring_team)
+        sent_val = self.package_value(sending, acquiring_team)
+        net = acquired_val - sent_val
+        return {
+            "acquired_value": round(acquired_val, 3),
+            "sent_value": round(sent_val, 3),
+            "net_value": round(net, 3),
+        }
+
+    def acceptable(self, team: Team, give: Sequence[Player], receive: Sequence[Player]) -> tuple[bool, TradeEval]:
+        eval_row = self.evaluate(team, give, receive)
+        margin = self.margin(team)
+        min_net = MIN_TRADE_NET + margin
+        net = float(eval_row["net_value"])
+        accept = net >= min_net and abs(net) <= MAX_TRADE_SWING
+        eval_row["min_net"] = round(min_net, 3)
+        eval_row["accept_margin"] = round(margin, 3)
+        return accept, eval_row
+
+    def balanced_offer(
+        self,
+        requesting_team: Team,
+        partner_team: Team,
+        *,
+        give_limit: int = 12,
+        receive_limit: int = 14,
+    ) -> tuple[Player, Player, TradeEval, TradeEval] | None:
+        """Best 1-for-1 both sides accept, favoring fair deals that fill the requester's need."""
+        req_primary, give_pool, receives = self._balanced_pools(requesting_team, partner_team, give_limit, receive_limit)
+        if not give_pool or not receives:
+            return None
+        top_receive = max(bound for _, bound, _, _ in receives)
+        best: tuple[Player, Player, TradeEval, TradeEval, float] | None = None
+        for give_player in give_pool:
+            give_bound = self.value(give_player, partner_team) - self.value(give_player, requesting_team) + _BOUND_SLACK
+            if best is not None and give_bound + top_receive <= best[4]:
+                continue
+            give_matches = bool(req_primary) and need_matches_position(req_primary, give_player.position)
+            for receive_player, receive_bound, alignment, receive_matches in receives:
+                if best is not None and give_bound + receive_bound <= best[4]:
+                    continue
+                if give_player.name == receive_player.name:
+                    continue
+                # Do not worsen biggest need: avoid paying same-need position unless clear upgrade.
+                if give_matches:
+                    if not receive_matches:
+                        continue
+                    if self._overall(receive_player) <= self._overall(give_player):
+                        continue
+                quality, req_eval, part_eval = self._mutual_quality(
+                    requesting_team, partner_team, (give_player,), receive_player, alignment
+                )
+                if quality is not None and (best is None or quality > best[4]):
+                    best = (give_player, receive_player, req_eval, part_eval, quality)
+        if best is None:
+            return None
+        return best[0], best[1], best[2], best[3]
+
+    def two_for_one_offer(
+        self,
+        requesting_team: Team,
+        partner_team: Team,
+        *,
+        give_limit: int = 12,
+        receive_limit: int = 14,
+    ) -> tuple[tuple[Player, Player], Player, TradeEval, TradeEval] | None:
+        """Best deal sending two players for one better than either, on the balanced rules.
+
+        The partner ends up a roster spot over; making room is up to the caller.
+        """
+        req_primary, give_pool, receives = self._balanced_pools(requesting_team, partner_team, give_limit, receive_limit)
+        if len(give_pool) < 2 or not receives:
+            return None
+        top_receive = max(bound for _, bound, _, _ in receives)
+        best: tuple[tuple[Player, Player], Player, TradeEval, TradeEval, float] | None = None
+        for package in combinations(give_pool, 2):
+            if all(player.position in GOALIE_POSITIONS for player in package):
+                continue
+            package_bound = (
+                self.package_value(package, partner_team) - self.package_value(package, requesting_team) + _BOUND_SLACK
+            )
+            if best is not None and package_bound + top_receive <= best[4]:
+                continue
+            best_given = max(self._overall(player) for player in package)
+            give_matches = bool(req_primary) and any(need_matches_position(req_primary, p.position) for p in package)
+            names = {player.name for player in package}
+            for receive_player, receive_bound, alignment, receive_matches in receives:
+                if best is not None and package_bound + receive_bound <= best[4]:
+                    continue
+                if receive_player.name in names or self._overall(receive_player) <= best_given:
+                    continue
+                if give_matches and not receive_matches:
+                    continue
+                quality, req_eval, part_eval = self._mutual_quality(
+                    requesting_team, partner_team, package, receive_player, alignment
+                )
+                if quality is not None and (best is None or quality > best[4]):
+                    best = (package, receive_player, req_eval, part_eval, quality)
+        if best is None:
+            return None
+        return best[0], best[1], best[2], best[3]
+
+    def relaxed_offer(
+        self,
+        requesting_team: Team,
+        partner_team: Team,
+        *,
+        limit: int = 10,
+    ) -> tuple[Player, Player, TradeEval, TradeEval] | None:
+        """Best 1-for-1 within loose value limits, ignoring needs and acceptance margins."""
+        give_pool = self.pool(requesting_team, outgoing=True)[:limit]
+        receive_pool = self.pool(partner_team, outgoing=False)[:limit]
+        if not give_pool or not receive_pool:
+            return None
+        receives = [
+            (p, self.value(p, requesting_team) - self.value(p, partner_team) + _BOUND_SLACK) for p in receive_pool
+        ]
+        top_receive = max(bound for _, bound in receives)
+        best: tuple[Player, Player, TradeEval, TradeEval, float] | None = None
+        for give_player in give_pool:
+            give_bound = self.value(give_player, partner_team) - self.value(give_player, requesting_team)
+            if best is not None and give_bound + top_receive <= best[4]:
+                continue
+            for receive_player, receive_bound in receives:
+                if best is not None and give_bound + receive_bound <= best[4]:
+                    continue
+                if give_player.name == receive_player.name:
+                    continue
+                req_eval = self.evaluate(requesting_team, (give_player,), (receive_player,))
+                part_eval = self.evaluate(partner_team, (receive_player,), (give_player,))
+                req_net = float(req_eval.get("net_value", 0.0))
+                part_net = float(part_eval.get("net_value", 0.0))
+                # Keep relaxed trades plausible but not obviously broken.
+                if req_net < -0.20 or part_net < -0.20:
+                    continue
+                if abs(req_net - part_net) > 0.45:
+                    continue
+                quality = req_net + part_net - abs(req_net - part_net) * 0.35
+                if best is None or quality > best[4]:
+                    best = (give_player, receive_player, req_eval, part_eval, quality)
+        if best is None:
+            return None
+        return best[0], best[1], best[2], best[3]
+
+    def _balanced_pools(
+        self,
+        requesting_team: Team,
+        partner_team: Team,
+        give_limit: int,
+        receive_limit: int,
+    ) -> tuple[str, list[Player], list[tuple[Player, float, float, bool]]]:
+        """The requester's need, its give pool, and the receivable players with their bounds.
+
+        Each receive row is (player, quality bound, need alignment, fills the need).
+        """
+        req_needs = self.needs(requesting_team)
+        req_scores = req_needs.get("scores", {}) if isinstance(req_needs, dict) else {}
+        req_primary = str(req_needs.get("primary_need", ""))
+
+        # Favor sending from weaker/less critical buckets first.
+        give_pool = sorted(
+            self.pool(requesting_team, outgoing=True)[:give_limit],
+            key=lambda p: (need_matches_position(req_primary, p.position), self._overall(p), -p.age),
+        )
+        receive_pool = self.pool(partner_team, outgoing=False)[:receive_limit]
+        if req_primary:
+            preferred = [p for p in receive_pool if need_matches_position(req_primary, p.position)]
+            if preferred:
+                receive_pool = preferred + [p for p in receive_pool if p not in preferred]
+        if not give_pool or not receive_pool:
+            return req_primary, give_pool, []
+
+        # Seller should move from relative surplus, not from their biggest need.
+        seller_needs = self.needs(partner_team)
+        seller_primary = str(seller_needs.get("primary_need", ""))
+        seller_scores = seller_needs.get("scores", {}) if isinstance(seller_needs, dict) else {}
+        seller_short = bool(seller_primary) and float(seller_scores.get(seller_primary, 0.0)) >= 0.55
+        receives: list[tuple[Player, float, float, bool]] = []
+        for player in receive_pool:
+            if seller_short and need_matches_position(seller_primary, player.position):
+                continue
+            matches = bool(req_primary) and need_matches_position(req_primary, player.position)
+            alignment = 0.0
+            if matches:
+                alignment += 0.18 + float(req_scores.get(req_primary, 0.0)) * 0.14
+            bound = self.value(player, requesting_team) - self.value(player, partner_team) + alignment
+            receives.append((player, bound, alignment, matches))
+        return req_primary, give_pool, receives
+
+    def _mutual_quality(
+        self,
+        requesting_team: Team,
+        partner_team: Team,
+        give: Sequence[Player],
+        receive_player: Player,
+        alignment: float,
+    ) -> tuple[float | None, TradeEval, TradeEval]:
+        req_accept, req_eval = self.acceptable(requesting_team, give, (receive_player,))
+        if not req_accept:
+            return None, req_eval, {}
+        part_accept, part_eval = self.acceptable(partner_team, (receive_player,), give)
+        if not part_accept:
+            return None, req_eval, part_eval
+        req_net = float(req_eval.get("net_value", 0.0))
+        part_net = float(part_eval.get("net_value", 0.0))
+        # Prefer deals both teams can defend as fair; slight bias toward improving weak teams.
+        fairness = -abs(req_net - part_net)
+        return req_net + part_net + fairness * 0.35 + alignment, req_eval, part_eval
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+
+class _Truncate:
+    __slots__ = ("length",)
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+
+
+class UndoLog:
+    """Inverse operations for in-place mutations made while simulating a day.
+
+    Mutation sites call `save` (or `save_length` before appending to a list)
+    ahead of the change; `rollback` replays the saved values newest-first and
+    `commit` simply drops them.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: list[tuple[Any, str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self, obj: Any, name: str) -> None:
+        self._entries.append((obj, name, getattr(obj, name)))
+
+    def save_fields(self, obj: Any, names: Iterable[str]) -> None:
+        entries = self._entries
+        for name in names:
+            entries.append((obj, name, getattr(obj, name)))
+
+    def save_length(self, obj: Any, name: str) -> None:
+        self._entries.append((obj, name, _Truncate(len(getattr(obj, name)))))
+
+    def commit(self) -> None:
+        self._entries.clear()
+
+    def rollback(self) -> None:
+        for obj, name, old in reversed(self._entries):
+            if isinstance(old, _Truncate):
+                del getattr(obj, name)[old.length:]
+            else:
+                setattr(obj, name, old)
+        self._entries.clear()
@@ -0,0 +1,24 @@
+import pytest
+
+from hockey_sim.app import build_default_teams
+from hockey_sim.league import LeagueSimulator
+
+
+@pytest.fixture
+def league_paths(tmp_path) -> dict[str, str]:
+    return {
+        "state_path": str(tmp_path / "league_state.json"),
+        "history_path": str(tmp_path / "season_history.json"),
+        "career_history_path": str(tmp_path / "career_history.json"),
+        "hall_of_fame_path": str(tmp_path / "hall_of_fame.json"),
+    }
+
+
+@pytest.fixture
+def sim_factory(league_paths):
+    """Builds one-game-per-matchup leagues saving to this test's files; a second build resumes the first."""
+
+    def build(seed: int) -> LeagueSimulator:
+        return LeagueSimulator(teams=build_default_teams(), games_per_matchup=1, seed=seed, **league_paths)
+
+    return build
@@ -0,0 +1,306 @@
+import asyncio
+import gzip
+import json
+import time
+from typing import Any, Callable
+
+import pytest
+from fastapi import HTTPException, Request
+
+from hockey_sim import api
+from hockey_sim.events import EventBus, EventSubscriber
+
+
+def _request(method: str = "GET", headers: dict[str, str] | None = None) -> Request:
+    raw_headers = [(key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in (headers or {}).items()]
+    return Request({"type": "http", "method": method, "path": "/api/test", "headers": raw_headers, "query_string": b""})
+
+
+def _wait_for(read: Callable[[], dict[str, Any]], done: Callable[[dict[str, Any]], bool], timeout: float = 60.0) -> dict[str, Any]:
+    deadline = time.monotonic() + timeout
+    row = read()
+    while not done(row):
+        assert time.monotonic() < deadline, row
+        time.sleep(0.01)
+        row = read()
+    return row
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch) -> api.SimService:
+    svc = api.SimService(data_root=tmp_path)
+    monkeypatch.setattr(api, "service", svc)
+    return svc
+
+
+@pytest.mark.regression
+def test_cached_response_reuses_body_until_generation_moves(service) -> None:
+    builds: list[int] = []
+
+    def builder() -> dict[str, int]:
+        builds.append(1)
+        return {"builds": len(builds)}
+
+    etag, body = service.cached_response("standings", ("league", None), builder)
+    assert service.cached_response("standings", ("league", None), builder) == (etag, body)
+    assert len(builds) == 1
+
+    service.bump_generation()
+    new_etag, new_body = service.cached_response("standings", ("league", None), builder)
+    assert len(builds) == 2
+    assert new_etag != etag and new_body != body
+
+
+@pytest.mark.regression
+def test_cached_json_answers_matching_if_none_match_with_304(service) -> None:
+    response = api._cached_json(_request(), "standings", (), lambda: {"ok": True})
+    etag = response.headers["etag"]
+    assert response.status_code == 200 and response.body == b'{"ok":true}'
+
+    cached = api._cached_json(_request(headers={"If-None-Match": f'"stale", {etag}'}), "standings", (), lambda: {"ok": True})
+    assert cached.status_code == 304 and cached.headers["etag"] == etag and cached.body == b""
+
+    service.bump_generation()
+    fresh = api._cached_json(_request(headers={"If-None-Match": etag}), "standings", (), lambda: {"ok": True})
+    assert fresh.status_code == 200 and fresh.headers["etag"] != etag
+
+
+@pytest.mark.regression
+def test_reads_during_a_write_request_are_not_cached(service) -> None:
+    state = {"value": "before"}
+    during: list[tuple[str, bytes]] = []
+
+    async def handler(request: Request):
+        state["value"] = "after"
+        # A read served mid-write sees the new state but must not be kept for later readers.
+        during.append(service.cached_response("meta", (), lambda: dict(state)))
+        return api.Response(status_code=204)
+
+    etag, _ = service.cached_response("meta", (), lambda: dict(state))
+    response = asyncio.run(api.bump_generation_on_write(_request("POST"), handler))
+    assert response.status_code == 204
+    assert during[0][0] != etag
+
+    after_etag, body = service.cached_response("meta", (), lambda: dict(state))
+    assert body == b'{"value":"after"}'
+    assert after_etag not in {etag, during[0][0]}
+    assert service._writes_in_flight == 0
+
+
+@pytest.mark.regression
+def test_sim_job_reports_progress_and_stops_when_cancelled(service) -> None:
+    service.auto_injury_moves = True
+    job = service.jobs.submit(target="end_of_regular_season", detail="minimal")
+    assert job["status"] in {"queued", "running"}
+    with pytest.raises(HTTPException) as busy:
+        service.jobs.submit(target="to_day", day=5)
+    assert busy.value.status_code == 409
+
+    running = _wait_for(lambda: service.jobs.get(job["id"]), lambda row: row["steps_done"] >= 3)
+    assert running["status"] == "running"
+    assert running["progress"]["phase"] == "regular" and running["progress"]["day"] >= 3
+    assert running["progress"]["total_days"] == service.simulator.total_days
+
+    assert service.jobs.cancel(job["id"])["cancel_requested"] is True
+    final = _wait_for(lambda: service.jobs.get(job["id"]), lambda row: row["status"] not in {"queued", "running"})
+    assert final["status"] == "cancelled" and final["error"] == ""
+    assert final["steps_done"] < service.simulator.total_days
+    assert final["progress"]["day"] == final["steps_done"]
+    assert service.jobs.active_job() is None
+    with pytest.raises(HTTPException) as missing:
+        service.jobs.get("no-such-job")
+    assert missing.value.status_code == 404
+
+
+@pytest.mark.regression
+def test_failed_offseason_job_keeps_only_checkpoints_on_disk(service, monkeypatch, sim_factory) -> None:
+    sim = sim_factory(37)
+    sim.simulate_to(sim.total_days)
+    sim.start_playoffs()
+    while sim.simulate_next_playoff_day().get("advanced"):
+        pass
+    service.simulator = sim
+    service.auto_injury_moves = True
+    checkpointed: dict[str, int] = {}
+
+    def broken_free_agency(user_team_name=None):
+        checkpointed.update({team.name: len(team.roster) for team in sim.teams})
+        sim.teams[0].roster.pop()
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(sim, "_run_contract_and_free_agency", broken_free_agency)
+    job = service.jobs.submit(target="n_seasons", seasons=1)
+    final = _wait_for(lambda: service.jobs.get(job["id"]), lambda row: row["status"] not in {"queued", "running"})
+    assert final["status"] == "failed" and "boom" in final["error"]
+
+    resumed = sim_factory(37)
+    assert {team.name: len(team.roster) for team in resumed.teams} == checkpointed
+    assert [row["stage"] for row in resumed._offseason_progress.timings] == ["summary", "career_stats", "aging", "draft"]
+    assert resumed.finalize_offseason_after_playoffs(user_team_name=service.user_team_name)["advanced"] is True
+    assert [entry["season"] for entry in resumed.season_history] == [1]
+
+
+@pytest.mark.regression
+def test_failed_regular_season_job_keeps_the_days_it_finished(service, monkeypatch, sim_factory) -> None:
+    sim = sim_factory(53)
+    service.simulator = sim
+    service.auto_injury_moves = True
+    simulate_next_day = sim.simulate_next_day
+
+    def flaky_day(*args, **kwargs):
+        if sim.current_day >= 4:
+            raise RuntimeError("boom")
+        return simulate_next_day(*args, **kwargs)
+
+    monkeypatch.setattr(sim, "simulate_next_day", flaky_day)
+    job = service.jobs.submit(target="to_day", day=10)
+    final = _wait_for(lambda: service.jobs.get(job["id"]), lambda row: row["status"] not in {"queued", "running"})
+    assert final["status"] == "failed" and final["steps_done"] == 3
+    assert sim_factory(53).current_day == sim.current_day == 4
+
+
+@pytest.mark.regression
+def test_goalie_row_combines_the_season_carried_over_a_trade(service, sim_factory) -> None:
+    sim = sim_factory(41)
+    service.simulator = sim
+    sim.simulate_to(sim.total_days // 2)
+    origin, destination = sim.teams[0], sim.teams[1]
+    goalie = max(origin.roster, key=lambda p: p.goalie_games)
+    before = (goalie.goalie_games, goalie.goalie_wins, round(goalie.gaa, 2), round(goalie.save_pct, 3))
+    assert before[0] > 0
+    sim.snapshot_trade_season_split(goalie, origin.name)
+    origin.roster.remove(goalie)
+    destination.roster.append(goalie)
+    goalie.team_name = destination.name
+
+    row = service._goalie_to_dict(goalie)
+    assert (row["team"], row["gp"], row["w"], row["gaa"], row["sv_pct"]) == (destination.name, *before)
+
+    goalie.goalie_games, goalie.goalie_wins = 2, 1
+    goalie.goals_against, goalie.shots_against, goalie.saves = 6, 60, 54
+    row = service._goalie_to_dict(goalie)
+    total_gp = before[0] + 2
+    assert (row["gp"], row["w"]) == (total_gp, before[1] + 1)
+    carry = goalie.career_seasons[-1]
+    assert row["gaa"] == round((float(carry["gaa"]) * before[0] + goalie.gaa * 2) / total_gp, 2)
+    assert row["sv_pct"] == round((float(carry["sv_pct"]) * before[0] + goalie.save_pct * 2) / total_gp, 3)
+
+
+@pytest.mark.regression
+def test_two_for_one_buyer_calls_up_for_the_position_it_gave_away(service) -> None:
+    buyer, seller = service.simulator.teams[1:3]
+    defender = next(p for p in buyer.roster if p.position == "D")
+    forward = next(p for p in buyer.roster if p.position == "C")
+    target = next(p for p in seller.roster if p.position == "LW")
+    assert any(p.position == "D" and not p.is_injured for p in buyer.minor_roster)
+    before = {p.name for p in buyer.roster}
+
+    service._execute_trade(team_a=buyer, team_b=seller, team_a_players=[defender, forward], team_b_players=[target])
+    service._call_up_after_consolidation(buyer, [defender, forward], target, day=35)
+    called = [p for p in buyer.roster if p.name not in before and p is not target]
+    assert len(buyer.roster) == len(before) and [p.position for p in called] == ["D"]
+    assert service.news_feed[0]["headline"] == f"Transaction: {buyer.name} recalled {called[0].name}"
+
+
+@pytest.mark.regression
+def test_event_subscriber_coalesces_snapshots_then_resyncs_when_full() -> None:
+    bus = EventBus()
+    subscriber = bus.subscribe(max_events=8)
+    other = bus.subscribe(max_events=8)
+    bus.publish("standings", {"day": 1})
+    for day in range(7):
+        bus.publish("games", {"day": day})
+    bus.unsubscribe(other)
+
+    # A full buffer first gives up its standings snapshot.
+    bus.publish("games", {"day": 7})
+    assert subscriber.dropped == 0 and len(subscriber._events) == 8
+
+    # Then the oldest events go, behind one resync marker that counts them.
+    bus.publish("games", {"day": 8})
+    bus.publish("games", {"day": 9})
+    assert subscriber.dropped == 3 and len(subscriber._events) == 8
+    events = subscriber.drain(limit=64)
+    assert events[0] == {"id": 0, "kind": "resync", "data": {"dropped": 3}}
+    assert [event["data"]["day"] for event in events[1:]] == [3, 4, 5, 6, 7, 8, 9]
+    assert other.closed and len(other._events) == 8
+
+
+def _run_asgi(app, path: str, query: str = "") -> tuple[dict[str, str], bytes]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+        "root_path": "",
+        "path": path,
+        "raw_path": path.encode("ascii"),
+        "headers": [(b"accept-encoding", b"gzip"), (b"host", b"testserver")],
+        "query_string": query.encode("ascii"),
+    }
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    headers = {key.decode(): value.decode() for key, value in messages[0]["headers"]}
+    return headers, b"".join(message.get("body", b"") for message in messages[1:])
+
+
+@pytest.mark.regression
+def test_gzip_leaves_the_event_stream_uncompressed() -> None:
+    async def endpoint(scope, receive, send) -> None:
+        media_type = b"text/event-stream" if scope["path"] == "/api/stream" else b"application/json"
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", media_type)]})
+        await send({"type": "http.response.body", "body": b"data: {}\n\n" * 400, "more_body": False})
+
+    gzip = api.EventStreamSafeGZipMiddleware(endpoint, minimum_size=1024)
+    stream_headers, stream_body = _run_asgi(gzip, "/api/stream")
+    assert "content-encoding" not in stream_headers
+    assert stream_body == b"data: {}\n\n" * 400
+    table_headers, _ = _run_asgi(gzip, "/api/players")
+    assert table_headers["content-encoding"] == "gzip"
+
+
+@pytest.mark.regression
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_encode_json_bytes_writes_non_finite_floats_as_null(monkeypatch, use_orjson) -> None:
+    if use_orjson and api.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(api, "orjson", None)
+    payload = {"gaa": float("nan"), "rows": [1.5, float("inf"), (float("-inf"), "x")], 3: "é"}
+    assert json.loads(api.encode_json_bytes(payload)) == {"gaa": None, "rows": [1.5, None, [None, "x"]], "3": "é"}
+
+
+@pytest.mark.regression
+def test_rows_to_columns_keeps_keys_that_first_appear_in_later_rows() -> None:
+    table = api.rows_to_columns([{"name": "A", "g": 1}, {"name": "B", "w": 4}, {"g": 2, "name": "C"}])
+    assert table == {
+        "fields": ["name", "g", "w"],
+        "rows": [["A", 1, None], ["B", None, 4], ["C", 2, None]],
+    }
+    assert api.rows_to_columns([]) == {"fields": [], "rows": []}
+
+
+@pytest.mark.regression
+def test_players_fields_projection_is_gzipped_and_ignores_unknown_fields(service) -> None:
+    headers, body = _run_asgi(api.app, "/api/players", "fields=g,p,not_a_stat")
+    assert headers["content-encoding"] == "gzip"
+    rows = json.loads(gzip.decompress(body))
+    assert len(rows) > 100
+    assert all(set(row) == {"team", "name", "g", "p"} for row in rows)
+
+    _, body = _run_asgi(api.app, "/api/players", "fields=not_a_stat&format=columns")
+    table = json.loads(gzip.decompress(body))
+    assert table["fields"] == ["team", "name"] and len(table["rows"]) == len(rows)
+
+    assert api.parse_fields(" g, ,p ") == frozenset({"g", "p"})
+    assert api.parse_fields(",") is None and api.parse_fields(None) is None
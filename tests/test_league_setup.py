@@ -1,7 +1,16 @@
+import itertools
+import json
+import uuid
+import zlib
+
 import pytest
 
+from hockey_sim import models
 from hockey_sim.app import build_default_teams
 from hockey_sim.league import LeagueSimulator
+from hockey_sim.playoffs import PlayoffSeries, playoff_three_stars, series_outcomes, summary_game_rows
+from hockey_sim.progression import DRAWS_PER_PLAYER, RATING_FIELDS, ProgressionTable
+from hockey_sim.trades import TradeSearch, need_matches_position
 
 
 @pytest.mark.smoke
@@ -154,6 +163,43 @@ def test_round_one_draft_order_and_player_pick_tracking(tmp_path) -> None:
     assert any(p.draft_overall == 1 for p in round_one)
 
 
+@pytest.mark.regression
+def test_draft_session_sims_to_user_pick_and_resumes_from_save(sim_factory) -> None:
+    sim = sim_factory(29)
+    state = sim.get_draft_state("Aurora")
+    user_slot = next(row["overall"] for row in sim.current_draft_state["picks"] if row["team"] == "Aurora")
+    class_rows = sim.get_draft_class("Aurora")["rows"]
+    wanted = [row["id"] for row in class_rows[:user_slot + 3]]
+    assert sim.set_draft_board("Aurora", wanted) == wanted
+    assert state["active"] is True
+
+    state = sim.sim_draft_to_user_pick("Aurora")
+    assert state["simulated_picks"] == user_slot - 1
+    assert state["next_pick"]["team"] == "Aurora"
+    taken = {row["prospect_id"] for row in sim.current_draft_state["picks"] if row["prospect_id"]}
+    assert len(taken) == user_slot - 1
+    assert state["user_board"] == [pid for pid in wanted if pid not in taken]
+
+    resumed = sim_factory(29)
+    assert resumed.get_draft_state("Aurora")["current_pick_index"] == user_slot - 1
+    pick = resumed.make_user_draft_pick("Aurora", state["user_board"][0])
+    assert pick["prospect_id"] == state["user_board"][0]
+    with pytest.raises(ValueError, match="Not your pick"):
+        resumed.make_user_draft_pick("Aurora", state["user_board"][1])
+    state = resumed.sim_draft_to_user_pick("Aurora")
+    assert state["next_pick"]["team"] == "Aurora"
+    with pytest.raises(ValueError, match="already drafted"):
+        resumed.make_user_draft_pick("Aurora", pick["prospect_id"])
+
+    while state["active"]:
+        available = next(row["id"] for row in resumed.get_draft_class("Aurora")["rows"] if row["available"])
+        resumed.make_user_draft_pick("Aurora", available)
+        state = resumed.sim_draft_to_user_pick("Aurora")
+    picks = resumed.current_draft_state["picks"]
+    assert len({row["prospect_id"] for row in picks}) == len(picks)
+    assert sim_factory(29).get_draft_state("Aurora")["active"] is False
+
+
 @pytest.mark.smoke
 def test_current_day_is_capped_at_regular_season_total() -> None:
     teams = build_default_teams()
@@ -185,5 +231,616 @@ def test_playoff_day_advances_injury_recovery(tmp_path) -> None:
     injured_player = sim.teams[0].roster[0]
     injured_player.injured_games_remaining = 3
     sim.simulate_next_playoff_day()
-    # Playoff days are pre-simulated before reveal; reveal should not decay injuries again.
-    assert injured_player.injured_games_remaining == 3
+    # Recovery ticks once per playoff day, however many series are in progress.
+    assert injured_player.injured_games_remaining == 2
+
+
+@pytest.mark.regression
+def test_playoffs_simulate_one_day_at_a_time_and_resume_from_save(sim_factory) -> None:
+    sim = sim_factory(43)
+    sim.simulate_to(sim.total_days)
+    sim.start_playoffs()
+    assert sim.pending_playoff_days == []
+    upcoming = sim.upcoming_playoff_day()
+    assert upcoming is not None and upcoming["games"]
+
+    first = sim.simulate_next_playoff_day()
+    played = first["day"]["games"]
+    assert [(g["home"], g["away"]) for g in played] == [(g["home"], g["away"]) for g in upcoming["games"]]
+
+    # Decisions made between days feed the next game: an injured starter cannot play it.
+    game = played[0]
+    team = sim.get_team(game["home"])
+    starter = next(p for p in team.roster if p.name == game["home_goalie"])
+    starter.injured_games_remaining = 10
+    sim._save_state()
+
+    resumed = sim_factory(43)
+    assert resumed.pending_playoff_days == sim.pending_playoff_days
+    assert resumed.pending_playoffs["rounds"] == sim.pending_playoffs["rounds"]
+    second = resumed.simulate_next_playoff_day()
+    next_game = next(g for g in second["day"]["games"] if team.name in (g["home"], g["away"]))
+    used = next_game["home_goalie"] if next_game["home"] == team.name else next_game["away_goalie"]
+    assert used and used != starter.name
+
+    while not resumed.playoffs_finished():
+        assert resumed.simulate_next_playoff_day()["advanced"] is True
+    bracket = resumed.pending_playoffs
+    cup_final = next(r for r in bracket["rounds"] if r["name"] == "Cup Final")
+    assert bracket["champion"] == cup_final["series"][0]["winner"]
+    assert bracket["mvp"]["team"] == bracket["champion"]
+    assert resumed.playoff_total_days() == len(resumed.pending_playoff_days)
+
+
+@pytest.mark.regression
+def test_playoff_games_are_stored_compactly_with_derived_three_stars(sim_factory) -> None:
+    sim = sim_factory(47)
+    sim.simulate_to(sim.total_days)
+    sim.start_playoffs()
+    sim.simulate_next_playoff_day()
+    series = sim._playoff_session.stage_series()[0]
+    game = series.games[0]
+    assert isinstance(game, tuple) and len(series.players) >= 2
+
+    row = series.game_rows()[0]
+    assert row["winner"] == series.game_winner(game)
+    assert row["home_goalie"] in series.players
+    stars = playoff_three_stars(game, series.players, row["home"], row["away"])
+    assert [label for label, _ in stars] == ["1st Star", "2nd Star", "3rd Star"][: len(stars)]
+    assert playoff_three_stars(game, series.players, row["home"], row["away"]) is stars
+
+    summary = json.loads(json.dumps(series.to_summary()))
+    assert summary_game_rows(summary)[0]["home_goals"] == row["home_goals"]
+    restored = PlayoffSeries.from_dict(json.loads(json.dumps(series.to_dict())))
+    assert restored.games == series.games
+    assert (restored.high_wins, restored.low_wins) == (series.high_wins, series.low_wins)
+
+    legacy = {"game": 1, "home": series.higher_seed, "away": series.lower_seed, "winner": series.lower_seed}
+    assert PlayoffSeries.from_dict({**series.to_dict(), "games": [legacy]}).low_wins == 1
+
+    resumed = sim_factory(47)
+    for _ in range(2):
+        resumed.simulate_next_playoff_day()
+    for series in resumed._playoff_session.stage_series():
+        assert len(series.players) == len(set(series.players))
+    # Display rows hold only plain JSON values, so any encoder takes them as-is.
+    rows = [game for day in resumed._playoff_session.days for game in day["games"]]
+    assert all(type(value) in (str, int, bool, list) for row in rows for value in row.values())
+    assert [star["label"] for star in rows[0]["three_stars"]] == ["1st Star", "2nd Star", "3rd Star"][: len(rows[0]["three_stars"])]
+
+
+@pytest.mark.regression
+def test_playoff_odds_tables_follow_series_state(sim_factory) -> None:
+    even = series_outcomes(0.5, 0.5)
+    assert sum(even.values()) == pytest.approx(1.0)
+    assert even[(4, 0)] == pytest.approx(1 / 16)
+    assert sum(p for (high, low), p in series_outcomes(0.5, 0.5, 3, 0).items() if high > low) == pytest.approx(15 / 16)
+
+    sim = sim_factory(47)
+    sim.simulate_to(sim.total_days)
+    sim.start_playoffs()
+    odds = sim.playoff_odds(samples=500)
+    assert len(odds["series"]) == len(sim.upcoming_playoff_day()["games"])
+    assert sum(row["champion"] for row in odds["teams"]) == pytest.approx(100.0, abs=0.5)
+    for row in odds["teams"]:
+        assert row["second_round"] >= row["conference_final"] >= row["cup_final"] >= row["champion"]
+    assert sim.playoff_odds(samples=500) is odds
+
+    while not sim.playoffs_finished():
+        sim.simulate_next_playoff_day()
+    final = sim.playoff_odds(samples=500)
+    assert final["series"] == []
+    assert final["teams"][0] == {
+        "team": sim.pending_playoffs["champion"],
+        "second_round": 100.0,
+        "conference_final": 100.0,
+        "cup_final": 100.0,
+        "champion": 100.0,
+    }
+
+
+@pytest.mark.regression
+def test_roster_changes_mark_team_dirty_until_next_game(sim_factory) -> None:
+    sim = sim_factory(43)
+    first_day_teams = {team.name for game in sim._season_days[0] for team in game}
+    sim.simulate_next_day()
+    injured_today = {
+        team.name for team in sim.teams if any(p.injured_games_remaining > 0 for p in team.roster)
+    }
+    assert not (first_day_teams - injured_today) & sim._dirty_team_names
+
+    team = next(t for t in sim.teams if t.name in first_day_teams and t.name not in sim._dirty_team_names)
+    prospect = next(p for p in team.minor_roster if not p.is_injured)
+    assert sim.promote_minor_player(team.name, prospect.name)
+    assert team.name in sim._dirty_team_names
+    assert prospect.name in {p.name for p in team.roster}
+
+
+@pytest.mark.smoke
+def test_standings_cache_refreshes_after_games(sim_factory) -> None:
+    sim = sim_factory(47)
+    assert sim.get_team(sim.teams[3].name) is sim.teams[3]
+    assert sim.get_team("No Such Team") is None
+    before = sim.get_conference_standings(sim.get_conferences()[0])
+    before.clear()
+    assert sim.get_conference_standings(sim.get_conferences()[0])
+
+    sim.simulate_next_day()
+    standings = sim.get_standings()
+    assert standings[0].points == max(rec.points for rec in standings)
+    for division in sim.get_divisions():
+        rows = sim.get_division_standings(division)
+        assert rows == [rec for rec in standings if rec.team.division == division]
+
+
+@pytest.mark.regression
+def test_clinch_and_elimination_tags_match_final_field(sim_factory) -> None:
+    sim = sim_factory(53)
+    daily_tags = []
+    while not sim.is_complete():
+        sim.simulate_next_day()
+        daily_tags.append(sim.get_clinch_tags())
+
+    final_tags = sim.get_clinch_tags()
+    field = {name for name, tags in final_tags.items() if "x" in tags}
+    assert len(field) == 16
+    assert all("e" in tags for name, tags in final_tags.items() if name not in field)
+    assert sum("p" in tags for tags in final_tags.values()) == 1
+    for tags_by_team in daily_tags:
+        for name, tags in tags_by_team.items():
+            if "x" in tags:
+                assert name in field
+            if "e" in tags:
+                assert name not in field
+    assert sim.get_playoff_clinch_status() == {name: name in field for name in final_tags}
+
+
+@pytest.mark.regression
+def test_fast_forward_matches_detailed_day_loop(tmp_path, monkeypatch) -> None:
+    def build(tag: str) -> LeagueSimulator:
+        # Lineup tie-breaks hash player ids, so both leagues need the same ids.
+        counter = itertools.count()
+        monkeypatch.setattr(models, "uuid4", lambda: uuid.UUID(int=next(counter)))
+        return LeagueSimulator(
+            teams=build_default_teams(),
+            games_per_matchup=1,
+            seed=59,
+            state_path=str(tmp_path / f"{tag}_league_state.json"),
+            history_path=str(tmp_path / f"{tag}_season_history.json"),
+            career_history_path=str(tmp_path / f"{tag}_career_history.json"),
+            hall_of_fame_path=str(tmp_path / f"{tag}_hall_of_fame.json"),
+        )
+
+    detailed = build("detailed")
+    for _ in range(10):
+        detailed.simulate_next_day()
+    fast = build("fast")
+    summary = fast.simulate_until(day=10, detail="minimal")
+    assert summary["simulated_days"] == 10
+    assert fast.current_day == detailed.current_day
+
+    def snapshot(sim: LeagueSimulator) -> tuple[list[tuple], list[tuple]]:
+        standings = [(r.team.name, r.wins, r.losses, r.ot_losses, r.goals_for) for r in sim.get_standings()]
+        players = sorted(
+            (p.name, p.goals, p.assists, p.games_played, p.injured_games_remaining, p.saves)
+            for team in sim.teams
+            for p in team.roster
+        )
+        return standings, players
+
+    assert snapshot(fast) == snapshot(detailed)
+    with pytest.raises(ValueError, match="detail"):
+        fast.simulate_until(day=12, detail="summary")
+    assert fast.current_day == detailed.current_day
+
+
+@pytest.mark.regression
+def test_process_game_executor_matches_serial_substreams(tmp_path, monkeypatch) -> None:
+    def run(mode: str) -> tuple[list[tuple], list[tuple]]:
+        counter = itertools.count()
+        monkeypatch.setattr(models, "uuid4", lambda: uuid.UUID(int=next(counter)))
+        sim = LeagueSimulator(
+            teams=build_default_teams(),
+            games_per_matchup=1,
+            seed=61,
+            state_path=str(tmp_path / f"{mode}_league_state.json"),
+            history_path=str(tmp_path / f"{mode}_season_history.json"),
+            career_history_path=str(tmp_path / f"{mode}_career_history.json"),
+            hall_of_fame_path=str(tmp_path / f"{mode}_hall_of_fame.json"),
+        )
+        sim.set_game_executor(mode, max_workers=2)
+        try:
+            for _ in range(3):
+                results = sim.simulate_next_day()
+                for result in results:
+                    assert result.home_goalie is None or result.home_goalie in result.home.roster
+        finally:
+            sim.close_game_executor()
+        standings = [(r.team.name, r.wins, r.losses, r.ot_losses, r.goals_for) for r in sim.get_standings()]
+        players = sorted(
+            (p.name, p.goals, p.assists, p.games_played, p.injured_games_remaining, p.saves)
+            for team in sim.teams
+            for p in team.roster
+        )
+        return standings, players
+
+    assert run("process") == run("serial")
+
+
+@pytest.mark.regression
+def test_simulate_days_saves_once_and_rolls_back_failed_batch(sim_factory, monkeypatch) -> None:
+    sim = sim_factory(67)
+    writes: list[int] = []
+    write_state = sim._write_state
+    monkeypatch.setattr(sim, "_write_state", lambda: (writes.append(sim.current_day), write_state()))
+
+    day_results = sim.simulate_days(4)
+    assert len(day_results) == 4
+    assert sim.current_day == 5
+    assert len(writes) == 1
+
+    def snapshot() -> tuple[object, ...]:
+        standings = [(r.team.name, r.wins, r.losses, r.ot_losses, r.goals_for, r.games_played) for r in sim.get_standings()]
+        players = sorted(
+            (p.player_id, p.goals, p.assists, p.games_played, p.injured_games_remaining, p.saves)
+            for team in sim.teams
+            for p in team.roster
+        )
+        return sim.current_day, standings, players, sim._rng.getstate()
+
+    before = snapshot()
+    register = sim._register_regular_season_result
+    calls = itertools.count()
+
+    def flaky_register(result) -> None:
+        if next(calls) == 30:
+            raise RuntimeError("boom")
+        register(result)
+
+    monkeypatch.setattr(sim, "_register_regular_season_result", flaky_register)
+    with pytest.raises(RuntimeError):
+        sim.simulate_to(10)
+    assert snapshot() == before
+    assert len(writes) == 1
+
+    monkeypatch.setattr(sim, "_register_regular_season_result", register)
+    sim.simulate_to(10)
+    assert sim.current_day == 11
+    assert all(rec.games_played <= 10 for rec in sim.get_standings())
+    assert len(writes) == 2
+
+
+@pytest.mark.regression
+def test_failed_day_undo_log_restores_player_stats_and_injuries(sim_factory, monkeypatch) -> None:
+    sim = sim_factory(71)
+    for _ in range(6):
+        sim.simulate_next_day()
+
+    fields = (
+        "games_played", "goals", "assists", "injuries", "injured_games_remaining", "games_missed_injury",
+        "injury_type", "injury_status", "goalie_games", "saves", "shots_against", "goalie_wins",
+    )
+
+    def snapshot() -> tuple[object, ...]:
+        standings = [
+            (r.team.name, r.wins, r.losses, r.ot_losses, r.goals_for, r.goals_against, tuple(r.recent_results))
+            for r in sim.get_standings()
+        ]
+        players = sorted(
+            (p.player_id, *(getattr(p, name) for name in fields))
+            for team in sim.teams
+            for p in [*team.roster, *team.minor_roster]
+        )
+        return sim.current_day, standings, players, sim._rng.getstate()
+
+    before = snapshot()
+    register = sim._register_regular_season_result
+    calls = itertools.count()
+
+    def flaky_register(result) -> None:
+        if next(calls) == 4:
+            raise RuntimeError("boom")
+        register(result)
+
+    monkeypatch.setattr(sim, "_register_regular_season_result", flaky_register)
+    with pytest.raises(RuntimeError):
+        sim.simulate_next_day()
+    assert snapshot() == before
+
+    monkeypatch.setattr(sim, "_register_regular_season_result", register)
+    results = sim.simulate_next_day()
+    assert results
+    assert sim.current_day == before[0] + 1
+
+
+@pytest.mark.regression
+def test_free_agent_market_signs_within_cap_and_keeps_user_players(sim_factory) -> None:
+    sim = sim_factory(31)
+    user_team = sim.teams[0]
+    for team in sim.teams:
+        for idx, player in enumerate([*team.roster, *team.minor_roster]):
+            if idx % 2 == 0:
+                player.contract_years_left = 1
+    user_expiring = {p.player_id for p in [*user_team.roster, *user_team.minor_roster] if p.contract_years_left == 1}
+
+    result = sim._run_contract_and_free_agency(user_team_name=user_team.name)
+
+    assert result["signings"]
+    signed_names = {row["player"] for row in result["signings"]}
+    free_agent_ids = {p.player_id for p in sim.free_agents}
+    assert user_expiring <= free_agent_ids
+    assert not any(p.name in signed_names for p in sim.free_agents)
+    signing_teams = {row["team"] for row in result["signings"]}
+    for team in sim.teams:
+        if team.name in signing_teams:
+            assert sim._team_cap_used(team) <= sim._team_cap_limit(team) + 0.01
+        active = [p for p in team.roster if not p.is_injured]
+        assert len(active) <= models.Team.MAX_ROSTER_SIZE
+
+
+@pytest.mark.regression
+def test_offseason_resumes_from_last_checkpoint_after_failed_stage(sim_factory, monkeypatch) -> None:
+    sim = sim_factory(37)
+    sim.simulate_to(sim.total_days)
+    sim.start_playoffs()
+    while sim.simulate_next_playoff_day().get("advanced"):
+        pass
+
+    checkpointed: dict[str, int] = {}
+
+    def broken_free_agency(user_team_name=None):
+        checkpointed.update({team.name: len(team.roster) for team in sim.teams})
+        sim.teams[0].roster.pop()
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(sim, "_run_contract_and_free_agency", broken_free_agency)
+    with pytest.raises(RuntimeError):
+        sim.finalize_offseason_after_playoffs(user_team_name="Aurora")
+    assert sim.finalize_offseason_after_playoffs(user_team_name="Aurora") == {
+        "advanced": False,
+        "reason": "offseason_failed",
+        "stage": "free_agency",
+    }
+    drafted = {name: list(names) for name, names in sim._offseason_progress.results["drafted"].items()}
+    # A later save must not put the half-applied stage over the checkpoint.
+    short_team = sim.teams[0]
+    promoted = short_team.minor_roster[0].name
+    assert sim.promote_minor_player(short_team.name, promoted)
+
+    resumed = sim_factory(37)
+    assert {team.name: len(team.roster) for team in resumed.teams} == checkpointed
+    assert promoted not in {p.name for p in resumed.get_team(short_team.name).roster}
+    assert resumed.season_number == 1
+    assert resumed._offseason_progress is not None
+    assert [row["stage"] for row in resumed._offseason_progress.timings] == [
+        "summary",
+        "career_stats",
+        "aging",
+        "draft",
+    ]
+    result = resumed.finalize_offseason_after_playoffs(user_team_name="Aurora")
+    assert result["advanced"] is True
+    assert result["drafted"] == drafted
+    assert [row["stage"] for row in result["stages"]][4:] == ["free_agency", "clear_stats", "coaches", "history", "new_season"]
+    assert all(row["seconds"] >= 0.0 for row in result["stages"])
+    assert resumed.season_number == 2
+    assert [entry["season"] for entry in resumed.season_history] == [1]
+    assert resumed._offseason_progress is None
+    reloaded = sim_factory(37)
+    assert [row["stage"] for row in reloaded.last_offseason_stages] == [row["stage"] for row in result["stages"]]
+
+
+@pytest.mark.regression
+def test_progression_table_ages_players_and_flags_retirements() -> None:
+    teams = build_default_teams()
+    entries = [(player, team, 82) for team in teams for player in [*team.roster, *team.minor_roster]]
+    veteran, _, _ = entries[0]
+    veteran.age = 36
+    veteran.injuries = 3
+    veteran.games_missed_injury = 30
+    before = {player.player_id: (player.age, tuple(getattr(player, name) for name in RATING_FIELDS)) for player, _, _ in entries}
+
+    table = ProgressionTable.build(entries)
+    with pytest.raises(ValueError):
+        table.run([0.5])
+    retiring = table.run([0.0] * (len(table) * DRAWS_PER_PLAYER), use_numpy=False)
+
+    assert retiring[0] is True
+    assert veteran.durability < before[veteran.player_id][1][RATING_FIELDS.index("durability")]
+    for (player, _, _), flag in zip(entries, retiring):
+        assert player.age == before[player.player_id][0] + 1
+        assert all(0.3 <= getattr(player, name) <= 5.0 for name in RATING_FIELDS)
+        threshold = 34 if player.position == "G" else 32
+        assert flag == (player.age >= threshold)
+
+
+@pytest.mark.regression
+def test_progression_table_numpy_path_matches_python_path() -> None:
+    pytest.importorskip("numpy")
+    python_teams = build_default_teams()
+    numpy_teams = build_default_teams()
+    python_rows = [(p, t, 60) for t in python_teams for p in [*t.roster, *t.minor_roster]]
+    numpy_rows = [(p, t, 60) for t in numpy_teams for p in [*t.roster, *t.minor_roster]]
+    draws = [((idx * 7919) % 1000) / 1000.0 for idx in range(len(python_rows) * DRAWS_PER_PLAYER)]
+    assert ProgressionTable.build(python_rows).run(draws, use_numpy=False) == ProgressionTable.build(numpy_rows).run(
+        draws, use_numpy=True
+    )
+    for (a, _, _), (b, _, _) in zip(python_rows, numpy_rows):
+        assert [getattr(a, name) for name in RATING_FIELDS] == [getattr(b, name) for name in RATING_FIELDS]
+
+
+@pytest.mark.regression
+def test_career_aggregate_tracks_recorded_and_traded_seasons(sim_factory) -> None:
+    sim = sim_factory(41)
+    sim.simulate_to(sim.total_days // 2)
+    origin, destination = sim.teams[0], sim.teams[1]
+    player = max(origin.roster, key=lambda p: p.games_played)
+    aggregate = sim.career_aggregate(player)
+    first_half = (player.games_played, player.goals, player.assists)
+    sim.snapshot_trade_season_split(player, origin.name)
+    origin.roster.remove(player)
+    destination.roster.append(player)
+    player.team_name = destination.name
+
+    assert sim.career_aggregate(player) is aggregate
+    carry = aggregate.season_totals(sim.season_number)
+    assert (carry["gp"], carry["g"], carry["a"]) == first_half
+    assert aggregate.team_seasons == {origin.name: 1}
+    assert aggregate.season_weighted_rates(sim.season_number) == (
+        float(player.career_seasons[-1].get("gaa", 0.0)) * max(1, carry["goalie_gp"]),
+        float(player.career_seasons[-1].get("sv_pct", 0.0)) * max(1, carry["goalie_gp"]),
+    )
+
+    sim.simulate_to(sim.total_days)
+    sim._record_career_season_stats(sim.season_number)
+    assert sim.career_aggregate(player) is aggregate
+    rows = player.career_seasons
+    for key in ("gp", "g", "a", "p", "goalie_w"):
+        assert aggregate.totals[key] == sum(int(row.get(key, 0)) for row in rows)
+    assert aggregate.team_totals(destination.name)["gp"] == rows[-1]["gp"]
+    assert aggregate.recent_total("injuries", 1) == rows[-1]["injuries"]
+
+    player.career_seasons = list(rows[:1])
+    rebuilt = sim.career_aggregate(player)
+    assert rebuilt is not aggregate
+    assert rebuilt.totals["gp"] == first_half[0]
+
+
+@pytest.mark.regression
+def test_record_book_ranks_retired_players_as_they_retire(sim_factory) -> None:
+    sim = sim_factory(43)
+    sim.simulate_to(sim.total_days)
+    sim._record_career_season_stats(sim.season_number)
+    book = sim.record_book()
+    retirees = [(team, player) for team in sim.teams[:4] for player in team.roster[:4]]
+    for team, player in retirees:
+        sim._add_hall_of_fame_entry(player, team.name, sim.season_number)
+
+    assert sim.record_book() is book
+    ranked = sorted(sim.hall_of_fame, key=lambda e: (int(e["career_p"]), str(e["name"])), reverse=True)
+    top = sorted(book.league_candidates().values(), key=lambda r: (r["p"], r["name"]), reverse=True)[:10]
+    assert [row["player_id"] for row in top] == [entry["player_id"] for entry in ranked[:10]]
+    team, player = retirees[0]
+    assert player.player_id in book.franchise_candidates(team.name)
+    sim.career_history["legacy"] = [
+        {"name": "Old Timer", "team": team.name, "season": 2},
+        {"name": "Old Timer", "team": team.name, "season": 5},
+    ]
+    assert sim.team_season_range("Old Timer", team.name) == (2, 5)
+    assert sim.team_season_range("Old Timer", sim.teams[5].name) is None
+
+    sim._add_hall_of_fame_entry(player, team.name, sim.season_number + 1)
+    assert sim.record_book() is not book
+    assert len(sim.hall_of_fame) == len(retirees)
+    assert sim.record_book().leader_candidates(team.name)[player.player_id]["name"] == player.name
+
+
+@pytest.mark.regression
+def test_trade_search_values_each_player_once_per_team() -> None:
+    teams = build_default_teams()
+    needs = {team.name: ("top4_d" if idx % 2 == 0 else "top6_f") for idx, team in enumerate(teams)}
+    calls: list[tuple[str, str]] = []
+
+    def overall(player: models.Player) -> float:
+        if player.position == "G":
+            return player.goaltending
+        return (player.shooting + player.playmaking + player.defense) / 3.0
+
+    def value(player: models.Player, team: models.Team) -> float:
+        calls.append((player.player_id, team.name))
+        return round(overall(player) + (0.4 if need_matches_position(needs[team.name], player.position) else 0.0), 3)
+
+    search = TradeSearch(
+        value=value,
+        needs=lambda team: {"scores": {needs[team.name]: 0.6}, "primary_need": needs[team.name]},
+        pool=lambda team, outgoing: sorted(team.roster, key=overall, reverse=not outgoing),
+        margin=lambda team: 0.0,
+        overall=overall,
+    )
+    buyer = teams[0]
+    for seller in teams[1:]:
+        search.balanced_offer(buyer, seller)
+        search.relaxed_offer(buyer, seller)
+        search.two_for_one_offer(buyer, seller, give_limit=16, receive_limit=18)
+    assert calls and len(calls) == len(set(calls))
+
+    seller = next(team for team in teams[1:] if search.two_for_one_offer(buyer, team) is not None)
+    (first, second), target, buyer_eval, seller_eval = search.two_for_one_offer(buyer, seller)
+    assert first in buyer.roster and second in buyer.roster and target in seller.roster
+    assert overall(target) > max(overall(first), overall(second))
+    assert buyer_eval["net_value"] >= buyer_eval["min_net"] and seller_eval["net_value"] >= seller_eval["min_net"]
+
+    seen = len(calls)
+    search.forget(seller)
+    search.two_for_one_offer(buyer, seller)
+    assert any(team_name == seller.name for _, team_name in calls[seen:])
+    assert all(team_name in {buyer.name, seller.name} for _, team_name in calls[seen:])
+
+
+@pytest.mark.regression
+def test_pruned_trade_scans_pick_what_a_full_scan_picks(monkeypatch) -> None:
+    teams = build_default_teams()
+    needs = {team.name: ("top4_d", "top6_f", "starter_g")[idx % 3] for idx, team in enumerate(teams)}
+
+    def overall(player: models.Player) -> float:
+        if player.position == "G":
+            return player.goaltending
+        return (player.shooting + player.playmaking + player.defense) / 3.0
+
+    def value(player: models.Player, team: models.Team) -> float:
+        # Unrounded values with a per-team wobble, so rounded nets sit on both sides of the raw bounds.
+        wobble = (zlib.crc32(f"{player.name}:{team.name}".encode()) % 997) / 997.0 * 0.05
+        return overall(player) / 4.0 + (0.12 if need_matches_position(needs[team.name], player.position) else 0.0) + wobble
+
+    def offers(search: TradeSearch) -> list[tuple]:
+        picks = []
+        for buyer, seller in itertools.permutations(teams[:8], 2):
+            balanced = search.balanced_offer(buyer, seller)
+            relaxed = search.relaxed_offer(buyer, seller)
+            two_for_one = search.two_for_one_offer(buyer, seller)
+            picks.append(
+                (
+                    balanced and (balanced[0].player_id, balanced[1].player_id),
+                    relaxed and (relaxed[0].player_id, relaxed[1].player_id),
+                    two_for_one and (tuple(p.player_id for p in two_for_one[0]), two_for_one[1].player_id),
+                )
+            )
+        return picks
+
+    def build() -> TradeSearch:
+        return TradeSearch(
+            value=value,
+            needs=lambda team: {"scores": {needs[team.name]: 0.6}, "primary_need": needs[team.name]},
+            pool=lambda team, outgoing: sorted(team.roster, key=overall, reverse=not outgoing),
+            margin=lambda team: 0.0,
+            overall=overall,
+        )
+
+    pruned = offers(build())
+    assert any(all(pick) for pick in pruned)
+    # With unbounded slack no bound ever prunes, leaving the plain nested loops over the same pools.
+    monkeypatch.setattr("hockey_sim.trades._BOUND_SLACK", float("inf"))
+    assert offers(build()) == pruned
+
+
+@pytest.mark.regression
+def test_trade_bounds_leave_room_for_rounded_nets() -> None:
+    buyer, seller = build_default_teams()[:2]
+    give, first, second = buyer.roster[0], seller.roster[0], seller.roster[1]
+    # (give, first) nets round to 0.052 and 0.050; (give, second) nets of 0.05051 round up to 0.051 each,
+    # so its quality beats the first pair's even though its raw bound of 0.10102 does not.
+    values = {
+        (give.player_id, seller.name): 0.05051,
+        (first.player_id, buyer.name): 0.052,
+        (first.player_id, seller.name): 0.00051,
+        (second.player_id, buyer.name): 0.05051,
+    }
+    search = TradeSearch(
+        value=lambda player, team: values.get((player.player_id, team.name), 0.0),
+        needs=lambda team: {"scores": {}, "primary_need": ""},
+        pool=lambda team, outgoing: [give] if team is buyer else [first, second],
+        margin=lambda team: 0.0,
+        overall=lambda player: 0.0,
+    )
+    assert search.relaxed_offer(buyer, seller)[1] is second
+    assert search.balanced_offer(buyer, seller)[1] is second
@@ -76,3 +76,18 @@ def test_state_save_includes_save_version_and_backup(tmp_path) -> None:
     # Second write should create/refresh backup.
     sim._save_state()
     assert backup_path.exists()
+
+
+@pytest.mark.regression
+def test_batched_saves_defer_state_write_until_batch_ends(tmp_path) -> None:
+    sim = _sim(tmp_path)
+    state_path = tmp_path / "league_state.json"
+    before = json.loads(state_path.read_text(encoding="utf-8"))
+    sim.begin_batched_saves()
+    sim.simulate_next_day()
+    sim.simulate_next_day()
+    during = json.loads(state_path.read_text(encoding="utf-8"))
+    assert during["day_index"] == before["day_index"]
+    sim.end_batched_saves()
+    after = json.loads(state_path.read_text(encoding="utf-8"))
+    assert after["day_index"] == before["day_index"] + 2
@@ -1,7 +1,14 @@
 import pytest
 
 from hockey_sim.models import Team
-from hockey_sim.schedule import build_round_robin
+from hockey_sim.schedule import (
+    ScheduleConfig,
+    SeasonSchedule,
+    build_constrained_days,
+    build_round_robin,
+    build_round_robin_days,
+    build_season_schedule,
+)
 
 
 @pytest.mark.smoke
@@ -14,3 +21,78 @@ def test_round_robin_count() -> None:
     ]
     games = build_round_robin(teams, games_per_matchup=2)
     assert len(games) == 12
+
+
+@pytest.mark.smoke
+def test_season_schedule_matches_round_robin_days() -> None:
+    teams = [Team(name=f"T{idx}") for idx in range(8)]
+    schedule = build_season_schedule(teams, games_per_matchup=2)
+    assert build_season_schedule(teams, games_per_matchup=2) is schedule
+
+    legacy = build_round_robin_days(teams, games_per_matchup=2)
+    materialized = schedule.materialize(teams)
+    assert [[(h.name, a.name) for h, a in day] for day in materialized] == [
+        [(h.name, a.name) for h, a in day] for day in legacy
+    ]
+    assert all(h is teams[int(h.name[1:])] for day in materialized for h, _a in day)
+
+    for team in teams:
+        played = [idx for idx, day in enumerate(legacy) if any(team.name in (h.name, a.name) for h, a in day)]
+        assert schedule.total_games(team.name) == len(played) == 14
+        assert schedule.remaining_games(team.name, played[5]) == len(played) - 5
+        assert schedule.next_game(team.name, played[3] + 1)[0] == played[4]
+        for pos, day_idx in enumerate(played):
+            assert schedule.is_back_to_back(team.name, day_idx) == (pos > 0 and played[pos - 1] == day_idx - 1)
+
+    restored = SeasonSchedule.from_dict(schedule.to_dict())
+    assert restored == schedule
+    assert SeasonSchedule.from_dict({"teams": ["A", "B"], "days": [[[0, 5]]]}) is None
+
+
+@pytest.mark.regression
+def test_constrained_schedule_hits_targets_for_large_league() -> None:
+    teams = [
+        Team(name=f"T{idx}", division=f"D{idx % 8}", conference=f"C{idx % 2}")
+        for idx in range(64)
+    ]
+    config = ScheduleConfig(games_per_team=82, max_back_to_backs=12)
+    days = build_constrained_days(teams, config)
+
+    games: dict[str, int] = {team.name: 0 for team in teams}
+    home: dict[str, int] = {team.name: 0 for team in teams}
+    back_to_backs: dict[str, int] = {team.name: 0 for team in teams}
+    streak: dict[str, int] = {}
+    last_day: dict[str, int] = {}
+    last_venue: dict[str, Team] = {}
+    for day_idx, day in enumerate(days):
+        assert day
+        seen: set[str] = set()
+        for home_team, away_team in day:
+            assert home_team is not away_team
+            home[home_team.name] += 1
+            for team in (home_team, away_team):
+                assert team.name not in seen
+                seen.add(team.name)
+                games[team.name] += 1
+                if last_day.get(team.name) == day_idx - 1:
+                    back_to_backs[team.name] += 1
+                    streak[team.name] += 1
+                    assert last_venue[team.name].conference == home_team.conference
+                else:
+                    streak[team.name] = 1
+                assert streak[team.name] <= config.max_consecutive_days
+                last_day[team.name] = day_idx
+                last_venue[team.name] = home_team
+
+    assert set(games.values()) == {82}
+    assert set(home.values()) == {41}
+    assert max(back_to_backs.values()) <= 12
+
+    schedule = build_season_schedule(teams, config=config)
+    assert schedule.total_days == len(days)
+    assert schedule.generator == config.generator
+    assert SeasonSchedule.from_dict(schedule.to_dict()) == schedule
+    assert not schedule.matches(teams, 2)
+
+    with pytest.raises(ValueError):
+        build_constrained_days(teams[:5], ScheduleConfig(games_per_team=3))
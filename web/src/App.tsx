@@ -50,6 +50,7 @@ type StandingRow = {
   l10: string;
   strk: string;
   clinch?: string[];
+  magic?: number | null;
 };
 
 type WildCardRow = {